@@ -14,6 +14,8 @@ from airflow.providers.amazon.aws.operators.glue import GlueJobOperator
 from airflow.providers.snowflake.operators.snowflake import SnowflakeOperator
 from docker.types import Mount
 
+from src.pipeline.warehouse.snowflake_load import build_load_sql
+
 HOST_PROJECT_PATH = os.getenv("HOST_PROJECT_PATH")
 if not HOST_PROJECT_PATH:
     raise ValueError("HOST_PROJECT_PATH not set in .env") 
@@ -27,72 +29,28 @@ default_args = {
     'retries': 2,
     'retry_delay': timedelta(minutes=5),
 }
-# --- Snowflake ELT ---
-SNOWFLAKE_LOAD_SQL = """
-USE DATABASE warehouse;
-USE SCHEMA public;
-
-TRUNCATE TABLE raw_weather_staging;
-
--- 1. Load current run_date partition from S3 Gold Stage
-COPY INTO raw_weather_staging (
-    time, temp_celsius, humidity_percent, wind_speed_kmh, precipitation_mm,
-    temp_fahrenheit, is_freezing, latitude, longitude, location, run_date
-)
-FROM (
-    SELECT
-        $1:time::TIMESTAMP, $1:temp_celsius::FLOAT, $1:humidity_percent::INT,
-        $1:wind_speed_kmh::FLOAT, $1:precipitation_mm::FLOAT, $1:temp_fahrenheit::FLOAT,
-        $1:is_freezing::BOOLEAN, $1:latitude::FLOAT, $1:longitude::FLOAT,
-        SPLIT_PART(REGEXP_SUBSTR(METADATA$FILENAME, 'location=[^/]+'), '=', 2)::VARCHAR AS location,
-        SPLIT_PART(REGEXP_SUBSTR(METADATA$FILENAME, 'run_date=[^/]+'), '=', 2)::DATE AS run_date
-    FROM @my_s3_gold_stage/run_date={{ ds }}/
-);
-
--- 2a. Upsert Location Dimension
-MERGE INTO dim_location AS target
-USING (SELECT DISTINCT location, latitude, longitude FROM raw_weather_staging) AS source
-ON target.location_name = source.location
-WHEN NOT MATCHED THEN
-    INSERT (location_name, latitude, longitude)
-    VALUES (source.location, source.latitude, source.longitude);
+# --- Location Sharding ---
+# Ingestion fans out over chunks of PIPELINE_LOCATIONS (comma-separated, default Boston),
+# at most MAX_PARALLEL_INGEST containers at a time, then fans in to one Glue run and one load.
+# Each chunk is fetched with one multi-coordinate Open-Meteo request.
+PIPELINE_LOCATIONS = [
+    loc.strip() for loc in (env_vars.get("PIPELINE_LOCATIONS") or "Boston").split(",") if loc.strip()
+]
+LOCATION_CHUNK_SIZE = int(env_vars.get("LOCATION_CHUNK_SIZE") or 1)
+MAX_PARALLEL_INGEST = int(env_vars.get("MAX_PARALLEL_INGEST") or 4)
+
+LOCATION_CHUNKS = [
+    ",".join(PIPELINE_LOCATIONS[i:i + LOCATION_CHUNK_SIZE])
+    for i in range(0, len(PIPELINE_LOCATIONS), LOCATION_CHUNK_SIZE)
+]
+INGEST_COMMANDS = [
+    f'--run-date {{{{ ds }}}} --location "{chunk}" --batch-size {LOCATION_CHUNK_SIZE} --write-s3'
+    for chunk in LOCATION_CHUNKS
+]
 
--- 2b. Upsert Date Dimension
-MERGE INTO dim_date AS target
-USING (
-    SELECT DISTINCT
-        TO_DATE(time) AS date_value, YEAR(time) AS year, MONTH(time) AS month,
-        DAY(time) AS day, DAYOFWEEK(time) AS day_of_week,
-        CASE WHEN DAYOFWEEK(time) IN (0, 6) THEN TRUE ELSE FALSE END AS is_weekend
-    FROM raw_weather_staging
-) AS source
-ON target.date_value = source.date_value
-WHEN NOT MATCHED THEN
-    INSERT (date_value, year, month, day, day_of_week, is_weekend)
-    VALUES (source.date_value, source.year, source.month, source.day, source.day_of_week, source.is_weekend);
-
--- 3. Upsert Facts (Natural Key Match)
-MERGE INTO fact_weather_hourly AS target
-USING (
-    SELECT 
-        d.date_id, l.location_id, HOUR(r.time) AS hour, r.temp_celsius,
-        r.humidity_percent, r.precipitation_mm, r.wind_speed_kmh
-    FROM raw_weather_staging r
-    JOIN dim_date d ON d.date_value = TO_DATE(r.time)
-    JOIN dim_location l ON l.location_name = r.location
-) AS source
-ON target.date_id = source.date_id 
-   AND target.location_id = source.location_id 
-   AND target.hour = source.hour
-WHEN MATCHED THEN
-    UPDATE SET 
-        target.temp_celsius = source.temp_celsius, target.humidity_percent = source.humidity_percent,
-        target.precipitation_mm = source.precipitation_mm, target.wind_speed_kmh = source.wind_speed_kmh,
-        target.extraction_time = CURRENT_TIMESTAMP()
-WHEN NOT MATCHED THEN
-    INSERT (date_id, location_id, hour, temp_celsius, humidity_percent, precipitation_mm, wind_speed_kmh)
-    VALUES (source.date_id, source.location_id, source.hour, source.temp_celsius, source.humidity_percent, source.precipitation_mm, source.wind_speed_kmh);
-"""
+# --- Snowflake ELT ---
+# One COPY per run_date gold prefix (here only {{ ds }}) + dimension/fact MERGEs bounded to the staged dates
+SNOWFLAKE_LOAD_SQL = build_load_sql(["{{ ds }}"])
 
 # --- DAG Definition ---
 with DAG(
@@ -105,20 +63,20 @@ with DAG(
     tags=['portfolio', 'production'],
 ) as dag:
 
-    # Task 1: Python API Extraction
-    extract_to_s3 = DockerOperator(
+    # Task 1: Python API Extraction (one mapped container per location chunk)
+    extract_to_s3 = DockerOperator.partial(
         task_id='extract_to_bronze_silver',
         image='de-ingest:latest',
         api_version='auto',
         auto_remove='force',
-        command='--run-date {{ ds }} --location "Boston" --write-s3',
         docker_url='unix://var/run/docker.sock',
         network_mode='e2e-de_default',
         environment=env_vars,
-        mounts=[Mount(source=f"{HOST_PROJECT_PATH}/data", target="/app/data", type="bind")]
-    )
+        mounts=[Mount(source=f"{HOST_PROJECT_PATH}/data", target="/app/data", type="bind")],
+        max_active_tis_per_dagrun=MAX_PARALLEL_INGEST,
+    ).expand(command=INGEST_COMMANDS)
 
-    # Task 2: AWS Glue PySpark Transformation
+    # Task 2: AWS Glue PySpark Transformation (single run over every location of the day)
     transform_glue_gold = GlueJobOperator(
         task_id='transform_glue_gold',
         job_name='silver_to_gold_etl', 
@@ -131,7 +89,7 @@ with DAG(
         wait_for_completion=True,
     )
 
-    # Task 3: Snowflake Staging & Upserts
+    # Task 3: Snowflake Staging & Upserts (one COPY + MERGE for all locations)
     load_snowflake_warehouse = SnowflakeOperator(
         task_id='load_snowflake_warehouse',
         snowflake_conn_id='snowflake_default',
@@ -153,4 +111,5 @@ with DAG(
     )
 
     # --- Pipeline Orchestration Order ---
+    # all mapped ingestion tasks must succeed before the single Glue run starts
     extract_to_s3 >> transform_glue_gold >> load_snowflake_warehouse >> run_dbt_analytics
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Benchmark for the compact hourly fact layout against the row layout.
+
+Loads a synthetic silver tree into the Postgres warehouse (see
+benchmarks/bench_lake.py), then for each layout reports the on-disk size of
+the fact table (heap, TOAST and indexes) and times every analytics query in
+src/pipeline/warehouse/queries.py:
+- rows:    fact_weather_hourly, one row per location and hour
+- compact: fact_weather_daily, one row per location and day with 24-slot
+           arrays, read through the fact_weather_hourly_compact view
+           (sql/postgres/03_compact_facts.sql)
+
+Each query runs twice per layout, with the result cache cleared; the best
+time is reported. Needs the Docker Postgres from Block 2 (POSTGRES_* settings).
+
+Usage:
+    python -m benchmarks.bench_fact_layout --locations 20 --days 365
+    python -m benchmarks.bench_fact_layout --locations 20 --days 365 --filtered --report layout.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any
+
+from benchmarks.bench_lake import SQL_DIR, reload_postgres, time_queries, write_silver_tree
+
+
+def relation_size(table: str) -> int:
+    """
+    On-disk size of a table including TOAST and indexes.
+
+    Args:
+        table: Table name
+
+    Returns:
+        Size in bytes
+    """
+    from sqlalchemy import text
+
+    from src.pipeline.warehouse.queries import get_engine
+
+    with get_engine().connect() as conn:
+        return int(conn.execute(text("SELECT pg_total_relation_size(CAST(:table AS regclass))"), {"table": table}).scalar())
+
+
+def compact_facts() -> float:
+    """
+    Move the loaded hourly facts into the compact layout.
+
+    Returns:
+        Conversion time in seconds
+    """
+    from sqlalchemy import text
+
+    from src.pipeline.warehouse.queries import get_engine
+
+    start = time.perf_counter()
+    with get_engine().begin() as conn:
+        with open(os.path.join(SQL_DIR, "03_compact_facts.sql")) as f:
+            conn.execute(text(f.read()))
+        conn.execute(text("ANALYZE fact_weather_daily"))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the row and compact hourly fact layouts in Postgres")
+    parser.add_argument("--locations", type=int, default=20, help="Locations in the synthetic tree (default: 20)")
+    parser.add_argument("--days", type=int, default=365, help="Run dates in the synthetic tree (default: 365)")
+    parser.add_argument("--filtered", action="store_true", help="Query one location and one month instead of everything")
+    parser.add_argument("--report", help="Optional path for a JSON report")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    filters: dict[str, Any] = {}
+    if args.filtered:
+        filters = {"locations": ["Bench0000"], "start_date": "2025-03-01", "end_date": "2025-03-31"}
+
+    from src.pipeline.config import Project_Config
+    from src.pipeline.warehouse import queries
+
+    with tempfile.TemporaryDirectory() as tmp:
+        Project_Config.Paths.LOCAL_SILVER = os.path.join(tmp, "silver")
+        Project_Config.Paths.PARTITION_CATALOG = None
+        rows = write_silver_tree(Project_Config.Paths.LOCAL_SILVER, args.locations, args.days, forecast_days=1)
+        queries.set_engine(None)
+        reload_postgres(args.days)
+
+    report: dict[str, Any] = {"rows": rows, "filters": filters}
+    Project_Config.Database.FACT_LAYOUT = "rows"
+    report["rows_bytes"] = relation_size("fact_weather_hourly")
+    report["rows_ms"] = time_queries(filters)
+
+    report["compact_s"] = round(compact_facts(), 2)
+    Project_Config.Database.FACT_LAYOUT = "compact"
+    report["compact_bytes"] = relation_size("fact_weather_daily")
+    report["compact_ms"] = time_queries(filters)
+
+    print(f"hourly facts: {rows:,} rows")
+    print(f"rows layout:    {report['rows_bytes'] / 2**20:8.1f} MiB")
+    print(f"compact layout: {report['compact_bytes'] / 2**20:8.1f} MiB ({report['compact_s']:.2f}s to convert)")
+    print(f"{'query':<22} {'rows ms':>10} {'compact ms':>12}")
+    for name, rows_ms in report["rows_ms"].items():
+        print(f"{name:<22} {rows_ms:>10.1f} {report['compact_ms'][name]:>12.1f}")
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"report written to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Load test for the fetch path against the local fake Open-Meteo server.
+
+Drives `_run_fetch` (request -> retry/backoff -> bronze write) for many
+synthetic locations at each concurrency level and reports throughput and
+per-job latency. The fake server's latency and error injection stand in for
+the public API, so results are repeatable and need no network:
+- Jobs share one HTTP session sized to the worker count, as in batch mode
+- The shared rate limiter is lifted by default to measure raw throughput
+  (pass --max-calls-per-minute 600 to see the production ceiling)
+- The circuit breaker is reset between levels
+
+Usage:
+    python -m benchmarks.bench_fetch --jobs 200 --concurrency 1,4,16 --latency-ms 50
+    python -m benchmarks.bench_fetch --jobs 200 --error-rate 0.1 --errors 429,503,timeout --format flatbuffers
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from benchmarks.fake_openmeteo import ERROR_KINDS, FakeOpenMeteo
+
+RUN_DATE = "2026-01-25"
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def synthetic_locations(count: int) -> dict[str, dict]:
+    """
+    Build location lookup entries on a coarse grid over the continental US.
+
+    Args:
+        count: Number of locations
+
+    Returns:
+        Mapping of location name (Bench0000, ...) to latitude/longitude
+    """
+    return {
+        f"Bench{i:04d}": {"latitude": round(25 + (i % 25), 2), "longitude": round(-124 + (i // 25) % 58, 2)}
+        for i in range(count)
+    }
+
+
+def run_level(locations: list[str], concurrency: int, api: FakeOpenMeteo) -> dict[str, Any]:
+    """
+    Fetch every location once with a worker pool and measure it.
+
+    Project_Config must already point at the fake server and a scratch bronze path.
+
+    Args:
+        locations: Location names present in Project_Config.LOCATION_LOOKUP
+        concurrency: Worker threads (and pooled connections)
+        api: Running fake server, for request counts
+
+    Returns:
+        Report with jobs, failures, requests served, seconds, jobs/s and latency percentiles (ms)
+    """
+    from src.pipeline.batch import _build_session
+    from src.pipeline.ingest.fetch import _run_fetch
+    from src.pipeline.ingest.resilience import API_CIRCUIT_BREAKER
+
+    API_CIRCUIT_BREAKER.record_success()
+    session = _build_session(concurrency)
+    requests_before = api.requests
+    latencies: list[float] = []
+    failures: dict[str, int] = {}
+
+    def job(location: str) -> None:
+        start = time.perf_counter()
+        try:
+            _run_fetch(RUN_DATE, location, "openmeteo", session=session)
+        except Exception as e:
+            failures[type(e).__name__] = failures.get(type(e).__name__, 0) + 1
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(job, locations))
+    elapsed = time.perf_counter() - start
+    session.close()
+
+    return {
+        "concurrency": concurrency,
+        "jobs": len(locations),
+        "failed": sum(failures.values()),
+        "errors": failures,
+        "requests": api.requests - requests_before,
+        "seconds": round(elapsed, 3),
+        "jobs_per_second": round(len(locations) / elapsed, 1),
+        "p50_ms": round(_percentile(latencies, 50), 1),
+        "p95_ms": round(_percentile(latencies, 95), 1),
+        "p99_ms": round(_percentile(latencies, 99), 1),
+    }
+
+
+def run_load_test(
+    jobs: int,
+    concurrency_levels: list[int],
+    api: FakeOpenMeteo,
+    bronze_root: str,
+    response_format: str = "json",
+    max_calls_per_minute: Optional[float] = None,
+    max_retries: Optional[int] = None,
+) -> list[dict[str, Any]]:
+    """
+    Point the pipeline at a running fake server and measure each concurrency level.
+
+    Args:
+        jobs: Locations fetched per level
+        concurrency_levels: Worker counts to measure
+        api: Running fake server
+        bronze_root: Scratch directory for bronze files
+        response_format: 'json' or 'flatbuffers'
+        max_calls_per_minute: Shared rate limit (default: unlimited)
+        max_retries: Retries per request (default: Project_Config.API.MAX_RETRIES)
+
+    Returns:
+        One report per concurrency level (see run_level)
+    """
+    from src.pipeline.config import Project_Config
+    from src.pipeline.ingest.resilience import API_RATE_LIMITER
+
+    locations = synthetic_locations(jobs)
+    Project_Config.LOCATION_LOOKUP.update(locations)
+    Project_Config.Paths.LOCAL_BRONZE = bronze_root
+    Project_Config.Paths.PARTITION_CATALOG = None
+    Project_Config.API.OPEN_METEO_URL_TEMPLATE = api.url_template
+    Project_Config.API.RESPONSE_FORMAT = response_format
+    if max_retries is not None:
+        Project_Config.API.MAX_RETRIES = max_retries
+    API_RATE_LIMITER.rate = (max_calls_per_minute or 1e9) / 60
+    API_RATE_LIMITER.capacity = max(1.0, API_RATE_LIMITER.rate)
+
+    return [run_level(list(locations), concurrency, api) for concurrency in concurrency_levels]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the fetch path against a local fake Open-Meteo")
+    parser.add_argument("--jobs", type=int, default=200, help="Locations fetched per concurrency level (default: 200)")
+    parser.add_argument("--concurrency", default="1,4,16", help="Comma-separated worker counts (default: 1,4,16)")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Fake server latency per response (default: 50)")
+    parser.add_argument("--jitter-ms", type=float, default=10.0, help="Extra random latency of up to this many ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an injected error")
+    parser.add_argument(
+        "--errors", default="429,503",
+        help=f"Comma-separated injected errors, from {','.join(str(k) for k in ERROR_KINDS)} (default: 429,503)",
+    )
+    parser.add_argument("--hang-seconds", type=float, default=15.0, help="How long an injected timeout hangs")
+    parser.add_argument("--format", choices=["json", "flatbuffers"], default="json", help="API response format")
+    parser.add_argument("--max-calls-per-minute", type=float, default=None, help="Shared rate limit (default: unlimited)")
+    parser.add_argument("--max-retries", type=int, default=None, help="Retries per request (default: FETCH_MAX_RETRIES)")
+    parser.add_argument("--report", help="Optional path for a JSON report")
+    args = parser.parse_args()
+
+    # retry warnings and failed-job errors would drown the table
+    logging.disable(logging.CRITICAL)
+    error_kinds = tuple(kind if kind == "timeout" else int(kind) for kind in args.errors.split(","))
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp, FakeOpenMeteo(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        error_kinds=error_kinds, hang_seconds=args.hang_seconds,
+    ) as api:
+        results = run_load_test(
+            args.jobs, levels, api, os.path.join(tmp, "bronze"),
+            response_format=args.format, max_calls_per_minute=args.max_calls_per_minute, max_retries=args.max_retries,
+        )
+
+    print(f"{'workers':>7} {'jobs/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'requests':>8} {'failed':>6}")
+    for r in results:
+        print(
+            f"{r['concurrency']:>7} {r['jobs_per_second']:>8.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+            f"{r['p99_ms']:>8.1f} {r['requests']:>8} {r['failed']:>6}"
+        )
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"report written to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
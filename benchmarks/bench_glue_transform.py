@@ -0,0 +1,97 @@
+"""
+Local benchmark for the silver -> gold Spark transform.
+
+Generates a synthetic hive-partitioned silver dataset, then times the
+legacy two-scan reconciliation (uncached count on silver and gold) against
+the cached single-scan path used by spark/glue_job.py. Both paths do the same
+work (read, transform, reconcile, gold write). Each runs once untimed to warm
+up the JVM and the file cache, then --repeats times in alternating order,
+and the median is reported.
+
+Requires pyspark and a local Java runtime.
+
+Usage:
+    python -m benchmarks.bench_glue_transform --locations 50 --hours 24 --repeats 5
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from spark.glue_job import create_local_spark_session, run_silver_to_gold, transform_silver_to_gold
+
+
+def _write_synthetic_silver(root: str, run_date: str, locations: int, hours: int) -> int:
+    """Write one weather_data.parquet per synthetic location under root/run_date=.../location=..."""
+    rng = np.random.default_rng(42)
+    times = pd.date_range(f"{run_date}T00:00", periods=hours, freq="h")
+    for i in range(locations):
+        df = pd.DataFrame({
+            "time": times,
+            "temperature_2m": rng.normal(5, 8, hours).round(1),
+            "relative_humidity_2m": rng.integers(20, 100, hours),
+            "precipitation": rng.exponential(0.3, hours).round(1),
+            "wind_speed_10m": rng.gamma(2, 5, hours).round(1),
+            "latitude": 40 + i * 0.01,
+            "longitude": -70 - i * 0.01,
+        })
+        path = os.path.join(root, f"run_date={run_date}", f"location=City{i:05d}")
+        os.makedirs(path, exist_ok=True)
+        df.to_parquet(os.path.join(path, "weather_data.parquet"), index=False)
+    return locations * hours
+
+
+def _run_legacy(spark, run_date: str, silver_root: str, gold_root: str) -> int:
+    """The pre-cache job: each count() re-reads silver from storage, then the gold write scans it again."""
+    raw_df = spark.read.parquet(f"{silver_root}/run_date={run_date}/")
+    record_count = raw_df.count()
+    curated_df = transform_silver_to_gold(raw_df, run_date)
+    if curated_df.count() != record_count:
+        raise ValueError("Silver and gold record counts differ")
+    curated_df.write.mode("overwrite").partitionBy("run_date", "location").parquet(gold_root)
+    return record_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the silver -> gold Spark transform locally")
+    parser.add_argument("--locations", type=int, default=50, help="Number of synthetic locations")
+    parser.add_argument("--hours", type=int, default=24, help="Hourly rows per location")
+    parser.add_argument("--run-date", default="2026-01-25", help="Partition date to generate")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per path (default: 5)")
+    args = parser.parse_args()
+
+    spark = create_local_spark_session("bench_silver_to_gold")
+    spark.sparkContext.setLogLevel("ERROR")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        silver_root = os.path.join(tmp, "silver")
+        rows = _write_synthetic_silver(silver_root, args.run_date, args.locations, args.hours)
+        paths = {
+            "legacy": lambda: _run_legacy(spark, args.run_date, silver_root, os.path.join(tmp, "gold-legacy")),
+            "single": lambda: run_silver_to_gold(spark, args.run_date, silver_root, os.path.join(tmp, "gold-single")),
+        }
+        for run in paths.values():
+            run()
+
+        timings: dict[str, list[float]] = {name: [] for name in paths}
+        for repeat in range(args.repeats):
+            # alternate which path goes first, so neither always runs on a warmer cache
+            order = list(paths) if repeat % 2 == 0 else list(reversed(paths))
+            for name in order:
+                start = time.perf_counter()
+                paths[name]()
+                timings[name].append(time.perf_counter() - start)
+
+    print(f"rows={rows} files={args.locations} repeats={args.repeats} (median, after one warm-up run each)")
+    print(f"legacy two-scan reconciliation + gold write: {statistics.median(timings['legacy']):.3f}s")
+    print(f"single-scan reconciliation + gold write:     {statistics.median(timings['single']):.3f}s")
+    spark.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Benchmark for the embedded lake engine against the Postgres warehouse path.
+
+Writes a synthetic hive-partitioned silver tree, then times every analytics
+query in src/pipeline/warehouse/queries.py:
+- lake:     embedded DuckDB straight over the Parquet partitions (LakeEngine)
+- postgres: the warehouse path, i.e. a full reload (01_create_tables.sql,
+            raw_weather via to_sql like load.py, 02_populate_tables.sql)
+            followed by the same queries over SQLAlchemy
+
+Each query runs twice per engine, with the result cache cleared; the best
+time is reported. The reload is timed separately, since it is what the lake
+path avoids. The Postgres path runs only with --postgres and needs the
+Docker Postgres from Block 2 (POSTGRES_* settings).
+
+Usage:
+    python -m benchmarks.bench_lake --locations 20 --days 365
+    python -m benchmarks.bench_lake --locations 20 --days 365 --postgres --filtered
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+SQL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sql", "postgres")
+
+
+def write_silver_tree(silver_root: str, locations: int, days: int, forecast_days: int, seed: int = 0) -> int:
+    """
+    Write one silver partition per run_date and location, each holding a forecast_days hourly forecast.
+
+    Args:
+        silver_root: LOCAL_SILVER_PATH to write under
+        locations: Number of locations (Bench0000, ...)
+        days: Number of consecutive run_dates, starting 2025-01-01
+        forecast_days: Days of hourly rows per partition
+        seed: Random seed
+
+    Returns:
+        Total rows written
+    """
+    rng = np.random.default_rng(seed)
+    hours = forecast_days * 24
+    first = date(2025, 1, 1)
+    for day in range(days):
+        run_date = (first + timedelta(days=day)).isoformat()
+        times = pd.date_range(f"{run_date}T00:00", periods=hours, freq="h")
+        for i in range(locations):
+            partition_dir = os.path.join(silver_root, "source=openmeteo", f"run_date={run_date}", f"location=Bench{i:04d}")
+            os.makedirs(partition_dir, exist_ok=True)
+            pd.DataFrame({
+                "time": times,
+                "temperature_2m": np.round(10 + 12 * np.sin(np.arange(hours) / 24 * 2 * np.pi) + rng.normal(0, 3, hours), 1),
+                "relative_humidity_2m": rng.integers(20, 100, hours),
+                "precipitation": np.round(np.maximum(rng.normal(-1, 1.5, hours), 0), 1),
+                "wind_speed_10m": np.round(rng.gamma(2, 6, hours), 1),
+                "latitude": 25.0 + i % 25,
+                "longitude": -124.0 + i // 25,
+            }).to_parquet(os.path.join(partition_dir, "weather_data.parquet"), index=False)
+    return days * locations * hours
+
+
+def _best_time(run: Callable[[], Any], repeats: int = 2) -> float:
+    """Best wall time of run() in ms, clearing the analytics cache before each call."""
+    from src.pipeline.warehouse.queries import RESULT_CACHE
+
+    best = float("inf")
+    for _ in range(repeats):
+        RESULT_CACHE.clear()
+        start = time.perf_counter()
+        run()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def time_queries(filters: dict[str, Any]) -> dict[str, float]:
+    """
+    Time every analytics query on the engine currently set in the query layer.
+
+    Args:
+        filters: locations/start_date/end_date passed to each query
+
+    Returns:
+        Mapping of query name to best time in ms
+    """
+    from src.pipeline.warehouse.queries import QUERIES
+
+    return {name: round(_best_time(lambda: query(**filters)), 1) for name, query in QUERIES.items()}
+
+
+def reload_postgres(days: int) -> float:
+    """
+    Rebuild the Postgres star schema from the whole silver tree, as the warehouse path requires.
+
+    Args:
+        days: Number of run_dates in the tree
+
+    Returns:
+        Reload time in seconds
+    """
+    from sqlalchemy import text
+
+    from src.pipeline.io.dataset import read_silver
+    from src.pipeline.transform.features import add_hourly_features
+    from src.pipeline.warehouse.queries import get_engine
+
+    engine = get_engine()
+    start = time.perf_counter()
+    last = (date(2025, 1, 1) + timedelta(days=days - 1)).isoformat()
+    df = read_silver("2025-01-01", last).to_pandas()
+    df = add_hourly_features(df, "temperature_2m", "precipitation")
+    df["source"] = "openmeteo"
+    with engine.begin() as conn:
+        with open(os.path.join(SQL_DIR, "01_create_tables.sql")) as f:
+            conn.execute(text(f.read()))
+    df.to_sql("raw_weather", con=engine, if_exists="append", index=False, method="multi", chunksize=10_000)
+    with engine.begin() as conn:
+        with open(os.path.join(SQL_DIR, "02_populate_tables.sql")) as f:
+            conn.execute(text(f.read()))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare analytics on the Parquet lake (DuckDB) with the Postgres warehouse")
+    parser.add_argument("--locations", type=int, default=20, help="Locations in the synthetic tree (default: 20)")
+    parser.add_argument("--days", type=int, default=365, help="Run dates in the synthetic tree (default: 365)")
+    parser.add_argument("--forecast-days", type=int, default=1, help="Days of hourly rows per partition (default: 1)")
+    parser.add_argument("--filtered", action="store_true", help="Query one location and one month instead of everything")
+    parser.add_argument("--postgres", action="store_true", help="Also reload and query the Postgres warehouse")
+    parser.add_argument("--threads", type=int, default=None, help="DuckDB worker threads (default: every core)")
+    parser.add_argument("--report", help="Optional path for a JSON report")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    filters: dict[str, Any] = {}
+    if args.filtered:
+        filters = {"locations": ["Bench0000"], "start_date": "2025-03-01", "end_date": "2025-03-31"}
+
+    from src.pipeline.config import Project_Config
+    from src.pipeline.warehouse import queries
+    from src.pipeline.warehouse.lake import LakeEngine
+
+    with tempfile.TemporaryDirectory() as tmp:
+        Project_Config.Paths.LOCAL_SILVER = os.path.join(tmp, "silver")
+        Project_Config.Paths.PARTITION_CATALOG = None
+        start = time.perf_counter()
+        rows = write_silver_tree(Project_Config.Paths.LOCAL_SILVER, args.locations, args.days, args.forecast_days)
+        print(f"silver tree: {rows:,} rows in {args.days * args.locations:,} partitions ({time.perf_counter() - start:.1f}s to write)")
+
+        queries.set_engine(LakeEngine("silver", threads=args.threads, lookback_days=args.forecast_days - 1))
+        report: dict[str, Any] = {"rows": rows, "filters": filters, "lake_ms": time_queries(filters)}
+
+        if args.postgres:
+            queries.set_engine(None)
+            report["postgres_reload_s"] = round(reload_postgres(args.days), 2)
+            report["postgres_ms"] = time_queries(filters)
+            print(f"postgres reload: {report['postgres_reload_s']:.2f}s")
+
+    print(f"{'query':<22} {'lake ms':>10} {'postgres ms':>12}")
+    for name, lake_ms in report["lake_ms"].items():
+        postgres_ms = report.get("postgres_ms", {}).get(name)
+        print(f"{name:<22} {lake_ms:>10.1f} {postgres_ms if postgres_ms is not None else '-':>12}")
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"report written to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Peak-memory benchmark for bronze -> silver normalization.
+
+Writes a synthetic multi-month bronze payload, then runs each mode in a fresh
+interpreter and reports its absolute peak RSS:
+- parse:     json.load of the payload only, the floor of both JSON modes
+- whole:     one DataFrame for the full hourly dict, written in one shot
+- streaming: fixed-size chunks appended as Parquet row groups (run_normalize)
+
+The JSON path parses the whole payload into Python lists before chunking,
+so its peak still grows with the payload: streaming only removes the
+full-size DataFrame and Parquet buffers on top of the parse. Bronze raw.arrow
+payloads are the path whose peak is bounded by the chunk size.
+
+Usage:
+    python -m benchmarks.bench_normalize --hours 2000000 --chunk-rows 50000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+RUN_DATE = "2026-01-25"
+
+_CHILD = """
+import json, resource, sys
+from src.pipeline.config import Project_Config
+from src.pipeline.ingest.normalize import _normalize_data, run_normalize
+from src.pipeline.io.local import save_parquet_local
+
+mode, chunk_rows, bronze_file = sys.argv[1], int(sys.argv[2]), sys.argv[3]
+if mode == "parse":
+    with open(bronze_file) as f:
+        data = json.load(f)
+elif mode == "whole":
+    with open(bronze_file) as f:
+        data = json.load(f)
+    save_parquet_local(_normalize_data(data), Project_Config.Paths.silver_path("openmeteo", "{run_date}", "Bench") + "/weather_data.parquet")
+else:
+    run_normalize("{run_date}", "Bench", chunk_rows=chunk_rows)
+
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def _write_bronze(bronze_root: str, hours: int) -> str:
+    """Write a synthetic Open-Meteo payload with `hours` hourly rows and return its path."""
+    rng = np.random.default_rng(42)
+    times = pd.date_range("2020-01-01T00:00", periods=hours, freq="h").strftime("%Y-%m-%dT%H:%M")
+    payload = {
+        "latitude": 42.36, "longitude": -71.06,
+        "hourly": {
+            "time": times.tolist(),
+            "temperature_2m": rng.normal(5, 8, hours).round(1).tolist(),
+            "relative_humidity_2m": rng.integers(20, 100, hours).tolist(),
+            "precipitation": rng.exponential(0.3, hours).round(1).tolist(),
+            "wind_speed_10m": rng.gamma(2, 5, hours).round(1).tolist(),
+        },
+    }
+    path = os.path.join(bronze_root, "source=openmeteo", f"run_date={RUN_DATE}", "location=Bench", "raw.json")
+    os.makedirs(os.path.dirname(path))
+    with open(path, "w") as f:
+        json.dump(payload, f)
+    return path
+
+
+def measure(mode: str, chunk_rows: int, bronze_file: str, env: dict) -> float:
+    """
+    Run one mode in a fresh interpreter and measure its peak RSS.
+
+    Args:
+        mode: 'parse', 'whole' or 'streaming'
+        chunk_rows: Rows per chunk for the streaming mode
+        bronze_file: Path to the bronze payload
+        env: Environment with the lake paths set
+
+    Returns:
+        Absolute peak RSS of the process, in MiB
+    """
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD.replace("{run_date}", RUN_DATE), mode, str(chunk_rows), bronze_file],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    # ru_maxrss is in KiB on Linux
+    return int(out.split()[-1]) / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare peak memory of JSON parsing, whole and streaming normalization")
+    parser.add_argument("--hours", type=int, default=2_000_000, help="Hourly rows in the payload (default: 2,000,000)")
+    parser.add_argument("--chunk-rows", type=int, default=50_000, help="Rows per streaming chunk (default: 50,000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bronze_file = _write_bronze(os.path.join(tmp, "bronze"), args.hours)
+        env = {
+            **os.environ,
+            "LOCAL_BRONZE_PATH": os.path.join(tmp, "bronze"),
+            "LOCAL_SILVER_PATH": os.path.join(tmp, "silver"),
+            "PYTHONPATH": os.getcwd(),
+        }
+        print(f"payload: {args.hours} rows, {os.path.getsize(bronze_file) / 2**20:.1f} MiB of JSON")
+        for mode in ("parse", "whole", "streaming"):
+            print(f"{mode:>9}: peak RSS {measure(mode, args.chunk_rows, bronze_file, env):.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
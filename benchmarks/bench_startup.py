@@ -0,0 +1,161 @@
+"""
+Cold-start benchmark for the de-ingest CLI.
+
+Every Airflow run starts a fresh container, so interpreter start + imports
+are paid per location per day. This measures two numbers against a budget:
+- Import time of src.pipeline.run, from `python -X importtime`
+- Time from process spawn to the first HTTP request reaching the API, using
+  a local stand-in server so no network is involved
+
+Exits non-zero when a budget is exceeded, so it can gate CI.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --runs 10 --import-budget-ms 200
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+IMPORT_BUDGET_MS = 250
+FIRST_REQUEST_BUDGET_MS = 800
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "boto3", "botocore", "sqlalchemy")
+
+
+def measure_import(module: str = "src.pipeline.run") -> tuple[float, list[tuple[float, str]]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module: Dotted module name to import
+
+    Returns:
+        Tuple of (cumulative import ms of the module, 10 heaviest (ms, dependency) by cumulative time)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # importtime indents nested imports by two spaces per level after the separator space
+        rows.append((int(cumulative) / 1000, name[1:].rstrip()))
+
+    total = next(ms for ms, name in reversed(rows) if name == module)
+    heaviest = [(ms, name.strip()) for ms, name in rows if name.strip() != module]
+    return total, sorted(heaviest, reverse=True)[:10]
+
+
+def loaded_heavy_modules(module: str = "src.pipeline.run") -> list[str]:
+    """
+    List heavy dependencies that get imported as a side effect of importing a module.
+
+    Args:
+        module: Dotted module name to import
+
+    Returns:
+        Names from HEAVY_MODULES present in sys.modules afterwards
+    """
+    code = f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return [name for name in out.strip().split(",") if name]
+
+
+class _FirstRequestHandler(BaseHTTPRequestHandler):
+    """Records when each request arrives and answers 503 so the CLI exits quickly."""
+
+    arrivals: list[float] = []
+
+    def do_GET(self):
+        type(self).arrivals.append(time.perf_counter())
+        self.send_response(503)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def measure_first_request(runs: int) -> list[float]:
+    """
+    Spawn the CLI against a local server and time spawn -> first request.
+
+    Args:
+        runs: Number of cold starts to measure
+
+    Returns:
+        Milliseconds to first request for each run
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FirstRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    timings = []
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "OPEN_METEO_URL_TEMPLATE": f"http://127.0.0.1:{port}/v1/forecast?latitude={{lat}}&longitude={{lon}}",
+            "LOCAL_BRONZE_PATH": os.path.join(tmp, "bronze"),
+            "LOCAL_SILVER_PATH": os.path.join(tmp, "silver"),
+            "AWS_BUCKET_NAME": os.environ.get("AWS_BUCKET_NAME", "bench-bucket"),
+            "AWS_REGION": os.environ.get("AWS_REGION", "us-east-2"),
+            # the stand-in server answers 503; exit on the first one instead of backing off
+            "FETCH_MAX_RETRIES": "0",
+        }
+        for _ in range(runs):
+            _FirstRequestHandler.arrivals.clear()
+            start = time.perf_counter()
+            # cwd=tmp keeps pipeline.log out of the repo, PYTHONPATH lets `src` resolve
+            subprocess.run(
+                [sys.executable, "-m", "src.pipeline.run", "--run-date", "2026-01-25", "--location", "Boston"],
+                env={**env, "PYTHONPATH": os.getcwd()}, cwd=tmp, capture_output=True,
+            )
+            if _FirstRequestHandler.arrivals:
+                timings.append((_FirstRequestHandler.arrivals[0] - start) * 1000)
+
+    server.shutdown()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure de-ingest cold start against a budget")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per measurement (default: 5)")
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--first-request-budget-ms", type=float, default=FIRST_REQUEST_BUDGET_MS)
+    args = parser.parse_args()
+
+    import_times = []
+    for _ in range(args.runs):
+        total, top = measure_import()
+        import_times.append(total)
+    import_ms = statistics.median(import_times)
+
+    print(f"import src.pipeline.run: median {import_ms:.1f} ms (budget {args.import_budget_ms:.0f} ms)")
+    for ms, name in top:
+        print(f"    {ms:8.1f} ms  {name}")
+
+    heavy = loaded_heavy_modules()
+    print(f"heavy modules loaded at import: {', '.join(heavy) or 'none'}")
+
+    first_request = measure_first_request(args.runs)
+    if not first_request:
+        print("first request: no request reached the local server")
+        sys.exit(1)
+    first_request_ms = statistics.median(first_request)
+    print(f"spawn -> first API request: median {first_request_ms:.1f} ms (budget {args.first_request_budget_ms:.0f} ms)")
+
+    over_budget = import_ms > args.import_budget_ms or first_request_ms > args.first_request_budget_ms
+    sys.exit(1 if over_budget or heavy else 0)
+
+
+if __name__ == "__main__":
+    main()
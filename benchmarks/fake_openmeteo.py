@@ -0,0 +1,409 @@
+"""
+Local stand-in for the Open-Meteo forecast API.
+
+Serves schema-correct responses for any coordinates and date range, so the
+fetch path can be load-tested and regression-tested without the public API:
+- JSON, or FlatBuffers with `format=flatbuffers` (size-prefixed WeatherApiResponse messages)
+- Comma-separated latitude/longitude lists return one result per coordinate
+- Deterministic hourly values for any `hourly=` variables, from start_date/end_date
+  (default: today plus 6 days, like the real API)
+- Configurable latency (fixed + jitter) and error injection: 429 with
+  Retry-After, 5xx, or 'timeout' (the connection hangs, then closes unanswered)
+- Request and per-status counters for assertions and reports
+
+Usage:
+    python -m benchmarks.fake_openmeteo --port 8080 --latency-ms 50 --error-rate 0.05
+
+    with FakeOpenMeteo(latency_ms=20, error_rate=0.1) as api:
+        os.environ["OPEN_METEO_URL_TEMPLATE"] = api.url_template
+"""
+
+import argparse
+import json
+import math
+import random
+import struct
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Union
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_HOURLY = "temperature_2m,relative_humidity_2m,precipitation,wind_speed_10m"
+ERROR_KINDS = (429, 500, 502, 503, 504, "timeout")
+
+# Units the real API reports, for hourly_units
+_UNITS = {
+    "temperature_2m": "°C",
+    "relative_humidity_2m": "%",
+    "precipitation": "mm",
+    "wind_speed_10m": "km/h",
+}
+# FlatBuffers Variable enum codes for the default variables (0 = undefined)
+_VARIABLE_CODES = {"temperature_2m": 47, "relative_humidity_2m": 29, "precipitation": 24, "wind_speed_10m": 59}
+_INTEGER_VARIABLES = {"relative_humidity_2m"}
+
+
+class FlatBuilder:
+    """
+    Minimal FlatBuffers writer laying out tables front to back.
+
+    Offset fields always point forward, so each parent is written before its
+    children and patched with `point` once the child's position is known.
+    """
+
+    def __init__(self):
+        # first 4 bytes hold the root table offset
+        self.buf = bytearray(4)
+
+    def table(self, scalars: dict, offsets: tuple = ()) -> tuple[int, dict]:
+        """
+        Write a vtable and its table.
+
+        Args:
+            scalars: Mapping of slot to (struct format, value)
+            offsets: Slots of offset fields (tables, vectors, strings) to patch later
+
+        Returns:
+            Tuple of (table position, mapping of offset slot to its field position)
+        """
+        body, slots, size = bytearray(), {}, 4
+        for slot, (fmt, value) in scalars.items():
+            slots[slot] = size
+            body += struct.pack(f"<{fmt}", value)
+            size += struct.calcsize(fmt)
+        for slot in offsets:
+            slots[slot] = size
+            body += bytes(4)
+            size += 4
+        count = max(slots) + 1
+        vtable_pos = len(self.buf)
+        self.buf += struct.pack(f"<HH{count}H", 4 + 2 * count, size, *(slots.get(i, 0) for i in range(count)))
+        table_pos = len(self.buf)
+        self.buf += struct.pack("<i", table_pos - vtable_pos) + body
+        return table_pos, {slot: table_pos + slots[slot] for slot in offsets}
+
+    def point(self, at: int, target: int) -> None:
+        """Patch the offset field at `at` to reference `target`."""
+        struct.pack_into("<I", self.buf, at, target - at)
+
+    def vector(self, fmt: str, values: list) -> int:
+        """Write a vector of scalars and return its position."""
+        pos = len(self.buf)
+        self.buf += struct.pack(f"<I{len(values)}{fmt}", len(values), *values)
+        return pos
+
+    def string(self, value: str) -> int:
+        """Write a null-terminated string and return its position."""
+        pos = len(self.buf)
+        encoded = value.encode("utf-8")
+        self.buf += struct.pack("<I", len(encoded)) + encoded + b"\0"
+        return pos
+
+
+def encode_message(
+    latitude: float,
+    longitude: float,
+    location_id: int,
+    start: int,
+    columns: dict[str, list],
+    utc_offset_seconds: int = 0,
+    interval: int = 3600,
+) -> bytes:
+    """
+    Encode one size-prefixed WeatherApiResponse message with an hourly block.
+
+    Args:
+        latitude: Grid latitude
+        longitude: Grid longitude
+        location_id: Index of the coordinate in the request
+        start: First hour as Unix seconds (UTC)
+        columns: Variable name to hourly values, in request order
+        utc_offset_seconds: Offset of the requested timezone
+        interval: Seconds between values
+
+    Returns:
+        Message bytes, including the 4-byte size prefix
+    """
+    b = FlatBuilder()
+    hours = len(next(iter(columns.values()), []))
+    root, root_fields = b.table(
+        {0: ("f", latitude), 1: ("f", longitude), 2: ("f", 5.0), 3: ("f", 0.1),
+         4: ("q", location_id), 6: ("i", utc_offset_seconds)},
+        offsets=(7, 8, 11),
+    )
+    b.point(0, root)
+    b.point(root_fields[7], b.string("GMT"))
+    b.point(root_fields[8], b.string("GMT"))
+
+    hourly, hourly_fields = b.table(
+        {0: ("q", start), 1: ("q", start + interval * hours), 2: ("i", interval)}, offsets=(3,)
+    )
+    b.point(root_fields[11], hourly)
+    elements = b.vector("I", [0] * len(columns))
+    b.point(hourly_fields[3], elements)
+    for i, (name, values) in enumerate(columns.items()):
+        variable, variable_fields = b.table({0: ("B", _VARIABLE_CODES.get(name, 0)), 5: ("h", 2)}, offsets=(3,))
+        b.point(elements + 4 + 4 * i, variable)
+        b.point(variable_fields[3], b.vector("f", values))
+    return struct.pack("<I", len(b.buf)) + bytes(b.buf)
+
+
+def _hourly_values(name: str, latitude: float, longitude: float, hours: int, start: int) -> list:
+    """Deterministic, plausible values for one variable at one coordinate."""
+    seed = (latitude * 7.0 + longitude * 3.0) % 24
+    values = []
+    for i in range(hours):
+        phase = math.sin(2 * math.pi * ((start // 3600 + i + seed) % 24) / 24)
+        if name in _INTEGER_VARIABLES:
+            values.append(int(60 + 30 * phase))
+        elif name == "precipitation":
+            values.append(round(max(0.0, 2 * phase - 1.2), 1))
+        else:
+            values.append(round(10 + 10 * phase - latitude / 10, 1))
+    return values
+
+
+class _FakeOpenMeteoServer(ThreadingHTTPServer):
+    """HTTP server holding the fake API's configuration and counters."""
+
+    daemon_threads = True
+    owner: "FakeOpenMeteo"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answers /v1/forecast requests for the owning FakeOpenMeteo."""
+
+    server: _FakeOpenMeteoServer
+
+    def do_GET(self):
+        api = self.server.owner
+        error = api._next_outcome()
+        api._sleep_latency()
+
+        if error == "timeout":
+            api._count("timeout")
+            time.sleep(api.hang_seconds)
+            # close without a status line: the client sees a timeout or a dropped connection
+            self.close_connection = True
+            return
+        if error is not None:
+            api._count(error)
+            body = json.dumps({"error": True, "reason": f"Injected HTTP {error}"}).encode()
+            self.send_response(int(error))
+            if error == 429:
+                self.send_header("Retry-After", str(api.retry_after_seconds))
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        try:
+            body, content_type = api.render(self.path)
+        except ValueError as e:
+            api._count(400)
+            body, content_type = json.dumps({"error": True, "reason": str(e)}).encode(), "application/json"
+            self.send_response(400)
+        else:
+            api._count(200)
+            self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeOpenMeteo:
+    """
+    Local fake of the Open-Meteo forecast endpoint running on a background thread.
+    """
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_kinds: tuple = (429, 503),
+        script: Optional[list[Union[int, str]]] = None,
+        hang_seconds: float = 15.0,
+        retry_after_seconds: int = 0,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            port: Port to listen on (0 picks a free one)
+            latency_ms: Fixed delay before every response
+            jitter_ms: Extra uniform random delay of up to this many milliseconds
+            error_rate: Probability that a request gets an injected error
+            error_kinds: Errors to draw from: HTTP statuses and/or 'timeout'
+            script: Outcomes for the first requests in order (an int status, 'timeout' or 200)
+            hang_seconds: How long a 'timeout' request hangs before the connection closes
+            retry_after_seconds: Retry-After value sent with 429 responses
+            seed: Seed for latency jitter and error draws
+        """
+        unknown = [kind for kind in error_kinds if kind not in ERROR_KINDS]
+        if unknown:
+            raise ValueError(f"Unsupported error kinds: {unknown}. Expected some of {ERROR_KINDS}")
+        self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_kinds = tuple(error_kinds)
+        self.script = list(script or [])
+        self.hang_seconds = hang_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.counts: Counter = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[_FakeOpenMeteoServer] = None
+
+    @property
+    def url(self) -> str:
+        """Base forecast URL of the running server."""
+        if self._server is None:
+            raise RuntimeError("FakeOpenMeteo is not running")
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1/forecast"
+
+    @property
+    def url_template(self) -> str:
+        """Value for OPEN_METEO_URL_TEMPLATE pointing at this server."""
+        return f"{self.url}?latitude={{lat}}&longitude={{lon}}&hourly={DEFAULT_HOURLY}"
+
+    @property
+    def requests(self) -> int:
+        """Requests received so far."""
+        return sum(self.counts.values())
+
+    def start(self) -> "FakeOpenMeteo":
+        """Start serving on a background thread."""
+        self._server = _FakeOpenMeteoServer(("127.0.0.1", self.port), _Handler)
+        self._server.owner = self
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeOpenMeteo":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _count(self, outcome: Union[int, str]) -> None:
+        with self._lock:
+            self.counts[outcome] += 1
+
+    def _next_outcome(self) -> Optional[Union[int, str]]:
+        """Injected error for the next request, or None to answer normally."""
+        with self._lock:
+            if self.script:
+                outcome = self.script.pop(0)
+                return None if outcome == 200 else outcome
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self._random.choice(self.error_kinds)
+        return None
+
+    def _sleep_latency(self) -> None:
+        with self._lock:
+            delay = self.latency_ms + self._random.uniform(0, self.jitter_ms)
+        if delay:
+            time.sleep(delay / 1000)
+
+    def render(self, path: str) -> tuple[bytes, str]:
+        """
+        Build the response body for a request path.
+
+        Args:
+            path: Request path with query string
+
+        Returns:
+            Tuple of (body, content type)
+
+        Raises:
+            ValueError: If coordinates or dates are missing or malformed
+        """
+        query = parse_qs(urlsplit(path).query)
+        try:
+            latitudes = [float(v) for v in query["latitude"][0].split(",")]
+            longitudes = [float(v) for v in query["longitude"][0].split(",")]
+        except (KeyError, ValueError):
+            raise ValueError("Parameter 'latitude' and 'longitude' must be comma-separated numbers")
+        if len(latitudes) != len(longitudes):
+            raise ValueError("Parameter 'latitude' and 'longitude' must have the same number of elements")
+
+        today = date.today()
+        start_date = date.fromisoformat(query.get("start_date", [today.isoformat()])[0])
+        end_date = date.fromisoformat(query.get("end_date", [(today + timedelta(days=6)).isoformat()])[0])
+        if end_date < start_date:
+            raise ValueError("Parameter 'end_date' must not be before 'start_date'")
+        variables = [v for value in query.get("hourly", []) for v in value.split(",") if v]
+        start = int(datetime(start_date.year, start_date.month, start_date.day, tzinfo=timezone.utc).timestamp())
+        hours = ((end_date - start_date).days + 1) * 24
+
+        if query.get("format") == ["flatbuffers"]:
+            return b"".join(
+                encode_message(
+                    latitude, longitude, location_id, start,
+                    {name: _hourly_values(name, latitude, longitude, hours, start) for name in variables},
+                )
+                for location_id, (latitude, longitude) in enumerate(zip(latitudes, longitudes))
+            ), "application/octet-stream"
+
+        times = [
+            (datetime.fromtimestamp(start, tz=timezone.utc) + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M")
+            for i in range(hours)
+        ]
+        results = []
+        for location_id, (latitude, longitude) in enumerate(zip(latitudes, longitudes)):
+            result = {
+                "latitude": latitude, "longitude": longitude,
+                "generationtime_ms": 0.1, "utc_offset_seconds": 0,
+                "timezone": "GMT", "timezone_abbreviation": "GMT", "elevation": 5.0,
+                "hourly_units": {"time": "iso8601", **{name: _UNITS.get(name, "") for name in variables}},
+                "hourly": {"time": times, **{
+                    name: _hourly_values(name, latitude, longitude, hours, start) for name in variables
+                }},
+            }
+            if len(latitudes) > 1:
+                result["location_id"] = location_id
+            results.append(result)
+        payload = results if len(results) > 1 else results[0]
+        return json.dumps(payload).encode(), "application/json"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a local fake of the Open-Meteo forecast API")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on (default: 8080)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fixed delay per response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra random delay of up to this many ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an injected error")
+    parser.add_argument(
+        "--errors", default="429,503",
+        help=f"Comma-separated injected errors, from {','.join(str(k) for k in ERROR_KINDS)} (default: 429,503)",
+    )
+    args = parser.parse_args()
+
+    error_kinds = tuple(kind if kind == "timeout" else int(kind) for kind in args.errors.split(","))
+    api = FakeOpenMeteo(args.port, args.latency_ms, args.jitter_ms, args.error_rate, error_kinds).start()
+    print(f"Fake Open-Meteo listening on {api.url}")
+    print(f"OPEN_METEO_URL_TEMPLATE={api.url_template}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        api.stop()
+
+
+if __name__ == "__main__":
+    main()
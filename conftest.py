@@ -0,0 +1,15 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def spark():
+    """Local SparkSession shared by the test run, skipped when pyspark or Java is unavailable."""
+    pytest.importorskip("pyspark")
+    from spark.glue_job import create_local_spark_session
+
+    try:
+        session = create_local_spark_session("pytest", master="local[1]")
+    except Exception as e:
+        pytest.skip(f"Local Spark unavailable: {e}")
+    yield session
+    session.stop()
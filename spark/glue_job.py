@@ -2,115 +2,280 @@
 AWS Glue/Spark ETL script for the e2e-de pipeline.
 
 Loads cleaned silver data for the supplied run_date from S3, renames
-columns, casts types, derives metrics, checks that row counts
-are unchanged, and writes parquet to the gold prefix partitioned by
+columns, casts types, derives metrics and the hourly time-series features
+(with lead-in from the previous run_date), checks that row counts are
+unchanged, and writes parquet to the gold prefix partitioned by
 run_date & location.
 
-Expected arguments: JOB_NAME, run_date, silver_bucket_prefix,
+The transform itself lives in importable functions that only need a plain
+SparkSession, so the same logic can be run and profiled locally:
+
+    from spark.glue_job import create_local_spark_session, run_silver_to_gold
+    spark = create_local_spark_session()
+    run_silver_to_gold(spark, "2026-01-25", "./data/silver/source=openmeteo", "./data/gold")
+
+Expected arguments (Glue): JOB_NAME, run_date, silver_bucket_prefix,
 gold_bucket_prefix.
 """
 import sys
-from awsglue.utils import getResolvedOptions
+import logging
+from datetime import date, timedelta
+from typing import Any, Optional
+
+from pyspark.sql import DataFrame, SparkSession, Window
 from pyspark.sql.functions import col, round, when, to_timestamp, lit
-from pyspark.context import SparkContext
-from awsglue.context import GlueContext
-from awsglue.job import Job
+from pyspark.sql import functions as F
+from pyspark.sql.utils import AnalysisException
 
-# --- argument parsing ---
-args = getResolvedOptions(sys.argv, [
-    'JOB_NAME',
-    'run_date',
-    'silver_bucket_prefix', 
-    'gold_bucket_prefix'    
-])
+logger: Any = logging.getLogger(__name__)
 
-# --- spark/glue context setup --- 
-sc = SparkContext.getOrCreate()
-glueContext = GlueContext(sc)
-spark = glueContext.spark_session
-spark.conf.set("spark.sql.sources.partitionOverwriteMode", "dynamic")
+# must match src/pipeline/transform/features.py
+ROLLING_HOURS = 3
 
-job = Job(glueContext)
-job.init(args['JOB_NAME'], args)
 
-logger = glueContext.get_logger()
-logger.info(f"Starting Glue Job: {args['JOB_NAME']}")
-logger.info(f"Processing for run_date: {args['run_date']}")
+def create_local_spark_session(app_name: str = "silver_to_gold_local", master: str = "local[*]") -> SparkSession:
+    """
+    Build a plain SparkSession configured like the Glue job, for local runs and benchmarks.
 
-# --- read silver data from S3 --- 
+    Args:
+        app_name: Spark application name
+        master: Spark master URL. Defaults to all local cores.
 
-# remove possible trailing "/" from bucket prefix argument
-silver_path = f"{args['silver_bucket_prefix'].rstrip('/')}/run_date={args['run_date']}/"
+    Returns:
+        SparkSession with dynamic partition overwrite enabled
+    """
+    spark = (
+        SparkSession.builder
+        .appName(app_name)
+        .master(master)
+        # few hundred rows per day, default 200 shuffle partitions is pure overhead
+        .config("spark.sql.shuffle.partitions", "4")
+        .getOrCreate()
+    )
+    spark.conf.set("spark.sql.sources.partitionOverwriteMode", "dynamic")
+    return spark
 
-logger.info(f"Reading Silver Parquet data from: {silver_path}")
 
-try:
-    raw_df = spark.read.parquet(silver_path)
-    record_count = raw_df.count()
-    print(f"Successfully loaded {record_count} records from the Silver layer.")
-
-except Exception as e:
-    logger.error(f"Failed to read data from {silver_path}. Error: {str(e)}")
-    sys.exit(1) 
-
-# --- transformation logic ---
-logger.info("Starting data transformations...")
-
-curated_df = (
-    raw_df
-    # rename API fields to analytics ready names
-    .withColumnRenamed("temperature_2m", "temp_celsius")
-    .withColumnRenamed("relative_humidity_2m", "humidity_percent")
-    .withColumnRenamed("wind_speed_10m", "wind_speed_kmh")
-    .withColumnRenamed("precipitation", "precipitation_mm")
-    
-    # cast time string to TimestampType for partitioning/sorting
-    .withColumn("time", to_timestamp(col("time")))
-    
-    # derived columns: fahrenheit & freezing flag
-    .withColumn("temp_fahrenheit", round((col("temp_celsius") * 9/5) + 32, 2))
-    .withColumn("is_freezing", when(col("temp_celsius") <= 0, True).otherwise(False))
-)
-
-logger.info("Transformations applied successfully.")
-
-# --- row count validation ---
-gold_count = curated_df.count()
-print(f"Gold layer record count: {gold_count}")
-
-if record_count != gold_count:
-    logger.error(f"Validation failed! Silver count ({record_count}) != Gold count ({gold_count}).")
-    sys.exit(1)
-else:
-    print("Validation passed: Silver and Gold record counts match.")
-
-# --- configure and execute write to gold parquet ---
-logger.info("Starting data load to Gold layer...")
-
-# add run date columns for partitioning
-final_df = curated_df.withColumn("run_date", lit(args['run_date']))
-logger.info("Successfully added run_date column.")
-
-# remove possible trailing "/" from bucket prefix argument
-gold_path = args['gold_bucket_prefix'].rstrip('/')
-
-try:
-    (
-        final_df.write
-
-        # idempotent write
-        .mode("overwrite")
-
-        # bucket folder layout
-        .partitionBy("run_date", "location")
-
-        .parquet(gold_path)
+def _rename_to_gold(raw_df: DataFrame) -> DataFrame:
+    """Rename API fields to analytics ready names and cast time."""
+    return (
+        raw_df
+        # rename API fields to analytics ready names
+        .withColumnRenamed("temperature_2m", "temp_celsius")
+        .withColumnRenamed("relative_humidity_2m", "humidity_percent")
+        .withColumnRenamed("wind_speed_10m", "wind_speed_kmh")
+        .withColumnRenamed("precipitation", "precipitation_mm")
+
+        # cast time string to TimestampType for partitioning/sorting
+        .withColumn("time", to_timestamp(col("time")))
+    )
+
+
+def add_hourly_features(curated_df: DataFrame, context_df: Optional[DataFrame] = None) -> DataFrame:
+    """
+    Add the hourly time-series features with window functions (Spark port of transform/features.py).
+
+    Args:
+        curated_df: Gold-named DataFrame with 'location' and 'time'
+        context_df: Previous run_date's gold-named rows, lead-in for the first hours only
+
+    Returns:
+        curated_df with temp_change_1h, temp_rolling_3h, temp_rank_daily and precip_cumulative_daily
+    """
+    rows = curated_df.withColumn("_context", lit(False))
+    if context_df is not None:
+        # lead-in: the previous ROLLING_HOURS - 1 hours, and every earlier hour of the first day
+        first = curated_df.groupBy("location").agg(F.min("time").alias("_first"))
+        lead_in = (
+            context_df.join(F.broadcast(first), "location")
+            .where(
+                (col("time") < col("_first"))
+                & (col("time") >= F.least(
+                    F.date_trunc("day", col("_first")),
+                    col("_first") - F.expr(f"INTERVAL {ROLLING_HOURS - 1} HOURS"),
+                ))
+            )
+            .select("location", "time", "temp_celsius", "precipitation_mm")
+            .withColumn("_context", lit(True))
+        )
+        rows = rows.unionByName(lead_in, allowMissingColumns=True)
+
+    seconds = col("time").cast("long")
+    by_time = Window.partitionBy("location").orderBy("time")
+    rolling = Window.partitionBy("location").orderBy(seconds).rangeBetween(-(ROLLING_HOURS - 1) * 3600, 0)
+    day = [col("location"), F.to_date("time")]
+    by_temp_daily = Window.partitionBy(*day).orderBy(col("temp_celsius").desc_nulls_last())
+    running_daily = Window.partitionBy(*day).orderBy("time").rowsBetween(Window.unboundedPreceding, Window.currentRow)
+
+    return (
+        rows
+        .withColumn(
+            "temp_change_1h",
+            when(seconds - F.lag(seconds).over(by_time) == 3600, col("temp_celsius") - F.lag("temp_celsius").over(by_time)),
+        )
+        .withColumn("temp_rolling_3h", F.avg("temp_celsius").over(rolling))
+        .withColumn("temp_rank_daily", when(col("temp_celsius").isNotNull(), F.rank().over(by_temp_daily)))
+        .withColumn("precip_cumulative_daily", F.sum("precipitation_mm").over(running_daily))
+        .where(~col("_context"))
+        .drop("_context")
     )
-    logger.info(f"Successfully wrote curated Parquet data to {gold_path}")
 
-except Exception as e:
-    logger.error(f"Failed to write data to Gold layer: {str(e)}")
-    sys.exit(1)
 
-logger.info("All transforms written, ready to commit job")
-job.commit()
+def transform_silver_to_gold(raw_df: DataFrame, run_date: str, context_df: Optional[DataFrame] = None) -> DataFrame:
+    """
+    Apply the silver -> gold curation logic.
+
+    Args:
+        raw_df: Silver DataFrame (API column names, partition column 'location')
+        run_date: Date in YYYY-MM-DD format, added as the 'run_date' partition column
+        context_df: Previous run_date's silver rows, lead-in for the hourly features
+
+    Returns:
+        Curated DataFrame ready to be written partitioned by run_date & location
+    """
+    curated_df = (
+        _rename_to_gold(raw_df)
+
+        # derived columns: fahrenheit & freezing flag
+        .withColumn("temp_fahrenheit", round((col("temp_celsius") * 9/5) + 32, 2))
+        .withColumn("is_freezing", when(col("temp_celsius") <= 0, True).otherwise(False))
+    )
+
+    # hourly time-series features, so q9-q12 read columns instead of running windows
+    if context_df is not None:
+        context_df = _rename_to_gold(context_df)
+    curated_df = add_hourly_features(curated_df, context_df)
+
+    # add run date column for partitioning
+    return curated_df.withColumn("run_date", lit(run_date))
+
+
+def reconcile_row_counts(raw_df: DataFrame, curated_df: DataFrame) -> tuple[int, int]:
+    """
+    Compare silver and gold row counts while scanning the source only once.
+
+    The silver DataFrame must already be cached: the first count materializes the
+    cache from storage, and the curated count is served from memory because every
+    transform in transform_silver_to_gold is row-preserving (projections, plus
+    feature windows that only shuffle the cached rows).
+
+    Args:
+        raw_df: Cached silver DataFrame
+        curated_df: DataFrame derived from raw_df
+
+    Returns:
+        Tuple of (silver_count, gold_count)
+
+    Raises:
+        ValueError: If the counts differ
+    """
+    record_count = raw_df.count()
+    gold_count = curated_df.count()
+    logger.info(f"Silver record count: {record_count}, Gold record count: {gold_count}")
+
+    if record_count != gold_count:
+        raise ValueError(
+            f"Validation failed! Silver count ({record_count}) != Gold count ({gold_count})."
+        )
+    return record_count, gold_count
+
+
+def run_silver_to_gold(spark: SparkSession, run_date: str, silver_prefix: str, gold_prefix: str) -> int:
+    """
+    Read one run_date of silver data, curate it, reconcile counts and write gold.
+
+    Args:
+        spark: Active SparkSession (Glue or local)
+        run_date: Date in YYYY-MM-DD format
+        silver_prefix: Silver root containing run_date=... partitions
+        gold_prefix: Gold root to write run_date=/location= partitions under
+
+    Returns:
+        Number of records written to the gold layer
+    """
+    # remove possible trailing "/" from bucket prefix argument
+    silver_path = f"{silver_prefix.rstrip('/')}/run_date={run_date}/"
+    gold_path = gold_prefix.rstrip('/')
+
+    logger.info(f"Reading Silver Parquet data from: {silver_path}")
+    # cache so the reconciliation counts and the write share a single scan of storage
+    raw_df = spark.read.parquet(silver_path).cache()
+
+    previous = (date.fromisoformat(run_date) - timedelta(days=1)).isoformat()
+    try:
+        context_df: Optional[DataFrame] = spark.read.parquet(f"{silver_prefix.rstrip('/')}/run_date={previous}/")
+    except AnalysisException:
+        logger.info(f"No silver partition for {previous}, features start without lead-in")
+        context_df = None
+
+    try:
+        logger.info("Starting data transformations...")
+        curated_df = transform_silver_to_gold(raw_df, run_date, context_df)
+
+        record_count, _ = reconcile_row_counts(raw_df, curated_df)
+        logger.info("Validation passed: Silver and Gold record counts match.")
+
+        logger.info("Starting data load to Gold layer...")
+        (
+            curated_df.write
+
+            # idempotent write
+            .mode("overwrite")
+
+            # bucket folder layout
+            .partitionBy("run_date", "location")
+
+            .parquet(gold_path)
+        )
+        logger.info(f"Successfully wrote curated Parquet data to {gold_path}")
+        return record_count
+
+    finally:
+        raw_df.unpersist()
+
+
+def main() -> None:
+    """
+    Glue entry point: resolve job arguments, run the transform and commit the job.
+    """
+    global logger
+
+    # awsglue only exists inside the Glue runtime, keep it off the import path
+    from awsglue.utils import getResolvedOptions
+    from awsglue.context import GlueContext
+    from awsglue.job import Job
+    from pyspark.context import SparkContext
+
+    # --- argument parsing ---
+    args = getResolvedOptions(sys.argv, [
+        'JOB_NAME',
+        'run_date',
+        'silver_bucket_prefix',
+        'gold_bucket_prefix'
+    ])
+
+    # --- spark/glue context setup ---
+    sc = SparkContext.getOrCreate()
+    glueContext = GlueContext(sc)
+    spark = glueContext.spark_session
+    spark.conf.set("spark.sql.sources.partitionOverwriteMode", "dynamic")
+
+    job = Job(glueContext)
+    job.init(args['JOB_NAME'], args)
+
+    logger = glueContext.get_logger()
+    logger.info(f"Starting Glue Job: {args['JOB_NAME']}")
+    logger.info(f"Processing for run_date: {args['run_date']}")
+
+    try:
+        run_silver_to_gold(spark, args['run_date'], args['silver_bucket_prefix'], args['gold_bucket_prefix'])
+    except Exception as e:
+        logger.error(f"Glue job failed: {str(e)}")
+        sys.exit(1)
+
+    logger.info("All transforms written, ready to commit job")
+    job.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 -- 01_create_tables.sql
 -- Purpose: Defines the schema for the data warehouse (star schema)
--- This script is idempotent: it drops existing tables before recreating them.
+-- This script is idempotent: it recreates the staging table and creates the star
+-- schema tables only if they are missing, so rerunning it (make load) keeps earlier loads.
 
 -- ==============================================================================
 -- 0. Staging Layer (Raw Data from Ingestion)
@@ -21,6 +22,10 @@ CREATE TABLE raw_weather (
     latitude FLOAT,
     longitude FLOAT,
     location VARCHAR(100),
+    temp_change_1h FLOAT,
+    temp_rolling_3h FLOAT,
+    temp_rank_daily INT,
+    precip_cumulative_daily FLOAT,
     source VARCHAR(50),
     run_date DATE
 );
@@ -32,9 +37,7 @@ CREATE TABLE raw_weather (
 -- 1a. Date Dimension
 -- Holds unique dates and derived attributes (year, month, day, day_of_week).
 -- This allows us to slice data by "Weekends" or "Q1" easily later.
-DROP TABLE IF EXISTS dim_date CASCADE;
-
-CREATE TABLE dim_date (
+CREATE TABLE IF NOT EXISTS dim_date (
     date_id SERIAL PRIMARY KEY,
     date_value DATE UNIQUE NOT NULL,
     year INT,
@@ -46,9 +49,7 @@ CREATE TABLE dim_date (
 
 -- 1b. Location Dimension
 -- Holds details about the places we are measuring.
-DROP TABLE IF EXISTS dim_location CASCADE;
-
-CREATE TABLE dim_location (
+CREATE TABLE IF NOT EXISTS dim_location (
     location_id SERIAL PRIMARY KEY,
     location_name VARCHAR(100) UNIQUE NOT NULL,
     latitude FLOAT NOT NULL,
@@ -62,9 +63,7 @@ CREATE TABLE dim_location (
 -- 2a. Hourly Weather Fact
 -- Holds the actual numerical measurements.
 -- Links back to dimensions using Foreign Keys (FK).
-DROP TABLE IF EXISTS fact_weather_hourly;
-
-CREATE TABLE fact_weather_hourly (
+CREATE TABLE IF NOT EXISTS fact_weather_hourly (
     fact_id SERIAL PRIMARY KEY,
     date_id INT NOT NULL REFERENCES dim_date(date_id),
     location_id INT NOT NULL REFERENCES dim_location(location_id),
@@ -73,5 +72,28 @@ CREATE TABLE fact_weather_hourly (
     relative_humidity_2m INT,
     precipitation FLOAT,
     wind_speed_10m FLOAT,
+    -- Hourly time-series features, precomputed per partition by load.py
+    temp_change_1h FLOAT,
+    temp_rolling_3h FLOAT,
+    temp_rank_daily INT,
+    precip_cumulative_daily FLOAT,
     extraction_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+
+-- Warehouses created before the hourly features keep their fact table (and its history),
+-- so add the feature columns in place.
+ALTER TABLE fact_weather_hourly ADD COLUMN IF NOT EXISTS temp_change_1h FLOAT;
+ALTER TABLE fact_weather_hourly ADD COLUMN IF NOT EXISTS temp_rolling_3h FLOAT;
+ALTER TABLE fact_weather_hourly ADD COLUMN IF NOT EXISTS temp_rank_daily INT;
+ALTER TABLE fact_weather_hourly ADD COLUMN IF NOT EXISTS precip_cumulative_daily FLOAT;
+
+-- 2b. Load Versions
+-- One row per (location, date) partition, stamped by 02_populate_tables.sql each time
+-- the partition's facts are replaced. Query result caches in any process compare the
+-- highest version in their scope to detect reloads (src/pipeline/warehouse/queries.py).
+CREATE TABLE IF NOT EXISTS fact_load_versions (
+    location_name VARCHAR(100) NOT NULL,
+    date_value DATE NOT NULL,
+    version BIGINT NOT NULL,
+    PRIMARY KEY (location_name, date_value)
+);
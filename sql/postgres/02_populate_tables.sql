@@ -1,36 +1,25 @@
 -- 02_populate_tables.sql
 -- Purpose: Transforms raw staging data into the Star Schema (Dimensions & Facts).
--- This script is idempotent: it clears target tables before reloading them
--- to prevent duplicate data during development.
+-- This script is idempotent: it replaces the facts of the (location, date) partitions
+-- staged in raw_weather and leaves every other partition, and the dimension ids, alone.
 
 -- ==============================================================================
--- 1. Clean Slate
+-- 1. Populate Dimensions
 -- ==============================================================================
 
--- Clear out the Fact table first (because it depends on Dimensions)
-TRUNCATE TABLE fact_weather_hourly CASCADE;
-
--- Clear out Dimensions
-TRUNCATE TABLE dim_location CASCADE;
-TRUNCATE TABLE dim_date CASCADE;
-
-
--- ==============================================================================
--- 2. Populate Dimensions
--- ==============================================================================
-
--- 2a. Populate Location Dimension
--- Logic: Select distinct locations from raw_weather and insert them.
+-- 1a. Populate Location Dimension
+-- Logic: Add the locations from raw_weather that are not in the dimension yet.
 INSERT INTO dim_location (location_name, latitude, longitude)
 SELECT DISTINCT 
     location,
     latitude,
     longitude
 FROM raw_weather
-WHERE location IS NOT NULL;
+WHERE location IS NOT NULL
+ON CONFLICT (location_name) DO NOTHING;
 
--- 2b. Populate Date Dimension
--- Logic: Extract unique dates and calculate attributes (Year, Month, Weekend).
+-- 1b. Populate Date Dimension
+-- Logic: Add the new dates and calculate attributes (Year, Month, Weekend).
 INSERT INTO dim_date (date_value, year, month, day, day_of_week, is_weekend)
 SELECT DISTINCT 
     CAST(time AS DATE) AS date_value,
@@ -39,14 +28,26 @@ SELECT DISTINCT
     EXTRACT(DAY FROM time) AS day,
     EXTRACT(DOW FROM time) AS day_of_week,
     CASE WHEN EXTRACT(DOW FROM time) IN (0, 6) THEN TRUE ELSE FALSE END AS is_weekend
-FROM raw_weather;
+FROM raw_weather
+ON CONFLICT (date_value) DO NOTHING;
 
 
 -- ==============================================================================
--- 3. Populate Fact Table
+-- 2. Populate Fact Table
 -- ==============================================================================
 
--- 3a. Populate Hourly Weather Fact
+-- 2a. Clear the Staged Partitions
+-- Logic: A reloaded (location, date) replaces its earlier facts instead of duplicating them.
+DELETE FROM fact_weather_hourly f
+USING dim_location l, dim_date d
+WHERE f.location_id = l.location_id
+  AND f.date_id = d.date_id
+  AND EXISTS (
+      SELECT 1 FROM raw_weather r
+      WHERE r.location = l.location_name AND CAST(r.time AS DATE) = d.date_value
+  );
+
+-- 2b. Populate Hourly Weather Fact
 -- Logic: Join raw_weather with dimensions to replace text with IDs.
 INSERT INTO fact_weather_hourly (
     date_id, 
@@ -56,6 +57,10 @@ INSERT INTO fact_weather_hourly (
     relative_humidity_2m, 
     precipitation, 
     wind_speed_10m,
+    temp_change_1h,
+    temp_rolling_3h,
+    temp_rank_daily,
+    precip_cumulative_daily,
     extraction_time
 )
 SELECT 
@@ -66,11 +71,30 @@ SELECT
     r.relative_humidity_2m,
     r.precipitation,
     r.wind_speed_10m,
+    r.temp_change_1h,
+    r.temp_rolling_3h,
+    r.temp_rank_daily,
+    r.precip_cumulative_daily,
     NOW() as extraction_time
 FROM raw_weather r
 -- Join to Date Dimension to get date_id
-JOIN dim_date d ON d.date_value = DATE(r.time)
+JOIN dim_date d ON d.date_value = CAST(r.time AS DATE)
 -- Join to Location Dimension to get location_id
 JOIN dim_location l ON l.location_name = r.location;
 
 
+-- ==============================================================================
+-- 3. Stamp Load Versions
+-- ==============================================================================
+
+-- Logic: Runs after the facts are replaced, so a cached result computed before this
+-- point carries an older version than its partitions now have and is recomputed.
+INSERT INTO fact_load_versions (location_name, date_value, version)
+SELECT DISTINCT
+    r.location,
+    CAST(r.time AS DATE),
+    v.version
+FROM raw_weather r
+CROSS JOIN (SELECT COALESCE(MAX(version), 0) + 1 AS version FROM fact_load_versions) v
+WHERE r.location IS NOT NULL
+ON CONFLICT (location_name, date_value) DO UPDATE SET version = EXCLUDED.version;
@@ -0,0 +1,107 @@
+-- 03_compact_facts.sql
+-- Purpose: Optional compact layout for the hourly facts (run after 02_populate_tables.sql).
+-- Stores one row per (location_id, date_id) with fixed 24-slot measurement arrays
+-- (slot h + 1 = hour h) instead of 24 rows each carrying a serial id, both keys and
+-- an extraction timestamp. The rows are moved out of fact_weather_hourly, and
+-- fact_weather_hourly_compact unnests them back into its shape for existing queries.
+-- Run it after every populate: each run merges the newly loaded hours into the compact
+-- rows already there (a reloaded hour replaces its slot), then empties fact_weather_hourly.
+
+-- ==============================================================================
+-- 1. Compact Fact Table
+-- ==============================================================================
+
+CREATE TABLE IF NOT EXISTS fact_weather_daily (
+    location_id INT NOT NULL REFERENCES dim_location(location_id),
+    date_id INT NOT NULL REFERENCES dim_date(date_id),
+    -- Bit h is set when hour h was loaded (a loaded hour can still hold NULL measures)
+    hour_mask INT NOT NULL,
+    temperature_2m FLOAT[] NOT NULL CHECK (array_length(temperature_2m, 1) = 24),
+    relative_humidity_2m INT[] NOT NULL CHECK (array_length(relative_humidity_2m, 1) = 24),
+    precipitation FLOAT[] NOT NULL CHECK (array_length(precipitation, 1) = 24),
+    wind_speed_10m FLOAT[] NOT NULL CHECK (array_length(wind_speed_10m, 1) = 24),
+    temp_change_1h FLOAT[] NOT NULL CHECK (array_length(temp_change_1h, 1) = 24),
+    temp_rolling_3h FLOAT[] NOT NULL CHECK (array_length(temp_rolling_3h, 1) = 24),
+    temp_rank_daily INT[] NOT NULL CHECK (array_length(temp_rank_daily, 1) = 24),
+    precip_cumulative_daily FLOAT[] NOT NULL CHECK (array_length(precip_cumulative_daily, 1) = 24),
+    extraction_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (location_id, date_id)
+);
+
+-- ==============================================================================
+-- 2. Merge the New Hourly Rows
+-- ==============================================================================
+
+-- Logic: every (location, day) gets all 24 hour slots. A slot takes the newly loaded hour,
+-- else keeps what the compact row already held; hours that were never loaded stay NULL
+INSERT INTO fact_weather_daily (
+    location_id,
+    date_id,
+    hour_mask,
+    temperature_2m,
+    relative_humidity_2m,
+    precipitation,
+    wind_speed_10m,
+    temp_change_1h,
+    temp_rolling_3h,
+    temp_rank_daily,
+    precip_cumulative_daily,
+    extraction_time
+)
+SELECT
+    k.location_id,
+    k.date_id,
+    CAST(COALESCE(SUM(1 << h.hour) FILTER (WHERE f.hour IS NOT NULL), 0) | COALESCE(MAX(d.hour_mask), 0) AS INT) AS hour_mask,
+    array_agg(CASE WHEN f.hour IS NOT NULL THEN f.temperature_2m ELSE d.temperature_2m[h.hour + 1] END ORDER BY h.hour),
+    array_agg(CASE WHEN f.hour IS NOT NULL THEN f.relative_humidity_2m ELSE d.relative_humidity_2m[h.hour + 1] END ORDER BY h.hour),
+    array_agg(CASE WHEN f.hour IS NOT NULL THEN f.precipitation ELSE d.precipitation[h.hour + 1] END ORDER BY h.hour),
+    array_agg(CASE WHEN f.hour IS NOT NULL THEN f.wind_speed_10m ELSE d.wind_speed_10m[h.hour + 1] END ORDER BY h.hour),
+    array_agg(CASE WHEN f.hour IS NOT NULL THEN f.temp_change_1h ELSE d.temp_change_1h[h.hour + 1] END ORDER BY h.hour),
+    array_agg(CASE WHEN f.hour IS NOT NULL THEN f.temp_rolling_3h ELSE d.temp_rolling_3h[h.hour + 1] END ORDER BY h.hour),
+    array_agg(CASE WHEN f.hour IS NOT NULL THEN f.temp_rank_daily ELSE d.temp_rank_daily[h.hour + 1] END ORDER BY h.hour),
+    array_agg(CASE WHEN f.hour IS NOT NULL THEN f.precip_cumulative_daily ELSE d.precip_cumulative_daily[h.hour + 1] END ORDER BY h.hour),
+    MAX(f.extraction_time)
+FROM (SELECT DISTINCT location_id, date_id FROM fact_weather_hourly) k
+CROSS JOIN generate_series(0, 23) AS h(hour)
+LEFT JOIN fact_weather_hourly f
+    ON f.location_id = k.location_id AND f.date_id = k.date_id AND f.hour = h.hour
+LEFT JOIN fact_weather_daily d
+    ON d.location_id = k.location_id AND d.date_id = k.date_id
+GROUP BY k.location_id, k.date_id
+ON CONFLICT (location_id, date_id) DO UPDATE SET
+    hour_mask = EXCLUDED.hour_mask,
+    temperature_2m = EXCLUDED.temperature_2m,
+    relative_humidity_2m = EXCLUDED.relative_humidity_2m,
+    precipitation = EXCLUDED.precipitation,
+    wind_speed_10m = EXCLUDED.wind_speed_10m,
+    temp_change_1h = EXCLUDED.temp_change_1h,
+    temp_rolling_3h = EXCLUDED.temp_rolling_3h,
+    temp_rank_daily = EXCLUDED.temp_rank_daily,
+    precip_cumulative_daily = EXCLUDED.precip_cumulative_daily,
+    extraction_time = EXCLUDED.extraction_time;
+
+-- The compact table now holds every fact; the next populate only adds new hours here
+TRUNCATE TABLE fact_weather_hourly;
+
+-- ==============================================================================
+-- 3. Compatibility View
+-- ==============================================================================
+
+-- Same columns as fact_weather_hourly (fact_id aside), one row per loaded hour
+CREATE OR REPLACE VIEW fact_weather_hourly_compact AS
+SELECT
+    c.date_id,
+    c.location_id,
+    h.hour,
+    c.temperature_2m[h.hour + 1] AS temperature_2m,
+    c.relative_humidity_2m[h.hour + 1] AS relative_humidity_2m,
+    c.precipitation[h.hour + 1] AS precipitation,
+    c.wind_speed_10m[h.hour + 1] AS wind_speed_10m,
+    c.temp_change_1h[h.hour + 1] AS temp_change_1h,
+    c.temp_rolling_3h[h.hour + 1] AS temp_rolling_3h,
+    c.temp_rank_daily[h.hour + 1] AS temp_rank_daily,
+    c.precip_cumulative_daily[h.hour + 1] AS precip_cumulative_daily,
+    c.extraction_time
+FROM fact_weather_daily c
+CROSS JOIN generate_series(0, 23) AS h(hour)
+WHERE c.hour_mask & (1 << h.hour) <> 0;
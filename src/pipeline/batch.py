@@ -0,0 +1,203 @@
+"""
+Batch execution of many ingestion jobs in one process.
+
+Runs fetch -> validate -> normalize for every (run_date, location, source)
+job in a manifest on a worker pool:
+- One HTTP session and one S3 client are shared by all jobs
+- A failing job is recorded and the batch carries on
+- A JSON report lists every job with its status, timing and error
+
+Manifest formats:
+    CSV:  header row with run_date,location[,source]
+    JSON: [{"run_date": "2026-01-25", "location": "Boston", "source": "openmeteo"}, ...]
+
+Usage:
+    python -m src.pipeline.run --manifest jobs.csv --workers 8 --report batch_report.json
+"""
+
+import csv
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_JOB_FIELDS = ("run_date", "location")
+
+
+def load_manifest(file_path: str, default_source: str = "openmeteo") -> list[dict]:
+    """
+    Load a CSV or JSON job manifest.
+
+    Args:
+        file_path: Path to a .csv or .json manifest
+        default_source: Source used for jobs that do not set one
+
+    Returns:
+        List of job dictionaries with run_date, location and source
+
+    Raises:
+        FileNotFoundError: If the manifest does not exist
+        ValueError: If the format is unsupported or a job is missing required fields
+    """
+    if not os.path.exists(file_path):
+        logger.error(f"Manifest not found: {file_path}")
+        raise FileNotFoundError(f"No file at {file_path}")
+
+    with open(file_path, "r", newline="") as f:
+        if file_path.endswith(".csv"):
+            rows: list[dict] = list(csv.DictReader(f))
+        elif file_path.endswith(".json"):
+            rows = json.load(f)
+        else:
+            raise ValueError(f"Unsupported manifest format: {file_path}. Expected .csv or .json")
+
+    jobs = []
+    for index, row in enumerate(rows, start=1):
+        missing = [field for field in REQUIRED_JOB_FIELDS if not str(row.get(field) or "").strip()]
+        if missing:
+            raise ValueError(f"Manifest job {index} is missing required fields: {', '.join(missing)}")
+        jobs.append({
+            "run_date": str(row["run_date"]).strip(),
+            "location": str(row["location"]).strip(),
+            "source": str(row.get("source") or default_source).strip(),
+        })
+
+    logger.info(f"Loaded {len(jobs)} jobs from manifest {file_path}")
+    return jobs
+
+
+def _build_session(pool_size: int) -> requests.Session:
+    """
+    Create an HTTP session whose connection pool fits the worker count.
+
+    Args:
+        pool_size: Maximum number of concurrent connections
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _run_job(job: dict, write_to_s3: bool, session: requests.Session, s3_client: Optional[Any]) -> dict:
+    """
+    Run one job and capture its outcome instead of raising.
+
+    Args:
+        job: Job dictionary with run_date, location and source
+        write_to_s3: If true, upload bronze/silver files to S3
+        session: Shared HTTP session
+        s3_client: Shared S3 client, or None
+
+    Returns:
+        Job result with status, duration_s and error
+    """
+    from src.pipeline.run import execute_pipeline
+
+    start = time.perf_counter()
+    try:
+        execute_pipeline(
+            job["run_date"], job["location"], job["source"],
+            write_to_s3=write_to_s3, session=session, s3_client=s3_client,
+        )
+        status, error = "success", None
+    except Exception as e:
+        logger.error(f"Job failed: {job['source']} | {job['location']} | {job['run_date']}: {e}")
+        status, error = "failed", f"{type(e).__name__}: {e}"
+
+    return {**job, "status": status, "duration_s": round(time.perf_counter() - start, 3), "error": error}
+
+
+def write_report(summary: dict, file_path: str) -> str:
+    """
+    Write the batch summary report as JSON.
+
+    Args:
+        summary: Batch summary from run_batch
+        file_path: Destination path
+
+    Returns:
+        Path to the written report
+    """
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(file_path, "w") as f:
+        json.dump(summary, f, indent=2)
+    logger.info(f"Batch report written to {file_path}")
+    return file_path
+
+
+def run_batch(
+    jobs: list[dict],
+    workers: int = 4,
+    write_to_s3: bool = False,
+    report_path: Optional[str] = None,
+) -> dict:
+    """
+    Run many ingestion jobs in one process with per-job failure isolation.
+
+    Args:
+        jobs: Job dictionaries from load_manifest
+        workers: Number of worker threads
+        write_to_s3: If true, upload bronze/silver files to S3
+        report_path: Optional path for the JSON summary report
+
+    Returns:
+        Summary with totals, wall time and per-job results (in manifest order)
+    """
+    workers = max(1, workers)
+    session = _build_session(workers)
+    s3_client = None
+    if write_to_s3:
+        from src.pipeline.io.s3 import S3Client
+        s3_client = S3Client()
+
+    logger.info(f"Starting batch: {len(jobs)} jobs on {workers} workers")
+    started_at = datetime.now(timezone.utc).isoformat()
+    start = time.perf_counter()
+
+    completed = 0
+    lock = threading.Lock()
+
+    def _tracked(job: dict) -> dict:
+        nonlocal completed
+        result = _run_job(job, write_to_s3, session, s3_client)
+        with lock:
+            completed += 1
+            logger.info(f"[{completed}/{len(jobs)}] {result['status']}: {job['location']} | {job['run_date']} ({result['duration_s']}s)")
+        return result
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_tracked, jobs))
+    finally:
+        session.close()
+
+    failed = [r for r in results if r["status"] != "success"]
+    summary = {
+        "started_at": started_at,
+        "duration_s": round(time.perf_counter() - start, 3),
+        "workers": workers,
+        "total": len(results),
+        "succeeded": len(results) - len(failed),
+        "failed": len(failed),
+        "jobs": results,
+    }
+    logger.info(f"Batch completed: {summary['succeeded']} succeeded, {summary['failed']} failed in {summary['duration_s']}s")
+
+    if report_path:
+        write_report(summary, report_path)
+    return summary
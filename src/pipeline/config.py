@@ -16,18 +16,45 @@ Environment Variables Required:
     LOCAL_GOLD_PATH: Base path for curated data storage (Placeholder)
     OPEN_METEO_URL_TEMPLATE: URL template for Open-Meteo API
 
+Environment Variables Optional (API Resilience):
+    OPEN_METEO_MAX_CALLS_PER_MINUTE: Shared request rate limit (default: 600)
+    FETCH_MAX_RETRIES: Retries for 429/5xx/connection errors (default: 4)
+    FETCH_BREAKER_FAILURES: Consecutive failures that open the circuit (default: 5)
+    FETCH_BREAKER_RESET_SECONDS: Circuit cool-down before a trial request (default: 30)
+
+Environment Variables Optional (Response Format):
+    OPEN_METEO_FORMAT: 'json' (default) or 'flatbuffers' for binary responses
+        decoded into NumPy arrays and stored in bronze as raw.arrow
+
+Environment Variables Optional (Partition Catalog):
+    PARTITION_CATALOG_PATH: SQLite file indexing every written lake partition
+
+Environment Variables Optional (Location Catalog):
+    LOCATION_CATALOG_PATH: CSV/Parquet catalog of name,latitude,longitude rows,
+        loaded on first lookup of a location outside LOCATION_LOOKUP
+
 Environment Variables Optional (Block 2+):
     POSTGRES_USER: PostgreSQL username (default: admin)
     POSTGRES_PASSWORD: PostgreSQL password (default: password)
     POSTGRES_HOST: PostgreSQL host (default: localhost)
     POSTGRES_PORT: PostgreSQL port (default: 5432)
     POSTGRES_DB: PostgreSQL database name (default: warehouse) 
+
+Environment Variables Optional (Analytics Queries):
+    ANALYTICS_POOL_SIZE: Pooled Postgres connections shared by analytics queries (default: 5)
+    ANALYTICS_CACHE_SIZE: Query results kept in the LRU cache (default: 256)
+    ANALYTICS_CACHE_TTL_SECONDS: Max age of a cached result; 0 keeps results until
+        their partitions are repopulated (default: 300)
+    FACT_LAYOUT: Hourly fact layout the queries read: 'rows' (fact_weather_hourly) or
+        'compact' (fact_weather_daily via sql/postgres/03_compact_facts.sql) (default: rows)
 """
 from typing import Optional
 import os
 import logging
 from dotenv import load_dotenv
 
+from src.pipeline.locations import DEFAULT_RESOLVE_DISTANCE_KM, LocationCatalog
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -42,15 +69,75 @@ class Project_Config:
     and API URL construction.
 
     Attributes:
-        LOCATION_LOOKUP: Mapping of location names to coordinates
+        LOCATION_LOOKUP: Mapping of built-in location names to coordinates
+        LOCATION_CATALOG_PATH: Optional external catalog for every other location
 
     """
     LOCATION_LOOKUP = {
         "Boston" : {"latitude": 42.3601, "longitude": -71.0589}
     }
+    LOCATION_CATALOG_PATH = os.getenv("LOCATION_CATALOG_PATH")
     AWS_BUCKET_NAME = os.getenv("AWS_BUCKET_NAME")
     AWS_REGION = os.getenv("AWS_REGION")
 
+    _catalog: Optional[LocationCatalog] = None
+
+    @classmethod
+    def catalog(cls) -> LocationCatalog:
+        """
+        Return the location catalog, loading it on first use.
+
+        Built-in LOCATION_LOOKUP entries are included and take precedence
+        over catalog rows with the same name.
+
+        Returns:
+            LocationCatalog covering LOCATION_CATALOG_PATH and LOCATION_LOOKUP
+        """
+        if cls._catalog is None:
+            if cls.LOCATION_CATALOG_PATH:
+                cls._catalog = LocationCatalog.from_file(cls.LOCATION_CATALOG_PATH, overrides=cls.LOCATION_LOOKUP)
+            else:
+                cls._catalog = LocationCatalog(cls.LOCATION_LOOKUP)
+        return cls._catalog
+
+    @classmethod
+    def get_location(cls, location: str) -> dict:
+        """
+        Look up coordinates for a location name.
+
+        LOCATION_LOOKUP is checked first so the default cities never load the catalog.
+
+        Args:
+            location: Location name
+
+        Returns:
+            Dictionary with latitude and longitude
+
+        Raises:
+            KeyError: If the location is neither built in nor in the catalog
+        """
+        if location in cls.LOCATION_LOOKUP:
+            return cls.LOCATION_LOOKUP[location]
+        return cls.catalog().get(location)
+
+    @classmethod
+    def resolve_location(cls, latitude: float, longitude: float, max_distance_km: float = DEFAULT_RESOLVE_DISTANCE_KM) -> str:
+        """
+        Resolve a coordinate-only input to the canonical location name used in partitions.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            max_distance_km: Maximum distance to the nearest known location
+
+        Returns:
+            Canonical location name
+
+        Raises:
+            ValueError: If no known location lies within max_distance_km
+        """
+        return cls.catalog().resolve(latitude, longitude, max_distance_km)
+
     class Paths:
         """
         Data lake path generation for bronze and silver layers.
@@ -58,6 +145,7 @@ class Project_Config:
         LOCAL_BRONZE = os.getenv("LOCAL_BRONZE_PATH")
         LOCAL_SILVER = os.getenv("LOCAL_SILVER_PATH")
         LOCAL_GOLD = os.getenv("LOCAL_GOLD_PATH")
+        PARTITION_CATALOG = os.getenv("PARTITION_CATALOG_PATH")
         
         @classmethod
         def bronze_path(cls, source: str, run_date: str, location: Optional[str]=None) -> str:
@@ -124,6 +212,12 @@ class Project_Config:
         """
         
         OPEN_METEO_URL_TEMPLATE = os.getenv("OPEN_METEO_URL_TEMPLATE")
+        # Published free-tier limit is 600 calls per minute
+        MAX_CALLS_PER_MINUTE = float(os.getenv("OPEN_METEO_MAX_CALLS_PER_MINUTE", "600"))
+        MAX_RETRIES = int(os.getenv("FETCH_MAX_RETRIES", "4"))
+        BREAKER_FAILURE_THRESHOLD = int(os.getenv("FETCH_BREAKER_FAILURES", "5"))
+        BREAKER_RESET_SECONDS = float(os.getenv("FETCH_BREAKER_RESET_SECONDS", "30"))
+        RESPONSE_FORMAT = os.getenv("OPEN_METEO_FORMAT", "json")
 
         @classmethod
         def get_open_meteo_url(cls,location : str) -> str:
@@ -131,17 +225,41 @@ class Project_Config:
             Construct Open-Meteo API URL with location coordinates.
 
             Args:
-                location: Location name from LOCATION_LOOKUP dictionary
+                location: Location name from LOCATION_LOOKUP or the location catalog
 
             Returns:
                 Complete API URL with latitude and longitude parameters
             """
-            coords = Project_Config.LOCATION_LOOKUP[location]
+            coords = Project_Config.get_location(location)
             if cls.OPEN_METEO_URL_TEMPLATE is None:
                 raise ValueError("OPEN_METEO_URL_TEMPLATE environment variable is not set")
             url = cls.OPEN_METEO_URL_TEMPLATE.format(lat=coords["latitude"],lon=coords["longitude"])
             logger.debug(f"Generated API URL for {location}: {url}")
             return url
+
+        @classmethod
+        def get_open_meteo_batch_url(cls, locations: list[str]) -> str:
+            """
+            Construct one Open-Meteo API URL requesting several coordinates.
+
+            Open-Meteo accepts comma-separated latitude/longitude lists and returns
+            one result per coordinate, in request order.
+
+            Args:
+                locations: Location names from LOCATION_LOOKUP or the location catalog
+
+            Returns:
+                Complete API URL with comma-separated latitude and longitude parameters
+            """
+            coords = [Project_Config.get_location(location) for location in locations]
+            if cls.OPEN_METEO_URL_TEMPLATE is None:
+                raise ValueError("OPEN_METEO_URL_TEMPLATE environment variable is not set")
+            url = cls.OPEN_METEO_URL_TEMPLATE.format(
+                lat=",".join(str(c["latitude"]) for c in coords),
+                lon=",".join(str(c["longitude"]) for c in coords),
+            )
+            logger.debug(f"Generated batch API URL for {len(locations)} locations: {url}")
+            return url
         
     class Database:
         """
@@ -152,6 +270,11 @@ class Project_Config:
         POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
         POSTGRES_PORT = os.getenv("POSTGRES_PORT", "5432")
         POSTGRES_DB = os.getenv("POSTGRES_DB", "warehouse")
+        ANALYTICS_POOL_SIZE = int(os.getenv("ANALYTICS_POOL_SIZE", "5"))
+        ANALYTICS_CACHE_SIZE = int(os.getenv("ANALYTICS_CACHE_SIZE", "256"))
+        ANALYTICS_CACHE_TTL_SECONDS = float(os.getenv("ANALYTICS_CACHE_TTL_SECONDS", "300"))
+        FACT_LAYOUT = os.getenv("FACT_LAYOUT", "rows")
+        LAKE_RUN_DATE_LOOKBACK_DAYS = int(os.getenv("LAKE_RUN_DATE_LOOKBACK_DAYS", "0"))
 
         @classmethod
         def connection_string(cls) -> str:
@@ -0,0 +1,30 @@
+"""
+Run date helpers shared by the lake readers, gap detection, reprocessing and
+the warehouse loaders.
+
+Usage:
+    from src.pipeline.dates import date_range
+    date_range("2026-01-30", "2026-02-01")  # ['2026-01-30', '2026-01-31', '2026-02-01']
+"""
+
+from datetime import date, timedelta
+
+
+def date_range(start_date: str, end_date: str) -> list[str]:
+    """
+    Expand an inclusive date range into run dates.
+
+    Args:
+        start_date: First date in YYYY-MM-DD format
+        end_date: Last date in YYYY-MM-DD format
+
+    Returns:
+        List of YYYY-MM-DD strings
+
+    Raises:
+        ValueError: If end_date is before start_date
+    """
+    start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    if end < start:
+        raise ValueError(f"end_date {end_date} is before start_date {start_date}")
+    return [(start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
@@ -0,0 +1,240 @@
+"""
+Gap detection for ingestion backfills.
+
+Builds the expected (run_date, location) grid for a date range and diffs it
+against what the bronze and silver layers already hold, so a catch-up run
+only re-ingests the holes instead of the whole range. A partition is
+scheduled when, for either layer:
+- Its file is missing locally, or in S3 when S3 is checked
+- Its checksum no longer matches the partition catalog entry
+- It was written longer ago than max_age_hours
+- The S3 copy differs in size from, or is older than, the local file
+
+Bronze partitions packed into a monthly archive (see io.archive) count as
+present; their checksum and age come from the archive's index.
+
+Existence checks cost one stat per partition file locally and one LIST per
+layer and run_date in S3; objects are never downloaded. With a catalog, a
+partition whose files still have the catalogued total size and were last
+modified before its catalog entry was written is taken as unchanged; only
+the others are re-read and hashed to compare checksums.
+
+Usage:
+    python -m src.pipeline.run --fill-gaps 2026-01-01 --end-date 2026-01-31 --location "Boston,Miami"
+    python -m src.pipeline.run --fill-gaps 2026-01-01 --end-date 2026-01-31 --max-age-hours 48 --dry-run
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional, TYPE_CHECKING
+
+from src.pipeline.config import Project_Config
+from src.pipeline.dates import date_range
+from src.pipeline.io.archive import find_member
+from src.pipeline.io.catalog import bronze_file, describe_partition, get_catalog, partition_checksum, partition_files
+
+if TYPE_CHECKING:
+    from src.pipeline.io.s3 import S3Client
+
+logger = logging.getLogger(__name__)
+
+# Layers written by one ingestion job, and the file each partition holds
+# (a bronze partition may hold raw.arrow instead, see catalog.bronze_file)
+LAYER_FILES = {"bronze": "raw.json", "silver": "weather_data.parquet"}
+
+
+def expected_grid(start_date: str, end_date: str, locations: list[str]) -> list[tuple[str, str]]:
+    """
+    Build every (run_date, location) pair a date range should contain.
+
+    Args:
+        start_date: First run_date (inclusive) in YYYY-MM-DD format
+        end_date: Last run_date (inclusive) in YYYY-MM-DD format
+        locations: Location names
+
+    Returns:
+        List of (run_date, location) tuples ordered by date then location
+    """
+    return [(run_date, location) for run_date in date_range(start_date, end_date) for location in locations]
+
+
+def _partition_dir(layer: str, source: str, run_date: str, location: Optional[str] = None) -> str:
+    """Partition (or run_date) directory of an ingestion layer."""
+    if layer == "bronze":
+        return Project_Config.Paths.bronze_path(source, run_date, location)
+    return Project_Config.Paths.silver_path(source, run_date, location)
+
+
+def _archived_reasons(
+    member: dict,
+    now: datetime,
+    catalog_entry: Optional[dict],
+    max_age_hours: Optional[float],
+) -> list[str]:
+    """
+    Explain why a bronze partition packed in a monthly archive needs re-ingesting.
+
+    The archive entry keeps the payload's checksum and original write time;
+    the checksum is combined the way describe_partition does for a loose file.
+    The per-partition S3 objects are replaced by one archive object, so the
+    S3 checks are skipped.
+
+    Args:
+        member: Entry of the archive's index
+        now: Reference time for age checks
+        catalog_entry: Partition catalog entry, or None
+        max_age_hours: Partitions written longer ago than this are stale
+
+    Returns:
+        Human-readable reasons (empty if the partition is complete and fresh)
+    """
+    reasons = []
+    if catalog_entry is not None and catalog_entry["checksum"] != partition_checksum([(member["name"], member["sha256"])]):
+        reasons.append("bronze checksum differs from catalog")
+    written_at = datetime.fromisoformat(catalog_entry["written_at"] if catalog_entry else member["written_at"])
+    if max_age_hours is not None and now - written_at > timedelta(hours=max_age_hours):
+        reasons.append(f"bronze older than {max_age_hours}h")
+    return reasons
+
+
+def _unchanged_since_catalog(layer: str, partition_dir: str, catalog_entry: dict) -> bool:
+    """
+    Stat-level check that a partition still matches its catalog entry.
+
+    Args:
+        layer: 'bronze' or 'silver'
+        partition_dir: Partition directory path
+        catalog_entry: Partition catalog entry
+
+    Returns:
+        True if the files have the catalogued total size and none was modified after the entry was written
+    """
+    files = partition_files(layer, partition_dir)
+    if not files:
+        return False
+    stats = [os.stat(path) for path in files]
+    written_at = datetime.fromisoformat(catalog_entry["written_at"])
+    return (
+        sum(stat.st_size for stat in stats) == catalog_entry["byte_size"]
+        and max(stat.st_mtime for stat in stats) <= written_at.timestamp()
+    )
+
+
+def _partition_reasons(
+    layer: str,
+    source: str,
+    run_date: str,
+    location: str,
+    now: datetime,
+    catalog_entry: Optional[dict],
+    s3_objects: Optional[dict[str, dict]],
+    max_age_hours: Optional[float],
+) -> list[str]:
+    """
+    Explain why one layer's partition needs re-ingesting.
+
+    Args:
+        layer: 'bronze' or 'silver'
+        source: Data source identifier
+        run_date: Date in YYYY-MM-DD format
+        location: Location name
+        now: Reference time for age checks
+        catalog_entry: Partition catalog entry, or None
+        s3_objects: Objects listed under the run_date prefix, or None when S3 is not checked
+        max_age_hours: Partitions written longer ago than this are stale
+
+    Returns:
+        Human-readable reasons (empty if the partition is complete and fresh)
+    """
+    partition_dir = _partition_dir(layer, source, run_date, location)
+    file_path = bronze_file(partition_dir) if layer == "bronze" else f"{partition_dir}/{LAYER_FILES[layer]}"
+
+    if not os.path.exists(file_path):
+        archived = find_member(partition_dir) if layer == "bronze" else None
+        if archived is None:
+            return [f"{layer} missing locally"]
+        return _archived_reasons(archived[1], now, catalog_entry, max_age_hours)
+
+    reasons = []
+    if catalog_entry is not None:
+        if not _unchanged_since_catalog(layer, partition_dir, catalog_entry):
+            # size or mtime moved: hash the files to tell a real change from a touch
+            stats = describe_partition(layer, partition_dir)
+            if stats is None or stats["checksum"] != catalog_entry["checksum"]:
+                reasons.append(f"{layer} checksum differs from catalog")
+        written_at = datetime.fromisoformat(catalog_entry["written_at"])
+    else:
+        written_at = datetime.fromtimestamp(os.path.getmtime(file_path), tz=timezone.utc)
+
+    if max_age_hours is not None and now - written_at > timedelta(hours=max_age_hours):
+        reasons.append(f"{layer} older than {max_age_hours}h")
+
+    if s3_objects is not None:
+        from src.pipeline.io.s3 import S3Client
+
+        s3_object = s3_objects.get(S3Client.mirror_key(file_path))
+        if s3_object is None:
+            reasons.append(f"{layer} missing in S3")
+        elif s3_object["size"] != os.path.getsize(file_path) or s3_object["last_modified"] < datetime.fromtimestamp(
+            os.path.getmtime(file_path), tz=timezone.utc
+        ):
+            reasons.append(f"{layer} S3 copy out of date")
+    return reasons
+
+
+def find_gaps(
+    start_date: str,
+    end_date: str,
+    locations: list[str],
+    source: str = "openmeteo",
+    s3_client: Optional["S3Client"] = None,
+    max_age_hours: Optional[float] = None,
+) -> list[dict]:
+    """
+    Diff the expected grid against bronze/silver and list the partitions to re-ingest.
+
+    Args:
+        start_date: First run_date (inclusive) in YYYY-MM-DD format
+        end_date: Last run_date (inclusive) in YYYY-MM-DD format
+        locations: Location names
+        source: Data source identifier. Defaults to 'openmeteo'.
+        s3_client: If given, partitions must also be present and current in S3
+        max_age_hours: If given, partitions written longer ago than this are stale
+
+    Returns:
+        Jobs with run_date, location, source and the reasons they were scheduled
+    """
+    now = datetime.now(timezone.utc)
+    grid = expected_grid(start_date, end_date, locations)
+
+    # one catalog query per layer for the whole range
+    catalog = get_catalog()
+    catalog_entries: dict[tuple[str, str, str], dict] = {}
+    if catalog is not None:
+        for layer in LAYER_FILES:
+            for entry in catalog.list_partitions(layer, source, start_date, end_date):
+                catalog_entries[(layer, entry["run_date"], entry["location"])] = entry
+
+    # one LIST per layer and run_date
+    s3_listings: dict[tuple[str, str], dict[str, dict]] = {}
+    if s3_client is not None:
+        for layer in LAYER_FILES:
+            for run_date in date_range(start_date, end_date):
+                s3_listings[(layer, run_date)] = s3_client.list_objects(f"{_partition_dir(layer, source, run_date)}/")
+
+    gaps = []
+    for run_date, location in grid:
+        reasons = []
+        for layer in LAYER_FILES:
+            reasons += _partition_reasons(
+                layer, source, run_date, location, now,
+                catalog_entries.get((layer, run_date, location)),
+                s3_listings.get((layer, run_date)) if s3_client is not None else None,
+                max_age_hours,
+            )
+        if reasons:
+            gaps.append({"run_date": run_date, "location": location, "source": source, "reasons": reasons})
+
+    logger.info(f"Gap scan: {len(gaps)} of {len(grid)} partitions need ingesting between {start_date} and {end_date}")
+    return gaps
@@ -0,0 +1,287 @@
+"""
+Binary (FlatBuffers) Open-Meteo response decoding.
+
+With `format=flatbuffers` Open-Meteo answers with one size-prefixed
+FlatBuffers `WeatherApiResponse` message per requested coordinate instead of
+JSON. The messages are decoded here without the FlatBuffers runtime:
+- Scalars and strings are read straight from the tables with struct
+- Each hourly variable becomes a NumPy float32 array viewing the response
+  bytes (no Python lists of floats or timestamp strings are built)
+- Variables come back in the order they were requested, so names are taken
+  from the `hourly=` parameter of the request URL
+- Hourly timestamps are rebuilt as int64 Unix seconds from start/end/interval
+
+Decoded payloads keep the JSON payload's top-level keys, so batch splitting
+and bronze metadata work unchanged. Bronze stores them losslessly as an Arrow
+IPC file (raw.arrow) that normalize reads memory-mapped.
+
+Usage:
+    from src.pipeline.ingest.binary import decode_response, hourly_variables
+    payloads = decode_response(response.content, hourly_variables(url))
+"""
+
+import json
+import logging
+import struct
+from typing import Any, Optional, TYPE_CHECKING
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+# pyarrow is only needed to write/read the bronze file
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+FLATBUFFERS_FORMAT = "flatbuffers"
+
+# Open-Meteo variables the JSON API prints as whole numbers; normalize keeps
+# them int64 (when complete) so silver schemas match JSON-ingested partitions
+INTEGER_VARIABLES = frozenset({
+    "relative_humidity_2m",
+    "cloud_cover",
+    "cloud_cover_low",
+    "cloud_cover_mid",
+    "cloud_cover_high",
+    "precipitation_probability",
+    "weather_code",
+    "is_day",
+})
+
+# vtable slots of the Open-Meteo schema (weather_api.fbs)
+_RESPONSE_SLOTS = {
+    "latitude": (0, "f"),
+    "longitude": (1, "f"),
+    "elevation": (2, "f"),
+    "generationtime_ms": (3, "f"),
+    "location_id": (4, "q"),
+    "model": (5, "B"),
+    "utc_offset_seconds": (6, "i"),
+}
+_TIMEZONE_SLOT = 7
+_TIMEZONE_ABBREVIATION_SLOT = 8
+_HOURLY_SLOT = 11
+_TIME_SLOT, _TIME_END_SLOT, _INTERVAL_SLOT, _VARIABLES_SLOT = 0, 1, 2, 3
+_VARIABLE_SLOT, _UNIT_SLOT, _VALUES_SLOT, _ALTITUDE_SLOT = 0, 1, 3, 5
+
+# Arrow schema metadata key holding the payload's scalar fields
+ARROW_METADATA_KEY = b"openmeteo"
+
+
+class _FlatTable:
+    """Read-only view of one FlatBuffers table inside a byte buffer."""
+
+    def __init__(self, buf: bytes, pos: int):
+        self.buf = buf
+        self.pos = pos
+        self.vtable = pos - struct.unpack_from("<i", buf, pos)[0]
+        self.vtable_size = struct.unpack_from("<H", buf, self.vtable)[0]
+
+    def _field(self, slot: int) -> int:
+        """Offset of a field inside the table, or 0 if the field is absent."""
+        entry = 4 + 2 * slot
+        if entry >= self.vtable_size:
+            return 0
+        return struct.unpack_from("<H", self.buf, self.vtable + entry)[0]
+
+    def _target(self, slot: int) -> Optional[int]:
+        """Follow an offset field (table, vector or string) to its position."""
+        field = self._field(slot)
+        if not field:
+            return None
+        at = self.pos + field
+        return at + struct.unpack_from("<I", self.buf, at)[0]
+
+    def scalar(self, slot: int, fmt: str, default: Any = 0) -> Any:
+        field = self._field(slot)
+        return struct.unpack_from(f"<{fmt}", self.buf, self.pos + field)[0] if field else default
+
+    def string(self, slot: int) -> Optional[str]:
+        at = self._target(slot)
+        if at is None:
+            return None
+        length = struct.unpack_from("<I", self.buf, at)[0]
+        return bytes(self.buf[at + 4:at + 4 + length]).decode("utf-8")
+
+    def table(self, slot: int) -> Optional["_FlatTable"]:
+        at = self._target(slot)
+        return _FlatTable(self.buf, at) if at is not None else None
+
+    def tables(self, slot: int) -> list["_FlatTable"]:
+        at = self._target(slot)
+        if at is None:
+            return []
+        length = struct.unpack_from("<I", self.buf, at)[0]
+        elements = [at + 4 + 4 * i for i in range(length)]
+        return [_FlatTable(self.buf, e + struct.unpack_from("<I", self.buf, e)[0]) for e in elements]
+
+    def array(self, slot: int, dtype: str) -> np.ndarray:
+        """Vector field as a zero-copy NumPy view (empty if absent)."""
+        at = self._target(slot)
+        if at is None:
+            return np.empty(0, dtype=dtype)
+        length = struct.unpack_from("<I", self.buf, at)[0]
+        return np.frombuffer(self.buf, dtype=dtype, count=length, offset=at + 4)
+
+
+def hourly_variables(url: str) -> list[str]:
+    """
+    Read the requested hourly variable names from an Open-Meteo URL.
+
+    Args:
+        url: Request URL with an `hourly=` parameter
+
+    Returns:
+        Variable names in request order (the order FlatBuffers responses use)
+    """
+    values = parse_qs(urlsplit(url).query).get("hourly", [])
+    return [name for value in values for name in value.split(",") if name]
+
+
+def split_messages(payload: bytes) -> list[int]:
+    """
+    Find the size-prefixed messages in a FlatBuffers response.
+
+    Args:
+        payload: Response body (one message per requested coordinate)
+
+    Returns:
+        Start offsets of each message's size prefix
+
+    Raises:
+        ValueError: If a size prefix runs past the end of the payload
+    """
+    starts = []
+    pos = 0
+    while pos < len(payload):
+        size = struct.unpack_from("<I", payload, pos)[0]
+        if pos + 4 + size > len(payload):
+            raise ValueError(f"Truncated FlatBuffers message at byte {pos}: needs {size} bytes")
+        starts.append(pos)
+        pos += 4 + size
+    return starts
+
+
+def decode_message(payload: bytes, start: int, variables: list[str]) -> dict:
+    """
+    Decode one WeatherApiResponse message.
+
+    Args:
+        payload: Response body
+        start: Offset of the message's size prefix
+        variables: Requested hourly variable names, in request order
+
+    Returns:
+        Payload dictionary with the JSON API's top-level keys; `hourly` maps
+        `time` to int64 Unix seconds (UTC) and each variable to float32 values
+
+    Raises:
+        ValueError: If the message has no hourly block or its variable count differs from the request
+    """
+    root_pos = start + 4
+    root = _FlatTable(payload, root_pos + struct.unpack_from("<I", payload, root_pos)[0])
+
+    data: dict[str, Any] = {key: root.scalar(slot, fmt) for key, (slot, fmt) in _RESPONSE_SLOTS.items()}
+    data["timezone"] = root.string(_TIMEZONE_SLOT) or "GMT"
+    data["timezone_abbreviation"] = root.string(_TIMEZONE_ABBREVIATION_SLOT) or "GMT"
+
+    hourly = root.table(_HOURLY_SLOT)
+    if hourly is None:
+        raise ValueError("FlatBuffers response has no hourly block")
+    block = hourly.tables(_VARIABLES_SLOT)
+    if len(block) != len(variables):
+        raise ValueError(f"FlatBuffers response has {len(block)} hourly variables, {len(variables)} were requested")
+
+    interval = hourly.scalar(_INTERVAL_SLOT, "i")
+    times = np.arange(hourly.scalar(_TIME_SLOT, "q"), hourly.scalar(_TIME_END_SLOT, "q"), interval, dtype=np.int64)
+    data["hourly"] = {"time": times}
+    data["hourly_variables"] = {}
+    for name, variable in zip(variables, block):
+        data["hourly"][name] = variable.array(_VALUES_SLOT, "<f4")
+        # enum codes kept so bronze stays a lossless copy of the response
+        data["hourly_variables"][name] = {
+            "variable": variable.scalar(_VARIABLE_SLOT, "B"),
+            "unit": variable.scalar(_UNIT_SLOT, "B"),
+            "altitude": variable.scalar(_ALTITUDE_SLOT, "h"),
+        }
+    data["format"] = FLATBUFFERS_FORMAT
+    return data
+
+
+def decode_response(payload: bytes, variables: list[str]) -> list[dict]:
+    """
+    Decode every message of a FlatBuffers response.
+
+    Args:
+        payload: Response body
+        variables: Requested hourly variable names, in request order
+
+    Returns:
+        One payload dictionary per requested coordinate, in response order
+    """
+    results = [decode_message(payload, start, variables) for start in split_messages(payload)]
+    logger.debug(f"Decoded {len(results)} FlatBuffers messages from {len(payload)} bytes")
+    return results
+
+
+def to_arrow_table(data: dict) -> "pa.Table":
+    """
+    Convert a decoded payload to the lossless Arrow form stored in bronze.
+
+    Hourly arrays become columns without copying; every other key is kept as
+    JSON in the schema metadata under `openmeteo`.
+
+    Args:
+        data: Decoded payload (see decode_message)
+
+    Returns:
+        pyarrow Table with a UTC `time` column and one float32 column per variable
+    """
+    import pyarrow as pa
+
+    hourly = data["hourly"]
+    columns = {"time": pa.array(hourly["time"], type=pa.timestamp("s", tz="UTC"))}
+    columns.update({name: pa.array(values) for name, values in hourly.items() if name != "time"})
+    metadata = {key: value for key, value in data.items() if key != "hourly"}
+    return pa.table(columns).replace_schema_metadata({ARROW_METADATA_KEY: json.dumps(metadata)})
+
+
+def arrow_metadata(table: "pa.Table") -> dict:
+    """
+    Read the payload's scalar fields back from a bronze Arrow table.
+
+    Args:
+        table: Table written by to_arrow_table
+
+    Returns:
+        Dictionary of the non-hourly payload keys
+
+    Raises:
+        ValueError: If the table carries no Open-Meteo metadata
+    """
+    metadata = table.schema.metadata or {}
+    if ARROW_METADATA_KEY not in metadata:
+        raise ValueError("Arrow bronze file has no Open-Meteo metadata")
+    return json.loads(metadata[ARROW_METADATA_KEY])
+
+
+def widen_float32(values: np.ndarray) -> np.ndarray:
+    """
+    Widen float32 values to the float64 of their 7-significant-digit decimal form.
+
+    A plain cast turns 3.9 into 3.9000000953674316; rounding to float32's
+    precision gives the same 3.9 the JSON API prints, vectorized.
+
+    Args:
+        values: float32 array (NaN passes through)
+
+    Returns:
+        float64 array
+    """
+    wide = values.astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        magnitude = np.floor(np.log10(np.abs(wide)))
+    decimals = np.clip(6 - np.nan_to_num(magnitude, nan=0.0, posinf=0.0, neginf=0.0), 0, None)
+    scale = 10.0 ** decimals
+    return np.rint(wide * scale) / scale
@@ -5,17 +5,41 @@ Data extraction module for ingestion pipeline.
 Fetches raw weather data from Open-Meteo API and saves to bronze layer
 with partitioning by source, run_date, and location.
 
+Locations can also be fetched in batches: one request carries many
+comma-separated coordinates and the response list is split back into
+one bronze partition per location.
+
+With OPEN_METEO_FORMAT=flatbuffers the API answers in binary, which is
+decoded into NumPy arrays and saved to bronze as raw.arrow instead of raw.json.
+
 """
 
+import hashlib
+import os
 import requests
 import logging
 from datetime import datetime, timezone
+from typing import Any, Optional, TYPE_CHECKING
+from src.pipeline import profiling
 from src.pipeline.config import Project_Config
 from src.pipeline.io.local import save_json_local
-from src.pipeline.io.s3 import S3Client
+from src.pipeline.io.catalog import BRONZE_FILES, bronze_stats, get_catalog, record_partition
+from src.pipeline.ingest.resilience import get_with_retry
+
+if TYPE_CHECKING:
+    from src.pipeline.io.s3 import S3Client
 
 logger = logging.getLogger(__name__)
 
+# Coordinates per Open-Meteo request in batch mode (keeps URLs well under server limits)
+DEFAULT_BATCH_SIZE = 50
+
+def _with_format(url: str) -> str:
+    """Append the configured response format to an API URL (JSON needs no parameter)."""
+    if Project_Config.API.RESPONSE_FORMAT == "flatbuffers":
+        return f"{url}&format=flatbuffers"
+    return url
+
 def _build_url(location: str, run_date :str ) -> str:
     """
     Build API URL with location coordinates and date parameters.
@@ -30,45 +54,107 @@ def _build_url(location: str, run_date :str ) -> str:
     base_url = Project_Config.API.get_open_meteo_url(location)
 
     url = f"{base_url}&start_date={run_date}&end_date={run_date}"
+    url = _with_format(url)
     logger.debug(f"Built API URL: {url}")
     return url
 
-def _fetch_from_api(url:str) -> dict:
+def _build_batch_url(locations: list[str], run_date: str) -> str:
+    """
+    Build one API URL for several locations and a date.
+
+    Args:
+        locations: Location names (e.g., ['Boston', 'Miami'])
+        run_date: Date in YYYY-MM-DD format
+
+    Returns:
+        Complete API URL with comma-separated coordinates
+    """
+    base_url = Project_Config.API.get_open_meteo_batch_url(locations)
+
+    url = f"{base_url}&start_date={run_date}&end_date={run_date}"
+    url = _with_format(url)
+    logger.debug(f"Built batch API URL: {url}")
+    return url
+
+def _fetch_from_api(url:str, session: Optional[requests.Session] = None) -> Any:
     """
     Fetch weather data from API endpoint.
 
     Args:
         url: Complete API URL with parameters
+        session: Optional shared HTTP session to reuse connections across jobs
 
     Returns: 
-        JSON response data as dictionary
+        JSON response data as dictionary (a list of dictionaries for multi-coordinate requests).
+        FlatBuffers responses are decoded to a list of dictionaries holding NumPy arrays.
 
     Raises:
-        requests.exceptions.RequestException: If HTTP request fails
+        requests.exceptions.RequestException: If HTTP request fails after retries, or the circuit is open
     """
     logger.info("Sending GET request to API")
-    response = requests.get(url, timeout=10)
-    response.raise_for_status()
+    http = session if session is not None else requests
+    # rate limited, retried with backoff and guarded by the shared circuit breaker
+    response = get_with_retry(http, url, timeout=10)
 
-    data = response.json()
+    if "format=flatbuffers" in url:
+        # numpy loads only for binary responses
+        from src.pipeline.ingest.binary import decode_response, hourly_variables
+        results = decode_response(response.content, hourly_variables(url))
+        # like JSON, a single coordinate is one payload rather than a list
+        data = results[0] if len(results) == 1 else results
+        logger.info(f"Decoded {len(response.content)} byte FlatBuffers response")
+    else:
+        data = response.json()
 
-    record_count = len(data.get('hourly',{}).get('time', []))
+    results = data if isinstance(data, list) else [data]
+    record_count = sum(len(result.get('hourly',{}).get('time', [])) for result in results)
     logger.info(f"Fetched {record_count} records from API")
 
     return data
 
-def _save_to_bronze(data:dict, run_date:str, location:str,source:str, write_to_s3: bool = False) -> str:
+def _split_batch_response(data: Any, locations: list[str]) -> dict[str, dict]:
+    """
+    Split a multi-coordinate response into one payload per location.
+
+    Args:
+        data: JSON response (list of results, or a single dict for one coordinate)
+        locations: Location names in the order their coordinates were requested
+
+    Returns:
+        Mapping of location name to its own response payload
+
+    Raises:
+        ValueError: If the number of results does not match the number of locations
+    """
+    results = data if isinstance(data, list) else [data]
+    if len(results) != len(locations):
+        logger.error(f"Batch response has {len(results)} results for {len(locations)} locations")
+        raise ValueError(f"Batch response has {len(results)} results for {len(locations)} locations")
+
+    # results come back in request order; honour location_id when the API includes it
+    if all("location_id" in result for result in results):
+        results = sorted(results, key=lambda result: result["location_id"])
+
+    return dict(zip(locations, results))
+
+def _save_to_bronze(data:dict, run_date:str, location:str,source:str, write_to_s3: bool = False, s3_client: Optional["S3Client"] = None) -> str:
     """
     Save raw API data to bronze layer with metadata.
 
+    JSON payloads are written as raw.json; payloads decoded from FlatBuffers
+    are written losslessly as raw.arrow. Any bronze file of the other format
+    left by an earlier run is removed.
+
     Args:
-        data: Raw JSON data from API
+        data: Raw JSON data from API, or a payload decoded from FlatBuffers
         run_date: Date in YYYY-MM-DD format
         location: Location name
         source: Data source identifier
+        write_to_s3: If true, upload the file to S3
+        s3_client: Optional shared S3 client (a new one is created if omitted)
 
     Returns:
-        Path to saved JSON file
+        Path to saved bronze file
     """
     # Add ingestion metadata
     data["ingestion_timestamp"] = datetime.now(timezone.utc).isoformat()
@@ -76,20 +162,47 @@ def _save_to_bronze(data:dict, run_date:str, location:str,source:str, write_to_s
 
     # Use Config to get the directory path (e.g., data/bronze/source=openmeteo/...)
     dir_path = Project_Config.Paths.bronze_path(source, run_date, location)
-    file_path = f"{dir_path}/raw.json"
+
+    # hash the bytes as they are written, so the catalog entry needs no read-back of the file
+    digest = hashlib.sha256() if get_catalog() is not None else None
 
     # Call our centralized I/O module instead of handling it here
-    save_json_local(data, file_path)
+    payload: Any = data
+    if data.get("format") == "flatbuffers":
+        from src.pipeline.ingest.binary import to_arrow_table
+        from src.pipeline.io.local import save_arrow_local
+        payload = to_arrow_table(data)
+        file_path = save_arrow_local(payload, f"{dir_path}/raw.arrow", digest)
+    else:
+        file_path = save_json_local(data, f"{dir_path}/raw.json", digest)
+
+    # normalize reads whichever bronze file exists, so drop one left by the other format
+    for name in BRONZE_FILES:
+        stale_path = f"{dir_path}/{name}"
+        if stale_path != file_path and os.path.exists(stale_path):
+            os.remove(stale_path)
+    if digest is not None:
+        record_partition("bronze", source, run_date, location, bronze_stats(file_path, payload, digest.hexdigest()))
 
     if write_to_s3:
         logger.info(f"Uploading bronze file to S3: {file_path}")
-        s3 = S3Client()
-        #No s3 key auto-mirrors local folder structure 
-        s3.upload_file(local_path = file_path, s3_key=None)
+        with profiling.stage("upload"):
+            if s3_client is None:
+                from src.pipeline.io.s3 import S3Client
+                s3_client = S3Client()
+            #No s3 key auto-mirrors local folder structure 
+            s3_client.upload_file(local_path = file_path, s3_key=None)
 
     return file_path
 
-def _run_fetch(run_date:str, location:str,source:str,write_to_s3 : bool = False) -> None:
+def _run_fetch(
+    run_date:str,
+    location:str,
+    source:str,
+    write_to_s3 : bool = False,
+    session: Optional[requests.Session] = None,
+    s3_client: Optional["S3Client"] = None,
+) -> None:
     """
     Orchestrate fetch process: build URL, fetch data, save to bronze.
     
@@ -97,6 +210,9 @@ def _run_fetch(run_date:str, location:str,source:str,write_to_s3 : bool = False)
         run_date: Date in YYYY-MM-DD format
         location: Location name (e.g., 'Boston')
         source: Data source identifier (e.g., 'openmeteo')
+        write_to_s3: If true, upload the bronze file to S3
+        session: Optional shared HTTP session
+        s3_client: Optional shared S3 client
     
     Raises:
         requests.exceptions.RequestException: If API request fails
@@ -106,15 +222,56 @@ def _run_fetch(run_date:str, location:str,source:str,write_to_s3 : bool = False)
         logger.info(f"Starting fetch: source={source}, location={location}, run_date={run_date}")
         
         url = _build_url(location, run_date)
-        data = _fetch_from_api(url)
-        _save_to_bronze(data, run_date, location, source, write_to_s3=write_to_s3)
+        data = _fetch_from_api(url, session=session)
+        _save_to_bronze(data, run_date, location, source, write_to_s3=write_to_s3, s3_client=s3_client)
 
     except Exception as e:
         logger.error(f"Error during fetch: {e}")
         raise
-    
 
+def _run_fetch_batch(
+    run_date: str,
+    locations: list[str],
+    source: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    write_to_s3: bool = False,
+    session: Optional[requests.Session] = None,
+    s3_client: Optional["S3Client"] = None,
+) -> dict[str, str]:
+    """
+    Fetch many locations with one request per batch and save each to its own bronze partition.
+
+    Args:
+        run_date: Date in YYYY-MM-DD format
+        locations: Location names to fetch
+        source: Data source identifier (e.g., 'openmeteo')
+        batch_size: Maximum coordinates per API request
+        write_to_s3: If true, upload each bronze file to S3
+        session: Optional shared HTTP session
+        s3_client: Optional shared S3 client
+
+    Returns:
+        Mapping of location name to saved bronze file path
 
+    Raises:
+        requests.exceptions.RequestException: If an API request fails
+        ValueError: If a batch response cannot be matched to its locations
+    """
+    batch_size = max(1, batch_size)
+    saved = {}
+    for start in range(0, len(locations), batch_size):
+        batch = locations[start:start + batch_size]
+        try:
+            logger.info(f"Starting batch fetch: source={source}, locations={len(batch)}, run_date={run_date}")
 
+            url = _build_batch_url(batch, run_date)
+            data = _fetch_from_api(url, session=session)
+            for location, payload in _split_batch_response(data, batch).items():
+                saved[location] = _save_to_bronze(payload, run_date, location, source, write_to_s3=write_to_s3, s3_client=s3_client)
 
+        except Exception as e:
+            logger.error(f"Error during batch fetch: {e}")
+            raise
 
+    logger.info(f"Batch fetch completed: {len(saved)} locations in {-(-len(locations) // batch_size)} requests")
+    return saved
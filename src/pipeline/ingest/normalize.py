@@ -7,16 +7,40 @@ Transforms validated bronze JSON into cleaned Parquet format:
 - Adds location metadata (latitude/longitude)
 - Converts timestamps to datetime objects
 - Saves as partitioned Parquet to silver layer
+
+Large payloads are normalized in fixed-size chunks of the hourly arrays and
+streamed to Parquet one row group at a time, so no full-size DataFrame or
+Parquet buffer is built. A raw.json payload is still parsed whole into
+Python lists first, so its peak memory grows with the payload; raw.arrow
+payloads are read memory-mapped and stay bounded by the chunk size.
+The Parquet schema is fixed from the whole payload before the first chunk
+is written, so column types do not depend on where the chunks split (a
+whole-number column with a null anywhere is float64, as in one shot).
+
+Bronze raw.arrow files (binary API responses) are read memory-mapped and
+normalized from their column buffers into the same silver schema, without
+parsing timestamp strings or building Python lists.
 """
 
 import logging
+from typing import Iterable, Iterator, Optional, Union, TYPE_CHECKING
+import numpy as np
 import pandas as pd
+from src.pipeline import profiling
 from src.pipeline.config import Project_Config
-from src.pipeline.io.local import save_parquet_local, read_json_local
-from src.pipeline.io.s3 import S3Client
+from src.pipeline.ingest.binary import INTEGER_VARIABLES, arrow_metadata, widen_float32
+from src.pipeline.io.local import save_parquet_chunks_local, read_arrow_local, read_json_local
+from src.pipeline.io.catalog import bronze_file, record_partition
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from src.pipeline.io.s3 import S3Client
 
 logger = logging.getLogger(__name__)
 
+# Hourly rows normalized and written per Parquet row group
+DEFAULT_CHUNK_ROWS = 50_000
+
 def _load_bronze_data(file_path : str) -> dict:
     """
     Load validated bronze JSON data using centralized I/O.
@@ -53,48 +77,189 @@ def _normalize_data(data : dict) -> pd.DataFrame:
     df['time'] = pd.to_datetime(df['time'])
 
     record_count = len(df)
-    logger.info(f"Normalized {record_count} records for silver layer")
-    logger.debug(f"DataFrame shape: {df.shape}, columns: {list(df.columns)}")
+    logger.debug(f"Normalized {record_count} records, columns: {list(df.columns)}")
 
     return df
 
 
-def _save_to_silver(df : pd.DataFrame,run_date : str, location: str, source: str, write_to_s3 : bool = False) -> str:
+def _iter_normalized_chunks(data : dict, chunk_rows : int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Normalize the hourly arrays in fixed-size slices.
+
+    Args:
+        data: Bronze layer JSON data
+        chunk_rows: Maximum rows per yielded DataFrame
+
+    Yields:
+        Normalized DataFrames of at most chunk_rows rows
     """
-    Save normalized DataFrame to silver layer as Parquet using centralized I/O.
+    hourly_data = data['hourly']
+    total_rows = len(hourly_data.get('time', []))
+    for start in range(0, total_rows, max(1, chunk_rows)):
+        chunk = {key: values[start:start + chunk_rows] for key, values in hourly_data.items()}
+        yield _normalize_data({**data, 'hourly': chunk})
+
+
+def _silver_schema(probe : pd.DataFrame, integer_columns : Iterable[str]) -> "pa.Schema":
+    """
+    Build the silver Arrow schema for a payload from one normalized sample row.
+
+    Args:
+        probe: Normalized DataFrame of the payload's first row (for column order and time type)
+        integer_columns: Variables that are whole numbers with no nulls across the whole payload
+
+    Returns:
+        Schema with integer_columns as int64 and every other numeric column as float64
+    """
+    import pyarrow as pa
+
+    integer_columns = set(integer_columns)
+    fields = []
+    for field in pa.Schema.from_pandas(probe, preserve_index=False):
+        if field.name in integer_columns:
+            field = field.with_type(pa.int64())
+        elif pa.types.is_integer(field.type) or pa.types.is_floating(field.type) or pa.types.is_null(field.type):
+            field = field.with_type(pa.float64())
+        fields.append(field)
+    return pa.schema(fields)
+
+
+def _json_silver_schema(data : dict) -> "pa.Schema":
+    """
+    Silver schema for a bronze JSON payload, matching what _normalize_data infers for it whole.
+
+    Args:
+        data: Bronze layer JSON data
+
+    Returns:
+        Arrow schema for the silver Parquet file
+    """
+    hourly_data = data['hourly']
+    probe = _normalize_data({**data, 'hourly': {key: values[:1] for key, values in hourly_data.items()}})
+    integer_columns = [
+        key for key, values in hourly_data.items()
+        if key != 'time' and values and all(type(value) is int for value in values)
+    ]
+    return _silver_schema(probe, integer_columns)
+
+
+def _table_silver_schema(table : "pa.Table") -> "pa.Schema":
+    """
+    Silver schema for a bronze Arrow table, matching the JSON path's types.
+
+    Args:
+        table: Bronze table read from raw.arrow
+
+    Returns:
+        Arrow schema for the silver Parquet file
+    """
+    import pyarrow.compute as pc
+
+    metadata = arrow_metadata(table)
+    probe = _normalize_table(table.slice(0, 1), metadata['latitude'], metadata['longitude'], metadata['utc_offset_seconds'])
+    integer_columns = [
+        name for name in table.column_names
+        if name in INTEGER_VARIABLES and table[name].null_count == 0 and not pc.any(pc.is_nan(table[name])).as_py()
+    ]
+    return _silver_schema(probe, integer_columns)
+
+
+def _normalize_table(table : "pa.Table", latitude : float, longitude : float, utc_offset_seconds : int) -> pd.DataFrame:
+    """
+    Transform a slice of a bronze Arrow table to the silver schema of _normalize_data.
+
+    Args:
+        table: Bronze table (UTC `time` column plus one float32 column per variable)
+        latitude: Location latitude
+        longitude: Location longitude
+        utc_offset_seconds: Offset applied so `time` is local, as in JSON responses
+
+    Returns:
+        Normalized DataFrame with hourly weather data and location columns
+    """
+    import pyarrow as pa
+
+    seconds = table["time"].cast(pa.int64()).to_numpy() + utc_offset_seconds
+    columns = {"time": seconds.astype("datetime64[s]").astype("datetime64[us]")}
+    for name in table.column_names:
+        if name == "time":
+            continue
+        values = widen_float32(table[name].to_numpy())
+        # match the JSON path, where pandas infers int64 for complete whole-number columns
+        if name in INTEGER_VARIABLES and not np.isnan(values).any():
+            values = values.astype(np.int64)
+        columns[name] = values
+
+    df = pd.DataFrame(columns)
+    df['latitude'] = latitude
+    df['longitude'] = longitude
+
+    logger.debug(f"Normalized {len(df)} records, columns: {list(df.columns)}")
+    return df
+
+
+def _iter_normalized_table_chunks(table : "pa.Table", chunk_rows : int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Normalize a bronze Arrow table in fixed-size zero-copy slices.
+
+    Args:
+        table: Bronze table read from raw.arrow
+        chunk_rows: Maximum rows per yielded DataFrame
+
+    Yields:
+        Normalized DataFrames of at most chunk_rows rows
+    """
+    metadata = arrow_metadata(table)
+    latitude, longitude = widen_float32(np.array([metadata['latitude'], metadata['longitude']], dtype=np.float32))
+    for start in range(0, table.num_rows, max(1, chunk_rows)):
+        yield _normalize_table(table.slice(start, chunk_rows), float(latitude), float(longitude), metadata['utc_offset_seconds'])
+
+
+def _save_to_silver(df : Union[pd.DataFrame, Iterable[pd.DataFrame]],run_date : str, location: str, source: str, write_to_s3 : bool = False, s3_client: Optional["S3Client"] = None, schema: Optional["pa.Schema"] = None) -> str:
+    """
+    Save normalized data to silver layer as Parquet using centralized I/O.
     
     Args:
-        df: Normalized DataFrame
+        df: Normalized DataFrame, or an iterable of DataFrame chunks to stream
         run_date: Date in YYYY-MM-DD format
         location: Location name
         source: Data source identifier
+        write_to_s3: If true, upload the file to S3
+        s3_client: Optional shared S3 client (a new one is created if omitted)
+        schema: Arrow schema for the file (required for consistent types when streaming chunks)
     
     Returns:
         Path to saved Parquet file
     
     Raises:
-        ValueError: If DataFrame is empty
+        ValueError: If there are no normalized rows
     """
-    if df.empty:
-        logger.error("Normalized DataFrame is empty!")
-        raise ValueError("Normalized DataFrame is empty!")
-    
+    frames = [df] if isinstance(df, pd.DataFrame) else df
+
     # Generate partitioned path via Config
     dir_path = Project_Config.Paths.silver_path(source, run_date, location)
     file_path = f"{dir_path}/weather_data.parquet"
 
-    # Use the local I/O module
-    save_parquet_local(df, file_path)
+    # Use the local I/O module (one row group per chunk)
+    record_count = save_parquet_chunks_local(frames, file_path, schema=schema)
+    if record_count == 0:
+        logger.error("Normalized DataFrame is empty!")
+        raise ValueError("Normalized DataFrame is empty!")
+    logger.info(f"Normalized {record_count} records for silver layer")
+    record_partition("silver", source, run_date, location)
 
     if write_to_s3:
         logger.info(f"Uploading silver file to S3: {file_path}")
-        s3 = S3Client()
-        s3.upload_file(local_path=file_path,s3_key=None)
+        with profiling.stage("upload"):
+            if s3_client is None:
+                from src.pipeline.io.s3 import S3Client
+                s3_client = S3Client()
+            s3_client.upload_file(local_path=file_path,s3_key=None)
 
     return file_path
 
 
-def run_normalize(run_date : str, location : str = "Boston", source: str = "openmeteo", write_to_s3 : bool = False) -> bool:
+def run_normalize(run_date : str, location : str = "Boston", source: str = "openmeteo", write_to_s3 : bool = False, s3_client: Optional["S3Client"] = None, chunk_rows : int = DEFAULT_CHUNK_ROWS) -> bool:
     """
     Orchestrate normalization: load bronze, transform, save to silver.
     
@@ -102,6 +267,9 @@ def run_normalize(run_date : str, location : str = "Boston", source: str = "open
         run_date: Date in YYYY-MM-DD format
         location: Location name. Defaults to 'Boston'.
         source: Data source identifier. Defaults to 'openmeteo'.
+        write_to_s3: If true, upload the silver file to S3
+        s3_client: Optional shared S3 client
+        chunk_rows: Hourly rows normalized and written at a time
     
     Returns:
         True if normalization completes successfully
@@ -113,13 +281,20 @@ def run_normalize(run_date : str, location : str = "Boston", source: str = "open
     try:
         logger.info(f"Starting normalization: source={source}, location={location}, run_date={run_date}")
 
-        # Build input path
-        input_path = f"{Project_Config.Paths.bronze_path(source, run_date, location)}/raw.json"
+        # Build input path (raw.json, or raw.arrow for binary responses)
+        input_path = bronze_file(Project_Config.Paths.bronze_path(source, run_date, location))
 
         # Load -> normalize -> save
-        raw_data = _load_bronze_data(input_path)
-        df = _normalize_data(raw_data)
-        _save_to_silver(df,run_date,location,source,write_to_s3=write_to_s3)
+        chunks: Iterable[pd.DataFrame]
+        if input_path.endswith(".arrow"):
+            table = read_arrow_local(input_path)
+            schema = _table_silver_schema(table)
+            chunks = _iter_normalized_table_chunks(table, chunk_rows)
+        else:
+            raw_data = _load_bronze_data(input_path)
+            schema = _json_silver_schema(raw_data)
+            chunks = _iter_normalized_chunks(raw_data, chunk_rows)
+        _save_to_silver(chunks,run_date,location,source,write_to_s3=write_to_s3,s3_client=s3_client,schema=schema)
         
         logger.info("Normalization completed successfully")
         return True
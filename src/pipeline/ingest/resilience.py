@@ -0,0 +1,254 @@
+"""
+Retry, rate limiting and circuit breaking for API requests.
+
+Keeps transient API trouble inside the running process instead of failing
+the container and waiting for Airflow's task-level retry:
+- Retryable responses (429/5xx) and connection errors are retried with
+  full-jitter exponential backoff, honouring Retry-After when sent
+- A token bucket shared by every fetch in the process keeps the request
+  rate under the provider's published limit
+- A circuit breaker opens after consecutive server/connection failures and
+  fails fast until a cool-down has passed, then lets one trial request through
+
+Usage:
+    from src.pipeline.ingest.resilience import get_with_retry
+    response = get_with_retry(session, url)
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import requests
+
+from src.pipeline.config import Project_Config
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised without sending a request while the circuit breaker is open."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting the request rate across concurrent fetches.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum burst size (default: one second of tokens)
+            clock: Monotonic time source
+            sleep: Sleep function
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                # tolerance: refill arithmetic can land a hair under a whole token
+                if self._tokens >= 1 - 1e-9:
+                    self._tokens = max(self._tokens - 1, 0.0)
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with a half-open trial after a cool-down.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before allowing a trial request
+            clock: Monotonic time source
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """'closed', 'open' or 'half-open'."""
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "half-open" if self._clock() - self._opened_at >= self.reset_timeout else "open"
+
+    def before_request(self) -> bool:
+        """
+        Check that a request may be sent.
+
+        Returns:
+            True if the request is the half-open trial (the caller must then
+            resolve it with record_success, record_failure or release_trial)
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or a half-open trial is already running
+        """
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return False
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            retry_in = max(self.reset_timeout - (self._clock() - (self._opened_at or 0)), 0)
+        raise CircuitOpenError(f"Circuit open after {self._failures} consecutive failures, retry in {retry_in:.0f}s")
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening (or re-opening) the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            # a failed half-open trial re-opens for another full cool-down
+            if self._trial_in_flight or (self._opened_at is None and self._failures >= self.failure_threshold):
+                logger.warning(f"Circuit breaker opened after {self._failures} consecutive failures")
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Free the half-open trial slot without a verdict, so the next request can be the trial."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+# Shared by every fetch in the process (batch workers, chunked DAG runs)
+API_RATE_LIMITER = TokenBucket(rate=Project_Config.API.MAX_CALLS_PER_MINUTE / 60)
+API_CIRCUIT_BREAKER = CircuitBreaker(
+    failure_threshold=Project_Config.API.BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=Project_Config.API.BREAKER_RESET_SECONDS,
+)
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Parse a numeric Retry-After header, if present."""
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def get_with_retry(
+    http: Any,
+    url: str,
+    timeout: float = 10,
+    max_retries: Optional[int] = None,
+    backoff_base: float = 0.5,
+    backoff_max: float = 30.0,
+    limiter: Optional[TokenBucket] = API_RATE_LIMITER,
+    breaker: Optional[CircuitBreaker] = API_CIRCUIT_BREAKER,
+    sleep: Callable[[float], None] = time.sleep,
+) -> requests.Response:
+    """
+    Send a GET request with rate limiting, retries and circuit breaking.
+
+    Args:
+        http: requests module or a requests.Session
+        url: Request URL
+        timeout: Per-attempt timeout in seconds
+        max_retries: Retries after the first attempt (default: Project_Config.API.MAX_RETRIES)
+        backoff_base: First backoff ceiling in seconds, doubled per retry
+        backoff_max: Largest backoff ceiling in seconds
+        limiter: Token bucket to draw from before each attempt, or None
+        breaker: Circuit breaker guarding the endpoint, or None
+        sleep: Sleep function
+
+    Returns:
+        Successful response
+
+    Raises:
+        CircuitOpenError: If the circuit breaker is open
+        requests.exceptions.HTTPError: If a non-retryable status is returned or retries run out
+        requests.exceptions.RequestException: If connection errors persist after retries
+    """
+    if max_retries is None:
+        max_retries = Project_Config.API.MAX_RETRIES
+
+    attempt = 0
+    while True:
+        trial = breaker.before_request() if breaker is not None else False
+        retry_after = None
+        try:
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                response = http.get(url, timeout=timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                if attempt == max_retries:
+                    raise
+                reason = type(e).__name__
+            else:
+                if response.status_code not in RETRYABLE_STATUSES:
+                    if breaker is not None:
+                        breaker.record_success()
+                    response.raise_for_status()
+                    return response
+
+                # 429 means slow down, not down: it never trips the breaker
+                if breaker is not None and response.status_code != 429:
+                    breaker.record_failure()
+                if attempt == max_retries:
+                    response.raise_for_status()
+                reason = f"HTTP {response.status_code}"
+                retry_after = _retry_after_seconds(response)
+        finally:
+            # a trial that ended without a verdict (429, unexpected error) must not hold the slot
+            if trial and breaker is not None:
+                breaker.release_trial()
+
+        # full jitter keeps concurrent workers from retrying in lockstep
+        delay = random.uniform(0, min(backoff_max, backoff_base * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, backoff_max))
+        logger.warning(f"Request failed ({reason}), retry {attempt + 1}/{max_retries} in {delay:.2f}s")
+        sleep(delay)
+        attempt += 1
@@ -6,6 +6,9 @@ Validates raw JSON data from API before normalization:
 - Schema validation (required keys present)
 - Data quality checks (non-empty, parseable timestamps)
 - Duplicate detection on natural key (location + timestamp)
+
+Bronze raw.arrow files (binary API responses) get the same schema, emptiness
+and duplicate checks against their metadata and typed time column.
 """
 
 import logging 
@@ -111,12 +114,61 @@ def _validate_data_quality(data:dict) -> bool:
     logger.info(f"Data quality validation passed ({record_count} records, 0 duplicates)")
     return True
     
+def _validate_arrow(file_path : str) -> bool:
+    """
+    Validate a bronze raw.arrow file: metadata keys, non-empty, no duplicate timestamps.
+
+    Args:
+        file_path: Path to bronze Arrow file
+
+    Returns:
+        True if all checks pass
+
+    Raises:
+        ValueError: If metadata is missing, the data is empty, or duplicates are found
+    """
+    import pyarrow.compute as pc
+    from src.pipeline.ingest.binary import arrow_metadata
+    from src.pipeline.io.local import read_arrow_local
+
+    REQUIRED_KEYS = [
+        "latitude",
+        "longitude",
+        "generationtime_ms",
+        "utc_offset_seconds",
+        "timezone",
+        "timezone_abbreviation",
+        "elevation",
+        "hourly_variables"
+    ]
+
+    table = read_arrow_local(file_path)
+    metadata = arrow_metadata(table)
+    missing_keys = [key for key in REQUIRED_KEYS if key not in metadata]
+    if missing_keys or "time" not in table.column_names:
+        missing = missing_keys + ([] if "time" in table.column_names else ["time"])
+        logger.error(f"Missing required keys: {', '.join(missing)}")
+        raise ValueError(f"Data is missing required keys: {','.join(missing)}")
+
+    if table.num_rows == 0:
+        logger.error("Hourly data is empty")
+        raise ValueError("Dataset is empty")
+
+    # time is a typed timestamp column, so only uniqueness needs checking
+    duplicate_count = table.num_rows - pc.count_distinct(table["time"]).as_py()
+    if duplicate_count:
+        logger.error(f"Found {duplicate_count} duplicate records on natural key (location + timestamp)")
+        raise ValueError(f"Data contains {duplicate_count} duplicates on natural key")
+
+    logger.info(f"Data quality validation passed ({table.num_rows} records, 0 duplicates)")
+    return True
+
 def validate_bronze_file(file_path : str) -> bool:
     """
     Orchestrate full validation: load, schema check, quality check.
     
     Args:
-        file_path: Path to bronze JSON file
+        file_path: Path to bronze JSON (or Arrow) file
     
     Returns:
         True if validation passes
@@ -128,7 +180,11 @@ def validate_bronze_file(file_path : str) -> bool:
     try:
         logger.info(f"Starting validation: {file_path}")
 
-        
+        if file_path.endswith(".arrow"):
+            _validate_arrow(file_path)
+            logger.info("Data successfully passed validation! Suitable for normalization")
+            return True
+
         data = read_json_local(file_path)
         _validate_schema(data)
         _validate_data_quality(data)
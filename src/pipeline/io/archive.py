@@ -0,0 +1,414 @@
+"""
+Bronze archive compaction into packed per-month containers.
+
+Every run_date and location leaves one small raw.json (or raw.arrow) in
+bronze, mirrored to S3 as its own object. Once a month is closed, this job
+packs all of its bronze partitions into a single compressed archive and
+removes the loose files:
+
+    {bronze}/source=S/_archive/2026-01.pack
+
+Container layout (little-endian):
+- MAGIC, then one zlib-compressed member per partition, back to back
+- A zlib-compressed JSON index: run_date, location, file name, offset and
+  length of each member, plus the payload's size, SHA-256 and write time
+- A footer: index offset, index length, MAGIC
+
+Each member is compressed on its own, so replaying one payload reads the
+footer, the index and that member only. The index is parsed once per
+archive version and looked up by (run_date, location). read_json_local,
+read_arrow_local and catalog.bronze_file fall back to the archive when a
+partition has no loose file, so validate and normalize replay archived
+partitions unchanged. A loose file always wins
+over its archived copy: a re-ingested partition overrides the archive, and
+the next compaction of that month folds it in.
+
+Consistency guarantees:
+- The archive is written to a temporary name and renamed into place, and
+  every member is verified against its checksum before any loose file is
+  deleted
+- Reruns merge loose partitions into the existing archive, copying the
+  members already packed without recompressing them
+- As each loose file is deleted, its partition catalog entry is pointed at
+  the archive (checksum and statistics are unchanged)
+
+Usage:
+    python -m src.pipeline.io.archive
+    python -m src.pipeline.io.archive --month 2026-01 --write-s3
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from src.pipeline.io.s3 import S3Client
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = "_archive"
+MAGIC = b"BRZPACK1"
+# index offset, index length, magic
+_FOOTER = struct.Struct("<QQ8s")
+# Bronze partitions hold one of these (see catalog.BRONZE_FILES)
+_BRONZE_FILES = ("raw.json", "raw.arrow")
+
+# path -> ((mtime_ns, size), index, members by (run_date, location))
+_index_cache: dict[str, tuple[tuple[int, int], dict, dict[tuple[str, str], dict]]] = {}
+_index_lock = threading.Lock()
+
+
+def archive_path(source_dir: str, month: str) -> str:
+    """
+    Path of a month's archive.
+
+    Args:
+        source_dir: Bronze source directory ({bronze}/source=S)
+        month: Month in YYYY-MM format
+
+    Returns:
+        Archive file path
+    """
+    return os.path.join(source_dir, ARCHIVE_DIR, f"{month}.pack")
+
+
+def read_index(path: str) -> dict:
+    """
+    Read an archive's index, cached until the file changes.
+
+    Args:
+        path: Archive file path
+
+    Returns:
+        Index dictionary with a 'members' list
+
+    Raises:
+        FileNotFoundError: If the archive does not exist
+        ValueError: If the file is not an archive
+    """
+    return _cached_index(path)[0]
+
+
+def _cached_index(path: str) -> tuple[dict, dict[tuple[str, str], dict]]:
+    """
+    Parse an archive's index and its (run_date, location) lookup, cached until the file changes.
+
+    Args:
+        path: Archive file path
+
+    Returns:
+        Tuple of (index dictionary, members keyed by (run_date, location))
+    """
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _index_lock:
+        cached = _index_cache.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a bronze archive: {path}")
+        f.seek(-_FOOTER.size, os.SEEK_END)
+        index_offset, index_length, magic = _FOOTER.unpack(f.read(_FOOTER.size))
+        if magic != MAGIC:
+            raise ValueError(f"Truncated bronze archive: {path}")
+        f.seek(index_offset)
+        index = json.loads(zlib.decompress(f.read(index_length)))
+    members = {(member["run_date"], member["location"]): member for member in index["members"]}
+
+    with _index_lock:
+        _index_cache[path] = (version, index, members)
+    return index, members
+
+
+def read_member(path: str, member: dict) -> bytes:
+    """
+    Read and decompress one payload of an archive.
+
+    Args:
+        path: Archive file path
+        member: Entry of the archive's index
+
+    Returns:
+        The original file contents
+
+    Raises:
+        ValueError: If the payload does not match its checksum
+    """
+    with open(path, "rb") as f:
+        f.seek(member["offset"])
+        data = zlib.decompress(f.read(member["length"]))
+    if hashlib.sha256(data).hexdigest() != member["sha256"]:
+        raise ValueError(f"Checksum mismatch for {member['run_date']}/{member['location']} in {path}")
+    return data
+
+
+def find_member(partition_dir: str) -> Optional[tuple[str, dict]]:
+    """
+    Look up the archived payload of a bronze partition.
+
+    Args:
+        partition_dir: Bronze partition directory ({bronze}/source=S/run_date=D/location=L)
+
+    Returns:
+        (archive path, index entry), or None if the partition is not archived
+    """
+    run_date_dir = os.path.dirname(os.path.normpath(partition_dir))
+    run_date = os.path.basename(run_date_dir).partition("run_date=")[2]
+    location = os.path.basename(os.path.normpath(partition_dir)).partition("location=")[2]
+    if not run_date or not location:
+        return None
+    path = archive_path(os.path.dirname(run_date_dir), run_date[:7])
+    if not os.path.exists(path):
+        return None
+    member = _cached_index(path)[1].get((run_date, location))
+    return (path, member) if member is not None else None
+
+
+def read_archived(file_path: str) -> bytes:
+    """
+    Contents of a bronze file that only exists in an archive.
+
+    Args:
+        file_path: Path the loose file would have (.../location=L/raw.json)
+
+    Returns:
+        The original file contents
+
+    Raises:
+        FileNotFoundError: If no archive holds that file
+    """
+    found = find_member(os.path.dirname(file_path))
+    if found is None or found[1]["name"] != os.path.basename(file_path):
+        raise FileNotFoundError(f"No file at {file_path}")
+    logger.debug(f"Reading {file_path} from archive {found[0]}")
+    return read_member(*found)
+
+
+def _loose_partitions(source_dir: str, month: str) -> list[tuple[str, str, str]]:
+    """(run_date, location, file path) of every loose bronze file in a month."""
+    partitions = []
+    for partition_dir in sorted(glob.glob(os.path.join(source_dir, f"run_date={month}-*", "location=*"))):
+        for name in _BRONZE_FILES:
+            file_path = os.path.join(partition_dir, name)
+            if os.path.exists(file_path):
+                run_date = os.path.basename(os.path.dirname(partition_dir)).split("=", 1)[1]
+                partitions.append((run_date, os.path.basename(partition_dir).split("=", 1)[1], file_path))
+                break
+    return partitions
+
+
+def _remove_loose(file_path: str) -> None:
+    """Delete a packed bronze file and the partition and run_date directories it leaves empty."""
+    os.remove(file_path)
+    for directory in (os.path.dirname(file_path), os.path.dirname(os.path.dirname(file_path))):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            break
+
+
+def compact_month(
+    source_dir: str,
+    month: str,
+    write_to_s3: bool = False,
+    s3_client: Optional["S3Client"] = None,
+) -> Optional[dict]:
+    """
+    Pack a month's loose bronze partitions into its archive and delete them.
+
+    Args:
+        source_dir: Bronze source directory ({bronze}/source=S)
+        month: Month in YYYY-MM format
+        write_to_s3: If true, upload the archive to S3
+        s3_client: Optional shared S3 client
+
+    Returns:
+        Summary of the archive, or None if the month had no loose partitions
+    """
+    loose = _loose_partitions(source_dir, month)
+    if not loose:
+        logger.debug(f"No loose bronze partitions for {month} in {source_dir}")
+        return None
+
+    path = archive_path(source_dir, month)
+    replaced = {(run_date, location) for run_date, location, _ in loose}
+    previous = read_index(path)["members"] if os.path.exists(path) else []
+    kept = [member for member in previous if (member["run_date"], member["location"]) not in replaced]
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    members = []
+    raw_bytes = 0
+    try:
+        with open(tmp_path, "wb") as out:
+            out.write(MAGIC)
+            if kept:
+                with open(path, "rb") as old:
+                    for member in kept:
+                        old.seek(member["offset"])
+                        compressed = old.read(member["length"])
+                        members.append({**member, "offset": out.tell()})
+                        out.write(compressed)
+            for run_date, location, file_path in loose:
+                with open(file_path, "rb") as f:
+                    data = f.read()
+                compressed = zlib.compress(data, 9)
+                members.append({
+                    "run_date": run_date,
+                    "location": location,
+                    "name": os.path.basename(file_path),
+                    "offset": out.tell(),
+                    "length": len(compressed),
+                    "raw_bytes": len(data),
+                    "sha256": hashlib.sha256(data).hexdigest(),
+                    "written_at": datetime.fromtimestamp(os.path.getmtime(file_path), tz=timezone.utc).isoformat(),
+                })
+                out.write(compressed)
+                raw_bytes += len(data)
+            members.sort(key=lambda member: (member["run_date"], member["location"]))
+            index = zlib.compress(json.dumps({"month": month, "members": members}).encode(), 9)
+            index_offset = out.tell()
+            out.write(index)
+            out.write(_FOOTER.pack(index_offset, len(index), MAGIC))
+            out.flush()
+            os.fsync(out.fileno())
+
+        # nothing is deleted until every packed payload reads back intact
+        for member in read_index(tmp_path)["members"]:
+            read_member(tmp_path, member)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    from src.pipeline.io.catalog import get_catalog
+
+    catalog = get_catalog()
+    source = os.path.basename(os.path.normpath(source_dir)).split("=", 1)[1]
+    for run_date, location, file_path in loose:
+        _remove_loose(file_path)
+        if catalog is not None:
+            catalog.relocate("bronze", source, run_date, location, path)
+
+    archive_bytes = os.path.getsize(path)
+    logger.info(
+        f"Packed {len(loose)} bronze partitions ({raw_bytes} bytes) into {path}: "
+        f"{len(members)} members, {archive_bytes} bytes"
+    )
+    if write_to_s3:
+        if s3_client is None:
+            from src.pipeline.io.s3 import S3Client
+            s3_client = S3Client()
+        s3_client.upload_file(local_path=path, s3_key=None)
+
+    return {"month": month, "path": path, "added": len(loose), "members": len(members), "bytes": archive_bytes}
+
+
+def closed_months(source_dir: str, before: date) -> list[str]:
+    """
+    Months with loose bronze partitions that ended before a given date's month.
+
+    Args:
+        source_dir: Bronze source directory ({bronze}/source=S)
+        before: Reference date; its own month is still open
+
+    Returns:
+        Sorted YYYY-MM strings
+    """
+    current = before.isoformat()[:7]
+    months = {
+        os.path.basename(path).split("=", 1)[1][:7]
+        for path in glob.glob(os.path.join(source_dir, "run_date=*"))
+    }
+    return sorted(month for month in months if month < current)
+
+
+def run_archive(
+    source: str = "openmeteo",
+    months: Optional[list[str]] = None,
+    before: Optional[date] = None,
+    write_to_s3: bool = False,
+) -> list[dict]:
+    """
+    Orchestrate compaction of closed bronze months.
+
+    Args:
+        source: Data source identifier. Defaults to 'openmeteo'.
+        months: Months in YYYY-MM format (default: every closed month)
+        before: Months ending before this date's month are closed (default: today)
+        write_to_s3: If true, upload each archive to S3
+
+    Returns:
+        Summaries of the archives written
+
+    Raises:
+        ValueError: If LOCAL_BRONZE_PATH is unset
+    """
+    from src.pipeline.config import Project_Config
+
+    if not Project_Config.Paths.LOCAL_BRONZE:
+        raise ValueError("LOCAL_BRONZE_PATH environment variable is not set")
+
+    source_dir = os.path.dirname(Project_Config.Paths.bronze_path(source, "1970-01-01"))
+    if months is None:
+        months = closed_months(source_dir, before or date.today())
+    logger.info(f"Archiving bronze months: {', '.join(months) or 'none'}")
+
+    s3_client = None
+    if write_to_s3:
+        from src.pipeline.io.s3 import S3Client
+        s3_client = S3Client()
+
+    summaries = []
+    for month in months:
+        summary = compact_month(source_dir, month, write_to_s3, s3_client)
+        if summary is not None:
+            summaries.append(summary)
+    logger.info(f"Bronze archiving completed: {len(summaries)} archive(s) written")
+    return summaries
+
+
+def main():
+    """
+    CLI entry point. Parses arguments and archives closed bronze months.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="Pack closed bronze partitions into compressed per-month archives")
+    parser.add_argument(
+        "--month",
+        action="append",
+        help="Month to archive in YYYY-MM format (repeatable; default: every month before the current one)"
+    )
+    parser.add_argument(
+        "--source",
+        default="openmeteo",
+        help="Data source identifier (default: openmeteo)"
+    )
+    parser.add_argument(
+        "--write-s3",
+        action="store_true",
+        help="Upload each archive to S3"
+    )
+
+    args = parser.parse_args()
+    logger.info(f"CLI arguments parsed: month={args.month}, source={args.source}, write_s3={args.write_s3}")
+    run_archive(args.source, args.month, write_to_s3=args.write_s3)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,626 @@
+"""
+Partition catalog for the bronze, silver and gold layers.
+
+A small SQLite database with one row per (layer, source, run_date, location)
+partition, so readers can plan work with one indexed query instead of
+walking directories or listing S3:
+- Row count, byte size, min/max time, checksum and write timestamp per partition
+- Writers upsert their partition in a single transaction right after writing it
+- WAL mode and a busy timeout let concurrent batch workers record safely
+
+The catalog is opt-in: when PARTITION_CATALOG_PATH is unset, recording is a
+no-op and readers fall back to directory listings.
+
+Usage:
+    python -m src.pipeline.io.catalog --layer silver --start-date 2026-01-01 --end-date 2026-01-31
+    python -m src.pipeline.io.catalog --layer gold --rebuild
+
+    from src.pipeline.io.catalog import PartitionCatalog
+    PartitionCatalog("data/_catalog.sqlite").list_partitions("gold", "openmeteo", "2026-01-01", "2026-01-31")
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from src.pipeline.config import Project_Config
+from src.pipeline.io.archive import find_member
+
+logger = logging.getLogger(__name__)
+
+LAYERS = ("bronze", "silver", "gold")
+
+# Bronze partitions hold one of these: raw JSON, or Arrow from a FlatBuffers response
+BRONZE_FILES = ("raw.json", "raw.arrow")
+
+# Gold compaction commit point, and the name prefix of the files compaction writes
+# (see transform.compact)
+MANIFEST_NAME = "_manifest.json"
+COMPACTED_PREFIX = "compacted-"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS partitions (
+    layer       TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    run_date    TEXT NOT NULL,
+    location    TEXT NOT NULL,
+    path        TEXT NOT NULL,
+    file_count  INTEGER NOT NULL,
+    row_count   INTEGER NOT NULL,
+    byte_size   INTEGER NOT NULL,
+    min_time    TEXT,
+    max_time    TEXT,
+    checksum    TEXT NOT NULL,
+    written_at  TEXT NOT NULL,
+    PRIMARY KEY (layer, source, run_date, location)
+);
+CREATE INDEX IF NOT EXISTS idx_partitions_run_date ON partitions (layer, source, run_date);
+"""
+
+_COLUMNS = (
+    "layer", "source", "run_date", "location", "path", "file_count", "row_count",
+    "byte_size", "min_time", "max_time", "checksum", "written_at",
+)
+
+# One PartitionCatalog per database path, so the schema is set up once per process
+_catalogs: dict[str, "PartitionCatalog"] = {}
+_catalogs_lock = threading.Lock()
+
+
+def file_checksum(file_path: str) -> str:
+    """
+    Compute the SHA-256 checksum of a file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def bronze_file(partition_dir: str) -> str:
+    """
+    Path of the bronze file in a partition directory.
+
+    Args:
+        partition_dir: Bronze partition directory path
+
+    Returns:
+        The existing raw.json or raw.arrow path, else the path of the file
+        packed in the month's archive (raw.json if neither exists)
+    """
+    for name in BRONZE_FILES:
+        path = os.path.join(partition_dir, name)
+        if os.path.exists(path):
+            return path
+    archived = find_member(partition_dir)
+    if archived is not None:
+        return os.path.join(partition_dir, archived[1]["name"])
+    return os.path.join(partition_dir, BRONZE_FILES[0])
+
+
+def partition_checksum(file_checksums: list[tuple[str, str]]) -> str:
+    """
+    Combine per-file checksums into the partition checksum the catalog stores.
+
+    Args:
+        file_checksums: (file name, file SHA-256) pairs in partition file order
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    for name, checksum in file_checksums:
+        digest.update(f"{name}:{checksum}\n".encode())
+    return digest.hexdigest()
+
+
+def partition_files(layer: str, partition_dir: str) -> list[str]:
+    """
+    List the data files of a partition directory.
+
+    A compacted partition's _manifest.json is honoured: files it marks as
+    superseded, and compaction outputs it does not name (left by an
+    interrupted run), are not part of the partition even while still on disk.
+
+    An archived bronze partition lists the path its file had, which
+    read_json_local and read_arrow_local resolve from the month's archive.
+
+    Args:
+        layer: 'bronze' (raw.json or raw.arrow) or 'silver'/'gold' (visible Parquet files)
+        partition_dir: Partition directory path
+
+    Returns:
+        Sorted list of file paths
+    """
+    if layer == "bronze":
+        raw_path = bronze_file(partition_dir)
+        return [raw_path] if os.path.exists(raw_path) or find_member(partition_dir) is not None else []
+
+    hidden: set[str] = set()
+    live: set[str] = set()
+    manifest_path = os.path.join(partition_dir, MANIFEST_NAME)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+        hidden = set(manifest.get("superseded", []))
+        live = {entry["name"] for entry in manifest["files"]}
+    files = []
+    for path in glob.glob(f"{partition_dir}/*.parquet"):
+        name = os.path.basename(path)
+        if name.startswith(("_", ".")) or name in hidden:
+            continue
+        if name.startswith(COMPACTED_PREFIX) and name not in live:
+            continue
+        files.append(path)
+    return sorted(files)
+
+
+def _json_time_range(data: dict) -> tuple[int, Optional[str], Optional[str]]:
+    """Row count and time range of a bronze JSON payload."""
+    times = data.get("hourly", {}).get("time", [])
+    return len(times), (min(times) if times else None), (max(times) if times else None)
+
+
+def _arrow_time_range(table: Any) -> tuple[int, Optional[str], Optional[str]]:
+    """Row count and local time range of a bronze Arrow table, in the JSON time format."""
+    import numpy as np
+    from src.pipeline.ingest.binary import arrow_metadata
+
+    if table.num_rows == 0:
+        return 0, None, None
+    seconds = table["time"].to_numpy().astype(np.int64)
+    local = np.array([seconds.min(), seconds.max()]) + arrow_metadata(table)["utc_offset_seconds"]
+    min_time, max_time = np.datetime_as_string(local.astype("datetime64[s]"), unit="m")
+    return table.num_rows, str(min_time), str(max_time)
+
+
+def _describe_json(file_path: str) -> tuple[int, Optional[str], Optional[str]]:
+    """Row count and time range of a bronze raw.json file (loose or archived)."""
+    from src.pipeline.io.local import read_json_local
+
+    return _json_time_range(read_json_local(file_path))
+
+
+def _describe_arrow(file_path: str) -> tuple[int, Optional[str], Optional[str]]:
+    """Row count and local time range of a bronze raw.arrow file (loose or archived)."""
+    from src.pipeline.io.local import read_arrow_local
+
+    return _arrow_time_range(read_arrow_local(file_path))
+
+
+def _describe_parquet(file_path: str) -> tuple[int, Optional[str], Optional[str]]:
+    """Row count and time range of a Parquet file, from footer statistics where present."""
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(file_path)
+    metadata = parquet_file.metadata
+    if "time" not in parquet_file.schema_arrow.names or metadata.num_rows == 0:
+        return metadata.num_rows, None, None
+
+    column = parquet_file.schema_arrow.get_field_index("time")
+    stats = [metadata.row_group(i).column(column).statistics for i in range(metadata.num_row_groups)]
+    if all(s is not None and s.has_min_max for s in stats):
+        return metadata.num_rows, str(min(s.min for s in stats)), str(max(s.max for s in stats))
+
+    time_range = pc.min_max(parquet_file.read(columns=["time"])["time"])
+    return metadata.num_rows, str(time_range["min"].as_py()), str(time_range["max"].as_py())
+
+
+def describe_partition(layer: str, partition_dir: str) -> Optional[dict]:
+    """
+    Collect catalog statistics for a partition directory.
+
+    The checksum covers every file, so any rewrite of the partition changes it.
+    An archived bronze partition's path is the archive that holds it.
+
+    Args:
+        layer: Lake layer the partition belongs to
+        partition_dir: Partition directory path
+
+    Returns:
+        Statistics dictionary, or None if the partition has no data files
+    """
+    files = partition_files(layer, partition_dir)
+    if not files:
+        return None
+
+    row_count, byte_size, min_times, max_times = 0, 0, [], []
+    checksums = []
+    location_path = partition_dir
+    for file_path in files:
+        if layer != "bronze":
+            describe = _describe_parquet
+        else:
+            describe = _describe_arrow if file_path.endswith(".arrow") else _describe_json
+        rows, min_time, max_time = describe(file_path)
+        row_count += rows
+        if min_time is not None and max_time is not None:
+            min_times.append(min_time)
+            max_times.append(max_time)
+        if os.path.exists(file_path):
+            checksums.append((os.path.basename(file_path), file_checksum(file_path)))
+            byte_size += os.path.getsize(file_path)
+        else:
+            # archived bronze: the index keeps the original file's checksum and size
+            archived = find_member(partition_dir)
+            if archived is None:
+                raise FileNotFoundError(f"No file at {file_path}")
+            checksums.append((archived[1]["name"], archived[1]["sha256"]))
+            byte_size += archived[1]["raw_bytes"]
+            location_path = archived[0]
+
+    return {
+        "path": location_path,
+        "file_count": len(files),
+        "row_count": row_count,
+        "byte_size": byte_size,
+        "min_time": min(min_times) if min_times else None,
+        "max_time": max(max_times) if max_times else None,
+        "checksum": partition_checksum(checksums),
+    }
+
+
+class PartitionCatalog:
+    """
+    SQLite-backed index of lake partitions.
+
+    Each call opens its own short-lived connection, so one instance can be
+    shared by worker threads.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: Path to the SQLite database (created if missing)
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def record(self, layer: str, source: str, run_date: str, location: str, stats: dict) -> dict:
+        """
+        Insert or replace one partition's entry in a single transaction.
+
+        Args:
+            layer: Lake layer ('bronze', 'silver' or 'gold')
+            source: Data source identifier
+            run_date: Date in YYYY-MM-DD format
+            location: Location name
+            stats: Statistics from describe_partition
+
+        Returns:
+            The stored entry
+
+        Raises:
+            ValueError: If the layer is unknown
+        """
+        if layer not in LAYERS:
+            raise ValueError(f"Unknown layer '{layer}'. Expected one of: {', '.join(LAYERS)}")
+
+        entry = {
+            "layer": layer, "source": source, "run_date": run_date, "location": location,
+            **stats, "written_at": datetime.now(timezone.utc).isoformat(),
+        }
+        placeholders = ", ".join(f":{column}" for column in _COLUMNS)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(f"INSERT OR REPLACE INTO partitions ({', '.join(_COLUMNS)}) VALUES ({placeholders})", entry)
+        finally:
+            conn.close()
+        logger.debug(f"Catalog recorded {layer} partition {source} | {location} | {run_date}")
+        return entry
+
+    def remove(self, layer: str, source: str, run_date: str, location: str) -> None:
+        """
+        Delete one partition's entry.
+
+        Args:
+            layer: Lake layer
+            source: Data source identifier
+            run_date: Date in YYYY-MM-DD format
+            location: Location name
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "DELETE FROM partitions WHERE layer = ? AND source = ? AND run_date = ? AND location = ?",
+                    (layer, source, run_date, location),
+                )
+        finally:
+            conn.close()
+
+    def relocate(self, layer: str, source: str, run_date: str, location: str, path: str) -> bool:
+        """
+        Point an existing entry at the file that now holds the partition, keeping its statistics.
+
+        Args:
+            layer: Lake layer
+            source: Data source identifier
+            run_date: Date in YYYY-MM-DD format
+            location: Location name
+            path: New location of the partition's data (e.g. its bronze archive)
+
+        Returns:
+            True if the partition was recorded and has been updated
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "UPDATE partitions SET path = ? WHERE layer = ? AND source = ? AND run_date = ? AND location = ?",
+                    (path, layer, source, run_date, location),
+                )
+        finally:
+            conn.close()
+        return cursor.rowcount > 0
+
+    def get(self, layer: str, source: str, run_date: str, location: str) -> Optional[dict]:
+        """
+        Look up one partition.
+
+        Args:
+            layer: Lake layer
+            source: Data source identifier
+            run_date: Date in YYYY-MM-DD format
+            location: Location name
+
+        Returns:
+            Entry dictionary, or None if the partition is not recorded
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT * FROM partitions WHERE layer = ? AND source = ? AND run_date = ? AND location = ?",
+                (layer, source, run_date, location),
+            ).fetchone()
+        finally:
+            conn.close()
+        return dict(row) if row else None
+
+    def list_partitions(
+        self,
+        layer: str,
+        source: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        List recorded partitions of a layer, optionally pruned by run_date window and location.
+
+        Args:
+            layer: Lake layer
+            source: Data source identifier
+            start_date: First run_date (inclusive) in YYYY-MM-DD format
+            end_date: Last run_date (inclusive) in YYYY-MM-DD format
+            location: Only this location
+
+        Returns:
+            Entry dictionaries ordered by run_date then location
+        """
+        query = "SELECT * FROM partitions WHERE layer = ? AND source = ?"
+        params: list[str] = [layer, source]
+        if start_date:
+            query += " AND run_date >= ?"
+            params.append(start_date)
+        if end_date:
+            query += " AND run_date <= ?"
+            params.append(end_date)
+        if location:
+            query += " AND location = ?"
+            params.append(location)
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(query + " ORDER BY run_date, location", params).fetchall()
+        finally:
+            conn.close()
+        return [dict(row) for row in rows]
+
+
+def get_catalog() -> Optional[PartitionCatalog]:
+    """
+    Open the catalog configured by PARTITION_CATALOG_PATH.
+
+    The instance is reused for the same path while its database file exists,
+    so the WAL pragma and schema script run once instead of on every call.
+
+    Returns:
+        PartitionCatalog, or None if the catalog is not configured
+    """
+    db_path = Project_Config.Paths.PARTITION_CATALOG
+    if not db_path:
+        return None
+    with _catalogs_lock:
+        catalog = _catalogs.get(db_path)
+        if catalog is None or not os.path.exists(db_path):
+            catalog = _catalogs[db_path] = PartitionCatalog(db_path)
+    return catalog
+
+
+def _partition_dir(layer: str, source: str, run_date: str, location: str) -> str:
+    """Partition directory for a layer via Project_Config.Paths."""
+    path_for_layer = {
+        "bronze": Project_Config.Paths.bronze_path,
+        "silver": Project_Config.Paths.silver_path,
+        "gold": Project_Config.Paths.gold_path,
+    }[layer]
+    return path_for_layer(source, run_date, location)
+
+
+def bronze_stats(file_path: str, payload: Any, sha256: str) -> dict:
+    """
+    Catalog statistics of a bronze file its writer just wrote, without reading it back.
+
+    Args:
+        file_path: Path of the raw.json or raw.arrow file
+        payload: The JSON dictionary or Arrow table that was written
+        sha256: Hex digest of the bytes written (see io.local.save_json_local)
+
+    Returns:
+        Statistics dictionary, as describe_partition returns for that partition
+    """
+    rows, min_time, max_time = (_json_time_range if isinstance(payload, dict) else _arrow_time_range)(payload)
+    return {
+        "path": os.path.dirname(file_path),
+        "file_count": 1,
+        "row_count": rows,
+        "byte_size": os.path.getsize(file_path),
+        "min_time": min_time,
+        "max_time": max_time,
+        "checksum": partition_checksum([(os.path.basename(file_path), sha256)]),
+    }
+
+
+def record_partition(
+    layer: str, source: str, run_date: str, location: str, stats: Optional[dict] = None
+) -> Optional[dict]:
+    """
+    Describe a freshly written partition and upsert it into the configured catalog.
+
+    Args:
+        layer: Lake layer
+        source: Data source identifier
+        run_date: Date in YYYY-MM-DD format
+        location: Location name
+        stats: Statistics the writer already has (e.g. from bronze_stats); the
+            partition is re-read with describe_partition when omitted
+
+    Returns:
+        The stored entry, or None if the catalog is not configured
+    """
+    catalog = get_catalog()
+    if catalog is None:
+        return None
+
+    partition_dir = _partition_dir(layer, source, run_date, location)
+    if stats is None:
+        stats = describe_partition(layer, partition_dir)
+    if stats is None:
+        catalog.remove(layer, source, run_date, location)
+        return None
+    return catalog.record(layer, source, run_date, location, stats)
+
+
+def rebuild_catalog(layer: str, source: str) -> int:
+    """
+    Walk a layer's directories once and record every partition found.
+
+    Used to backfill the catalog for data written before it was enabled.
+
+    Args:
+        layer: Lake layer
+        source: Data source identifier
+
+    Returns:
+        Number of partitions recorded
+
+    Raises:
+        ValueError: If PARTITION_CATALOG_PATH is unset
+    """
+    catalog = get_catalog()
+    if catalog is None:
+        raise ValueError("PARTITION_CATALOG_PATH environment variable is not set")
+
+    layer_root = {
+        "bronze": Project_Config.Paths.LOCAL_BRONZE,
+        "silver": Project_Config.Paths.LOCAL_SILVER,
+        "gold": Project_Config.Paths.LOCAL_GOLD,
+    }[layer]
+    source_root = f"{layer_root}/source={source}"
+    recorded = 0
+    for partition_dir in sorted(glob.glob(f"{source_root}/run_date=*/location=*")):
+        run_date = os.path.basename(os.path.dirname(partition_dir)).split("=", 1)[1]
+        location = os.path.basename(partition_dir).split("=", 1)[1]
+        stats = describe_partition(layer, partition_dir)
+        if stats is not None:
+            catalog.record(layer, source, run_date, location, stats)
+            recorded += 1
+
+    logger.info(f"Rebuilt catalog for {layer}/{source}: {recorded} partitions")
+    return recorded
+
+
+def main():
+    """
+    CLI entry point. Lists catalog partitions as JSON lines, or rebuilds a layer's entries.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="Query or rebuild the lake partition catalog")
+    parser.add_argument(
+        "--layer",
+        required=True,
+        choices=LAYERS,
+        help="Lake layer to query"
+    )
+    parser.add_argument(
+        "--source",
+        default="openmeteo",
+        help="Data source identifier (default: openmeteo)"
+    )
+    parser.add_argument(
+        "--start-date",
+        help="First run_date (inclusive) in YYYY-MM-DD format"
+    )
+    parser.add_argument(
+        "--end-date",
+        help="Last run_date (inclusive) in YYYY-MM-DD format"
+    )
+    parser.add_argument(
+        "--location",
+        help="Only this location"
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Walk the layer's directories and record every partition"
+    )
+
+    args = parser.parse_args()
+
+    if args.rebuild:
+        rebuild_catalog(args.layer, args.source)
+        return
+
+    catalog = get_catalog()
+    if catalog is None:
+        raise SystemExit("PARTITION_CATALOG_PATH environment variable is not set")
+    for entry in catalog.list_partitions(args.layer, args.source, args.start_date, args.end_date, args.location):
+        print(json.dumps(entry))
+
+
+if __name__ == "__main__":
+    main()
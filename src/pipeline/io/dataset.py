@@ -0,0 +1,174 @@
+"""
+Dataset-level reader for the hive-partitioned silver layer.
+
+Reads many run_date/location partitions as one Arrow dataset:
+- Partition pruning: only the run_date= and location= directories inside the
+  request are listed (or looked up in the partition catalog), never the whole tree
+- Column projection: only the requested columns are decoded
+- Predicate pushdown: row filters are evaluated against Parquet row group
+  statistics before any data pages are read
+- run_date and location come back as columns taken from the directory keys
+
+Usage:
+    import pyarrow.dataset as ds
+    from src.pipeline.io.dataset import read_silver, iter_silver_batches
+
+    table = read_silver("2026-01-01", "2026-01-31", locations=["Boston"],
+                        columns=["time", "temp_celsius"], filter=ds.field("temp_celsius") < 0)
+    for batch in iter_silver_batches("2026-01-01", "2026-01-31"):
+        ...
+"""
+
+import glob
+import logging
+import os
+from typing import Iterator, Optional, TYPE_CHECKING
+
+from src.pipeline.config import Project_Config
+from src.pipeline.dates import date_range
+from src.pipeline.io.catalog import get_catalog, partition_files
+
+# pyarrow is imported inside the readers so importing this module stays cheap
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+logger = logging.getLogger(__name__)
+
+
+def silver_files(
+    start_date: str,
+    end_date: str,
+    locations: Optional[list[str]] = None,
+    source: str = "openmeteo",
+) -> list[str]:
+    """
+    List the silver Parquet files of the partitions inside a run_date window.
+
+    Uses the partition catalog when configured, otherwise lists only the
+    run_date= directories of the window.
+
+    Args:
+        start_date: First run_date (inclusive) in YYYY-MM-DD format
+        end_date: Last run_date (inclusive) in YYYY-MM-DD format
+        locations: Only these locations (default: every location)
+        source: Data source identifier. Defaults to 'openmeteo'.
+
+    Returns:
+        Sorted list of Parquet file paths
+    """
+    catalog = get_catalog()
+    if catalog is not None:
+        entries = catalog.list_partitions("silver", source, start_date, end_date)
+        partition_dirs = [
+            Project_Config.Paths.silver_path(source, entry["run_date"], entry["location"])
+            for entry in entries
+            if locations is None or entry["location"] in locations
+        ]
+    else:
+        partition_dirs = []
+        for run_date in date_range(start_date, end_date):
+            if locations is None:
+                partition_dirs += glob.glob(f"{Project_Config.Paths.silver_path(source, run_date)}/location=*")
+            else:
+                partition_dirs += [Project_Config.Paths.silver_path(source, run_date, location) for location in locations]
+
+    return sorted(path for partition_dir in partition_dirs for path in partition_files("silver", partition_dir))
+
+
+def silver_dataset(
+    start_date: str,
+    end_date: str,
+    locations: Optional[list[str]] = None,
+    source: str = "openmeteo",
+) -> "ds.Dataset":
+    """
+    Open the pruned silver partitions as one Arrow dataset with hive partition columns.
+
+    Args:
+        start_date: First run_date (inclusive) in YYYY-MM-DD format
+        end_date: Last run_date (inclusive) in YYYY-MM-DD format
+        locations: Only these locations (default: every location)
+        source: Data source identifier. Defaults to 'openmeteo'.
+
+    Returns:
+        pyarrow Dataset whose schema includes run_date and location
+
+    Raises:
+        FileNotFoundError: If no silver files exist for the request
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    files = silver_files(start_date, end_date, locations, source)
+    if not files:
+        logger.error(f"No silver files found for {source} between {start_date} and {end_date}")
+        raise FileNotFoundError(f"No silver Parquet files for {source} between {start_date} and {end_date}")
+
+    # keep partition keys as strings: run_date would otherwise be inferred as a date or int
+    partitioning = ds.partitioning(pa.schema([("run_date", pa.string()), ("location", pa.string())]), flavor="hive")
+    source_root = os.path.dirname(Project_Config.Paths.silver_path(source, start_date))
+    logger.debug(f"Opening silver dataset over {len(files)} files")
+    return ds.dataset(files, format="parquet", partitioning=partitioning, partition_base_dir=source_root)
+
+
+def read_silver(
+    start_date: str,
+    end_date: str,
+    locations: Optional[list[str]] = None,
+    columns: Optional[list[str]] = None,
+    filter: Optional["ds.Expression"] = None,
+    source: str = "openmeteo",
+) -> "pa.Table":
+    """
+    Read silver data for a run_date window into one Arrow table.
+
+    Args:
+        start_date: First run_date (inclusive) in YYYY-MM-DD format
+        end_date: Last run_date (inclusive) in YYYY-MM-DD format
+        locations: Only these locations (default: every location)
+        columns: Columns to read, including run_date/location if wanted (default: all)
+        filter: Row filter pushed down to Parquet statistics (e.g. ds.field("temp_celsius") < 0)
+        source: Data source identifier. Defaults to 'openmeteo'.
+
+    Returns:
+        pyarrow Table
+
+    Raises:
+        FileNotFoundError: If no silver files exist for the request
+    """
+    dataset = silver_dataset(start_date, end_date, locations, source)
+    table = dataset.to_table(columns=columns, filter=filter)
+    logger.info(f"Read {table.num_rows} silver records from {len(dataset.files)} files")
+    return table
+
+
+def iter_silver_batches(
+    start_date: str,
+    end_date: str,
+    locations: Optional[list[str]] = None,
+    columns: Optional[list[str]] = None,
+    filter: Optional["ds.Expression"] = None,
+    source: str = "openmeteo",
+    batch_size: int = 131_072,
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Stream silver data for a run_date window as record batches with bounded memory.
+
+    Args:
+        start_date: First run_date (inclusive) in YYYY-MM-DD format
+        end_date: Last run_date (inclusive) in YYYY-MM-DD format
+        locations: Only these locations (default: every location)
+        columns: Columns to read (default: all)
+        filter: Row filter pushed down to Parquet statistics
+        source: Data source identifier. Defaults to 'openmeteo'.
+        batch_size: Maximum rows per batch
+
+    Yields:
+        pyarrow RecordBatch objects
+
+    Raises:
+        FileNotFoundError: If no silver files exist for the request
+    """
+    dataset = silver_dataset(start_date, end_date, locations, source)
+    yield from dataset.to_batches(columns=columns, filter=filter, batch_size=batch_size)
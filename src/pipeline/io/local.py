@@ -2,7 +2,8 @@
 Local filesystem I/O operations for data pipeline.
 
 Handles reading and writing data to local storage with support for:
-- Bronze layer (raw JSON)
+- Bronze layer (raw JSON, or Arrow IPC for binary API responses), read
+  from the monthly archives once the loose files are packed (see io.archive)
 - Silver layer (Parquet)
 - Path validation and directory creation
 """
@@ -10,38 +11,161 @@ Handles reading and writing data to local storage with support for:
 import os
 import json
 import logging
-import pandas as pd
+from typing import Any, Iterable, Optional, TYPE_CHECKING
+
+# pandas/pyarrow are imported inside the Parquet/Arrow helpers so JSON-only callers start fast
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
-def save_json_local(data: dict, file_path: str) -> str:
-    """Saves a dictionary to a local JSON file, creating directories if needed."""
+
+class _DigestWriter:
+    """Binary file wrapper that feeds every written chunk into a hash as it goes to disk."""
+
+    def __init__(self, f: Any, digest: Any):
+        self._f = f
+        self._digest = digest
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        if isinstance(data, str):
+            data = data.encode()
+        self._digest.update(data)
+        return self._f.write(data)
+
+    def flush(self) -> None:
+        self._f.flush()
+
+    def close(self) -> None:
+        self.closed = True
+
+def save_json_local(data: dict, file_path: str, digest: Optional[Any] = None) -> str:
+    """Saves a dictionary to a local JSON file, creating directories if needed (bytes are fed to digest, e.g. hashlib.sha256(), as written)."""
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    if digest is not None:
+        with open(file_path, "wb") as f:
+            json.dump(data, _DigestWriter(f, digest))
+        logger.info(f"Successfully saved JSON to local: {file_path}")
+        return file_path
     with open(file_path, "w") as f:
         json.dump(data, f)
     logger.info(f"Successfully saved JSON to local: {file_path}")
     return file_path
 
-def save_parquet_local(df: pd.DataFrame, file_path: str) -> str:
+def save_parquet_local(df: "pd.DataFrame", file_path: str) -> str:
     """Saves a DataFrame to a local Parquet file, creating directories if needed."""
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
     df.to_parquet(file_path, index=False)
     logger.info(f"Successfully saved Parquet to local: {file_path}")
     return file_path
 
+def save_parquet_chunks_local(frames: Iterable["pd.DataFrame"], file_path: str, schema: Optional["pa.Schema"] = None) -> int:
+    """
+    Stream DataFrames into one local Parquet file, one row group per frame.
+
+    Only one frame is held in memory at a time. The file is written to a
+    temporary name and renamed into place, so readers never see a partial file.
+
+    Args:
+        frames: DataFrames with the same columns
+        file_path: Destination Parquet path
+        schema: Arrow schema every frame is converted to. If omitted, the
+            first frame fixes it, so later frames must not change column types.
+
+    Returns:
+        Number of rows written (nothing is left on disk if zero)
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    tmp_path = f"{file_path}.tmp"
+    writer = None
+    rows = 0
+    try:
+        for df in frames:
+            if writer is None:
+                if schema is None:
+                    # an all-null column in the first chunk would otherwise pin the type to null
+                    schema = pa.Schema.from_pandas(df, preserve_index=False)
+                    schema = pa.schema([f.with_type(pa.float64()) if pa.types.is_null(f.type) else f for f in schema])
+                writer = pq.ParquetWriter(tmp_path, schema)
+            writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+            rows += len(df)
+    except Exception:
+        if writer is not None:
+            writer.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if writer is None:
+        return 0
+    writer.close()
+    if rows == 0:
+        os.remove(tmp_path)
+        return 0
+
+    os.replace(tmp_path, file_path)
+    logger.info(f"Successfully streamed {rows} rows to Parquet local: {file_path}")
+    return rows
+
+def save_arrow_local(table: "pa.Table", file_path: str, digest: Optional[Any] = None) -> str:
+    """Saves an Arrow table to a local Arrow IPC file, creating directories if needed (bytes are fed to digest as written)."""
+    import pyarrow as pa
+
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    if digest is not None:
+        with open(file_path, "wb") as f, pa.PythonFile(_DigestWriter(f, digest), mode="w") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    else:
+        with pa.OSFile(file_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    logger.info(f"Successfully saved Arrow to local: {file_path}")
+    return file_path
+
+def read_arrow_local(file_path: str) -> "pa.Table":
+    """Reads a local Arrow IPC file memory-mapped (column buffers are not copied), or its archived copy."""
+    import pyarrow as pa
+
+    if not os.path.exists(file_path):
+        from src.pipeline.io.archive import read_archived
+
+        try:
+            payload = read_archived(file_path)
+        except FileNotFoundError:
+            logger.error(f"Arrow file not found: {file_path}")
+            raise
+        return pa.ipc.open_file(pa.py_buffer(payload)).read_all()
+
+    with pa.memory_map(file_path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    logger.debug(f"Successfully read Arrow from local: {file_path}")
+    return table
+
 def read_json_local(file_path: str) -> dict:
-    """Reads a local JSON file and returns a dictionary."""
+    """Reads a local JSON file (or its archived copy) and returns a dictionary."""
     if not os.path.exists(file_path):
-        logger.error(f"JSON file not found: {file_path}")
-        raise FileNotFoundError(f"No file at {file_path}")
-    
+        from src.pipeline.io.archive import read_archived
+
+        try:
+            return json.loads(read_archived(file_path))
+        except FileNotFoundError:
+            logger.error(f"JSON file not found: {file_path}")
+            raise
+
     with open(file_path, "r") as f:
         data = json.load(f)
     logger.debug(f"Successfully read JSON from local: {file_path}")
     return data
 
-def read_parquet_local(file_path: str) -> pd.DataFrame:
+def read_parquet_local(file_path: str) -> "pd.DataFrame":
     """Reads a local Parquet file and returns a DataFrame."""
+    import pandas as pd
+
     if not os.path.exists(file_path):
         logger.error(f"Parquet file not found: {file_path}")
         raise FileNotFoundError(f"No file at {file_path}")
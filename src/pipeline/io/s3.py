@@ -22,13 +22,9 @@ Configuration:
 """
 from typing import Optional
 import re
-import boto3
 import logging
 import os
-from botocore.exceptions import ClientError
 from src.pipeline.config import Project_Config
-from dotenv import load_dotenv
-load_dotenv()
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +36,9 @@ class S3Client:
         self.bucket_name = Project_Config.AWS_BUCKET_NAME
         self.region = Project_Config.AWS_REGION
         
+        # boto3 is only imported by runs that actually touch S3
+        import boto3
+
         # boto3 looks for AWS keys in env
         self.client = boto3.client('s3', region_name=self.region)
         logger.info(f"S3 Client initialized for bucket: {self.bucket_name}")
@@ -66,6 +65,45 @@ class S3Client:
                 f"Must contain only alphanumeric, '/', '_', '-', '.'"
             )
 
+    @staticmethod
+    def mirror_key(path: str) -> str:
+        """
+        Normalize a local path or key into the S3 key that mirrors it.
+
+        Args:
+            path: Local file path or S3 key
+
+        Returns:
+            Key with forward slashes and no leading './'
+        """
+        # Always force forward slashes
+        s3_key = path.replace(os.sep,"/")
+
+        # Remove any existing leading "./" to prevent a "." folder in S3
+        if s3_key.startswith("./"):
+            s3_key = s3_key[2:]
+        logger.debug(f"Normalized s3_key: {s3_key}")
+        return s3_key
+
+    def list_objects(self, prefix: str) -> dict[str, dict]:
+        """
+        List every object under a key prefix.
+
+        Args:
+            prefix: Key prefix (local-style paths are normalized like upload keys)
+
+        Returns:
+            Mapping of key to {"size": bytes, "last_modified": datetime}
+        """
+        prefix = self.mirror_key(prefix)
+        paginator = self.client.get_paginator("list_objects_v2")
+        objects = {}
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                objects[obj["Key"]] = {"size": obj["Size"], "last_modified": obj["LastModified"]}
+        logger.debug(f"Listed {len(objects)} objects under s3://{self.bucket_name}/{prefix}")
+        return objects
+
     def upload_file(self, local_path: str, s3_key: Optional[str] = None, check_exists: bool = False) -> bool:
         """
         Uploads a local file to the S3 bucket.
@@ -80,21 +118,12 @@ class S3Client:
         """
 
         # If no key provided, mirror local path
-        # Always force forward slashes
-        if s3_key is None:
-            s3_key = local_path.replace(os.sep,"/")
-            logger.debug(f"Auto-generated s3_key from local_path: {s3_key}")
-        else:
-            s3_key = s3_key.replace(os.sep,"/")
-            logger.debug(f"Normalized s3_key separators: {s3_key}")
-
-        # Remove any existing leading "./" to prevent a "." folder in S3
-        if s3_key.startswith("./"):
-            s3_key = s3_key[2:]
-            logger.debug(f"Removed leading './': {s3_key}")
+        s3_key = self.mirror_key(local_path if s3_key is None else s3_key)
 
         self._validate_s3_key(s3_key)
 
+        from botocore.exceptions import ClientError
+
         if check_exists:
             try:
                 self.client.head_object(Bucket=self.bucket_name, Key=s3_key)
@@ -1,10 +1,13 @@
 """
     CLI entry point for loading silver Parquet data into Postgres staging.
 
-    Orchestrates: Read silver Parquet -> Connect to Postgres -> Write to raw_weather table.
+    Orchestrates: Read silver Parquet -> Add hourly features -> Connect to Postgres -> Write to raw_weather table.
+    02_populate_tables.sql then stamps the loaded partitions in fact_load_versions, which
+    evicts the cached analytics results that cover them (see src/pipeline/warehouse/queries.py).
 
     Usage:
     python -m src.pipeline.load --run-date 2026-02-01 --location Boston
+    python -m src.pipeline.load --run-date 2026-02-01 --location Boston --profile
 """
 
 import pandas as pd
@@ -12,8 +15,10 @@ import argparse
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 import logging
+from src.pipeline import profiling
 from src.pipeline.config import Project_Config
-from src.pipeline.io.local import read_parquet_local
+from src.pipeline.io.dataset import read_silver
+from src.pipeline.transform.features import add_hourly_features, previous_partition
 
 logger = logging.getLogger(__name__)
 
@@ -61,13 +66,15 @@ def load_silver_data(run_date: str, location: str, source: str) -> pd.DataFrame:
         
     Returns:
         pd.DataFrame: The loaded data
+
+    Raises:
+        FileNotFoundError: If the silver partition does not exist
     """
     
-    silver_path = Project_Config.Paths.silver_path(source, run_date, location)
-    file_path = f"{silver_path}/weather_data.parquet"
-
-    logger.info(f"Loading silver data from: {file_path}")
-    df = read_parquet_local(file_path)
+    logger.info(f"Loading silver data for: {source} | {location} | {run_date}")
+    # partition columns are added back by run_load
+    table = read_silver(run_date, run_date, locations=[location], source=source)
+    df = table.drop_columns(["run_date", "location"]).to_pandas()
 
     record_count = len(df)
     logger.info(f"Loaded {record_count} records from silver layer")
@@ -96,11 +103,15 @@ def run_load(run_date: str, location: str = "Boston", source: str = "openmeteo")
     
     engine = connect_to_postgres()
     
-    df = load_silver_data(run_date, location, source)
-    df['location'] = location
-    df['source'] = source
-    df['run_date'] = run_date
-    write_to_postgres(df, 'raw_weather', engine)
+    with profiling.stage("read"):
+        df = load_silver_data(run_date, location, source)
+        df['location'] = location
+        context = previous_partition(run_date, source, locations=[location])
+        df = add_hourly_features(df, 'temperature_2m', 'precipitation', context=context)
+        df['source'] = source
+        df['run_date'] = run_date
+    with profiling.stage("load"):
+        write_to_postgres(df, 'raw_weather', engine)
 
     logger.info("Load completed successfully.")
 
@@ -130,7 +141,17 @@ def main():
         help="Data source identifier (default: openmeteo)"
     )
     
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        metavar="DIR",
+        help="Profile each stage (CPU + allocations) and write reports to DIR (default: profiles/<timestamp>)"
+    )
+    
     args = parser.parse_args()
+    if args.profile is not None:
+        profiling.enable(args.profile or None)
     logger.info(f"CLI arguments parsed: run_date={args.run_date}, location={args.location}, source={args.source}")
     Project_Config.validate()
     run_load(args.run_date, args.location, args.source)
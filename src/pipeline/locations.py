@@ -0,0 +1,289 @@
+"""
+Location catalog with a spatial index.
+
+Loads location names and coordinates from an external CSV or Parquet catalog
+(columns: name, latitude, longitude) so the pipeline can cover tens of
+thousands of places without growing Project_Config.LOCATION_LOOKUP:
+- Name lookups are dictionary hits
+- Nearest-location queries use a KD-tree over unit-sphere coordinates, so
+  results are exact great-circle neighbours and cost O(log n)
+- Bounding-box queries use a latitude-sorted index and bisect
+- Both spatial indexes are built on first use, so loading a catalog only to
+  look up names stays cheap
+
+Usage:
+    from src.pipeline.locations import LocationCatalog
+    catalog = LocationCatalog.from_file("config/locations.csv")
+    catalog.resolve(42.36, -71.06)        # -> 'Boston'
+    catalog.within_bbox(40, -75, 45, -70)  # -> ['Boston', ...]
+"""
+
+import bisect
+import csv
+import logging
+import math
+import os
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0088
+# Coordinate-only inputs further than this from every catalog entry are rejected
+DEFAULT_RESOLVE_DISTANCE_KM = 25.0
+
+REQUIRED_COLUMNS = ("name", "latitude", "longitude")
+
+# KD-tree node: (point index, split axis, left subtree, right subtree)
+_Node = Optional[tuple]
+
+
+def _to_unit_vector(latitude: float, longitude: float) -> tuple[float, float, float]:
+    """
+    Project a coordinate onto the unit sphere.
+
+    Args:
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+
+    Returns:
+        (x, y, z) on the unit sphere
+    """
+    lat, lon = math.radians(latitude), math.radians(longitude)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat))
+
+
+def _chord_to_km(squared_chord: float) -> float:
+    """
+    Convert a squared chord length on the unit sphere to great-circle kilometres.
+
+    Args:
+        squared_chord: Squared straight-line distance between two unit vectors
+
+    Returns:
+        Great-circle distance in kilometres
+    """
+    chord = min(math.sqrt(squared_chord), 2.0)
+    return 2 * math.asin(chord / 2) * EARTH_RADIUS_KM
+
+
+class LocationCatalog:
+    """
+    Named locations with name, nearest-neighbour and bounding-box lookups.
+
+    Attributes:
+        names: Location names in catalog order
+    """
+
+    def __init__(self, locations: dict[str, dict]):
+        """
+        Args:
+            locations: Mapping of location name to {"latitude": ..., "longitude": ...}
+        """
+        self._by_name = {
+            name: {"latitude": float(coords["latitude"]), "longitude": float(coords["longitude"])}
+            for name, coords in locations.items()
+        }
+        self.names = list(self._by_name)
+        self._points: Optional[list[tuple[float, float, float]]] = None
+        self._tree: _Node = None
+        self._latitudes: Optional[list[float]] = None
+        self._by_latitude: Optional[list[str]] = None
+
+    @classmethod
+    def from_file(cls, file_path: str, overrides: Optional[dict[str, dict]] = None) -> "LocationCatalog":
+        """
+        Load a catalog from a CSV or Parquet file with name, latitude and longitude columns.
+
+        Args:
+            file_path: Path to a .csv or .parquet catalog
+            overrides: Optional locations that replace or extend rows from the file
+
+        Returns:
+            LocationCatalog with every row of the file
+
+        Raises:
+            FileNotFoundError: If the catalog does not exist
+            ValueError: If the format is unsupported, columns are missing or a name repeats
+        """
+        if not os.path.exists(file_path):
+            logger.error(f"Location catalog not found: {file_path}")
+            raise FileNotFoundError(f"No file at {file_path}")
+
+        if file_path.endswith(".csv"):
+            with open(file_path, "r", newline="") as f:
+                rows: list[dict] = list(csv.DictReader(f))
+        elif file_path.endswith(".parquet"):
+            # pyarrow only loads for Parquet catalogs
+            import pyarrow.parquet as pq
+            rows = pq.read_table(file_path, columns=list(REQUIRED_COLUMNS)).to_pylist()
+        else:
+            raise ValueError(f"Unsupported catalog format: {file_path}. Expected .csv or .parquet")
+
+        if rows:
+            missing = [column for column in REQUIRED_COLUMNS if column not in rows[0]]
+            if missing:
+                raise ValueError(f"Location catalog is missing required columns: {', '.join(missing)}")
+
+        locations: dict[str, dict] = {}
+        for row in rows:
+            name = str(row["name"]).strip()
+            if name in locations:
+                raise ValueError(f"Duplicate location name in catalog: {name}")
+            locations[name] = {"latitude": row["latitude"], "longitude": row["longitude"]}
+
+        logger.info(f"Loaded {len(locations)} locations from catalog {file_path}")
+        return cls({**locations, **(overrides or {})})
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def get(self, name: str) -> dict:
+        """
+        Look up a location's coordinates by name.
+
+        Args:
+            name: Canonical location name (the location= partition value)
+
+        Returns:
+            Dictionary with latitude and longitude
+
+        Raises:
+            KeyError: If the name is not in the catalog
+        """
+        if name not in self._by_name:
+            raise KeyError(f"Unknown location: {name}")
+        return self._by_name[name]
+
+    @staticmethod
+    def _build_tree(points: list[tuple[float, float, float]], indices: list[int], depth: int) -> _Node:
+        """
+        Recursively build a KD-tree over unit vectors, splitting on the median.
+
+        Args:
+            points: Unit vectors for every catalog location
+            indices: Point indices in this subtree
+            depth: Current depth (selects the split axis)
+
+        Returns:
+            Root node of the subtree, or None if empty
+        """
+        if not indices:
+            return None
+        axis = depth % 3
+        indices.sort(key=lambda i: points[i][axis])
+        mid = len(indices) // 2
+        return (
+            indices[mid],
+            axis,
+            LocationCatalog._build_tree(points, indices[:mid], depth + 1),
+            LocationCatalog._build_tree(points, indices[mid + 1:], depth + 1),
+        )
+
+    def _ensure_tree(self) -> None:
+        """Build the nearest-neighbour index on first use."""
+        if self._points is None:
+            self._points = [
+                _to_unit_vector(coords["latitude"], coords["longitude"]) for coords in self._by_name.values()
+            ]
+            self._tree = self._build_tree(self._points, list(range(len(self._points))), 0)
+            logger.debug(f"Built KD-tree over {len(self._points)} locations")
+
+    def _ensure_latitude_index(self) -> None:
+        """Build the latitude-sorted index for bounding-box queries on first use."""
+        if self._latitudes is None:
+            ordered = sorted(self._by_name.items(), key=lambda item: item[1]["latitude"])
+            self._latitudes = [coords["latitude"] for _, coords in ordered]
+            self._by_latitude = [name for name, _ in ordered]
+
+    def nearest(self, latitude: float, longitude: float) -> Optional[tuple[str, float]]:
+        """
+        Find the catalog location closest to a coordinate.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+
+        Returns:
+            Tuple of (location name, great-circle distance in km), or None for an empty catalog
+        """
+        if not self._by_name:
+            return None
+        self._ensure_tree()
+        points = self._points
+        assert points is not None
+        target = _to_unit_vector(latitude, longitude)
+        best = [math.inf, -1]
+
+        stack = [self._tree]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            index, axis, left, right = node
+            point = points[index]
+            distance = (point[0] - target[0]) ** 2 + (point[1] - target[1]) ** 2 + (point[2] - target[2]) ** 2
+            if distance < best[0]:
+                best = [distance, index]
+            diff = target[axis] - point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # far side is pushed first (visited last) and only if the split plane is closer than the best hit
+            if diff * diff < best[0]:
+                stack.append(far)
+            stack.append(near)
+
+        return self.names[int(best[1])], _chord_to_km(best[0])
+
+    def within_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> list[str]:
+        """
+        List catalog locations inside a bounding box.
+
+        A box with min_lon > max_lon is treated as crossing the antimeridian.
+
+        Args:
+            min_lat: Southern edge in degrees
+            min_lon: Western edge in degrees
+            max_lat: Northern edge in degrees
+            max_lon: Eastern edge in degrees
+
+        Returns:
+            Location names inside the box, ordered by latitude
+        """
+        self._ensure_latitude_index()
+        assert self._latitudes is not None and self._by_latitude is not None
+        start = bisect.bisect_left(self._latitudes, min_lat)
+        end = bisect.bisect_right(self._latitudes, max_lat)
+
+        matches = []
+        for name in self._by_latitude[start:end]:
+            lon = self._by_name[name]["longitude"]
+            inside = min_lon <= lon <= max_lon if min_lon <= max_lon else (lon >= min_lon or lon <= max_lon)
+            if inside:
+                matches.append(name)
+        return matches
+
+    def resolve(self, latitude: float, longitude: float, max_distance_km: float = DEFAULT_RESOLVE_DISTANCE_KM) -> str:
+        """
+        Resolve a coordinate-only input to its canonical location (partition) name.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            max_distance_km: Maximum distance to the nearest catalog location
+
+        Returns:
+            Canonical location name
+
+        Raises:
+            ValueError: If no catalog location lies within max_distance_km
+        """
+        match = self.nearest(latitude, longitude)
+        if match is None or match[1] > max_distance_km:
+            raise ValueError(
+                f"No catalog location within {max_distance_km} km of ({latitude}, {longitude})"
+            )
+        name, distance = match
+        logger.debug(f"Resolved ({latitude}, {longitude}) to {name} ({distance:.1f} km)")
+        return name
@@ -0,0 +1,256 @@
+"""
+Opt-in per-stage profiling for pipeline runs.
+
+With `--profile`, each pipeline stage (fetch, validate, normalize, upload,
+read, load) runs under cProfile and tracemalloc, and at exit the run writes:
+- <stage>.prof: merged cProfile stats per stage (`python -m pstats`, snakeviz)
+- profile_summary.txt: per stage calls, wall time, peak traced memory, the
+  slowest functions by cumulative time and the top allocation sites
+
+Stages nest: an upload inside fetch pauses the fetch profile while it runs.
+cProfile allows one active profiler per process on newer Pythons, so in
+batch mode only one worker's stage is CPU-profiled at a time (the others
+still get wall time and memory). tracemalloc is process-wide, so memory
+numbers are most precise for single-location runs.
+
+When profiling is off, `stage()` returns one shared no-op context manager
+and neither cProfile nor tracemalloc is imported.
+
+Usage:
+    python -m src.pipeline.run --run-date 2026-01-25 --location Boston --profile
+    python -m src.pipeline.load --run-date 2026-01-25 --location Boston --profile profiles/load
+
+    from src.pipeline import profiling
+    with profiling.stage("fetch"):
+        ...
+"""
+
+import atexit
+import contextlib
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, ContextManager, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_DIR = "profiles"
+_NULL_STAGE: ContextManager[None] = contextlib.nullcontext()
+
+_profiler: Optional["StageProfiler"] = None
+
+
+class StageProfiler:
+    """
+    Collects CPU profiles, wall time and allocation statistics per named stage.
+    """
+
+    def __init__(self, output_dir: str, top: int = 15):
+        """
+        Args:
+            output_dir: Directory for the .prof files and the summary
+            top: Functions and allocation sites listed per stage in the summary
+        """
+        import tracemalloc
+
+        self.output_dir = output_dir
+        self.top = top
+        self._stages: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._cpu_owner: Optional[int] = None
+        self._active = 0
+        tracemalloc.start()
+
+    def _stack(self) -> list[dict]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _claim_cpu(self) -> bool:
+        """Claim the process-wide CPU profiler for this thread, if it is free or already ours."""
+        me = threading.get_ident()
+        with self._lock:
+            if self._cpu_owner in (None, me):
+                self._cpu_owner = me
+                return True
+        return False
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Profile the enclosed block as one call of a stage.
+
+        Args:
+            name: Stage name (e.g. 'fetch')
+        """
+        import cProfile
+        import tracemalloc
+
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        if parent is not None:
+            if parent["profile"] is not None:
+                parent["profile"].disable()
+            # the child resets the peak, so keep what the parent has reached so far
+            parent["peak"] = max(parent["peak"], tracemalloc.get_traced_memory()[1])
+
+        with self._lock:
+            # allocations from before the first open stage (mostly imports) only slow snapshots down
+            if self._active == 0:
+                tracemalloc.clear_traces()
+            self._active += 1
+        frame: dict[str, Any] = {"profile": cProfile.Profile() if self._claim_cpu() else None, "peak": 0}
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        stack.append(frame)
+        start = time.perf_counter()
+        if frame["profile"] is not None:
+            frame["profile"].enable()
+        try:
+            yield
+        finally:
+            if frame["profile"] is not None:
+                frame["profile"].disable()
+            wall = time.perf_counter() - start
+            stack.pop()
+            peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            allocations = self._allocation_diff(before, tracemalloc.take_snapshot())
+            self._record(name, wall, peak, frame["profile"], allocations)
+            with self._lock:
+                self._active -= 1
+
+            if parent is not None:
+                parent["peak"] = max(parent["peak"], peak)
+                if parent["profile"] is not None:
+                    parent["profile"].enable()
+            # release the CPU profiler once no enclosing stage of this thread holds it
+            if frame["profile"] is not None and all(f["profile"] is None for f in stack):
+                with self._lock:
+                    self._cpu_owner = None
+
+    def _allocation_diff(self, before: Any, after: Any) -> list[tuple[str, int, int]]:
+        """Allocation sites that grew during a stage, as (file:line, bytes, blocks)."""
+        import tracemalloc
+
+        ignore = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ]
+        diffs = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+        return [
+            (f"{d.traceback[0].filename}:{d.traceback[0].lineno}", d.size_diff, d.count_diff)
+            for d in diffs[: self.top * 2] if d.size_diff > 0
+        ]
+
+    def _record(self, name: str, wall: float, peak: int, profile: Any, allocations: list) -> None:
+        with self._lock:
+            entry = self._stages.setdefault(
+                name, {"calls": 0, "wall": 0.0, "peak": 0, "profiles": [], "allocations": {}}
+            )
+            entry["calls"] += 1
+            entry["wall"] += wall
+            entry["peak"] = max(entry["peak"], peak)
+            if profile is not None:
+                entry["profiles"].append(profile)
+            for site, size, count in allocations:
+                total_size, total_count = entry["allocations"].get(site, (0, 0))
+                entry["allocations"][site] = (total_size + size, total_count + count)
+
+    def write_report(self) -> Optional[str]:
+        """
+        Write per-stage .prof files and the text summary.
+
+        Returns:
+            Path to profile_summary.txt, or None if no stage ran
+        """
+        import io
+        import pstats
+
+        with self._lock:
+            stages = dict(self._stages)
+        if not stages:
+            return None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        lines = [f"Pipeline profile ({datetime.now(timezone.utc).isoformat()})", ""]
+        for name, entry in stages.items():
+            lines.append(
+                f"== {name}: {entry['calls']} call(s), {entry['wall']:.3f}s wall, "
+                f"peak traced memory {entry['peak'] / 2**20:.1f} MiB"
+            )
+            if entry["profiles"]:
+                buffer = io.StringIO()
+                stats = pstats.Stats(*entry["profiles"], stream=buffer)
+                stats.dump_stats(os.path.join(self.output_dir, f"{name}.prof"))
+                stats.sort_stats("cumulative").print_stats(self.top)
+                lines += ["", "Slowest functions (cumulative):", buffer.getvalue().strip()]
+            top_allocations = sorted(entry["allocations"].items(), key=lambda item: item[1][0], reverse=True)[: self.top]
+            if top_allocations:
+                lines += ["", "Top allocations (net growth during stage):"]
+                lines += [f"    {size / 1024:10.1f} KiB  {count:8d} blocks  {site}" for site, (size, count) in top_allocations]
+            lines.append("")
+
+        summary_path = os.path.join(self.output_dir, "profile_summary.txt")
+        with open(summary_path, "w") as f:
+            f.write("\n".join(lines))
+        for name, entry in stages.items():
+            logger.info(f"Profile {name}: {entry['calls']} call(s), {entry['wall']:.3f}s, peak {entry['peak'] / 2**20:.1f} MiB")
+        logger.info(f"Profile written to {summary_path}")
+        return summary_path
+
+
+def stage(name: str) -> ContextManager[None]:
+    """
+    Context manager profiling one stage when profiling is enabled.
+
+    Args:
+        name: Stage name (e.g. 'fetch', 'normalize')
+
+    Returns:
+        A profiling context, or a shared no-op context when profiling is off
+    """
+    if _profiler is None:
+        return _NULL_STAGE
+    return _profiler.stage(name)
+
+
+def enable(output_dir: Optional[str] = None) -> StageProfiler:
+    """
+    Turn on stage profiling for the rest of the process and write the report at exit.
+
+    Args:
+        output_dir: Report directory (default: profiles/<UTC timestamp> in the working directory)
+
+    Returns:
+        The active StageProfiler
+    """
+    global _profiler
+    if output_dir is None:
+        output_dir = os.path.join(DEFAULT_PROFILE_DIR, datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ"))
+    _profiler = StageProfiler(output_dir)
+    # runs before logging's own atexit hook, and also on sys.exit(1)
+    atexit.register(disable)
+    logger.info(f"Profiling enabled, writing to {output_dir}")
+    return _profiler
+
+
+def disable() -> Optional[str]:
+    """
+    Write the report of the active profiler and turn profiling off.
+
+    Returns:
+        Path to the summary, or None if profiling was not enabled or no stage ran
+    """
+    global _profiler
+    if _profiler is None:
+        return None
+    import tracemalloc
+
+    profiler, _profiler = _profiler, None
+    summary_path = profiler.write_report()
+    tracemalloc.stop()
+    return summary_path
@@ -0,0 +1,223 @@
+"""
+Parallel bronze -> silver reprocessing.
+
+Rebuilds silver from the bronze already on disk, e.g. after a change to
+_normalize_data or the silver schema. Unlike --manifest and --fill-gaps,
+nothing is fetched, so the work is CPU-bound (JSON/Arrow decoding and
+pandas) and runs on a process pool instead of threads:
+- Bronze partitions in the date/location range are discovered from the
+  loose run_date=/location= directories and the monthly bronze archives
+- Partitions are dispatched in chunks, so each task amortizes its
+  inter-process round trip over many small partitions
+- Each worker process creates its own S3 client once, for all its chunks
+- A failing partition is recorded and the run carries on
+- Progress, throughput and ETA are logged as chunks complete, and the JSON
+  report matches the batch report (per-partition status, timing and error)
+
+Usage:
+    python -m src.pipeline.run --reprocess 2025-01-01 --end-date 2025-12-31
+    python -m src.pipeline.run --reprocess 2025-01-01 --end-date 2025-12-31 --location "Boston,Miami" --workers 8 --write-s3
+"""
+
+import glob
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from src.pipeline.config import Project_Config
+from src.pipeline.dates import date_range
+from src.pipeline.io.archive import archive_path, read_index
+from src.pipeline.io.catalog import BRONZE_FILES
+
+logger = logging.getLogger(__name__)
+
+# Target chunks per worker: enough to balance uneven partitions, few enough to amortize dispatch
+CHUNKS_PER_WORKER = 4
+MAX_CHUNK_SIZE = 64
+
+# Per-process state set by _init_worker
+_s3_client: Optional[Any] = None
+
+
+def discover_partitions(
+    start_date: str,
+    end_date: str,
+    locations: Optional[list[str]] = None,
+    source: str = "openmeteo",
+) -> list[dict]:
+    """
+    List the bronze partitions in a date range, loose or archived.
+
+    Args:
+        start_date: First run_date (inclusive) in YYYY-MM-DD format
+        end_date: Last run_date (inclusive) in YYYY-MM-DD format
+        locations: Location names to keep (default: every location found)
+        source: Data source identifier. Defaults to 'openmeteo'.
+
+    Returns:
+        Jobs with run_date, location and source, ordered by date then location
+    """
+    run_dates = date_range(start_date, end_date)
+    found: set[tuple[str, str]] = set()
+    for run_date in run_dates:
+        for partition_dir in glob.glob(os.path.join(Project_Config.Paths.bronze_path(source, run_date), "location=*")):
+            if any(os.path.exists(os.path.join(partition_dir, name)) for name in BRONZE_FILES):
+                found.add((run_date, os.path.basename(partition_dir).split("=", 1)[1]))
+
+    source_dir = os.path.dirname(Project_Config.Paths.bronze_path(source, start_date))
+    for month in sorted({run_date[:7] for run_date in run_dates}):
+        path = archive_path(source_dir, month)
+        if os.path.exists(path):
+            found.update(
+                (member["run_date"], member["location"])
+                for member in read_index(path)["members"]
+                if start_date <= member["run_date"] <= end_date
+            )
+
+    if locations is not None:
+        wanted = set(locations)
+        found = {(run_date, location) for run_date, location in found if location in wanted}
+    return [{"run_date": run_date, "location": location, "source": source} for run_date, location in sorted(found)]
+
+
+def _init_worker(paths: dict[str, Optional[str]], write_to_s3: bool, log_level: int) -> None:
+    """
+    Prepare a worker process: lake paths of the parent, logging and one S3 client.
+
+    Args:
+        paths: Project_Config.Paths attributes to copy from the parent
+        write_to_s3: If true, create the process's S3 client
+        log_level: Root logging level of the parent
+    """
+    global _s3_client
+
+    for name, value in paths.items():
+        setattr(Project_Config.Paths, name, value)
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=log_level, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    if write_to_s3:
+        from src.pipeline.io.s3 import S3Client
+        _s3_client = S3Client()
+
+
+def _reprocess_chunk(jobs: list[dict], write_to_s3: bool) -> list[dict]:
+    """
+    Validate and normalize a chunk of partitions, capturing each outcome instead of raising.
+
+    Args:
+        jobs: Job dictionaries from discover_partitions
+        write_to_s3: If true, upload each silver file to S3
+
+    Returns:
+        Job results with status, duration_s and error, in chunk order
+    """
+    from src.pipeline.run import _validate_and_normalize
+
+    results = []
+    for job in jobs:
+        start = time.perf_counter()
+        try:
+            _validate_and_normalize(job["run_date"], job["location"], job["source"], write_to_s3=write_to_s3, s3_client=_s3_client)
+            status, error = "success", None
+        except Exception as e:
+            logger.error(f"Reprocess failed: {job['source']} | {job['location']} | {job['run_date']}: {e}")
+            status, error = "failed", f"{type(e).__name__}: {e}"
+        results.append({**job, "status": status, "duration_s": round(time.perf_counter() - start, 3), "error": error})
+    return results
+
+
+def chunk_jobs(jobs: list[dict], workers: int, chunk_size: Optional[int] = None) -> list[list[dict]]:
+    """
+    Split jobs into contiguous chunks for the process pool.
+
+    Args:
+        jobs: Job dictionaries
+        workers: Number of worker processes
+        chunk_size: Jobs per chunk (default: about CHUNKS_PER_WORKER chunks per worker, at most MAX_CHUNK_SIZE)
+
+    Returns:
+        List of chunks, in job order
+    """
+    if chunk_size is None:
+        chunk_size = min(MAX_CHUNK_SIZE, math.ceil(len(jobs) / (max(1, workers) * CHUNKS_PER_WORKER)))
+    chunk_size = max(1, chunk_size)
+    return [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+
+
+def run_reprocess(
+    jobs: list[dict],
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    write_to_s3: bool = False,
+    report_path: Optional[str] = None,
+) -> dict:
+    """
+    Rebuild silver from bronze for many partitions on a process pool.
+
+    Args:
+        jobs: Job dictionaries from discover_partitions
+        workers: Number of worker processes (default: one per CPU core)
+        chunk_size: Partitions per task (default: see chunk_jobs)
+        write_to_s3: If true, upload each silver file to S3
+        report_path: Optional path for the JSON summary report
+
+    Returns:
+        Summary with totals, wall time, throughput and per-partition results (in job order)
+    """
+    from src.pipeline.batch import write_report
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    chunks = chunk_jobs(jobs, workers, chunk_size)
+    paths = {
+        name: getattr(Project_Config.Paths, name)
+        for name in ("LOCAL_BRONZE", "LOCAL_SILVER", "PARTITION_CATALOG")
+    }
+
+    logger.info(f"Starting reprocess: {len(jobs)} partitions in {len(chunks)} chunks on {workers} processes")
+    started_at = datetime.now(timezone.utc).isoformat()
+    start = time.perf_counter()
+
+    chunk_results: list[list[dict]] = [[] for _ in chunks]
+    done = failed = 0
+    if chunks:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(paths, write_to_s3, logging.getLogger().level),
+        ) as executor:
+            futures = {executor.submit(_reprocess_chunk, chunk, write_to_s3): i for i, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                results = future.result()
+                chunk_results[futures[future]] = results
+                done += len(results)
+                failed += sum(r["status"] != "success" for r in results)
+                elapsed = time.perf_counter() - start
+                rate = done / elapsed if elapsed else 0.0
+                eta = (len(jobs) - done) / rate if rate else 0.0
+                logger.info(f"[{done}/{len(jobs)}] reprocessed ({failed} failed), {rate:.1f} partitions/s, ETA {eta:.0f}s")
+
+    results = [result for chunk in chunk_results for result in chunk]
+    duration = time.perf_counter() - start
+    summary = {
+        "started_at": started_at,
+        "duration_s": round(duration, 3),
+        "workers": workers,
+        "chunk_size": len(chunks[0]) if chunks else 0,
+        "partitions_per_s": round(len(results) / duration, 2) if duration else 0.0,
+        "total": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "jobs": results,
+    }
+    logger.info(
+        f"Reprocess completed: {summary['succeeded']} succeeded, {summary['failed']} failed "
+        f"in {summary['duration_s']}s ({summary['partitions_per_s']} partitions/s)"
+    )
+
+    if report_path:
+        write_report(summary, report_path)
+    return summary
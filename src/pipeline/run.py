@@ -6,18 +6,183 @@ Orchestrates fetch -> validate -> normalize.
 
 Usage:
     python -m src.pipeline.run --run-date 2026-01-25 --location Boston
+    python -m src.pipeline.run --run-date 2026-01-25 --location "Boston,Miami"
+    python -m src.pipeline.run --run-date 2026-01-25 --location "Boston,Miami,Chicago" --batch-size 50
+    python -m src.pipeline.run --run-date 2026-01-25 --coordinates "42.36,-71.06"
+    python -m src.pipeline.run --manifest jobs.csv --workers 8 --report batch_report.json
+    python -m src.pipeline.run --fill-gaps 2026-01-01 --end-date 2026-01-31 --location "Boston,Miami"
+    python -m src.pipeline.run --reprocess 2025-01-01 --end-date 2025-12-31 --workers 8
+    python -m src.pipeline.run --run-date 2026-01-25 --location Boston --profile
 """
 
 import argparse
 import sys
 import logging
-from src.pipeline.ingest.fetch import _run_fetch
+from typing import Optional, TYPE_CHECKING
+from src.pipeline.ingest.fetch import _run_fetch, _run_fetch_batch
 from src.pipeline.ingest.validate import validate_bronze_file
-from src.pipeline.ingest.normalize import run_normalize
+from src.pipeline import profiling
 from src.pipeline.config import Project_Config
+from src.pipeline.io.catalog import bronze_file
+
+if TYPE_CHECKING:
+    import requests
+    from src.pipeline.io.s3 import S3Client
 
 logger = logging.getLogger(__name__)
 
+def _parse_locations(value: str) -> list[str]:
+    """
+    Split a comma-separated --location value into location names.
+
+    Args:
+        value: One location or a comma-separated chunk (e.g. 'Boston,Miami')
+
+    Returns:
+        List of stripped, non-empty location names
+    """
+    return [location.strip() for location in value.split(",") if location.strip()]
+
+def _parse_coordinates(value: str) -> list[str]:
+    """
+    Resolve a --coordinates value to canonical location names.
+
+    Args:
+        value: One 'lat,lon' pair or several separated by ';' (e.g. '42.36,-71.06;25.76,-80.19')
+
+    Returns:
+        Location names of the nearest catalog entries, in input order
+
+    Raises:
+        ValueError: If a pair is malformed or has no catalog location nearby
+    """
+    locations = []
+    for pair in value.split(";"):
+        if not pair.strip():
+            continue
+        try:
+            latitude, longitude = (float(part) for part in pair.split(","))
+        except ValueError:
+            raise ValueError(f"Invalid coordinate pair '{pair.strip()}'. Expected 'lat,lon'")
+        locations.append(Project_Config.resolve_location(latitude, longitude))
+    return locations
+
+def execute_pipeline(
+    run_date: str,
+    location: str,
+    source: str = "openmeteo",
+    write_to_s3: bool = False,
+    session: Optional["requests.Session"] = None,
+    s3_client: Optional["S3Client"] = None,
+) -> None:
+    """
+    Run fetch -> validate -> normalize for one job, raising on the first error.
+
+    Args:
+        run_date: Date to process in YYYY-MM-DD format
+        location: Location name
+        source: Data source identifier. Defaults to 'openmeteo'.
+        write_to_s3: If true, upload bronze/silver files to S3. Defaults to False
+        session: Optional shared HTTP session (batch mode)
+        s3_client: Optional shared S3 client (batch mode)
+
+    Raises:
+        Exception: Any error during fetch, validation, or normalization
+    """
+    logger.info("[1/3] FETCH: Retrieving data from API...")
+    with profiling.stage("fetch"):
+        _run_fetch(run_date, location, source, write_to_s3=write_to_s3, session=session, s3_client=s3_client)
+
+    _validate_and_normalize(run_date, location, source, write_to_s3=write_to_s3, s3_client=s3_client)
+
+def _validate_and_normalize(
+    run_date: str,
+    location: str,
+    source: str,
+    write_to_s3: bool = False,
+    s3_client: Optional["S3Client"] = None,
+) -> None:
+    """
+    Run validate -> normalize for one location whose bronze file is already written.
+
+    Args:
+        run_date: Date to process in YYYY-MM-DD format
+        location: Location name
+        source: Data source identifier
+        write_to_s3: If true, upload the silver file to S3
+        s3_client: Optional shared S3 client
+
+    Raises:
+        Exception: Any error during validation or normalization
+    """
+    logger.info("[2/3] VALIDATE: Checking data quality...")
+    bronze_path = bronze_file(Project_Config.Paths.bronze_path(source, run_date, location))
+    with profiling.stage("validate"):
+        validate_bronze_file(bronze_path)
+
+    logger.info("[3/3] NORMALIZE: Transforming to silver layer...")
+    with profiling.stage("normalize"):
+        # pandas/pyarrow load here, after the API request has already gone out
+        from src.pipeline.ingest.normalize import run_normalize
+        run_normalize(run_date, location, source, write_to_s3=write_to_s3, s3_client=s3_client)
+
+def run_batched_pipeline(
+    run_date: str,
+    locations: list[str],
+    source: str = "openmeteo",
+    batch_size: int = 50,
+    write_to_s3: bool = False,
+) -> bool:
+    """
+    Fetch many locations with multi-coordinate requests, then validate and normalize each one.
+
+    A location that fails validation or normalization does not stop the others;
+    the pipeline exits non-zero once every location has been attempted.
+
+    Args:
+        run_date: Date to process in YYYY-MM-DD format
+        locations: Location names
+        source: Data source identifier. Defaults to 'openmeteo'.
+        batch_size: Maximum coordinates per API request. Defaults to 50.
+        write_to_s3: If true, upload bronze/silver files to S3. Defaults to False
+
+    Returns:
+        True if every location completes successfully
+
+    Raises:
+        Exception: A fetch error, or any failed location, causes sys.exit(1)
+    """
+    logger.info("="*60)
+    logger.info(f"Starting Batched Pipeline: {source} | {len(locations)} locations | {run_date}")
+    logger.info("="*60)
+
+    try:
+        logger.info(f"[1/3] FETCH: Retrieving data from API in batches of {batch_size}...")
+        with profiling.stage("fetch"):
+            _run_fetch_batch(run_date, locations, source, batch_size=batch_size, write_to_s3=write_to_s3)
+    except Exception as e:
+        logger.error(f"Batched fetch failed: {e}")
+        sys.exit(1)
+
+    failed = []
+    for location in locations:
+        try:
+            _validate_and_normalize(run_date, location, source, write_to_s3=write_to_s3)
+        except Exception as e:
+            logger.error(f"Location {location} failed: {e}")
+            failed.append(location)
+
+    if failed:
+        logger.error("="*60)
+        logger.error(f"Pipeline failed for {len(failed)} of {len(locations)} locations: {', '.join(failed)}")
+        logger.error("="*60)
+        sys.exit(1)
+
+    logger.info("="*60)
+    logger.info("Pipeline completed successfully!")
+    logger.info("="*60)
+    return True
+
 def run_pipeline(run_date: str, location: str = "Boston", source: str = "openmeteo", write_to_s3: bool = False) -> bool:
     """
     Orchestrate the full ingestion pipeline: fetch -> validate -> normalize.
@@ -39,15 +204,7 @@ def run_pipeline(run_date: str, location: str = "Boston", source: str = "openmet
     logger.info("="*60)
     
     try:
-        logger.info("[1/3] FETCH: Retrieving data from API...")
-        _run_fetch(run_date, location, source, write_to_s3=write_to_s3)
-
-        logger.info("[2/3] VALIDATE: Checking data quality...")
-        bronze_path = f"{Project_Config.Paths.bronze_path(source, run_date, location)}/raw.json"
-        validate_bronze_file(bronze_path)
-
-        logger.info("[3/3] NORMALIZE: Transforming to silver layer...")
-        run_normalize(run_date, location, source, write_to_s3=write_to_s3)
+        execute_pipeline(run_date, location, source, write_to_s3=write_to_s3)
 
         logger.info("="*60)
         logger.info("Pipeline completed successfully!")
@@ -61,6 +218,48 @@ def run_pipeline(run_date: str, location: str = "Boston", source: str = "openmet
         logger.error("="*60)
         sys.exit(1)
 
+def run_locations_pipeline(run_date: str, locations: list[str], source: str = "openmeteo", write_to_s3: bool = False) -> bool:
+    """
+    Run fetch -> validate -> normalize for each location with one request per location.
+
+    A failed location is logged and skipped, so the others still run, and the
+    pipeline exits non-zero once every location has been attempted.
+
+    Args:
+        run_date: Date to process in YYYY-MM-DD format
+        locations: Location names
+        source: Data source identifier. Defaults to 'openmeteo'.
+        write_to_s3: If true, upload bronze/silver files to S3. Defaults to False
+
+    Returns:
+        True if every location completes successfully
+
+    Raises:
+        Exception: Any failed location causes sys.exit(1)
+    """
+    logger.info("="*60)
+    logger.info(f"Starting Pipeline: {source} | {len(locations)} locations | {run_date}")
+    logger.info("="*60)
+
+    failed = []
+    for location in locations:
+        try:
+            execute_pipeline(run_date, location, source, write_to_s3=write_to_s3)
+        except Exception as e:
+            logger.error(f"Location {location} failed: {e}")
+            failed.append(location)
+
+    if failed:
+        logger.error("="*60)
+        logger.error(f"Pipeline failed for {len(failed)} of {len(locations)} locations: {', '.join(failed)}")
+        logger.error("="*60)
+        sys.exit(1)
+
+    logger.info("="*60)
+    logger.info("Pipeline completed successfully!")
+    logger.info("="*60)
+    return True
+
 def main():
     """
     Parse CLI arguments and execute the pipeline.
@@ -84,20 +283,45 @@ def main():
 Examples:
     python -m src.pipeline.run --run-date 2026-01-25 --location Boston
     python -m src.pipeline.run --run-date 2026-01-25 --location Boston --source openmeteo
+    python -m src.pipeline.run --run-date 2026-01-25 --location "Boston,Miami" --write-s3
+    python -m src.pipeline.run --run-date 2026-01-25 --location "Boston,Miami,Chicago" --batch-size 50
+    python -m src.pipeline.run --run-date 2026-01-25 --coordinates "42.36,-71.06"
+    python -m src.pipeline.run --manifest jobs.csv --workers 8 --report batch_report.json
+    python -m src.pipeline.run --fill-gaps 2026-01-01 --end-date 2026-01-31 --max-age-hours 48 --dry-run
+    python -m src.pipeline.run --reprocess 2025-01-01 --end-date 2025-12-31 --workers 8 --write-s3
+    python -m src.pipeline.run --run-date 2026-01-25 --location Boston --profile
 
 """
     
     )
-    parser.add_argument(
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument(
         "--run-date",
-        required=True,
         help="Date to process in YYYY-MM-DD format"
     )
+    mode.add_argument(
+        "--manifest",
+        help="CSV/JSON manifest of (run_date, location[, source]) jobs to run in one process"
+    )
+    mode.add_argument(
+        "--fill-gaps",
+        metavar="START_DATE",
+        help="Ingest only the missing or stale (run_date, location) partitions from START_DATE to --end-date"
+    )
+    mode.add_argument(
+        "--reprocess",
+        metavar="START_DATE",
+        help="Rebuild silver from existing bronze partitions from START_DATE to --end-date on a process pool"
+    )
 
     parser.add_argument(
         "--location",
-        default="Boston",
-        help="Location name (default: Boston)"
+        help="Location name or comma-separated chunk of locations (default: Boston; --reprocess: every location found)"
+    )
+
+    parser.add_argument(
+        "--coordinates",
+        help="'lat,lon' pairs separated by ';', resolved to the nearest catalog locations (overrides --location)"
     )
 
     parser.add_argument(
@@ -112,13 +336,140 @@ Examples:
         help="Upload data to s3 (default: False)"
     )
 
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Coordinates per Open-Meteo request for multi-location runs (default: 1, one request per location)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker threads for --manifest and --fill-gaps batches (default: 4), or processes for --reprocess (default: CPU count)"
+    )
+
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Partitions per task for --reprocess (default: sized from the partition and worker counts)"
+    )
+
+    parser.add_argument(
+        "--report",
+        default="batch_report.json",
+        help="Summary report path for --manifest, --fill-gaps and --reprocess batches (default: batch_report.json)"
+    )
+
+    parser.add_argument(
+        "--end-date",
+        help="Last run_date for --fill-gaps and --reprocess in YYYY-MM-DD format (default: START_DATE)"
+    )
+
+    parser.add_argument(
+        "--max-age-hours",
+        type=float,
+        help="With --fill-gaps, also re-ingest partitions written longer ago than this"
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="With --fill-gaps or --reprocess, print the partitions that would be processed and exit"
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        metavar="DIR",
+        help="Profile each stage (CPU + allocations) and write reports to DIR (default: profiles/<timestamp>)"
+    )
+
     args = parser.parse_args()
+    if args.profile is not None:
+        profiling.enable(args.profile or None)
+    workers = args.workers or 4
+    location = args.location or "Boston"
+
+    if args.reprocess:
+        from src.pipeline.reprocess import discover_partitions, run_reprocess
+
+        end_date = args.end_date or args.reprocess
+        logger.info(f"CLI arguments parsed: reprocess={args.reprocess}..{end_date}, location={args.location}, source={args.source}")
+        Project_Config.validate()
+
+        locations = _parse_locations(args.location) if args.location else None
+        jobs = discover_partitions(args.reprocess, end_date, locations, args.source)
+        logger.info(f"Found {len(jobs)} bronze partitions to reprocess")
+        if args.dry_run:
+            for job in jobs:
+                logger.info(f"Scheduled: {job['location']} | {job['run_date']}")
+            return
+        if not jobs:
+            return
+
+        summary = run_reprocess(
+            jobs, workers=args.workers, chunk_size=args.chunk_size,
+            write_to_s3=args.write_s3, report_path=args.report,
+        )
+        if summary["failed"]:
+            sys.exit(1)
+        return
+
+    if args.fill_gaps:
+        from src.pipeline.batch import run_batch
+        from src.pipeline.gaps import find_gaps
+
+        end_date = args.end_date or args.fill_gaps
+        logger.info(f"CLI arguments parsed: fill_gaps={args.fill_gaps}..{end_date}, location={location}, source={args.source}")
+        Project_Config.validate()
 
-    logger.info(f"CLI arguments parsed: run_date={args.run_date}, location={args.location}, source={args.source}")
+        s3_client = None
+        if args.write_s3:
+            from src.pipeline.io.s3 import S3Client
+            s3_client = S3Client()
+
+        gaps = find_gaps(
+            args.fill_gaps, end_date, _parse_locations(location), args.source,
+            s3_client=s3_client, max_age_hours=args.max_age_hours,
+        )
+        for gap in gaps:
+            logger.info(f"Scheduled: {gap['location']} | {gap['run_date']} ({'; '.join(gap['reasons'])})")
+        if args.dry_run or not gaps:
+            return
+
+        summary = run_batch(gaps, workers=workers, write_to_s3=args.write_s3, report_path=args.report)
+        if summary["failed"]:
+            sys.exit(1)
+        return
+
+    if args.manifest:
+        from src.pipeline.batch import load_manifest, run_batch
+
+        logger.info(f"CLI arguments parsed: manifest={args.manifest}, workers={workers}, source={args.source}")
+        Project_Config.validate()
+
+        jobs = load_manifest(args.manifest, default_source=args.source)
+        summary = run_batch(jobs, workers=workers, write_to_s3=args.write_s3, report_path=args.report)
+        if summary["failed"]:
+            sys.exit(1)
+        return
+
+    logger.info(f"CLI arguments parsed: run_date={args.run_date}, location={location}, source={args.source}")
 
     Project_Config.validate()
 
-    run_pipeline(args.run_date, args.location, args.source,write_to_s3 = args.write_s3)
+    locations = _parse_coordinates(args.coordinates) if args.coordinates else _parse_locations(location)
+    if args.batch_size > 1 and len(locations) > 1:
+        run_batched_pipeline(args.run_date, locations, args.source, batch_size=args.batch_size, write_to_s3=args.write_s3)
+        return
+
+    if len(locations) > 1:
+        run_locations_pipeline(args.run_date, locations, args.source, write_to_s3=args.write_s3)
+        return
+
+    run_pipeline(args.run_date, locations[0], args.source,write_to_s3 = args.write_s3)
 
 if __name__ == "__main__":
     main()
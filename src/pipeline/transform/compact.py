@@ -0,0 +1,362 @@
+"""
+Gold layer compaction for small partition files.
+
+Spark's partitionBy("run_date", "location") leaves many tiny Parquet files per
+partition. This job merges every run_date/location partition in a date window
+into right-sized files sorted by time and writes a _manifest.json next to them.
+
+Consistency guarantees:
+- The manifest is the commit point. New files are written next to the old
+  ones, then _manifest.json is atomically replaced with one that names the
+  new files and marks the old ones as superseded. Readers that list files
+  through catalog.partition_files (LakeEngine, the catalog) see either the
+  old or the new file set, never both and never an empty partition
+- Superseded files are only deleted by a later run, once the manifest that
+  superseded them is older than the grace period, so a reader that listed
+  the old files just before the commit can still open them
+- Files from a run interrupted before its commit are never named by a
+  manifest; readers ignore them and the next run deletes them
+- A partition whose files already match its manifest is skipped, so reruns are
+  idempotent and cheap
+
+Readers that list the directory themselves (Spark, Snowflake COPY) do not
+read the manifest and see the old and new files together until the
+superseded files are garbage-collected; run them after that, or compact with
+--gc-grace-minutes 0 before loading.
+
+Usage:
+    python -m src.pipeline.transform.compact --start-date 2026-01-01 --end-date 2026-01-31
+    python -m src.pipeline.transform.compact --end-date 2026-01-31 --days 7 --target-mb 64 --gc-grace-minutes 0
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from src.pipeline.config import Project_Config
+from src.pipeline.io.catalog import (
+    COMPACTED_PREFIX,
+    MANIFEST_NAME,
+    file_checksum,
+    get_catalog,
+    partition_files,
+    record_partition,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TARGET_FILE_BYTES = 128 * 1024 * 1024
+# How long superseded files stay on disk for readers that listed them before the commit
+DEFAULT_GC_GRACE_SECONDS = 60 * 60
+
+
+def _read_manifest(partition_dir: str) -> Optional[dict]:
+    """
+    Read a partition's compaction manifest if one exists.
+
+    Args:
+        partition_dir: Partition directory path
+
+    Returns:
+        Parsed manifest dictionary, or None if missing
+    """
+    manifest_path = os.path.join(partition_dir, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, "r") as f:
+        return json.load(f)
+
+
+def _write_manifest(partition_dir: str, manifest: dict) -> None:
+    """
+    Atomically replace a partition's manifest.
+
+    Args:
+        partition_dir: Partition directory path
+        manifest: Manifest dictionary to commit
+    """
+    manifest_path = os.path.join(partition_dir, MANIFEST_NAME)
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, manifest_path)
+
+
+def _collect_garbage(partition_dir: str, manifest: Optional[dict], gc_grace_seconds: float) -> None:
+    """
+    Delete files no manifest reader can see any more.
+
+    Compaction outputs the manifest does not name (an interrupted run) are
+    removed right away. Superseded files are removed once the manifest is
+    older than the grace period, and the manifest is rewritten without them.
+
+    Args:
+        partition_dir: Partition directory path
+        manifest: Current manifest, or None
+        gc_grace_seconds: Minimum age of the manifest before its superseded files are deleted
+    """
+    live = {entry["name"] for entry in manifest["files"]} if manifest is not None else set()
+    for path in glob.glob(f"{partition_dir}/{COMPACTED_PREFIX}*.parquet"):
+        if os.path.basename(path) not in live:
+            logger.warning(f"Removing output of an interrupted compaction: {path}")
+            os.remove(path)
+
+    if manifest is None or not manifest.get("superseded"):
+        return
+    age = datetime.now(timezone.utc) - datetime.fromisoformat(manifest["compacted_at"])
+    if age.total_seconds() < gc_grace_seconds:
+        return
+    for name in manifest["superseded"]:
+        path = os.path.join(partition_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+    logger.info(f"Removed {len(manifest['superseded'])} superseded files from {partition_dir}")
+    _write_manifest(partition_dir, {**manifest, "superseded": []})
+
+
+def _is_compacted(files: list[str], manifest: Optional[dict]) -> bool:
+    """
+    Check whether the files on disk are exactly the ones recorded in the manifest.
+
+    Args:
+        files: Current Parquet files of the partition
+        manifest: Partition manifest, or None
+
+    Returns:
+        True if the partition is already compacted and unchanged since
+    """
+    if manifest is None:
+        return False
+    on_disk = {os.path.basename(path): os.path.getsize(path) for path in files}
+    recorded = {entry["name"]: entry["bytes"] for entry in manifest["files"]}
+    return on_disk == recorded
+
+
+def gold_partition_dirs(source: str, start_date: str, end_date: str) -> list[str]:
+    """
+    Find the gold run_date/location partition directories inside a date window.
+
+    Args:
+        source: Data source identifier
+        start_date: First run_date (inclusive) in YYYY-MM-DD format
+        end_date: Last run_date (inclusive) in YYYY-MM-DD format
+
+    Returns:
+        Sorted list of partition directory paths
+    """
+    catalog = get_catalog()
+    if catalog is not None:
+        # one indexed query instead of a directory walk
+        entries = catalog.list_partitions("gold", source, start_date, end_date)
+        return [
+            Project_Config.Paths.gold_path(source, entry["run_date"], entry["location"])
+            for entry in entries
+            if os.path.isdir(Project_Config.Paths.gold_path(source, entry["run_date"], entry["location"]))
+        ]
+
+    source_root = f"{Project_Config.Paths.LOCAL_GOLD}/source={source}"
+    partitions = []
+    for path in sorted(glob.glob(f"{source_root}/run_date=*/location=*")):
+        run_date = os.path.basename(os.path.dirname(path)).split("=", 1)[1]
+        # ISO dates compare correctly as strings
+        if start_date <= run_date <= end_date and os.path.isdir(path):
+            partitions.append(path)
+    return partitions
+
+
+def compact_partition(
+    partition_dir: str,
+    target_file_bytes: int = DEFAULT_TARGET_FILE_BYTES,
+    force: bool = False,
+    gc_grace_seconds: float = DEFAULT_GC_GRACE_SECONDS,
+) -> Optional[dict]:
+    """
+    Merge one partition's files into right-sized, time-sorted files with a manifest.
+
+    Args:
+        partition_dir: Partition directory (.../run_date=X/location=Y)
+        target_file_bytes: Approximate size of each output file
+        force: Rewrite even if the manifest says the partition is already compacted
+        gc_grace_seconds: Minimum age of a manifest before the files it superseded are deleted
+
+    Returns:
+        The new manifest, or None if the partition was skipped
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    # partition_dir = {gold}/source=S/run_date=D/location=L
+    run_date_path = os.path.dirname(partition_dir)
+    source_path = os.path.dirname(run_date_path)
+    location_dir = os.path.basename(partition_dir)
+    run_date_dir = os.path.basename(run_date_path)
+
+    previous = _read_manifest(partition_dir)
+    _collect_garbage(partition_dir, previous, gc_grace_seconds)
+    previous = _read_manifest(partition_dir)
+
+    files = partition_files("gold", partition_dir)
+    if not files:
+        logger.debug(f"No Parquet files in {partition_dir}, skipping")
+        return None
+    if not force and _is_compacted(files, previous):
+        logger.info(f"Already compacted, skipping: {partition_dir}")
+        return None
+
+    # partition columns stay in the directory names, as Spark wrote them
+    table = pa.concat_tables(pq.read_table(f, partitioning=None) for f in files)
+    table = table.sort_by("time")
+    source_bytes = sum(os.path.getsize(f) for f in files)
+
+    bytes_per_row = max(source_bytes / max(table.num_rows, 1), 1)
+    rows_per_file = max(int(target_file_bytes / bytes_per_row), 1)
+
+    compacted_at = datetime.now(timezone.utc)
+    # unique per run, so new files never overwrite the live ones they replace
+    generation = compacted_at.strftime("%Y%m%dT%H%M%S%f")
+    entries = []
+    for index, offset in enumerate(range(0, table.num_rows, rows_per_file)):
+        chunk = table.slice(offset, rows_per_file)
+        name = f"{COMPACTED_PREFIX}{generation}-{index:05d}.parquet"
+        out_path = os.path.join(partition_dir, name)
+        pq.write_table(chunk, out_path)
+
+        time_range = pc.min_max(chunk["time"])
+        entries.append({
+            "name": name,
+            "rows": chunk.num_rows,
+            "bytes": os.path.getsize(out_path),
+            "min_time": str(time_range["min"].as_py()),
+            "max_time": str(time_range["max"].as_py()),
+            "sha256": file_checksum(out_path),
+        })
+
+    manifest = {
+        "run_date": run_date_dir.split("=", 1)[1],
+        "location": location_dir.split("=", 1)[1],
+        "compacted_at": compacted_at.isoformat(),
+        "target_file_bytes": target_file_bytes,
+        "source_files": len(files),
+        "row_count": table.num_rows,
+        "files": entries,
+        # the old live files plus anything an earlier manifest superseded and GC has not removed yet
+        "superseded": sorted(
+            {os.path.basename(f) for f in files} | set(previous.get("superseded", []) if previous else [])
+        ),
+    }
+    # commit: readers switch from the old to the new file set here
+    _write_manifest(partition_dir, manifest)
+    record_partition(
+        "gold", os.path.basename(source_path).split("=", 1)[1], manifest["run_date"], manifest["location"]
+    )
+
+    logger.info(f"Compacted {len(files)} files ({source_bytes} bytes) into {len(entries)} in {partition_dir}")
+    return manifest
+
+
+def run_compaction(
+    start_date: str,
+    end_date: str,
+    source: str = "openmeteo",
+    target_file_bytes: int = DEFAULT_TARGET_FILE_BYTES,
+    force: bool = False,
+    gc_grace_seconds: float = DEFAULT_GC_GRACE_SECONDS,
+) -> dict:
+    """
+    Orchestrate compaction of every gold partition in a run_date window.
+
+    Args:
+        start_date: First run_date (inclusive) in YYYY-MM-DD format
+        end_date: Last run_date (inclusive) in YYYY-MM-DD format
+        source: Data source identifier. Defaults to 'openmeteo'.
+        target_file_bytes: Approximate size of each output file
+        force: Rewrite partitions even if already compacted
+        gc_grace_seconds: Minimum age of a manifest before the files it superseded are deleted
+
+    Returns:
+        Summary with counts of compacted and skipped partitions
+
+    Raises:
+        ValueError: If LOCAL_GOLD_PATH is unset
+    """
+    if not Project_Config.Paths.LOCAL_GOLD:
+        raise ValueError("LOCAL_GOLD_PATH environment variable is not set")
+
+    partitions = gold_partition_dirs(source, start_date, end_date)
+    logger.info(f"Compacting {len(partitions)} gold partitions between {start_date} and {end_date}")
+
+    compacted = skipped = 0
+    for partition_dir in partitions:
+        if compact_partition(partition_dir, target_file_bytes, force, gc_grace_seconds) is None:
+            skipped += 1
+        else:
+            compacted += 1
+
+    logger.info(f"Compaction completed: {compacted} compacted, {skipped} skipped")
+    return {"partitions": len(partitions), "compacted": compacted, "skipped": skipped}
+
+
+def main():
+    """
+    CLI entry point. Parses arguments and compacts the gold window.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="Compact small gold Parquet files into right-sized, time-sorted files")
+    parser.add_argument(
+        "--end-date",
+        default=date.today().isoformat(),
+        help="Last run_date to compact in YYYY-MM-DD format (default: today)"
+    )
+    window = parser.add_mutually_exclusive_group()
+    window.add_argument(
+        "--start-date",
+        help="First run_date to compact in YYYY-MM-DD format"
+    )
+    window.add_argument(
+        "--days",
+        type=int,
+        default=7,
+        help="Window length in days ending at --end-date (default: 7)"
+    )
+    parser.add_argument(
+        "--source",
+        default="openmeteo",
+        help="Data source identifier (default: openmeteo)"
+    )
+    parser.add_argument(
+        "--target-mb",
+        type=int,
+        default=DEFAULT_TARGET_FILE_BYTES // (1024 * 1024),
+        help="Target output file size in MB (default: 128)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite partitions that are already compacted"
+    )
+    parser.add_argument(
+        "--gc-grace-minutes",
+        type=float,
+        default=DEFAULT_GC_GRACE_SECONDS / 60,
+        help="Delete superseded files once their manifest is this old (default: 60)"
+    )
+
+    args = parser.parse_args()
+    start_date = args.start_date or (date.fromisoformat(args.end_date) - timedelta(days=args.days - 1)).isoformat()
+    logger.info(f"CLI arguments parsed: start_date={start_date}, end_date={args.end_date}, source={args.source}")
+    run_compaction(start_date, args.end_date, args.source, args.target_mb * 1024 * 1024, args.force, args.gc_grace_minutes * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Precomputed hourly time-series features.
+
+Computes once per partition the metrics that q9-q12 used to derive with
+window functions on every query, so reading them is a plain column scan:
+- temp_change_1h: change from the previous hour (null when that hour is missing)
+- temp_rolling_3h: mean temperature over the current and two previous hours
+- temp_rank_daily: rank of the hour from hottest (1) within its day
+- precip_cumulative_daily: running precipitation total since midnight
+
+Series are per location and ordered by time. Hour-over-hour features carry
+across midnight and daily features restart at it. A run_date partition
+starts mid-series, so its first hours take their lead-in from the previous
+run_date's partition (`context`) and get the same values as they would in
+one continuous series. Without context they start fresh, like the first
+hours ever fetched.
+
+The Spark job (spark/glue_job.py) and the DuckDB lake engine compute the
+same columns with window functions.
+
+Usage:
+    from src.pipeline.transform.features import add_hourly_features, previous_partition
+    context = previous_partition("2026-01-25", locations=["Boston"])
+    df = add_hourly_features(df, "temperature_2m", "precipitation", context=context)
+"""
+
+import logging
+from datetime import date, timedelta
+from typing import Optional
+
+import pandas as pd
+
+from src.pipeline.io.dataset import read_silver
+
+logger = logging.getLogger(__name__)
+
+FEATURE_COLUMNS = ["temp_change_1h", "temp_rolling_3h", "temp_rank_daily", "precip_cumulative_daily"]
+ROLLING_HOURS = 3
+
+
+def _lead_in(df: pd.DataFrame, context: pd.DataFrame, temperature: str, precipitation: str) -> pd.DataFrame:
+    """
+    Context rows each location needs before its first hour in df.
+
+    That is the previous ROLLING_HOURS - 1 hours for the hourly features and
+    every earlier hour of the first day for the daily ones.
+    """
+    first = df.groupby("location")["time"].min()
+    lead_in = context.loc[context["location"].isin(first.index), ["location", "time", temperature, precipitation]]
+    first_time = lead_in["location"].map(first)
+    start = first_time.dt.normalize().where(
+        first_time.dt.normalize() < first_time - pd.Timedelta(hours=ROLLING_HOURS - 1),
+        first_time - pd.Timedelta(hours=ROLLING_HOURS - 1),
+    )
+    return lead_in[(lead_in["time"] < first_time) & (lead_in["time"] >= start)]
+
+
+def add_hourly_features(
+    df: pd.DataFrame,
+    temperature: str = "temp_celsius",
+    precipitation: str = "precipitation_mm",
+    context: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """
+    Add the FEATURE_COLUMNS to an hourly frame with vectorized group operations.
+
+    Args:
+        df: Hourly rows with 'location' and 'time' columns, in any order
+        temperature: Temperature column name (gold: temp_celsius, silver: temperature_2m)
+        precipitation: Precipitation column name (gold: precipitation_mm, silver: precipitation)
+        context: Rows of the previous partition with the same columns, used
+            only as lead-in for df's first hours and never returned
+
+    Returns:
+        Copy of df, rows and index unchanged, with the feature columns appended
+    """
+    frame = df[["location", "time", temperature, precipitation]].assign(
+        time=pd.to_datetime(df["time"]), _row=range(len(df))
+    )
+    if context is not None and not context.empty:
+        lead_in = _lead_in(frame, context.assign(time=pd.to_datetime(context["time"])), temperature, precipitation)
+        frame = pd.concat([frame, lead_in.assign(_row=-1)], ignore_index=True)
+    frame = frame.sort_values(["location", "time"], kind="stable", ignore_index=True)
+
+    temp = frame[temperature]
+    by_location = frame.groupby("location", sort=False)
+    hour_gap = frame["time"] - by_location["time"].shift()
+    change = (temp - by_location[temperature].shift()).where(hour_gap == pd.Timedelta(hours=1))
+
+    # rows are at least an hour apart, so the window holds at most ROLLING_HOURS - 1 earlier rows;
+    # a missing hour shrinks the window instead of reaching further back
+    window_sum = temp.fillna(0)
+    window_count = temp.notna().astype(int)
+    for lag in range(1, ROLLING_HOURS):
+        in_window = frame["time"] - by_location["time"].shift(lag) <= pd.Timedelta(hours=ROLLING_HOURS - 1)
+        lagged = by_location[temperature].shift(lag).where(in_window)
+        window_sum = window_sum + lagged.fillna(0)
+        window_count = window_count + lagged.notna()
+    rolling = (window_sum / window_count).where(window_count > 0)
+
+    day_keys = [frame["location"], frame["time"].dt.normalize()]
+    rank = temp.groupby(day_keys).rank(method="min", ascending=False).astype("Int64")
+    precip = frame[precipitation]
+    # like SQL SUM: nulls are skipped, and the total is null until the first value
+    cumulative = precip.fillna(0).groupby(day_keys).cumsum().where(precip.notna().groupby(day_keys).cumsum() > 0)
+
+    features = pd.DataFrame({
+        "_row": frame["_row"],
+        "temp_change_1h": change,
+        "temp_rolling_3h": rolling,
+        "temp_rank_daily": rank,
+        "precip_cumulative_daily": cumulative,
+    })
+    features = features[features["_row"] >= 0].sort_values("_row")
+
+    result = df.copy()
+    for column in FEATURE_COLUMNS:
+        result[column] = features[column].to_numpy()
+    return result
+
+
+def previous_partition(
+    run_date: str, source: str = "openmeteo", locations: Optional[list[str]] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Read the silver partition of the run_date before, as lead-in context.
+
+    Args:
+        run_date: Run date being processed, in YYYY-MM-DD format
+        source: Data source identifier. Defaults to 'openmeteo'.
+        locations: Only these locations (default: every location)
+
+    Returns:
+        Silver DataFrame with a 'location' column, or None if the previous day was never ingested
+    """
+    previous = (date.fromisoformat(run_date) - timedelta(days=1)).isoformat()
+    try:
+        table = read_silver(previous, previous, locations=locations, source=source)
+    except FileNotFoundError:
+        logger.info(f"No silver partition for {previous}, features for {run_date} start without lead-in")
+        return None
+    return table.drop_columns(["run_date"]).to_pandas()
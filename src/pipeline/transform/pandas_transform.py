@@ -0,0 +1,307 @@
+"""
+Local silver -> gold transformation engine.
+
+Vectorized pandas implementation of the spark/glue_job.py semantics for
+small partitions, where Glue spin-up dominates the runtime:
+- Renames API fields to analytics-ready names
+- Casts time to timestamp
+- Derives temp_fahrenheit (rounded HALF_UP like Spark) and is_freezing
+- Precomputes the hourly time-series features (transform/features.py), with
+  lead-in from the previous run_date's silver partition
+- Adds run_date and writes gold Parquet partitioned by run_date & location
+
+run_transform picks the engine from the silver partition size: pandas for
+small days, a local SparkSession (spark/glue_job.py) for large ones.
+
+Usage:
+    python -m src.pipeline.transform.pandas_transform --run-date 2026-01-25
+    python -m src.pipeline.transform.pandas_transform --run-date 2026-01-25 --engine spark
+"""
+
+import argparse
+import glob
+import logging
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.pipeline.config import Project_Config
+from src.pipeline.io.local import save_parquet_local
+from src.pipeline.io.catalog import MANIFEST_NAME, get_catalog, record_partition
+from src.pipeline.io.dataset import read_silver, silver_files
+from src.pipeline.transform.features import add_hourly_features, previous_partition
+
+logger = logging.getLogger(__name__)
+
+GOLD_COLUMN_RENAMES = {
+    "temperature_2m": "temp_celsius",
+    "relative_humidity_2m": "humidity_percent",
+    "wind_speed_10m": "wind_speed_kmh",
+    "precipitation": "precipitation_mm",
+}
+
+# Above this many silver rows for a run_date the local Spark engine is used
+PANDAS_ENGINE_MAX_ROWS = 1_000_000
+
+ENGINES = ("auto", "pandas", "spark")
+
+
+def _round_half_up(values: pd.Series, decimals: int) -> pd.Series:
+    """
+    Round like Spark's round(): HALF_UP on the decimal value, not banker's rounding.
+
+    Args:
+        values: Numeric Series (nulls preserved)
+        decimals: Number of decimal places
+
+    Returns:
+        Rounded float Series
+    """
+    factor = 10.0 ** decimals
+    # round the scaled value first to absorb binary representation error (32.445 * 100 = 3244.4999...)
+    scaled = np.round(values.to_numpy(dtype="float64") * factor, 6)
+    rounded = np.sign(scaled) * np.floor(np.abs(scaled) + 0.5) / factor
+    return pd.Series(rounded, index=values.index)
+
+
+def transform_silver_to_gold(df: pd.DataFrame, run_date: str, context: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Apply the silver -> gold curation logic (pandas port of the Glue job).
+
+    Args:
+        df: Silver DataFrame with API column names and a 'location' column
+        run_date: Date in YYYY-MM-DD format, added as the 'run_date' column
+        context: Previous run_date's silver rows, lead-in for the hourly features
+
+    Returns:
+        Curated DataFrame with the same columns and values as the Spark job
+    """
+    curated = df.rename(columns=GOLD_COLUMN_RENAMES)
+
+    # cast time to timestamp for partitioning/sorting
+    curated["time"] = pd.to_datetime(curated["time"])
+
+    # derived columns: fahrenheit & freezing flag (null temperatures are not freezing)
+    curated["temp_fahrenheit"] = _round_half_up(curated["temp_celsius"] * 9 / 5 + 32, 2)
+    curated["is_freezing"] = (curated["temp_celsius"] <= 0).fillna(False).astype(bool)
+
+    # hourly time-series features, so q9-q12 read columns instead of running windows
+    if context is not None:
+        context = context.rename(columns=GOLD_COLUMN_RENAMES)
+    curated = add_hourly_features(curated, context=context)
+
+    curated["run_date"] = run_date
+    return curated
+
+
+def _silver_row_count(files: list[str]) -> int:
+    """
+    Count silver rows from Parquet footers without reading any column data.
+
+    Args:
+        files: Parquet file paths
+
+    Returns:
+        Total number of rows
+    """
+    import pyarrow.parquet as pq
+
+    return sum(pq.ParquetFile(f).metadata.num_rows for f in files)
+
+
+def _silver_size(run_date: str, source: str) -> tuple[int, int]:
+    """
+    Row and file counts of a run_date's silver data, from the partition catalog when configured.
+
+    Args:
+        run_date: Date in YYYY-MM-DD format
+        source: Data source identifier
+
+    Returns:
+        Tuple of (row count, file count)
+    """
+    catalog = get_catalog()
+    entries = catalog.list_partitions("silver", source, run_date, run_date) if catalog else []
+    if entries:
+        return sum(e["row_count"] for e in entries), sum(e["file_count"] for e in entries)
+
+    files = silver_files(run_date, run_date, source=source)
+    return _silver_row_count(files), len(files)
+
+
+def _record_gold_partitions(run_date: str, source: str) -> None:
+    """Record every gold location partition of a run_date in the partition catalog."""
+    gold_dir = Project_Config.Paths.gold_path(source, run_date)
+    for partition_dir in sorted(glob.glob(f"{gold_dir}/location=*")):
+        record_partition("gold", source, run_date, os.path.basename(partition_dir).split("=", 1)[1])
+
+
+def choose_engine(row_count: int, max_pandas_rows: int = PANDAS_ENGINE_MAX_ROWS) -> str:
+    """
+    Pick the transform engine for a partition of the given size.
+
+    Args:
+        row_count: Number of silver rows for the run_date
+        max_pandas_rows: Largest partition handled in-process by pandas
+
+    Returns:
+        'pandas' or 'spark'
+    """
+    return "pandas" if row_count <= max_pandas_rows else "spark"
+
+
+def read_silver_partition(run_date: str, source: str = "openmeteo") -> pd.DataFrame:
+    """
+    Read all locations of one silver run_date, adding the hive 'location' column.
+
+    Args:
+        run_date: Date in YYYY-MM-DD format
+        source: Data source identifier. Defaults to 'openmeteo'.
+
+    Returns:
+        Concatenated silver DataFrame
+
+    Raises:
+        FileNotFoundError: If no silver files exist for the run_date
+    """
+    # run_date is re-added by the transform, only the location key is kept
+    table = read_silver(run_date, run_date, source=source)
+    return table.drop_columns(["run_date"]).to_pandas()
+
+
+def write_gold_partitions(df: pd.DataFrame, run_date: str, source: str = "openmeteo") -> list[str]:
+    """
+    Write curated data to gold, one Parquet file per run_date/location partition.
+
+    Existing Parquet files and any compaction manifest in a partition are
+    replaced so reruns are idempotent, matching Spark's dynamic partition
+    overwrite.
+
+    Args:
+        df: Curated DataFrame with 'location' and 'run_date' columns
+        run_date: Date in YYYY-MM-DD format
+        source: Data source identifier
+
+    Returns:
+        Paths of the written Parquet files
+    """
+    written = []
+    for location, group in df.groupby("location", sort=True):
+        dir_path = Project_Config.Paths.gold_path(source, run_date, str(location))
+        for stale in glob.glob(f"{dir_path}/*.parquet") + glob.glob(f"{dir_path}/{MANIFEST_NAME}"):
+            os.remove(stale)
+
+        # partition columns live in the directory names, like Spark's partitionBy
+        file_path = f"{dir_path}/weather_data.parquet"
+        save_parquet_local(group.drop(columns=["location", "run_date"]), file_path)
+        written.append(file_path)
+    return written
+
+
+def _run_pandas(run_date: str, source: str) -> int:
+    """Run the silver -> gold transform in-process with pandas."""
+    raw_df = read_silver_partition(run_date, source)
+    curated_df = transform_silver_to_gold(raw_df, run_date, context=previous_partition(run_date, source))
+
+    if len(raw_df) != len(curated_df):
+        raise ValueError(
+            f"Validation failed! Silver count ({len(raw_df)}) != Gold count ({len(curated_df)})."
+        )
+
+    write_gold_partitions(curated_df, run_date, source)
+    return len(curated_df)
+
+
+def _run_spark(run_date: str, source: str) -> int:
+    """Run the silver -> gold transform on a local SparkSession using the Glue job logic."""
+    # pyspark is only needed for large partitions, keep it off the pandas path
+    from spark.glue_job import create_local_spark_session, run_silver_to_gold
+
+    spark = create_local_spark_session()
+    silver_prefix = f"{Project_Config.Paths.LOCAL_SILVER}/source={source}"
+    gold_prefix = f"{Project_Config.Paths.LOCAL_GOLD}/source={source}"
+    return run_silver_to_gold(spark, run_date, silver_prefix, gold_prefix)
+
+
+def run_transform(
+    run_date: str,
+    source: str = "openmeteo",
+    engine: str = "auto",
+    max_pandas_rows: int = PANDAS_ENGINE_MAX_ROWS,
+) -> int:
+    """
+    Orchestrate the local silver -> gold transform for one run_date.
+
+    Args:
+        run_date: Date in YYYY-MM-DD format
+        source: Data source identifier. Defaults to 'openmeteo'.
+        engine: 'pandas', 'spark' or 'auto' (choose by silver row count)
+        max_pandas_rows: Threshold used by 'auto'
+
+    Returns:
+        Number of records written to the gold layer
+
+    Raises:
+        ValueError: If the engine is unknown, LOCAL_GOLD_PATH is unset, or counts differ
+        FileNotFoundError: If no silver data exists for the run_date
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Expected one of: {', '.join(ENGINES)}")
+    if not Project_Config.Paths.LOCAL_GOLD:
+        raise ValueError("LOCAL_GOLD_PATH environment variable is not set")
+
+    if engine == "auto":
+        row_count, file_count = _silver_size(run_date, source)
+        engine = choose_engine(row_count, max_pandas_rows)
+        logger.info(f"Silver partition has {row_count} rows in {file_count} files, using {engine} engine")
+
+    logger.info(f"Starting gold transform: source={source}, run_date={run_date}, engine={engine}")
+    gold_count = _run_pandas(run_date, source) if engine == "pandas" else _run_spark(run_date, source)
+    if get_catalog() is not None:
+        _record_gold_partitions(run_date, source)
+    logger.info(f"Gold transform completed: {gold_count} records written")
+    return gold_count
+
+
+def main():
+    """
+    CLI entry point. Parses arguments and runs the local gold transform.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="Transform silver Parquet into the gold layer locally")
+    parser.add_argument(
+        "--run-date",
+        required=True,
+        help="Date to process in YYYY-MM-DD format"
+    )
+    parser.add_argument(
+        "--source",
+        default="openmeteo",
+        help="Data source identifier (default: openmeteo)"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="auto",
+        help="Transform engine (default: auto, chosen by partition size)"
+    )
+    parser.add_argument(
+        "--max-pandas-rows",
+        type=int,
+        default=PANDAS_ENGINE_MAX_ROWS,
+        help=f"Largest partition transformed with pandas in auto mode (default: {PANDAS_ENGINE_MAX_ROWS})"
+    )
+
+    args = parser.parse_args()
+    logger.info(f"CLI arguments parsed: run_date={args.run_date}, source={args.source}, engine={args.engine}")
+    run_transform(args.run_date, args.source, args.engine, args.max_pandas_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Server-side chart downsampling for the dashboard.
+
+Keeps what the Streamlit app sends to the browser bounded by the chart's
+width instead of the length of the selected date range:
+- Lines: Largest-Triangle-Three-Buckets (LTTB), which keeps the points
+  that carry the visible shape (peaks, troughs, turns)
+- Bars: calendar buckets (day, week, month, quarter, year), the finest
+  one that fits, so each bar is still a readable total
+- Scatter: a uniform random sample, seeded so reruns show the same points
+
+Every function returns its input unchanged when it already fits.
+
+Usage:
+    from src.pipeline.warehouse.downsample import bucket_bars, lttb_frame, sample_points
+    temp_trend = lttb_frame(temp_trend, 800)
+    precip_trend, bucket = bucket_bars(precip_trend, 800 // MIN_BAR_PX)
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Narrowest bar worth drawing, in pixels
+MIN_BAR_PX = 4
+# Pandas period -> label, finest first
+CALENDAR_BUCKETS = {"D": "Daily", "W": "Weekly", "M": "Monthly", "Q": "Quarterly", "Y": "Yearly"}
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of the points Largest-Triangle-Three-Buckets keeps.
+
+    The first and last points are always kept. The points between them are
+    split into threshold - 2 buckets. From each bucket, the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    average is kept.
+
+    Args:
+        x: Increasing x values
+        y: y values (NaN points are only kept as first or last point)
+        threshold: Number of points to keep
+
+    Returns:
+        Sorted index array of at most threshold points
+    """
+    n = len(x)
+    if threshold >= n or n <= 2:
+        return np.arange(n)
+    if threshold < 3:
+        return np.array([0, n - 1])
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    kept = np.empty(threshold, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        with np.errstate(invalid="ignore"):
+            next_y = y[next_start:next_end]
+            avg_y = np.nanmean(next_y) if not np.isnan(next_y).all() else y[a]
+        avg_x = x[next_start:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        kept[i + 1] = a
+    return kept
+
+
+def lttb_frame(df: pd.DataFrame, threshold: int) -> pd.DataFrame:
+    """
+    Downsample a date-indexed line chart frame with LTTB.
+
+    Each column keeps its own LTTB points and the frame keeps their union,
+    so every line's extremes survive (at most columns x threshold rows).
+
+    Args:
+        df: Chart data indexed by date, one column per line
+        threshold: Points to keep per line, about the chart width in pixels
+
+    Returns:
+        The rows to plot
+    """
+    if len(df) <= threshold:
+        return df
+    x = pd.DatetimeIndex(df.index).asi8
+    rows = np.unique(np.concatenate([lttb(x, df[column].to_numpy(dtype=float), threshold) for column in df.columns]))
+    logger.debug(f"LTTB: {len(df)} -> {len(rows)} rows")
+    return df.iloc[rows]
+
+
+def bucket_bars(series: pd.Series, max_bars: int) -> tuple[pd.Series, str]:
+    """
+    Sum a date-indexed bar series into the finest calendar bucket that fits.
+
+    Args:
+        series: Daily values indexed by date
+        max_bars: Most bars the chart can show
+
+    Returns:
+        (series indexed by bucket start date, bucket label such as 'Daily' or 'Monthly')
+    """
+    if len(series) <= max_bars:
+        return series, CALENDAR_BUCKETS["D"]
+    index = pd.DatetimeIndex(series.index)
+    for period, label in CALENDAR_BUCKETS.items():
+        starts = index.to_period(period).start_time
+        # yearly is the coarsest bucket, used even if it does not fit
+        if starts.nunique() <= max_bars:
+            break
+    bucketed = series.groupby(starts.date).sum()
+    bucketed.index.name = series.index.name
+    logger.debug(f"Bars: {len(series)} days -> {len(bucketed)} {label.lower()} buckets")
+    return bucketed, label
+
+
+def sample_points(df: pd.DataFrame, max_points: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Uniform sample of scatter rows, in their original order.
+
+    This gives the same distribution as a reservoir sample. It draws the
+    positions in one vectorized call, because the rows are already in
+    memory. The fixed seed keeps the points stable across reruns.
+
+    Args:
+        df: Rows to plot
+        max_points: Most points to send
+        seed: Random seed
+
+    Returns:
+        At most max_points rows
+    """
+    if len(df) <= max_points:
+        return df
+    rows = np.sort(np.random.default_rng(seed).choice(len(df), size=max_points, replace=False))
+    return df.iloc[rows]
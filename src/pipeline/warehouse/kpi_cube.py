@@ -0,0 +1,232 @@
+"""
+In-memory aggregate cube for the dashboard KPIs.
+
+Built once per load of mart_daily_weather_summary, so the Streamlit app
+answers every filter change from precomputed arrays instead of re-masking
+and re-aggregating the DataFrame:
+- Measures are dense (location x date) NumPy arrays over the sorted dates
+  in the data, plus an "all locations" row aggregated across cities
+- Date ranges are resolved with a binary search on the date axis (O(log n))
+- Means and totals come from prefix sums of values and non-null counts (O(1))
+- Range maxima come from a sparse table of power-of-two windows (O(1))
+- Per-date chart series and the underlying rows are contiguous slices
+
+Results match the pandas filter + mean/sum/max the app used before: nulls
+are skipped, a mean over no values is NaN, and a location's missing days
+are absent from its series.
+
+Usage:
+    from src.pipeline.warehouse.kpi_cube import KpiCube
+    cube = KpiCube(df)
+    cube.kpis("Boston", date(2026, 1, 1), date(2026, 1, 31))
+    cube.temperature_series(None, date(2026, 1, 1), date(2026, 1, 31))
+"""
+
+import logging
+import uuid
+from datetime import date
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Measure -> how the KPI cards and charts aggregate it across rows
+MEAN_COLUMNS = ["avg_temp_c", "min_temp_c", "max_temp_c", "avg_humidity"]
+SUM_COLUMNS = ["total_precipitation_mm"]
+MAX_COLUMNS = ["max_wind_speed_kmh"]
+
+
+def _prefix(values: np.ndarray) -> np.ndarray:
+    """Prefix sums along the date axis, with a leading zero column."""
+    prefix = np.zeros((values.shape[0], values.shape[1] + 1))
+    np.cumsum(values, axis=1, out=prefix[:, 1:])
+    return prefix
+
+
+def _sparse_table(values: np.ndarray) -> list[np.ndarray]:
+    """
+    Sparse table for range maxima along the date axis.
+
+    Level k holds the max over the 2**k dates starting at each position, so
+    any range is covered by two overlapping windows of one level. NaN marks
+    a missing value and is ignored, like pandas max().
+    """
+    levels = [values]
+    width = 1
+    while 2 * width <= values.shape[1]:
+        previous = levels[-1]
+        levels.append(np.fmax(previous[:, :-width], previous[:, width:]))
+        width *= 2
+    return levels
+
+
+class KpiCube:
+    """
+    Range aggregates of the daily summary mart by location and date.
+
+    Location None stands for every location, like the dashboard's
+    "All Locations" option. build_id is unique per instance, so results
+    derived from a cube can be cached under the build that produced them.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df: mart_daily_weather_summary rows with lowercase columns, a
+                'location_name' and a 'summary_date' (datetime.date)
+        """
+        self.build_id = uuid.uuid4().hex
+        days = pd.to_datetime(df["summary_date"]).to_numpy().astype("datetime64[D]")
+        order = np.lexsort((days, df["location_name"].to_numpy()))
+        self.frame = df.iloc[order].reset_index(drop=True)
+        self._frame_dates = days[order]
+        self.locations: list[str] = sorted(self.frame["location_name"].unique().tolist())
+        self._index = {location: i for i, location in enumerate(self.locations)}
+        self.dates = np.unique(self._frame_dates)
+
+        row = self.frame["location_name"].map(self._index).to_numpy()
+        col = np.searchsorted(self.dates, self._frame_dates)
+        shape = (len(self.locations), len(self.dates))
+        present = np.zeros(shape)
+        present[row, col] = 1
+        # rows of one location are contiguous in self.frame; by_date orders every row by date for "All Locations"
+        self._offsets = np.searchsorted(row, np.arange(len(self.locations) + 1))
+        by_date = np.argsort(self._frame_dates, kind="stable")
+        self._by_date = self.frame.iloc[by_date].reset_index(drop=True)
+        self._by_date_dates = self._frame_dates[by_date]
+
+        self._present = _prefix(np.vstack([present, present.sum(axis=0)]))
+        self._sums: dict[str, np.ndarray] = {}
+        self._counts: dict[str, np.ndarray] = {}
+        self._daily: dict[str, np.ndarray] = {}
+        for column in MEAN_COLUMNS + SUM_COLUMNS:
+            values = np.full(shape, np.nan)
+            values[row, col] = self.frame[column].to_numpy(dtype=float)
+            counts = (~np.isnan(values)).astype(float)
+            values = np.nan_to_num(values)
+            values, counts = np.vstack([values, values.sum(axis=0)]), np.vstack([counts, counts.sum(axis=0)])
+            self._sums[column], self._counts[column] = _prefix(values), _prefix(counts)
+            if column in SUM_COLUMNS:
+                self._daily[column] = values
+            else:
+                self._daily[column] = np.divide(values, counts, out=np.full_like(values, np.nan), where=counts > 0)
+        self._maxima: dict[str, list[np.ndarray]] = {}
+        for column in MAX_COLUMNS:
+            values = np.full(shape, np.nan)
+            values[row, col] = self.frame[column].to_numpy(dtype=float)
+            overall = np.fmax.reduce(values, axis=0) if len(self.locations) else np.full(len(self.dates), np.nan)
+            self._maxima[column] = _sparse_table(np.vstack([values, overall]))
+        logger.info(f"KPI cube built: {len(self.locations)} locations x {len(self.dates)} dates")
+
+    def _row(self, location: Optional[str]) -> int:
+        """Array row of a location; the last row aggregates every location."""
+        if location is None:
+            return len(self.locations)
+        if location not in self._index:
+            raise KeyError(f"Unknown location '{location}'")
+        return self._index[location]
+
+    def _span(self, start_date: date, end_date: date) -> tuple[int, int]:
+        """Half-open [i, j) positions of the dates in the inclusive range."""
+        i = int(np.searchsorted(self.dates, np.datetime64(start_date, "D"), side="left"))
+        j = int(np.searchsorted(self.dates, np.datetime64(end_date, "D"), side="right"))
+        return i, max(i, j)
+
+    def _range_max(self, column: str, row: int, i: int, j: int) -> float:
+        if i == j:
+            return float("nan")
+        levels = self._maxima[column]
+        k = (j - i).bit_length() - 1
+        return float(np.fmax(levels[k][row, i], levels[k][row, j - (1 << k)]))
+
+    def kpis(self, location: Optional[str], start_date: date, end_date: date) -> Optional[dict[str, float]]:
+        """
+        KPI card values over a location (None: all) and an inclusive date range.
+
+        Args:
+            location: Location name, or None for every location
+            start_date: First date
+            end_date: Last date
+
+        Returns:
+            Mean of each MEAN_COLUMNS, total of each SUM_COLUMNS and max of each
+            MAX_COLUMNS, keyed by column; None if no rows fall in the range
+
+        Raises:
+            KeyError: If the location is not in the data
+        """
+        row = self._row(location)
+        i, j = self._span(start_date, end_date)
+        if self._present[row, j] - self._present[row, i] == 0:
+            return None
+        result = {}
+        for column in MEAN_COLUMNS:
+            count = self._counts[column][row, j] - self._counts[column][row, i]
+            total = self._sums[column][row, j] - self._sums[column][row, i]
+            result[column] = float(total / count) if count else float("nan")
+        for column in SUM_COLUMNS:
+            result[column] = float(self._sums[column][row, j] - self._sums[column][row, i])
+        for column in MAX_COLUMNS:
+            result[column] = self._range_max(column, row, i, j)
+        return result
+
+    def _series(self, columns: list[str], location: Optional[str], start_date: date, end_date: date) -> pd.DataFrame:
+        row = self._row(location)
+        i, j = self._span(start_date, end_date)
+        # dates this location has no row for are left out, as a groupby would
+        present = np.diff(self._present[row, i:j + 1]) > 0
+        index = pd.Index(self.dates[i:j][present].astype(object), name="summary_date")
+        return pd.DataFrame({column: self._daily[column][row, i:j][present] for column in columns}, index=index)
+
+    def temperature_series(self, location: Optional[str], start_date: date, end_date: date) -> pd.DataFrame:
+        """
+        Per-date mean of min/avg/max temperature across the selected locations.
+
+        Args:
+            location: Location name, or None for every location
+            start_date: First date
+            end_date: Last date
+
+        Returns:
+            pd.DataFrame indexed by summary_date with min_temp_c, avg_temp_c and max_temp_c
+        """
+        return self._series(["min_temp_c", "avg_temp_c", "max_temp_c"], location, start_date, end_date)
+
+    def precipitation_series(self, location: Optional[str], start_date: date, end_date: date) -> pd.Series:
+        """
+        Per-date precipitation total across the selected locations.
+
+        Args:
+            location: Location name, or None for every location
+            start_date: First date
+            end_date: Last date
+
+        Returns:
+            pd.Series of total_precipitation_mm indexed by summary_date
+        """
+        return self._series(["total_precipitation_mm"], location, start_date, end_date)["total_precipitation_mm"]
+
+    def rows(self, location: Optional[str], start_date: date, end_date: date) -> pd.DataFrame:
+        """
+        Mart rows of the selection, as one contiguous slice.
+
+        Args:
+            location: Location name, or None for every location
+            start_date: First date
+            end_date: Last date
+
+        Returns:
+            pd.DataFrame of the matching rows (a view; do not modify)
+        """
+        if location is None:
+            frame, all_dates, first, last = self._by_date, self._by_date_dates, 0, len(self._by_date)
+        else:
+            row = self._row(location)
+            frame, all_dates = self.frame, self._frame_dates
+            first, last = int(self._offsets[row]), int(self._offsets[row + 1])
+        dates = all_dates[first:last]
+        i = first + int(np.searchsorted(dates, np.datetime64(start_date, "D"), side="left"))
+        j = first + int(np.searchsorted(dates, np.datetime64(end_date, "D"), side="right"))
+        return frame.iloc[i:max(i, j)]
@@ -0,0 +1,377 @@
+"""
+Embedded DuckDB engine for running the analytics directly on the lake.
+
+Runs the q1-q13 queries of src/pipeline/warehouse/queries.py over the
+hive-partitioned silver or gold Parquet trees, with no Postgres load and no
+02_populate_tables.sql:
+- raw_weather, dim_location, dim_date and fact_weather_hourly are temporary
+  views, so the star-schema joins run unchanged; only the fact view reads
+  Parquet, dimensions come from partition keys and a calendar
+- Partition pruning: only the location= and run_date= directories that can
+  hold the requested locations and dates are scanned (the partition catalog
+  is used when configured)
+- With a lookback (below), where several run_dates hold the same hour, the
+  latest run_date wins for each location and hour, as after a reload of that run
+- The hourly features q9-q12 read are stored in gold and derived with
+  window functions over silver
+- DuckDB scans Parquet column-by-column in vectorized batches on every core
+
+The fetch requests start_date = end_date = run_date, so a run_date partition
+holds only that day's hours and a date range maps to exactly its run_dates.
+Lakes whose partitions hold later dates too (e.g. multi-day forecasts) set
+LAKE_RUN_DATE_LOOKBACK_DAYS (or lookback_days) to how many days past its
+run_date a partition can reach; pruning then keeps that many earlier
+run_dates and overlapping hours are deduplicated. Silver also reads the run_date
+before the range, since the features derived from it look up to two hours back.
+
+Usage:
+    python -m src.pipeline.warehouse.lake --query high_winds --start-date 2026-01-01 --end-date 2026-12-31 --param min_wind_speed=25
+    python -m src.pipeline.warehouse.lake --query avg_temp_by_city --layer gold --location "Boston,Miami"
+
+    from src.pipeline.warehouse import lake, queries
+    queries.set_engine(lake.LakeEngine("silver"))
+    queries.rainy_cities(start_date="2025-01-01", end_date="2025-12-31", min_precipitation=500)
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import threading
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Optional
+
+from src.pipeline.config import Project_Config
+
+# duckdb and pandas are imported on first query so importing this module stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
+    from sqlalchemy.sql.elements import TextClause
+
+logger = logging.getLogger(__name__)
+
+LAYERS = ("silver", "gold")
+
+# Star-schema column -> Parquet column for each layer
+_LAYER_COLUMNS = {
+    "silver": {
+        "temperature_2m": "temperature_2m",
+        "relative_humidity_2m": "relative_humidity_2m",
+        "precipitation": "precipitation",
+        "wind_speed_10m": "wind_speed_10m",
+    },
+    "gold": {
+        "temperature_2m": "temp_celsius",
+        "relative_humidity_2m": "humidity_percent",
+        "precipitation": "precipitation_mm",
+        "wind_speed_10m": "wind_speed_kmh",
+        "temp_change_1h": "temp_change_1h",
+        "temp_rolling_3h": "temp_rolling_3h",
+        "temp_rank_daily": "temp_rank_daily",
+        "precip_cumulative_daily": "precip_cumulative_daily",
+    },
+}
+
+_EMPTY_RAW = """SELECT CAST(NULL AS TIMESTAMP) AS time, CAST(NULL AS DOUBLE) AS temperature_2m,
+    CAST(NULL AS BIGINT) AS relative_humidity_2m, CAST(NULL AS DOUBLE) AS precipitation,
+    CAST(NULL AS DOUBLE) AS wind_speed_10m, CAST(NULL AS DOUBLE) AS latitude, CAST(NULL AS DOUBLE) AS longitude,
+    CAST(NULL AS VARCHAR) AS location, CAST(NULL AS VARCHAR) AS run_date
+WHERE false"""
+
+# Gold stores the hourly features (src/pipeline/transform/features.py); for silver they are
+# derived here with the same semantics, over the deduplicated series
+_SILVER_FEATURES = """CASE WHEN time - LAG(time) OVER by_time = INTERVAL 1 HOUR
+        THEN temperature_2m - LAG(temperature_2m) OVER by_time END AS temp_change_1h,
+    AVG(temperature_2m) OVER (by_time RANGE BETWEEN INTERVAL 2 HOUR PRECEDING AND CURRENT ROW) AS temp_rolling_3h,
+    CASE WHEN temperature_2m IS NOT NULL THEN RANK() OVER (
+        PARTITION BY location, CAST(time AS DATE) ORDER BY temperature_2m DESC NULLS LAST
+    ) END AS temp_rank_daily,
+    SUM(precipitation) OVER (
+        PARTITION BY location, CAST(time AS DATE) ORDER BY time ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+    ) AS precip_cumulative_daily"""
+_GOLD_FEATURES = "temp_change_1h, temp_rolling_3h, temp_rank_daily, precip_cumulative_daily"
+
+# Same shape as fact_weather_hourly in sql/postgres/01_create_tables.sql, with natural keys as ids
+_FACT_VIEW = """CREATE OR REPLACE TEMP VIEW fact_weather_hourly AS
+SELECT CAST(time AS DATE) AS date_id, location AS location_id, hour(time) AS hour,
+    temperature_2m, relative_humidity_2m, precipitation, wind_speed_10m,
+    {features}
+FROM raw_weather
+WINDOW by_time AS (PARTITION BY location ORDER BY time)"""
+
+
+def _quote(value: str) -> str:
+    """SQL string literal (view definitions cannot take bind parameters)."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+class LakeEngine:
+    """
+    Runs analytics queries on an in-process DuckDB over the Parquet lake.
+
+    Pass one to `queries.set_engine()` to answer the analytics from silver or
+    gold instead of Postgres.
+    """
+
+    def __init__(
+        self,
+        layer: str = "silver",
+        source: str = "openmeteo",
+        threads: Optional[int] = None,
+        lookback_days: Optional[int] = None,
+    ):
+        """
+        Args:
+            layer: 'silver' or 'gold'
+            source: Data source identifier. Defaults to 'openmeteo'.
+            threads: DuckDB worker threads (default: every core)
+            lookback_days: Days past its run_date a partition can hold
+                (default: LAKE_RUN_DATE_LOOKBACK_DAYS, 0 for one day per run_date)
+
+        Raises:
+            ValueError: If the layer is unknown or its local path is not set
+        """
+        if layer not in LAYERS:
+            raise ValueError(f"Unknown layer '{layer}', expected one of {LAYERS}")
+        if not (Project_Config.Paths.LOCAL_SILVER if layer == "silver" else Project_Config.Paths.LOCAL_GOLD):
+            raise ValueError(f"LOCAL_{layer.upper()}_PATH environment variable is not set")
+        self.layer = layer
+        self.source = source
+        self.threads = threads
+        self.lookback_days = Project_Config.Database.LAKE_RUN_DATE_LOOKBACK_DAYS if lookback_days is None else lookback_days
+        self._conn: Any = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> Any:
+        with self._lock:
+            if self._conn is None:
+                import duckdb
+
+                self._conn = duckdb.connect()
+                if self.threads:
+                    self._conn.execute(f"SET threads = {int(self.threads)}")
+            return self._conn
+
+    def _source_root(self) -> str:
+        if self.layer == "silver":
+            return os.path.dirname(Project_Config.Paths.silver_path(self.source, "x"))
+        return os.path.dirname(Project_Config.Paths.gold_path(self.source, "x"))
+
+    def _run_date_bounds(self) -> Optional[tuple[str, str]]:
+        """Earliest and latest run_date on disk, or None if the layer is empty."""
+        root = self._source_root()
+        run_dates = sorted(
+            name.split("=", 1)[1] for name in (os.listdir(root) if os.path.isdir(root) else [])
+            if name.startswith("run_date=")
+        )
+        return (run_dates[0], run_dates[-1]) if run_dates else None
+
+    def files(
+        self,
+        locations: Optional[tuple[str, ...]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> list[str]:
+        """
+        List the Parquet files of the partitions that can hold the requested rows.
+
+        Args:
+            locations: Only these locations (default: every location)
+            start_date: First data date in YYYY-MM-DD format (default: unbounded)
+            end_date: Last data date in YYYY-MM-DD format (default: unbounded)
+
+        Returns:
+            Sorted list of Parquet file paths
+        """
+        from src.pipeline.io.catalog import partition_files
+        from src.pipeline.io.dataset import silver_files
+        from src.pipeline.transform.compact import gold_partition_dirs
+
+        bounds = self._run_date_bounds()
+        if bounds is None:
+            return []
+        first = bounds[0]
+        if start_date is not None:
+            # silver derives the hourly features here, and they reach into the previous day
+            context_days = 1 if self.layer == "silver" else 0
+            first = max(first, (date.fromisoformat(start_date) - timedelta(days=self.lookback_days + context_days)).isoformat())
+        last = min(bounds[1], end_date) if end_date is not None else bounds[1]
+        if first > last:
+            return []
+
+        if self.layer == "silver":
+            return silver_files(first, last, list(locations) if locations is not None else None, self.source)
+        return sorted(
+            path
+            for partition_dir in gold_partition_dirs(self.source, first, last)
+            if locations is None or os.path.basename(partition_dir).split("=", 1)[1] in locations
+            # honours compaction manifests, so a compaction never shows old and new files together
+            for path in partition_files("gold", partition_dir)
+        )
+
+    def version(
+        self,
+        locations: Optional[tuple[str, ...]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> str:
+        """
+        Fingerprint of the files a query would scan, from their paths, sizes and mtimes.
+
+        Any write to those partitions, by this or another process, changes it.
+
+        Args:
+            locations: Only these locations (default: every location)
+            start_date: First data date in YYYY-MM-DD format (default: unbounded)
+            end_date: Last data date in YYYY-MM-DD format (default: unbounded)
+
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.sha256()
+        for path in self.files(locations, start_date, end_date):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()
+
+    def _views(self, files: list[str]) -> list[str]:
+        """
+        Star-schema views over the given files.
+
+        Only the fact view reads Parquet: dimensions come from the partition
+        paths (locations) and a calendar covering their run_dates (dates), so
+        each query scans the files once.
+        """
+        if not files:
+            return [
+                f"CREATE OR REPLACE TEMP VIEW raw_weather AS {_EMPTY_RAW}",
+                "CREATE OR REPLACE TEMP VIEW dim_location AS "
+                "SELECT location AS location_id, location AS location_name FROM raw_weather",
+                "CREATE OR REPLACE TEMP VIEW dim_date AS SELECT CAST(time AS DATE) AS date_id, "
+                "CAST(time AS DATE) AS date_value, 0 AS day_of_week, false AS is_weekend FROM raw_weather",
+                _FACT_VIEW.format(features=_SILVER_FEATURES),
+            ]
+
+        keys = [dict(part.split("=", 1) for part in path.split(os.sep) if "=" in part) for path in files]
+        locations = sorted({key["location"] for key in keys})
+        run_dates = sorted(key["run_date"] for key in keys)
+        last_date = date.fromisoformat(run_dates[-1]) + timedelta(days=self.lookback_days)
+        columns = ", ".join(f"{column} AS {name}" for name, column in _LAYER_COLUMNS[self.layer].items())
+        file_list = ", ".join(_quote(path) for path in files)
+        # run_dates can only overlap when a partition reaches past its own day
+        latest_run = (
+            "\nQUALIFY ROW_NUMBER() OVER (PARTITION BY location, time ORDER BY run_date DESC) = 1"
+            if self.lookback_days else ""
+        )
+        return [
+            f"""CREATE OR REPLACE TEMP VIEW raw_weather AS
+SELECT time, {columns}, latitude, longitude, location, run_date
+FROM read_parquet([{file_list}], hive_partitioning = true,
+    hive_types = {{'run_date': VARCHAR, 'location': VARCHAR}}, union_by_name = true){latest_run}""",
+            f"""CREATE OR REPLACE TEMP VIEW dim_location AS
+SELECT location_name AS location_id, location_name
+FROM (VALUES {", ".join(f"({_quote(location)})" for location in locations)}) AS t(location_name)""",
+            f"""CREATE OR REPLACE TEMP VIEW dim_date AS
+SELECT date_value AS date_id, date_value, year(date_value) AS year, month(date_value) AS month,
+    day(date_value) AS day, dayofweek(date_value) AS day_of_week, dayofweek(date_value) IN (0, 6) AS is_weekend
+FROM (
+    SELECT CAST(unnest(generate_series(DATE {_quote(run_dates[0])}, DATE {_quote(last_date.isoformat())}, INTERVAL 1 DAY)) AS DATE)
+        AS date_value
+)""",
+            _FACT_VIEW.format(features=_SILVER_FEATURES if self.layer == "silver" else _GOLD_FEATURES),
+        ]
+
+    def execute(
+        self,
+        statement: "TextClause",
+        params: dict[str, Any],
+        locations: Optional[tuple[str, ...]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> "pd.DataFrame":
+        """
+        Run an analytics statement over the pruned partitions.
+
+        Args:
+            statement: SQLAlchemy text() statement written against the star schema
+            params: Its bind parameters
+            locations: Locations the statement filters on (for pruning)
+            start_date: First date it filters on (for pruning)
+            end_date: Last date it filters on (for pruning)
+
+        Returns:
+            pd.DataFrame of results
+        """
+        from sqlalchemy.dialects import sqlite
+
+        files = self.files(locations, start_date, end_date)
+        logger.debug(f"Lake query over {len(files)} {self.layer} files")
+        # SQLite's qmark style renders the named and expanding parameters as DuckDB-compatible '?'
+        compiled = statement.bindparams(**params).compile(
+            dialect=sqlite.dialect(), compile_kwargs={"render_postcompile": True}
+        )
+        positional = [compiled.params[name] for name in compiled.positiontup or []]
+
+        # a cursor is its own connection, so the temp views of concurrent queries do not collide
+        cursor = self._connection().cursor()
+        try:
+            for view in self._views(files):
+                cursor.execute(view)
+            return cursor.execute(str(compiled), positional).df()
+        finally:
+            cursor.close()
+
+    def close(self) -> None:
+        """Close the DuckDB connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def main():
+    """
+    CLI entry point. Runs one analytics query over the lake and prints the result.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    from src.pipeline.warehouse import queries
+
+    parser = argparse.ArgumentParser(description="Run an analytics query directly on silver or gold Parquet")
+    parser.add_argument("--query", required=True, choices=sorted(queries.QUERIES), help="Analytics query to run")
+    parser.add_argument("--layer", choices=LAYERS, default="silver", help="Lake layer to query (default: silver)")
+    parser.add_argument("--source", default="openmeteo", help="Data source identifier (default: openmeteo)")
+    parser.add_argument("--location", help="Comma-separated location names (default: all)")
+    parser.add_argument("--start-date", help="First date in YYYY-MM-DD format (default: unbounded)")
+    parser.add_argument("--end-date", help="Last date in YYYY-MM-DD format (default: unbounded)")
+    parser.add_argument(
+        "--param", action="append", default=[], metavar="NAME=VALUE",
+        help="Query threshold, e.g. min_wind_speed=25 (repeatable)",
+    )
+    parser.add_argument("--threads", type=int, default=None, help="DuckDB worker threads (default: every core)")
+    args = parser.parse_args()
+
+    thresholds: dict[str, Any] = {}
+    for param in args.param:
+        name, _, value = param.partition("=")
+        thresholds[name] = float(value) if "." in value else int(value)
+
+    # under `python -m` this module is __main__, so use the class queries dispatches on
+    queries.set_engine(queries.LakeEngine(args.layer, args.source, args.threads))
+    df = queries.QUERIES[args.query](
+        locations=args.location.split(",") if args.location else None,
+        start_date=args.start_date,
+        end_date=args.end_date,
+        **thresholds,
+    )
+    print(df.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,696 @@
+"""
+Parameterized analytics queries over the Postgres star schema.
+
+Exposes the analyses in sql/queries/ (q1-q13) as functions instead of
+fixed-literal scripts run through psql:
+- Every query takes optional locations and an inclusive start/end date range
+- Thresholds (freezing point, wind and rain cutoffs, bucket edges, variance)
+  are bind parameters rather than literals
+- All queries share one pooled engine (ANALYTICS_POOL_SIZE connections)
+- Results are kept in an LRU cache keyed by query name and parameters
+- FACT_LAYOUT=compact reads the hourly facts through the view over the
+  one-row-per-location-day table of sql/postgres/03_compact_facts.sql
+- The time-series queries (q9-q12) read the hourly features precomputed per
+  partition (transform/features.py) instead of running window functions, so
+  values at the edge of a date filter match those in the middle of a series
+
+Each cached result remembers the load version of the (location, date)
+partitions it covers. 02_populate_tables.sql stamps every partition it
+replaces in fact_load_versions, so the signal is shared by every process.
+Each lookup first reads the current version of its partitions (one indexed
+query). A result is served only while that version is unchanged, so a
+populate evicts just the results that overlap it. On the lake engine the
+version is the size and mtime of the Parquet files the query would scan.
+
+`set_engine(lake.LakeEngine("silver"))` answers the same queries from the
+Parquet lake with embedded DuckDB instead (see src/pipeline/warehouse/lake.py).
+
+Usage:
+    from src.pipeline.warehouse import queries
+    queries.high_winds(locations=["Boston"], start_date="2026-01-01", end_date="2026-01-31", min_wind_speed=25)
+    queries.rainy_cities(min_precipitation=5.0)
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
+
+from sqlalchemy import bindparam, create_engine, text
+from sqlalchemy.engine import Engine
+
+from src.pipeline.config import Project_Config
+from src.pipeline.warehouse.lake import LakeEngine
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DateLike = Union[str, date]
+
+# Relation the queries read hourly facts from, per FACT_LAYOUT (see sql/postgres/03_compact_facts.sql)
+FACT_TABLES = {"rows": "fact_weather_hourly", "compact": "fact_weather_hourly_compact"}
+
+# Latest load version of the partitions in scope, written by sql/postgres/02_populate_tables.sql
+_VERSION_SQL = """SELECT MAX(v.version) AS version FROM fact_load_versions v {where}"""
+
+_FROM = """FROM {fact} f
+JOIN dim_location l ON f.location_id = l.location_id
+JOIN dim_date d ON f.date_id = d.date_id"""
+# Window of fact_weather_hourly.temp_rolling_3h (see src/pipeline/transform/features.py)
+PRECOMPUTED_ROLLING_HOURS = 3
+
+_engine: Optional[Union[Engine, LakeEngine]] = None
+_engine_lock = threading.Lock()
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache of query results, validated against the load version of their partitions.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 0):
+        """
+        Args:
+            max_entries: Results kept before the least recently used is evicted
+            ttl_seconds: Max age of a result (0 keeps it until its partitions are reloaded)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[Any, Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple, version: Any) -> Optional[Any]:
+        """
+        Look up a result and mark it most recently used.
+
+        Args:
+            key: Cache key from the query layer
+            version: Current load version of the partitions the query covers
+
+        Returns:
+            The cached result, or None on a miss, an expired entry or a result
+            computed before its partitions were last loaded
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry[1] != version or (self.ttl_seconds and time.monotonic() - entry[2] > self.ttl_seconds)
+            ):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, value: Any, version: Any) -> None:
+        """
+        Store a result, evicting the least recently used entries past max_entries.
+
+        Args:
+            key: Cache key from the query layer
+            value: Query result
+            version: Load version read before the query ran; if a load lands
+                while it runs, the next lookup sees a newer version and recomputes
+        """
+        with self._lock:
+            if self.max_entries <= 0:
+                return
+            self._entries[key] = (value, version, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every result."""
+        with self._lock:
+            self._entries.clear()
+
+
+RESULT_CACHE = QueryCache(
+    Project_Config.Database.ANALYTICS_CACHE_SIZE, Project_Config.Database.ANALYTICS_CACHE_TTL_SECONDS
+)
+
+
+def get_engine() -> Union[Engine, LakeEngine]:
+    """
+    Return the engine shared by all analytics queries, creating it on first use.
+
+    Returns:
+        The engine from set_engine(), else a sqlalchemy.engine.Engine pooling
+        ANALYTICS_POOL_SIZE Postgres connections
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            pool_size = Project_Config.Database.ANALYTICS_POOL_SIZE
+            _engine = create_engine(
+                Project_Config.Database.connection_string(),
+                pool_size=pool_size,
+                max_overflow=0,
+                pool_pre_ping=True,
+                connect_args={"connect_timeout": 10},
+            )
+            logger.info(f"Analytics connection pool created ({pool_size} connections)")
+        return _engine
+
+
+def set_engine(engine: Optional[Union[Engine, LakeEngine]]) -> None:
+    """
+    Point the query layer at another engine (None: back to Postgres on next use) and clear the cache.
+
+    Args:
+        engine: SQLAlchemy engine, or a LakeEngine to query the Parquet lake
+    """
+    global _engine
+    with _engine_lock:
+        _engine = engine
+    RESULT_CACHE.clear()
+
+
+def _where(
+    location_column: str, date_column: str, location_key: Optional[tuple[str, ...]], start: Optional[str], end: Optional[str]
+) -> tuple[list[str], dict[str, Any]]:
+    """WHERE conditions and bind parameters restricting a query to locations and an inclusive date range."""
+    clauses: list[str] = []
+    bind: dict[str, Any] = {}
+    if location_key is not None:
+        clauses.append(f"{location_column} IN :locations")
+        bind["locations"] = list(location_key)
+    if start is not None:
+        clauses.append(f"{date_column} >= :start_date")
+        bind["start_date"] = start
+    if end is not None:
+        clauses.append(f"{date_column} <= :end_date")
+        bind["end_date"] = end
+    return clauses, bind
+
+
+def _statement(sql: str, clauses: list[str], location_key: Optional[tuple[str, ...]], **fields: str) -> Any:
+    """Fill a template's {where} (and other) placeholders into a text() statement."""
+    statement = text(sql.format(where=f"WHERE {' AND '.join(clauses)}" if clauses else "", **fields))
+    if location_key is not None:
+        statement = statement.bindparams(bindparam("locations", expanding=True))
+    return statement
+
+
+def _load_version(
+    engine: Union[Engine, LakeEngine],
+    location_key: Optional[tuple[str, ...]],
+    start: Optional[str],
+    end: Optional[str],
+) -> Any:
+    """
+    Current load version of the partitions a query covers.
+
+    Args:
+        engine: Engine the query runs on
+        location_key: Sorted locations (None: all)
+        start: First date in YYYY-MM-DD format (None: unbounded)
+        end: Last date in YYYY-MM-DD format (None: unbounded)
+
+    Returns:
+        Highest fact_load_versions.version in scope (None if nothing was loaded),
+        or a digest of the scanned files' sizes and mtimes on a LakeEngine
+    """
+    if isinstance(engine, LakeEngine):
+        return engine.version(location_key, start, end)
+    clauses, bind = _where("v.location_name", "v.date_value", location_key, start, end)
+    with engine.connect() as conn:
+        return conn.execute(_statement(_VERSION_SQL, clauses, location_key), bind).scalar()
+
+
+def _iso(value: DateLike) -> str:
+    """Normalize a date or YYYY-MM-DD string, rejecting anything else."""
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.isoformat()
+    return date.fromisoformat(value).isoformat()
+
+
+def _run(
+    name: str,
+    sql: str,
+    params: dict[str, Any],
+    conditions: Iterable[str],
+    locations: Optional[Iterable[str]],
+    start_date: Optional[DateLike],
+    end_date: Optional[DateLike],
+) -> "pd.DataFrame":
+    """
+    Run one analytics query through the cache.
+
+    Args:
+        name: Query name, part of the cache key
+        sql: Statement with {fact} and {where} placeholders for the fact relation and the filter clause
+        params: Bind parameters for the query's own thresholds
+        conditions: Extra WHERE conditions using those parameters
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+
+    Returns:
+        pd.DataFrame of results; a copy, so callers may modify it
+
+    Raises:
+        ValueError: If FACT_LAYOUT is not one of FACT_TABLES
+    """
+    import pandas as pd
+
+    engine = get_engine()
+    if isinstance(engine, LakeEngine):
+        fact = FACT_TABLES["rows"]
+    elif Project_Config.Database.FACT_LAYOUT in FACT_TABLES:
+        fact = FACT_TABLES[Project_Config.Database.FACT_LAYOUT]
+    else:
+        raise ValueError(f"Unknown FACT_LAYOUT '{Project_Config.Database.FACT_LAYOUT}', expected one of {sorted(FACT_TABLES)}")
+
+    location_key = tuple(sorted(set(locations))) if locations is not None else None
+    start = _iso(start_date) if start_date is not None else None
+    end = _iso(end_date) if end_date is not None else None
+    key = (name, fact, location_key, start, end, tuple(sorted(params.items())))
+
+    version = _load_version(engine, location_key, start, end)
+    cached = RESULT_CACHE.get(key, version)
+    if cached is not None:
+        logger.debug(f"Analytics cache hit: {name}")
+        return cached.copy()
+
+    scope_clauses, scope_bind = _where("l.location_name", "d.date_value", location_key, start, end)
+    clauses = list(conditions) + scope_clauses
+    bind = {**params, **scope_bind}
+    statement = _statement(sql, clauses, location_key, fact=fact)
+
+    start_time = time.perf_counter()
+    if isinstance(engine, LakeEngine):
+        df = engine.execute(statement, bind, location_key, start, end)
+    else:
+        with engine.connect() as conn:
+            result = conn.execute(statement, bind)
+            df = pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+    logger.info(f"Analytics query {name}: {len(df)} rows in {time.perf_counter() - start_time:.3f}s")
+
+    RESULT_CACHE.put(key, df, version)
+    return df.copy()
+
+
+def sample_data(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+    limit: int = 10,
+) -> "pd.DataFrame":
+    """
+    Readable sample of hourly facts joined to their dimensions (q1).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+        limit: Rows returned
+
+    Returns:
+        pd.DataFrame with location_name, date_value, hour, temperature_2m, precipitation
+    """
+    sql = f"""SELECT l.location_name, d.date_value, f.hour, f.temperature_2m, f.precipitation
+{_FROM}
+{{where}}
+ORDER BY l.location_name, d.date_value, f.hour
+LIMIT :limit"""
+    return _run("sample_data", sql, {"limit": limit}, [], locations, start_date, end_date)
+
+
+def freezing_hours(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+    below: float = 0.0,
+) -> "pd.DataFrame":
+    """
+    Hours colder than a threshold, coldest first (q2).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+        below: Temperature cutoff in °C
+
+    Returns:
+        pd.DataFrame with location_name, date_value, hour, temperature_2m
+    """
+    sql = f"""SELECT l.location_name, d.date_value, f.hour, f.temperature_2m
+{_FROM}
+{{where}}
+ORDER BY f.temperature_2m ASC"""
+    return _run(
+        "freezing_hours", sql, {"below": below}, ["f.temperature_2m < :below"], locations, start_date, end_date
+    )
+
+
+def high_winds(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+    min_wind_speed: float = 15.0,
+) -> "pd.DataFrame":
+    """
+    Hours windier than a threshold, windiest first (q3).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+        min_wind_speed: Wind speed cutoff in km/h
+
+    Returns:
+        pd.DataFrame with location_name, date_value, hour, wind_speed_10m, temperature_2m
+    """
+    sql = f"""SELECT l.location_name, d.date_value, f.hour, f.wind_speed_10m, f.temperature_2m
+{_FROM}
+{{where}}
+ORDER BY f.wind_speed_10m DESC"""
+    return _run(
+        "high_winds", sql, {"min_wind_speed": min_wind_speed}, ["f.wind_speed_10m > :min_wind_speed"],
+        locations, start_date, end_date,
+    )
+
+
+def weekend_weather(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+) -> "pd.DataFrame":
+    """
+    Hourly temperatures on weekend days only (q4).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+
+    Returns:
+        pd.DataFrame with location_name, date_value, day_of_week (0=Sunday), hour, temperature_2m
+    """
+    sql = f"""SELECT l.location_name, d.date_value, d.day_of_week, f.hour, f.temperature_2m
+{_FROM}
+{{where}}
+ORDER BY l.location_name, d.date_value, f.hour"""
+    return _run("weekend_weather", sql, {}, ["d.is_weekend = TRUE"], locations, start_date, end_date)
+
+
+def avg_temp_by_city(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+) -> "pd.DataFrame":
+    """
+    Daily average temperature per location, warmest first (q5).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+
+    Returns:
+        pd.DataFrame with location_name, date_value, hours_recorded, avg_temp
+    """
+    sql = f"""SELECT l.location_name, d.date_value, COUNT(*) AS hours_recorded,
+    ROUND(CAST(AVG(f.temperature_2m) AS NUMERIC), 1) AS avg_temp
+{_FROM}
+{{where}}
+GROUP BY l.location_name, d.date_value
+ORDER BY avg_temp DESC"""
+    return _run("avg_temp_by_city", sql, {}, [], locations, start_date, end_date)
+
+
+def min_max_temp(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+) -> "pd.DataFrame":
+    """
+    Daily temperature range per location, widest first (q6).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+
+    Returns:
+        pd.DataFrame with location_name, date_value, min_temp, max_temp, temp_variance
+    """
+    sql = f"""SELECT l.location_name, d.date_value, MIN(f.temperature_2m) AS min_temp, MAX(f.temperature_2m) AS max_temp,
+    MAX(f.temperature_2m) - MIN(f.temperature_2m) AS temp_variance
+{_FROM}
+{{where}}
+GROUP BY l.location_name, d.date_value
+ORDER BY temp_variance DESC"""
+    return _run("min_max_temp", sql, {}, [], locations, start_date, end_date)
+
+
+def rainy_cities(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+    min_precipitation: float = 0.0,
+) -> "pd.DataFrame":
+    """
+    Locations whose total precipitation over the range exceeds a threshold, wettest first (q7).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+        min_precipitation: Total precipitation cutoff in mm
+
+    Returns:
+        pd.DataFrame with location_name, total_precipitation
+    """
+    sql = f"""SELECT l.location_name, SUM(f.precipitation) AS total_precipitation
+{_FROM}
+{{where}}
+GROUP BY l.location_name
+HAVING SUM(f.precipitation) > :min_precipitation
+ORDER BY total_precipitation DESC"""
+    return _run(
+        "rainy_cities", sql, {"min_precipitation": min_precipitation}, [], locations, start_date, end_date
+    )
+
+
+def temp_buckets(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+    cold_below: float = 10.0,
+    hot_above: float = 20.0,
+) -> "pd.DataFrame":
+    """
+    Hours per day in Cold / Mild / Hot temperature buckets (q8).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+        cold_below: Temperatures below this are 'Cold' (°C)
+        hot_above: Temperatures above this are 'Hot' (°C); the rest are 'Mild'
+
+    Returns:
+        pd.DataFrame with location_name, date_value, temp_category, hours_count
+    """
+    # bucket in a subquery so GROUP BY does not repeat the parameterized CASE
+    sql = f"""SELECT location_name, date_value, temp_category, COUNT(*) AS hours_count
+FROM (
+    SELECT l.location_name, d.date_value,
+        CASE
+            WHEN f.temperature_2m < :cold_below THEN 'Cold'
+            WHEN f.temperature_2m <= :hot_above THEN 'Mild'
+            ELSE 'Hot'
+        END AS temp_category
+    {_FROM}
+    {{where}}
+) bucketed
+GROUP BY location_name, date_value, temp_category
+ORDER BY location_name, date_value, hours_count DESC"""
+    return _run(
+        "temp_buckets", sql, {"cold_below": cold_below, "hot_above": hot_above}, [],
+        locations, start_date, end_date,
+    )
+
+
+def hourly_temp_change(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+) -> "pd.DataFrame":
+    """
+    Temperature change from the previous hour per location (q9).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+
+    Returns:
+        pd.DataFrame with location_name, date_value, hour, temperature_2m, prev_hour_temp, temp_change
+    """
+    sql = f"""SELECT l.location_name, d.date_value, f.hour, f.temperature_2m,
+    f.temperature_2m - f.temp_change_1h AS prev_hour_temp,
+    ROUND(CAST(f.temp_change_1h AS NUMERIC), 1) AS temp_change
+{_FROM}
+{{where}}
+ORDER BY l.location_name, d.date_value, f.hour"""
+    return _run("hourly_temp_change", sql, {}, [], locations, start_date, end_date)
+
+
+def rolling_avg_temp(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+    window_hours: int = 3,
+) -> "pd.DataFrame":
+    """
+    Moving average temperature over the current and previous hours (q10).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+        window_hours: Hours in the window, including the current one
+
+    Returns:
+        pd.DataFrame with location_name, date_value, hour, temperature_2m, moving_avg
+
+    Raises:
+        ValueError: If window_hours is less than 1
+    """
+    window_hours = int(window_hours)
+    if window_hours < 1:
+        raise ValueError(f"window_hours must be at least 1, got {window_hours}")
+    if window_hours == PRECOMPUTED_ROLLING_HOURS:
+        moving_avg = "f.temp_rolling_3h"
+    else:
+        # other windows fall back to a window function; frame offsets must be constants,
+        # so the validated int is formatted in
+        moving_avg = f"""AVG(f.temperature_2m) OVER (
+        PARTITION BY l.location_name
+        ORDER BY d.date_value, f.hour
+        ROWS BETWEEN {window_hours - 1} PRECEDING AND CURRENT ROW
+    )"""
+    sql = f"""SELECT l.location_name, d.date_value, f.hour, f.temperature_2m,
+    ROUND(CAST({moving_avg} AS NUMERIC), 1) AS moving_avg
+{_FROM}
+{{where}}
+ORDER BY l.location_name, d.date_value, f.hour"""
+    return _run(f"rolling_avg_temp_{window_hours}h", sql, {}, [], locations, start_date, end_date)
+
+
+def hottest_hour_rank(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+    top: Optional[int] = None,
+) -> "pd.DataFrame":
+    """
+    Hours ranked from hottest (1) per location and day (q11).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+        top: Keep only ranks up to this value (None: every hour)
+
+    Returns:
+        pd.DataFrame with location_name, date_value, hour, temperature_2m, heat_rank
+    """
+    sql = f"""SELECT l.location_name, d.date_value, f.hour, f.temperature_2m, f.temp_rank_daily AS heat_rank
+{_FROM}
+{{where}}
+ORDER BY l.location_name, d.date_value, heat_rank"""
+    if top is None:
+        return _run("hottest_hour_rank", sql, {}, [], locations, start_date, end_date)
+    return _run(
+        "hottest_hour_rank", sql, {"top": top}, ["f.temp_rank_daily <= :top"], locations, start_date, end_date
+    )
+
+
+def cumulative_rainfall(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+) -> "pd.DataFrame":
+    """
+    Running total of precipitation through each day per location (q12).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+
+    Returns:
+        pd.DataFrame with location_name, date_value, hour, precipitation, cumulative_precip
+    """
+    sql = f"""SELECT l.location_name, d.date_value, f.hour, f.precipitation, f.precip_cumulative_daily AS cumulative_precip
+{_FROM}
+{{where}}
+ORDER BY l.location_name, d.date_value, f.hour"""
+    return _run("cumulative_rainfall", sql, {}, [], locations, start_date, end_date)
+
+
+def extreme_weather(
+    locations: Optional[Iterable[str]] = None,
+    start_date: Optional[DateLike] = None,
+    end_date: Optional[DateLike] = None,
+    min_variance: float = 10.0,
+) -> "pd.DataFrame":
+    """
+    Location-days whose temperature swing exceeds a threshold, largest first (q13).
+
+    Args:
+        locations: Location names to include (None: all)
+        start_date: First date to include (None: unbounded)
+        end_date: Last date to include (None: unbounded)
+        min_variance: Daily max - min temperature cutoff in °C
+
+    Returns:
+        pd.DataFrame with location_name, date_value, max_temp, min_temp, temp_variance
+    """
+    sql = f"""WITH daily_stats AS (
+    SELECT l.location_name, d.date_value, MAX(f.temperature_2m) AS max_temp, MIN(f.temperature_2m) AS min_temp
+    {_FROM}
+    {{where}}
+    GROUP BY l.location_name, d.date_value
+)
+SELECT location_name, date_value, max_temp, min_temp, max_temp - min_temp AS temp_variance
+FROM daily_stats
+WHERE max_temp - min_temp > :min_variance
+ORDER BY temp_variance DESC"""
+    return _run("extreme_weather", sql, {"min_variance": min_variance}, [], locations, start_date, end_date)
+
+
+QUERIES = {
+    "sample_data": sample_data,
+    "freezing_hours": freezing_hours,
+    "high_winds": high_winds,
+    "weekend_weather": weekend_weather,
+    "avg_temp_by_city": avg_temp_by_city,
+    "min_max_temp": min_max_temp,
+    "rainy_cities": rainy_cities,
+    "temp_buckets": temp_buckets,
+    "hourly_temp_change": hourly_temp_change,
+    "rolling_avg_temp": rolling_avg_temp,
+    "hottest_hour_rank": hottest_hour_rank,
+    "cumulative_rainfall": cumulative_rainfall,
+    "extreme_weather": extreme_weather,
+}
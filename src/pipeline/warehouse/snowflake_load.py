@@ -0,0 +1,203 @@
+"""
+Snowflake ELT load script generator.
+
+Builds the staging -> star schema load for any set of run dates, so a
+multi-day backfill costs one warehouse resume instead of one per day:
+- One COPY INTO per requested run_date, each reading only that run_date=
+  prefix of the gold stage (no listing of the whole stage)
+- Dimension MERGEs for dim_location and dim_date
+- A fact MERGE whose target scan is bounded to the staged date_id range
+
+dim_date.date_id is an AUTOINCREMENT, so ids follow the order in which dates
+were first loaded, not the calendar. The date_id bound prunes well while
+dates arrive in calendar order (the daily DAG and forward backfills). A
+backfill of dates older than ones already loaded gets new, high ids, and a
+batch that mixes those with recent dates spans most of the id range and
+prunes little. Load such history in its own batch.
+
+The MERGE statements only use SQL shared by Snowflake and DuckDB (plus a
+dialect-specific session variable), so they can be tested locally.
+
+Usage:
+    python -m src.pipeline.warehouse.snowflake_load --start-date 2026-01-01 --end-date 2026-01-31 > backfill.sql
+
+    from src.pipeline.dates import date_range
+    from src.pipeline.warehouse.snowflake_load import build_load_sql
+    sql = build_load_sql(date_range("2026-01-01", "2026-01-31"))
+"""
+
+import argparse
+import logging
+
+from src.pipeline.dates import date_range
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STAGE = "@my_s3_gold_stage"
+
+# How each dialect assigns and reads a session variable
+_VARIABLE_SYNTAX = {
+    "snowflake": {"set": "SET {name} = ({query});", "get": "${name}"},
+    "duckdb": {"set": "SET VARIABLE {name} = ({query});", "get": "getvariable('{name}')"},
+}
+
+_STAGED_DATE_IDS = """SELECT {agg}(d.date_id)
+    FROM raw_weather_staging r
+    JOIN dim_date d ON d.date_value = CAST(r.time AS DATE)"""
+
+# Loads one run_date= prefix of the gold stage; partition columns come from the file path
+_COPY_SQL = """COPY INTO raw_weather_staging (
+    time, temp_celsius, humidity_percent, wind_speed_kmh, precipitation_mm,
+    temp_fahrenheit, is_freezing, latitude, longitude, location, run_date
+)
+FROM (
+    SELECT
+        $1:time::TIMESTAMP, $1:temp_celsius::FLOAT, $1:humidity_percent::INT,
+        $1:wind_speed_kmh::FLOAT, $1:precipitation_mm::FLOAT, $1:temp_fahrenheit::FLOAT,
+        $1:is_freezing::BOOLEAN, $1:latitude::FLOAT, $1:longitude::FLOAT,
+        SPLIT_PART(REGEXP_SUBSTR(METADATA$FILENAME, 'location=[^/]+'), '=', 2)::VARCHAR AS location,
+        SPLIT_PART(REGEXP_SUBSTR(METADATA$FILENAME, 'run_date=[^/]+'), '=', 2)::DATE AS run_date
+    FROM {stage}/run_date={run_date}/
+)
+PATTERN = '.*[.]parquet';"""
+
+
+def build_copy_statements(run_dates: list[str], stage: str = DEFAULT_STAGE) -> list[str]:
+    """
+    Build one COPY INTO per run date, each scoped to its run_date= prefix of the gold stage.
+
+    Args:
+        run_dates: Run dates in YYYY-MM-DD format (Airflow templates like '{{ ds }}' pass through)
+        stage: Snowflake external stage pointing at the gold root
+
+    Returns:
+        COPY INTO statements loading raw_weather_staging, one per distinct run date
+
+    Raises:
+        ValueError: If no run dates are given
+    """
+    if not run_dates:
+        raise ValueError("At least one run_date is required")
+
+    return [_COPY_SQL.format(stage=stage, run_date=run_date) for run_date in dict.fromkeys(run_dates)]
+
+
+
+def build_merge_statements(dialect: str = "snowflake") -> list[str]:
+    """
+    Build the dimension and fact MERGEs from raw_weather_staging.
+
+    Args:
+        dialect: 'snowflake' or 'duckdb' (only the session variable syntax differs)
+
+    Returns:
+        Ordered list of SQL statements
+
+    Raises:
+        ValueError: If the dialect is unknown
+    """
+    if dialect not in _VARIABLE_SYNTAX:
+        raise ValueError(f"Unknown dialect '{dialect}'. Expected one of: {', '.join(_VARIABLE_SYNTAX)}")
+    syntax = _VARIABLE_SYNTAX[dialect]
+
+    location_merge = """MERGE INTO dim_location AS target
+USING (SELECT DISTINCT location, latitude, longitude FROM raw_weather_staging) AS source
+ON target.location_name = source.location
+WHEN NOT MATCHED THEN
+    INSERT (location_name, latitude, longitude)
+    VALUES (source.location, source.latitude, source.longitude);"""
+
+    date_merge = """MERGE INTO dim_date AS target
+USING (
+    SELECT DISTINCT
+        CAST(time AS DATE) AS date_value, YEAR(time) AS year, MONTH(time) AS month,
+        DAY(time) AS day, DAYOFWEEK(time) AS day_of_week,
+        CASE WHEN DAYOFWEEK(time) IN (0, 6) THEN TRUE ELSE FALSE END AS is_weekend
+    FROM raw_weather_staging
+) AS source
+ON target.date_value = source.date_value
+WHEN NOT MATCHED THEN
+    INSERT (date_value, year, month, day, day_of_week, is_weekend)
+    VALUES (source.date_value, source.year, source.month, source.day, source.day_of_week, source.is_weekend);"""
+
+    # bound the target scan to the staged dates so MERGE cost tracks the batch, not the table
+    set_bounds = [
+        syntax["set"].format(name="min_date_id", query=_STAGED_DATE_IDS.format(agg="MIN")),
+        syntax["set"].format(name="max_date_id", query=_STAGED_DATE_IDS.format(agg="MAX")),
+    ]
+    min_ref = syntax["get"].format(name="min_date_id")
+    max_ref = syntax["get"].format(name="max_date_id")
+
+    fact_merge = f"""MERGE INTO fact_weather_hourly AS target
+USING (
+    SELECT
+        d.date_id, l.location_id, HOUR(r.time) AS hour, r.temp_celsius,
+        r.humidity_percent, r.precipitation_mm, r.wind_speed_kmh
+    FROM raw_weather_staging r
+    JOIN dim_date d ON d.date_value = CAST(r.time AS DATE)
+    JOIN dim_location l ON l.location_name = r.location
+) AS source
+ON target.date_id BETWEEN {min_ref} AND {max_ref}
+   AND target.date_id = source.date_id
+   AND target.location_id = source.location_id
+   AND target.hour = source.hour
+WHEN MATCHED THEN
+    UPDATE SET
+        temp_celsius = source.temp_celsius, humidity_percent = source.humidity_percent,
+        precipitation_mm = source.precipitation_mm, wind_speed_kmh = source.wind_speed_kmh,
+        extraction_time = CURRENT_TIMESTAMP
+WHEN NOT MATCHED THEN
+    INSERT (date_id, location_id, hour, temp_celsius, humidity_percent, precipitation_mm, wind_speed_kmh)
+    VALUES (source.date_id, source.location_id, source.hour, source.temp_celsius, source.humidity_percent, source.precipitation_mm, source.wind_speed_kmh);"""
+
+    return [location_merge, date_merge, *set_bounds, fact_merge]
+
+
+def build_load_sql(run_dates: list[str], stage: str = DEFAULT_STAGE) -> str:
+    """
+    Build the full Snowflake load script for a batch of run dates.
+
+    Args:
+        run_dates: Run dates in YYYY-MM-DD format (or Airflow templates)
+        stage: Snowflake external stage pointing at the gold root
+
+    Returns:
+        Multi-statement SQL script for SnowflakeOperator
+    """
+    statements = [
+        "USE DATABASE warehouse;",
+        "USE SCHEMA public;",
+        "TRUNCATE TABLE raw_weather_staging;",
+        *build_copy_statements(run_dates, stage),
+        *build_merge_statements("snowflake"),
+    ]
+    logger.debug(f"Built Snowflake load script for {len(run_dates)} run dates")
+    return "\n\n".join(statements) + "\n"
+
+
+def main():
+    """
+    CLI entry point. Prints the load script for a run_date range to stdout.
+    """
+    parser = argparse.ArgumentParser(description="Generate the Snowflake load script for a range of run dates")
+    parser.add_argument(
+        "--start-date",
+        required=True,
+        help="First run_date in YYYY-MM-DD format"
+    )
+    parser.add_argument(
+        "--end-date",
+        help="Last run_date in YYYY-MM-DD format (default: --start-date)"
+    )
+    parser.add_argument(
+        "--stage",
+        default=DEFAULT_STAGE,
+        help=f"External stage pointing at the gold root (default: {DEFAULT_STAGE})"
+    )
+
+    args = parser.parse_args()
+    print(build_load_sql(date_range(args.start_date, args.end_date or args.start_date), args.stage), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,16 @@
 # streamlit/app.py
 
+import sys
+from pathlib import Path
+
 import streamlit as st
 import pandas as pd
 
+# `streamlit run streamlit/app.py` only puts this directory on the path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.pipeline.warehouse.downsample import MIN_BAR_PX, bucket_bars, lttb_frame, sample_points  # noqa: E402
+from src.pipeline.warehouse.kpi_cube import KpiCube  # noqa: E402
+
 # 1. Page Configuration
 st.set_page_config(
     page_title="Weather Analytics Dashboard",
@@ -14,7 +22,6 @@ st.title("⛅ Weather Analytics Dashboard")
 st.markdown("Stakeholder consumption layer powered by Snowflake & governed dbt metrics.")
 
 # 2. Connection & Caching
-@st.cache_data(ttl=600)
 def load_data():
     conn = st.connection("snowflake", type="snowflake")
     query = """
@@ -31,10 +38,30 @@ def load_data():
     df['summary_date'] = pd.to_datetime(df['summary_date']).dt.date
     return df
 
+# Aggregates are built once per load and shared across reruns, so filter changes
+# are answered from the cube instead of re-filtering the DataFrame
+@st.cache_resource(ttl=600)
+def load_cube():
+    return KpiCube(load_data())
+
+# Charts are downsampled on the server to about one point per pixel, so the
+# payload depends on the page width, not on how much history is selected.
+# Entries are keyed on the cube's build_id (_cube itself is not hashed), so a
+# rebuilt cube never serves charts computed from the previous load.
+@st.cache_data(ttl=600, max_entries=256)
+def chart_data(_cube, build_id, location, start_date, end_date, page_width):
+    half_width = page_width // 2
+    temp_trend = lttb_frame(_cube.temperature_series(location, start_date, end_date), half_width)
+    precip_trend, bucket = bucket_bars(
+        _cube.precipitation_series(location, start_date, end_date), half_width // MIN_BAR_PX
+    )
+    scatter = sample_points(_cube.rows(location, start_date, end_date), page_width)
+    return temp_trend, precip_trend, bucket, scatter
+
 # Fetch data
 with st.spinner("Connecting to Snowflake warehouse..."):
     try:
-        weather_df = load_data()
+        cube = load_cube()
     except Exception as e:
         st.error(f"Failed to load data: {e}")
         st.stop()
@@ -43,12 +70,12 @@ with st.spinner("Connecting to Snowflake warehouse..."):
 st.sidebar.header("Dashboard Filters")
 
 # Location Filter
-locations = weather_df['location_name'].unique().tolist()
+locations = cube.locations
 selected_location = st.sidebar.selectbox("Select Location", options=["All Locations"] + locations)
 
 # Date Filter
-min_date = weather_df['summary_date'].min()
-max_date = weather_df['summary_date'].max()
+min_date = cube.dates[0].item()
+max_date = cube.dates[-1].item()
 
 # Handle edge case where there is only one day of data
 if min_date == max_date:
@@ -68,24 +95,28 @@ else:
     else:
         start_date = end_date = date_selection
 
-# Apply Filters 
-filtered_df = weather_df[
-    (weather_df['summary_date'] >= start_date) &
-    (weather_df['summary_date'] <= end_date)
-]
+# Chart Width Filter
+page_width = st.sidebar.select_slider(
+    "Chart Width (px)",
+    options=[640, 960, 1280, 1600, 1920, 2560],
+    value=1280,
+    help="Width of the page; charts send about one point per pixel"
+)
 
-if selected_location != "All Locations":
-    filtered_df = filtered_df[filtered_df['location_name'] == selected_location]
+# Apply Filters 
+location_filter = None if selected_location == "All Locations" else selected_location
+temp_trend, precip_trend, bucket, filtered_df = chart_data(cube, cube.build_id, location_filter, start_date, end_date, page_width)
 
 # 4. KPI Cards
 st.subheader("Key Performance Indicators")
 kpi1, kpi2, kpi3, kpi4 = st.columns(4)
 
-if not filtered_df.empty:
-    avg_temp = filtered_df['avg_temp_c'].mean()
-    total_precip = filtered_df['total_precipitation_mm'].sum()
-    max_wind = filtered_df['max_wind_speed_kmh'].max()
-    avg_humidity = filtered_df['avg_humidity'].mean()
+kpis = cube.kpis(location_filter, start_date, end_date)
+if kpis is not None:
+    avg_temp = kpis['avg_temp_c']
+    total_precip = kpis['total_precipitation_mm']
+    max_wind = kpis['max_wind_speed_kmh']
+    avg_humidity = kpis['avg_humidity']
 else:
     avg_temp = total_precip = max_wind = avg_humidity = 0.0
 
@@ -101,13 +132,11 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("Temperature Trends")
-    # Group by date to average metrics if 'All Locations' is selected
-    temp_trend = filtered_df.groupby('summary_date')[['min_temp_c', 'avg_temp_c', 'max_temp_c']].mean()
+    # Averaged by date across locations if 'All Locations' is selected
     st.line_chart(temp_trend)
 
 with col2:
-    st.subheader("Daily Precipitation")
-    precip_trend = filtered_df.groupby('summary_date')['total_precipitation_mm'].sum()
+    st.subheader(f"{bucket} Precipitation")
     st.bar_chart(precip_trend)
 
 st.subheader("Wind Speed vs. Humidity")
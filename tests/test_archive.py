@@ -0,0 +1,110 @@
+import os
+from datetime import date
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.pipeline.config import Project_Config
+from src.pipeline.gaps import find_gaps
+from src.pipeline.io.archive import archive_path, read_index, run_archive
+from src.pipeline.io.catalog import bronze_file, file_checksum, record_partition
+from src.pipeline.io.local import read_arrow_local, read_json_local, save_arrow_local, save_json_local
+
+
+@pytest.fixture
+def lake(tmp_path, monkeypatch):
+    """Point bronze/silver at a temporary directory with no partition catalog."""
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_BRONZE", str(tmp_path / "bronze"))
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_SILVER", str(tmp_path / "silver"))
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", None)
+    return tmp_path
+
+
+def _payload(run_date, temp=1.5):
+    return {"hourly": {"time": [f"{run_date}T{hour:02d}:00" for hour in range(24)], "temperature_2m": [temp] * 24}}
+
+
+def _bronze(run_date, location):
+    return Project_Config.Paths.bronze_path("openmeteo", run_date, location)
+
+
+def test_archive_round_trips_and_reads_transparently(lake):
+    """Test that closed months are packed, loose files removed, and archived payloads read back unchanged."""
+    checksums = {}
+    for run_date in ["2026-01-30", "2026-01-31", "2026-02-01"]:
+        path = save_json_local(_payload(run_date), f"{_bronze(run_date, 'Boston')}/raw.json")
+        checksums[run_date] = file_checksum(path)
+    table = pa.table({"time": pa.array([0, 3600], pa.int64()), "temperature_2m": [1.0, 2.0]})
+    save_arrow_local(table, f"{_bronze('2026-01-31', 'Miami')}/raw.arrow")
+
+    summaries = run_archive(before=date(2026, 2, 15))
+    source_dir = os.path.dirname(_bronze("2026-01-31", None))
+    assert [(s["month"], s["added"], s["members"]) for s in summaries] == [("2026-01", 3, 3)]
+    assert not os.path.exists(f"{source_dir}/run_date=2026-01-30")
+    assert os.path.exists(f"{_bronze('2026-02-01', 'Boston')}/raw.json")
+
+    # the open month is left alone and the archive is smaller than what it packs
+    index = read_index(archive_path(source_dir, "2026-01"))
+    assert os.path.getsize(archive_path(source_dir, "2026-01")) < sum(m["raw_bytes"] for m in index["members"])
+    assert {m["run_date"]: m["sha256"] for m in index["members"] if m["location"] == "Boston"} == {
+        run_date: checksums[run_date] for run_date in ["2026-01-30", "2026-01-31"]
+    }
+
+    assert bronze_file(_bronze("2026-01-30", "Boston")).endswith("raw.json")
+    assert read_json_local(bronze_file(_bronze("2026-01-30", "Boston"))) == _payload("2026-01-30")
+    assert read_arrow_local(bronze_file(_bronze("2026-01-31", "Miami"))).equals(table)
+    with pytest.raises(FileNotFoundError):
+        read_json_local(f"{_bronze('2026-01-29', 'Boston')}/raw.json")
+    with pytest.raises(FileNotFoundError):
+        read_json_local(f"{_bronze('2026-01-31', 'Miami')}/raw.json")
+
+
+def test_reingested_partition_overrides_archive_and_gaps_see_archived(lake):
+    """Test that a loose file wins over its archived copy, reruns merge it, and gap detection treats archived partitions as present."""
+    for run_date in ["2026-01-30", "2026-01-31"]:
+        save_json_local(_payload(run_date), f"{_bronze(run_date, 'Boston')}/raw.json")
+        silver_dir = Project_Config.Paths.silver_path("openmeteo", run_date, "Boston")
+        os.makedirs(silver_dir)
+        pd.DataFrame({"time": pd.to_datetime([f"{run_date}T00:00"])}).to_parquet(f"{silver_dir}/weather_data.parquet")
+    run_archive(months=["2026-01"])
+
+    assert find_gaps("2026-01-30", "2026-01-31", ["Boston"]) == []
+    assert find_gaps("2026-01-30", "2026-01-31", ["Boston"], max_age_hours=0)[0]["reasons"] == [
+        "bronze older than 0h", "silver older than 0h",
+    ]
+
+    save_json_local(_payload("2026-01-31", temp=9.0), f"{_bronze('2026-01-31', 'Boston')}/raw.json")
+    assert read_json_local(bronze_file(_bronze("2026-01-31", "Boston")))["hourly"]["temperature_2m"][0] == 9.0
+
+    summaries = run_archive(months=["2026-01"])
+    assert [(s["added"], s["members"]) for s in summaries] == [(1, 2)]
+    assert run_archive(months=["2026-01"]) == []
+    assert read_json_local(bronze_file(_bronze("2026-01-31", "Boston")))["hourly"]["temperature_2m"][0] == 9.0
+    assert read_json_local(bronze_file(_bronze("2026-01-30", "Boston"))) == _payload("2026-01-30")
+    assert not os.path.exists(f"{archive_path(os.path.dirname(_bronze('2026-01-30', None)), '2026-01')}.tmp")
+
+
+def test_archived_partitions_match_their_catalog_entries(lake, monkeypatch):
+    """Test that archiving does not make catalogued bronze partitions look changed to gap detection."""
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", str(lake / "_catalog.sqlite"))
+    for run_date in ["2026-01-30", "2026-01-31"]:
+        save_json_local(_payload(run_date), f"{_bronze(run_date, 'Boston')}/raw.json")
+        silver_dir = Project_Config.Paths.silver_path("openmeteo", run_date, "Boston")
+        os.makedirs(silver_dir)
+        pd.DataFrame({"time": pd.to_datetime([f"{run_date}T00:00"])}).to_parquet(f"{silver_dir}/weather_data.parquet")
+        record_partition("bronze", "openmeteo", run_date, "Boston")
+        record_partition("silver", "openmeteo", run_date, "Boston")
+
+    assert find_gaps("2026-01-30", "2026-01-31", ["Boston"]) == []
+    run_archive(months=["2026-01"])
+    assert find_gaps("2026-01-30", "2026-01-31", ["Boston"]) == []
+
+    # a catalog entry recorded for different bronze contents is still caught
+    save_json_local(_payload("2026-01-31", temp=9.0), f"{_bronze('2026-01-31', 'Boston')}/raw.json")
+    record_partition("bronze", "openmeteo", "2026-01-31", "Boston")
+    os.remove(f"{_bronze('2026-01-31', 'Boston')}/raw.json")
+    assert find_gaps("2026-01-30", "2026-01-31", ["Boston"]) == [{
+        "run_date": "2026-01-31", "location": "Boston", "source": "openmeteo",
+        "reasons": ["bronze checksum differs from catalog"],
+    }]
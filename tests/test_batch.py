@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+import src.pipeline.run as run_module
+from src.pipeline.batch import load_manifest, run_batch
+
+
+def test_load_manifest_csv_defaults_source(tmp_path):
+    """Test that CSV manifests are parsed and jobs without a source get the default."""
+    manifest = tmp_path / "jobs.csv"
+    manifest.write_text("run_date,location,source\n2026-01-25,Boston,\n2026-01-26, Miami ,openmeteo\n")
+
+    jobs = load_manifest(str(manifest))
+
+    assert jobs == [
+        {"run_date": "2026-01-25", "location": "Boston", "source": "openmeteo"},
+        {"run_date": "2026-01-26", "location": "Miami", "source": "openmeteo"},
+    ]
+
+
+def test_load_manifest_rejects_incomplete_jobs(tmp_path):
+    """Test that a JSON job without a location is rejected with its position."""
+    manifest = tmp_path / "jobs.json"
+    manifest.write_text(json.dumps([{"run_date": "2026-01-25"}]))
+
+    with pytest.raises(ValueError, match="job 1 is missing required fields: location"):
+        load_manifest(str(manifest))
+
+
+def test_run_batch_isolates_failures_and_shares_session(tmp_path, monkeypatch):
+    """Test that one failing job does not abort the batch and all jobs share one HTTP session."""
+    sessions = set()
+
+    def fake_execute(run_date, location, source, write_to_s3=False, session=None, s3_client=None):
+        sessions.add(id(session))
+        if run_date == "2026-01-26":
+            raise ValueError("Dataset is empty")
+
+    monkeypatch.setattr(run_module, "execute_pipeline", fake_execute)
+    jobs = [
+        {"run_date": f"2026-01-2{day}", "location": "Boston", "source": "openmeteo"}
+        for day in range(5, 9)
+    ]
+    report = tmp_path / "report.json"
+
+    summary = run_batch(jobs, workers=2, report_path=str(report))
+
+    assert (summary["succeeded"], summary["failed"]) == (3, 1)
+    assert [job["status"] for job in summary["jobs"]] == ["success", "failed", "success", "success"]
+    assert summary["jobs"][1]["error"] == "ValueError: Dataset is empty"
+    assert len(sessions) == 1
+    assert json.loads(report.read_text())["total"] == 4
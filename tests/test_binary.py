@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.fake_openmeteo import encode_message
+from src.pipeline.ingest.binary import decode_response, hourly_variables
+
+VARIABLES = ["temperature_2m", "relative_humidity_2m"]
+
+
+def test_decode_batch_response_into_arrays():
+    """Test that a multi-coordinate binary response decodes to per-location NumPy arrays."""
+    start = 1769299200  # 2026-01-25T00:00Z
+    payload = encode_message(42.36, -71.06, 0, start, {"temperature_2m": [1.5, 2.0, 2.5], "relative_humidity_2m": [60, 61, 62]})
+    payload += encode_message(25.76, -80.19, 1, start, {"temperature_2m": [20.1, 20.2, 20.3], "relative_humidity_2m": [80, 81, 82]})
+    url = "https://api.open-meteo.com/v1/forecast?latitude=42.36,25.76&hourly=temperature_2m,relative_humidity_2m&format=flatbuffers"
+
+    boston, miami = decode_response(payload, hourly_variables(url))
+
+    assert hourly_variables(url) == VARIABLES
+    assert (boston["location_id"], miami["location_id"]) == (0, 1)
+    assert boston["timezone"] == "GMT" and boston["elevation"] == 5.0
+    assert boston["hourly"]["time"].tolist() == [start, start + 3600, start + 7200]
+    assert boston["hourly"]["temperature_2m"].dtype == np.float32
+    np.testing.assert_array_equal(miami["hourly"]["relative_humidity_2m"], [80, 81, 82])
+    assert boston["hourly_variables"]["temperature_2m"] == {"variable": 47, "unit": 0, "altitude": 2}
+
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_response(payload[:-1], VARIABLES)
+
+
+def test_binary_bronze_normalizes_like_json(tmp_path, monkeypatch):
+    """Test that a FlatBuffers payload saved as raw.arrow validates and normalizes to the JSON path's silver frame."""
+    from src.pipeline.config import Project_Config
+    from src.pipeline.ingest.fetch import _save_to_bronze
+    from src.pipeline.ingest.normalize import _normalize_data, run_normalize
+    from src.pipeline.ingest.validate import validate_bronze_file
+    from src.pipeline.io.catalog import describe_partition
+
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_BRONZE", str(tmp_path / "bronze"))
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_SILVER", str(tmp_path / "silver"))
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", None)
+    temps, humidity = [-3.9, 0.0, 2.1, 5.5], [65, 70, 71, 90]
+    columns = {"temperature_2m": temps, "relative_humidity_2m": humidity}
+    payload = encode_message(42.36, -71.06, 0, 1769299200, columns, utc_offset_seconds=-18000)
+    # a JSON run of the same partition leaves raw.json behind
+    json_file = _save_to_bronze({"hourly": {}}, "2026-01-25", "Boston", "openmeteo")
+
+    (data,) = decode_response(payload, VARIABLES)
+    bronze_path = _save_to_bronze(data, "2026-01-25", "Boston", "openmeteo")
+
+    assert bronze_path.endswith("raw.arrow")
+    assert not os.path.exists(json_file)
+    assert validate_bronze_file(bronze_path)
+    stats = describe_partition("bronze", os.path.dirname(bronze_path))
+    assert (stats["row_count"], stats["min_time"], stats["max_time"]) == (4, "2026-01-24T19:00", "2026-01-24T22:00")
+
+    run_normalize("2026-01-25", "Boston", chunk_rows=3)
+    silver = pd.read_parquet(f"{Project_Config.Paths.silver_path('openmeteo', '2026-01-25', 'Boston')}/weather_data.parquet")
+    expected = _normalize_data({
+        "latitude": 42.36, "longitude": -71.06,
+        "hourly": {
+            "time": ["2026-01-24T19:00", "2026-01-24T20:00", "2026-01-24T21:00", "2026-01-24T22:00"],
+            "temperature_2m": temps, "relative_humidity_2m": humidity,
+        },
+    })
+    pd.testing.assert_frame_equal(silver, expected)
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from src.pipeline.config import Project_Config
+from src.pipeline.io.archive import run_archive
+from src.pipeline.io.catalog import (
+    PartitionCatalog,
+    bronze_stats,
+    describe_partition,
+    get_catalog,
+    partition_files,
+    record_partition,
+)
+from src.pipeline.io.local import save_json_local
+from src.pipeline.transform.compact import run_compaction
+
+
+@pytest.fixture
+def lake(tmp_path, monkeypatch):
+    """Point every layer and the partition catalog at a temporary directory."""
+    for attr, name in [("LOCAL_BRONZE", "bronze"), ("LOCAL_SILVER", "silver"), ("LOCAL_GOLD", "gold")]:
+        monkeypatch.setattr(Project_Config.Paths, attr, str(tmp_path / name))
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", str(tmp_path / "_catalog.sqlite"))
+    return tmp_path
+
+
+def test_record_partition_is_noop_without_catalog(monkeypatch):
+    """Test that writers skip the catalog entirely when PARTITION_CATALOG_PATH is unset."""
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", None)
+
+    assert get_catalog() is None
+    assert record_partition("bronze", "openmeteo", "2026-01-25", "Boston") is None
+
+
+def test_record_bronze_and_silver_partitions(lake):
+    """Test that row count, time range, size and checksum are captured for JSON and Parquet partitions."""
+    bronze_dir = Project_Config.Paths.bronze_path("openmeteo", "2026-01-25", "Boston")
+    os.makedirs(bronze_dir)
+    with open(f"{bronze_dir}/raw.json", "w") as f:
+        json.dump({"hourly": {"time": ["2026-01-25T01:00", "2026-01-25T00:00"]}}, f)
+
+    silver_dir = Project_Config.Paths.silver_path("openmeteo", "2026-01-25", "Boston")
+    os.makedirs(silver_dir)
+    times = pd.date_range("2026-01-25T00:00", periods=24, freq="h")
+    pd.DataFrame({"time": times, "temp_celsius": 1.0}).to_parquet(f"{silver_dir}/weather_data.parquet", index=False)
+
+    bronze = record_partition("bronze", "openmeteo", "2026-01-25", "Boston")
+    silver = record_partition("silver", "openmeteo", "2026-01-25", "Boston")
+
+    assert bronze["row_count"] == 2
+    assert (bronze["min_time"], bronze["max_time"]) == ("2026-01-25T00:00", "2026-01-25T01:00")
+    assert silver["row_count"] == 24 and silver["file_count"] == 1
+    assert silver["min_time"].startswith("2026-01-25 00:00") and silver["max_time"].startswith("2026-01-25 23:00")
+    assert silver["byte_size"] == os.path.getsize(f"{silver_dir}/weather_data.parquet")
+    assert get_catalog().get("silver", "openmeteo", "2026-01-25", "Boston")["checksum"] == silver["checksum"]
+    # the schema is set up once per path: the same instance is handed out until the file disappears
+    assert get_catalog() is get_catalog()
+
+
+def test_writer_stats_need_no_read_back_and_cover_archived_bronze(lake):
+    """Test that writer stats match a read-back, and that archiving re-points the catalog entry with unchanged stats."""
+    bronze_dir = Project_Config.Paths.bronze_path("openmeteo", "2026-01-25", "Boston")
+    payload = {"hourly": {"time": ["2026-01-25T01:00", "2026-01-25T00:00"], "temperature_2m": [1.0, 2.0]}}
+    digest = hashlib.sha256()
+    raw_path = save_json_local(payload, f"{bronze_dir}/raw.json", digest)
+
+    stats = bronze_stats(raw_path, payload, digest.hexdigest())
+    assert stats == describe_partition("bronze", bronze_dir)
+
+    record_partition("bronze", "openmeteo", "2026-01-25", "Boston", stats)
+
+    run_archive(months=["2026-01"])
+    assert not os.path.exists(raw_path)
+    assert partition_files("bronze", bronze_dir) == [raw_path]
+    # the catalog entry follows the data into the archive, with unchanged statistics
+    archived = describe_partition("bronze", bronze_dir)
+    assert archived["path"].endswith(os.path.join("_archive", "2026-01.pack"))
+    assert {**archived, "path": stats["path"]} == stats
+    entry = get_catalog().get("bronze", "openmeteo", "2026-01-25", "Boston")
+    assert (entry["path"], entry["checksum"]) == (archived["path"], stats["checksum"])
+
+
+def test_list_partitions_prunes_by_date_and_location(lake):
+    """Test that readers can prune partitions with one query."""
+    catalog = PartitionCatalog(Project_Config.Paths.PARTITION_CATALOG)
+    stats = {"path": "p", "file_count": 1, "row_count": 24, "byte_size": 10, "min_time": None, "max_time": None, "checksum": "x"}
+    for run_date in ["2026-01-24", "2026-01-25", "2026-01-26"]:
+        for location in ["Boston", "Miami"]:
+            catalog.record("gold", "openmeteo", run_date, location, stats)
+
+    pruned = catalog.list_partitions("gold", "openmeteo", "2026-01-25", "2026-01-26", location="Miami")
+
+    assert [(e["run_date"], e["location"]) for e in pruned] == [("2026-01-25", "Miami"), ("2026-01-26", "Miami")]
+    assert catalog.list_partitions("silver", "openmeteo") == []
+
+
+def test_compaction_updates_catalog_entry(lake):
+    """Test that compaction plans from the catalog and records the rewritten partition."""
+    partition_dir = Project_Config.Paths.gold_path("openmeteo", "2026-01-25", "Boston")
+    os.makedirs(partition_dir)
+    times = pd.date_range("2026-01-25T00:00", periods=24, freq="h")
+    for i in range(3):
+        pd.DataFrame({"time": times[i::3], "temp_celsius": 1.0}).to_parquet(f"{partition_dir}/part-{i}.parquet", index=False)
+    before = record_partition("gold", "openmeteo", "2026-01-25", "Boston")
+
+    assert run_compaction("2026-01-25", "2026-01-25")["compacted"] == 1
+
+    after = get_catalog().get("gold", "openmeteo", "2026-01-25", "Boston")
+    assert before["file_count"] == 3 and after["file_count"] == 1
+    assert after["row_count"] == 24
+    assert after["checksum"] != before["checksum"]
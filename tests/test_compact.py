@@ -0,0 +1,78 @@
+import json
+import os
+
+import pandas as pd
+import pyarrow.dataset as ds
+import pytest
+
+from src.pipeline.config import Project_Config
+from src.pipeline.io.catalog import partition_files
+from src.pipeline.transform.compact import MANIFEST_NAME, compact_partition, run_compaction
+
+RUN_DATE = "2026-01-25"
+
+
+@pytest.fixture
+def gold_partition(tmp_path, monkeypatch):
+    """Seed one gold partition with six small, unsorted part files like Spark leaves behind."""
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_GOLD", str(tmp_path / "gold"))
+    partition_dir = Project_Config.Paths.gold_path("openmeteo", RUN_DATE, "Boston")
+    os.makedirs(partition_dir)
+
+    times = pd.date_range(f"{RUN_DATE}T00:00", periods=24, freq="h")
+    for i in range(6):
+        # interleave hours across files so the merged output has to be re-sorted
+        part = pd.DataFrame({"time": times[i::6], "temp_celsius": [float(i)] * 4})
+        part.to_parquet(f"{partition_dir}/part-{i:05d}-spark.parquet", index=False)
+    return partition_dir
+
+
+def test_compaction_merges_sorts_and_writes_manifest(gold_partition):
+    """Test that small files are merged into one time-sorted file with a matching manifest."""
+    summary = run_compaction(RUN_DATE, RUN_DATE)
+
+    assert summary == {"partitions": 1, "compacted": 1, "skipped": 0}
+    with open(f"{gold_partition}/{MANIFEST_NAME}") as f:
+        manifest = json.load(f)
+    live = partition_files("gold", gold_partition)
+    assert [os.path.basename(path) for path in live] == [manifest["files"][0]["name"]]
+
+    df = pd.read_parquet(live[0])
+    assert len(df) == 24
+    assert df["time"].is_monotonic_increasing
+
+    assert manifest["row_count"] == 24
+    assert manifest["source_files"] == 6
+    assert len(manifest["superseded"]) == 6
+    assert manifest["files"][0]["min_time"].startswith(RUN_DATE)
+
+
+def test_compaction_is_idempotent_and_invisible_to_readers(gold_partition):
+    """Test that the manifest commit keeps old files readable until GC, and readers see each row exactly once."""
+    old_files = partition_files("gold", gold_partition)
+    run_compaction(RUN_DATE, RUN_DATE)
+    assert run_compaction(RUN_DATE, RUN_DATE)["skipped"] == 1
+
+    # a reader that listed the old files before the commit can still open them
+    assert all(os.path.exists(path) for path in old_files)
+    assert ds.dataset(partition_files("gold", gold_partition), format="parquet").to_table().num_rows == 24
+
+    # an interrupted run's output is invisible, then removed along with the superseded files
+    pd.DataFrame({"time": pd.to_datetime([RUN_DATE])}).to_parquet(f"{gold_partition}/compacted-orphan-00000.parquet")
+    assert len(partition_files("gold", gold_partition)) == 1
+    assert compact_partition(gold_partition, gc_grace_seconds=0) is None
+    assert sorted(os.listdir(gold_partition)) == sorted(
+        [MANIFEST_NAME] + [os.path.basename(path) for path in partition_files("gold", gold_partition)]
+    )
+    table = ds.dataset(Project_Config.Paths.LOCAL_GOLD, format="parquet", partitioning="hive").to_table()
+    assert table.num_rows == 24
+
+
+def test_compaction_splits_to_target_size(gold_partition):
+    """Test that a tiny target size produces several time-ordered files."""
+    run_compaction(RUN_DATE, RUN_DATE, target_file_bytes=1)
+
+    with open(f"{gold_partition}/{MANIFEST_NAME}") as f:
+        files = json.load(f)["files"]
+    assert len(files) > 1
+    assert files[0]["max_time"] <= files[1]["min_time"]
@@ -29,3 +29,31 @@ def test_location_lookup_exists():
     """
     assert "Boston" in Project_Config.LOCATION_LOOKUP
     assert Project_Config.LOCATION_LOOKUP["Boston"]["latitude"] == 42.3601
+
+def test_open_meteo_batch_url_joins_coordinates(monkeypatch):
+    """
+    Verifies that a batch URL carries every location's coordinates as comma-separated lists.
+    """
+    monkeypatch.setattr(Project_Config.API, "OPEN_METEO_URL_TEMPLATE", "https://api/forecast?latitude={lat}&longitude={lon}")
+    monkeypatch.setattr(Project_Config, "LOCATION_LOOKUP", {
+        "Boston": {"latitude": 42.3601, "longitude": -71.0589},
+        "Miami": {"latitude": 25.7617, "longitude": -80.1918},
+    })
+
+    url = Project_Config.API.get_open_meteo_batch_url(["Boston", "Miami"])
+
+    assert url == "https://api/forecast?latitude=42.3601,25.7617&longitude=-71.0589,-80.1918"
+
+def test_get_location_falls_back_to_catalog(monkeypatch, tmp_path):
+    """
+    Verifies that names outside LOCATION_LOOKUP are read from LOCATION_CATALOG_PATH
+    and that coordinate-only input resolves to a catalog name.
+    """
+    catalog_file = tmp_path / "locations.csv"
+    catalog_file.write_text("name,latitude,longitude\nMiami,25.7617,-80.1918\n")
+    monkeypatch.setattr(Project_Config, "LOCATION_CATALOG_PATH", str(catalog_file))
+    monkeypatch.setattr(Project_Config, "_catalog", None)
+
+    assert Project_Config.get_location("Miami") == {"latitude": 25.7617, "longitude": -80.1918}
+    assert Project_Config.get_location("Boston")["latitude"] == 42.3601
+    assert Project_Config.resolve_location(25.76, -80.19) == "Miami"
@@ -0,0 +1,60 @@
+import os
+
+import pandas as pd
+import pyarrow.dataset as ds
+import pytest
+
+from src.pipeline.config import Project_Config
+from src.pipeline.io.dataset import iter_silver_batches, read_silver, silver_files
+
+
+@pytest.fixture
+def silver_tree(tmp_path, monkeypatch):
+    """Seed silver with three days x two locations of hourly rows."""
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_SILVER", str(tmp_path / "silver"))
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", None)
+    for day, run_date in enumerate(["2026-01-24", "2026-01-25", "2026-01-26"]):
+        for offset, location in enumerate(["Boston", "Miami"]):
+            silver_dir = Project_Config.Paths.silver_path("openmeteo", run_date, location)
+            os.makedirs(silver_dir)
+            pd.DataFrame({
+                "time": pd.date_range(f"{run_date}T00:00", periods=24, freq="h"),
+                "temp_celsius": [float(day * 10 + offset)] * 24,
+                "humidity_percent": [50] * 24,
+            }).to_parquet(f"{silver_dir}/weather_data.parquet", index=False)
+
+
+def test_silver_files_prunes_by_date_and_location(silver_tree):
+    """Test that only partitions inside the window and location list are listed."""
+    files = silver_files("2026-01-25", "2026-01-26", locations=["Miami"])
+
+    assert len(files) == 2
+    assert all("location=Miami" in f and "run_date=2026-01-24" not in f for f in files)
+
+
+def test_read_silver_projects_filters_and_adds_partition_keys(silver_tree):
+    """Test column projection, pushed-down row filters and string partition columns."""
+    table = read_silver(
+        "2026-01-24", "2026-01-26",
+        columns=["time", "temp_celsius", "run_date", "location"],
+        filter=ds.field("temp_celsius") >= 10,
+    )
+
+    assert table.column_names == ["time", "temp_celsius", "run_date", "location"]
+    assert table.num_rows == 4 * 24
+    assert set(table["run_date"].to_pylist()) == {"2026-01-25", "2026-01-26"}
+    assert set(table["location"].to_pylist()) == {"Boston", "Miami"}
+
+
+def test_iter_silver_batches_streams_bounded_batches(silver_tree):
+    """Test that the batch iterator respects batch_size and covers every row."""
+    batches = list(iter_silver_batches("2026-01-24", "2026-01-26", columns=["time"], batch_size=10))
+
+    assert max(batch.num_rows for batch in batches) <= 10
+    assert sum(batch.num_rows for batch in batches) == 6 * 24
+
+
+def test_read_silver_raises_when_window_is_empty(silver_tree):
+    """Test that an empty window is reported like a missing file."""
+    with pytest.raises(FileNotFoundError):
+        read_silver("2025-01-01", "2025-01-02")
@@ -0,0 +1,10 @@
+import pytest
+
+from src.pipeline.dates import date_range
+
+
+def test_date_range_is_inclusive():
+    """Test that date_range expands both endpoints and rejects reversed ranges."""
+    assert date_range("2026-01-30", "2026-02-01") == ["2026-01-30", "2026-01-31", "2026-02-01"]
+    with pytest.raises(ValueError):
+        date_range("2026-02-01", "2026-01-30")
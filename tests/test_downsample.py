@@ -0,0 +1,50 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.pipeline.warehouse.downsample import bucket_bars, lttb, lttb_frame, sample_points
+
+
+def _daily(values, name="value") -> pd.Series:
+    index = pd.Index([date(2020, 1, 1) + timedelta(days=i) for i in range(len(values))], name="summary_date")
+    return pd.Series(values, index=index, name=name)
+
+
+def test_lttb_keeps_endpoints_and_spikes():
+    """Test that LTTB keeps the first and last points and isolated extremes, and leaves short series alone."""
+    y = np.sin(np.arange(2000) / 100)
+    y[700], y[1500] = 25.0, -25.0
+    y[300] = np.nan
+    kept = lttb(np.arange(2000), y, 100)
+
+    assert len(kept) == 100 and kept[0] == 0 and kept[-1] == 1999
+    assert np.all(np.diff(kept) > 0)
+    assert {700, 1500} <= set(kept) and 300 not in kept
+    assert lttb(np.arange(50), np.arange(50.0), 100).tolist() == list(range(50))
+
+    frame = pd.DataFrame({"low": -y, "high": y}, index=_daily(y).index)
+    sampled = lttb_frame(frame, 100)
+    assert 100 <= len(sampled) <= 200 and sampled.index.is_monotonic_increasing
+    assert len(lttb_frame(frame.head(80), 100)) == 80
+
+
+def test_bars_bucket_by_calendar_and_scatter_sample_is_stable():
+    """Test that bar totals are kept in the finest calendar bucket that fits and the scatter sample is bounded and repeatable."""
+    precip = _daily(np.ones(3 * 365))
+    daily, label = bucket_bars(precip, 2000)
+    assert label == "Daily" and daily is precip
+
+    weekly, label = bucket_bars(precip, 200)
+    assert label == "Weekly" and len(weekly) <= 200 and weekly.sum() == precip.sum()
+    assert all(day.weekday() == 0 for day in weekly.index[1:])
+
+    monthly, label = bucket_bars(precip, 40)
+    assert label == "Monthly" and monthly.index[1] == date(2020, 2, 1) and monthly.iloc[1] == 29
+    assert bucket_bars(precip, 2)[1] == "Yearly"
+
+    rows = pd.DataFrame({"x": np.arange(10_000)})
+    sample = sample_points(rows, 500)
+    assert len(sample) == 500 and sample["x"].is_monotonic_increasing
+    assert sample.equals(sample_points(rows, 500))
+    assert sample_points(rows.head(10), 500).equals(rows.head(10))
@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+from src.pipeline.transform.features import add_hourly_features
+
+
+def _hours(start: str, temperatures: list, precipitation: list, location: str = "Boston") -> pd.DataFrame:
+    return pd.DataFrame({
+        "location": location,
+        "time": pd.date_range(start, periods=len(temperatures), freq="h"),
+        "temperature_2m": temperatures,
+        "precipitation": precipitation,
+    })
+
+
+def test_features_handle_day_edges_missing_hours_and_nulls():
+    """Test that daily features restart at midnight, hourly ones carry across it, and gaps or nulls break them."""
+    df = _hours("2026-01-24T22:00", [1.0, 3.0, 2.0, None, 6.0], [0.5, None, 1.0, 0.2, 0.3])
+    df = df.drop(index=2).iloc[::-1]  # 2026-01-25T00:00 missing, rows out of order
+    result = add_hourly_features(df, "temperature_2m", "precipitation")
+
+    assert result.index.tolist() == [4, 3, 1, 0]
+    result = result.sort_values("time")
+    assert result["temp_change_1h"].iloc[1] == 2.0
+    assert result["temp_change_1h"].drop(index=1).isna().all()
+    # the window covers the current and two previous hours that exist
+    assert result["temp_rolling_3h"].tolist() == [1.0, 2.0, pytest.approx(3.0), 6.0]
+    assert result["temp_rank_daily"].tolist()[:2] == [2, 1] and pd.isna(result["temp_rank_daily"].iloc[2])
+    assert result["temp_rank_daily"].iloc[3] == 1
+    assert result["precip_cumulative_daily"].tolist() == [0.5, 0.5, 0.2, pytest.approx(0.5)]
+
+
+def test_features_take_lead_in_from_previous_partition():
+    """Test that a partition's first hours match the continuous series when the previous partition is given."""
+    full = pd.concat([
+        _hours("2026-01-24T00:00", [float(h % 7) for h in range(30)], [0.1] * 30),
+        _hours("2026-01-24T00:00", [20.0 - h for h in range(30)], [0.0] * 30, location="Miami"),
+    ], ignore_index=True)
+    previous = full[full["time"] < "2026-01-24T20:00"]
+    current = full[full["time"] >= "2026-01-24T20:00"]
+
+    expected = add_hourly_features(full, "temperature_2m", "precipitation").loc[current.index]
+    pd.testing.assert_frame_equal(add_hourly_features(current, "temperature_2m", "precipitation", context=previous), expected)
+
+    fresh = add_hourly_features(current, "temperature_2m", "precipitation")
+    first = fresh.groupby("location").head(1)
+    assert first["temp_change_1h"].isna().all()
+    assert first["precip_cumulative_daily"].tolist() == [0.1, 0.0]
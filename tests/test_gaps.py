@@ -0,0 +1,120 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from src.pipeline.config import Project_Config
+from src.pipeline.gaps import expected_grid, find_gaps
+from src.pipeline.io.catalog import describe_partition, record_partition
+from src.pipeline.io.s3 import S3Client
+
+
+@pytest.fixture
+def lake(tmp_path, monkeypatch):
+    """Point bronze/silver at a temporary directory with no partition catalog."""
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_BRONZE", str(tmp_path / "bronze"))
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_SILVER", str(tmp_path / "silver"))
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", None)
+    return tmp_path
+
+
+def _write_partition(run_date, location):
+    bronze_dir = Project_Config.Paths.bronze_path("openmeteo", run_date, location)
+    os.makedirs(bronze_dir)
+    with open(f"{bronze_dir}/raw.json", "w") as f:
+        json.dump({"hourly": {"time": [f"{run_date}T00:00"]}}, f)
+
+    silver_dir = Project_Config.Paths.silver_path("openmeteo", run_date, location)
+    os.makedirs(silver_dir)
+    pd.DataFrame({"time": pd.to_datetime([f"{run_date}T00:00"])}).to_parquet(f"{silver_dir}/weather_data.parquet")
+
+
+class _FakeS3:
+    """Stands in for S3Client.list_objects with a fixed set of keys."""
+
+    def __init__(self, objects):
+        self.objects = objects
+
+    def list_objects(self, prefix):
+        prefix = S3Client.mirror_key(prefix)
+        return {key: obj for key, obj in self.objects.items() if key.startswith(prefix)}
+
+
+def test_expected_grid_covers_every_date_and_location():
+    """Test that the grid is the cross product of the date range and locations."""
+    grid = expected_grid("2026-01-30", "2026-02-01", ["Boston", "Miami"])
+
+    assert len(grid) == 6
+    assert grid[0] == ("2026-01-30", "Boston") and grid[-1] == ("2026-02-01", "Miami")
+
+
+def test_find_gaps_schedules_only_missing_partitions(lake):
+    """Test that complete partitions are skipped and holes are scheduled with a reason."""
+    _write_partition("2026-01-24", "Boston")
+    _write_partition("2026-01-25", "Boston")
+    os.remove(f"{Project_Config.Paths.silver_path('openmeteo', '2026-01-25', 'Boston')}/weather_data.parquet")
+
+    gaps = find_gaps("2026-01-24", "2026-01-26", ["Boston"])
+
+    assert [(g["run_date"], g["reasons"]) for g in gaps] == [
+        ("2026-01-25", ["silver missing locally"]),
+        ("2026-01-26", ["bronze missing locally", "silver missing locally"]),
+    ]
+
+
+def test_find_gaps_detects_checksum_and_age_staleness(lake, monkeypatch):
+    """Test that a partition changed since it was catalogued, or too old, is rescheduled."""
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", str(lake / "_catalog.sqlite"))
+    _write_partition("2026-01-25", "Boston")
+    record_partition("bronze", "openmeteo", "2026-01-25", "Boston")
+    record_partition("silver", "openmeteo", "2026-01-25", "Boston")
+
+    assert find_gaps("2026-01-25", "2026-01-25", ["Boston"]) == []
+
+    with open(f"{Project_Config.Paths.bronze_path('openmeteo', '2026-01-25', 'Boston')}/raw.json", "w") as f:
+        json.dump({"hourly": {"time": []}}, f)
+    gaps = find_gaps("2026-01-25", "2026-01-25", ["Boston"], max_age_hours=0)
+
+    assert gaps[0]["reasons"] == [
+        "bronze checksum differs from catalog", "bronze older than 0h", "silver older than 0h",
+    ]
+
+
+def test_find_gaps_hashes_only_partitions_whose_stats_moved(lake, monkeypatch):
+    """Test that unchanged catalogued partitions are not re-hashed, while a touched file is hashed and a same-size rewrite caught."""
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", str(lake / "_catalog.sqlite"))
+    _write_partition("2026-01-25", "Boston")
+    record_partition("bronze", "openmeteo", "2026-01-25", "Boston")
+    record_partition("silver", "openmeteo", "2026-01-25", "Boston")
+    described = []
+    monkeypatch.setattr("src.pipeline.gaps.describe_partition", lambda layer, path: described.append(layer) or describe_partition(layer, path))
+
+    assert find_gaps("2026-01-25", "2026-01-25", ["Boston"]) == []
+    assert described == []
+
+    raw_path = f"{Project_Config.Paths.bronze_path('openmeteo', '2026-01-25', 'Boston')}/raw.json"
+    later = datetime.now().timestamp() + 60
+    os.utime(raw_path, (later, later))
+    assert find_gaps("2026-01-25", "2026-01-25", ["Boston"]) == []
+    assert described == ["bronze"]
+
+    with open(raw_path) as f:
+        contents = f.read()
+    with open(raw_path, "w") as f:
+        f.write(contents.replace("T00:00", "T01:00"))
+    os.utime(raw_path, (later, later))
+    assert find_gaps("2026-01-25", "2026-01-25", ["Boston"])[0]["reasons"] == ["bronze checksum differs from catalog"]
+
+
+def test_find_gaps_checks_s3_copies(lake):
+    """Test that partitions missing from S3 are scheduled even when present locally."""
+    _write_partition("2026-01-25", "Boston")
+    bronze_file = f"{Project_Config.Paths.bronze_path('openmeteo', '2026-01-25', 'Boston')}/raw.json"
+    later = datetime.now(timezone.utc) + timedelta(minutes=1)
+    s3 = _FakeS3({S3Client.mirror_key(bronze_file): {"size": os.path.getsize(bronze_file), "last_modified": later}})
+
+    gaps = find_gaps("2026-01-25", "2026-01-25", ["Boston"], s3_client=s3)
+
+    assert gaps[0]["reasons"] == ["silver missing in S3"]
@@ -0,0 +1,53 @@
+import datetime
+
+import pytest
+
+pyspark = pytest.importorskip("pyspark")
+
+from spark.glue_job import (  # noqa: E402
+    reconcile_row_counts,
+    transform_silver_to_gold,
+)
+
+
+def _silver_df(spark):
+    rows = [
+        (datetime.datetime(2026, 1, 25, 0), -1.5, 80, 0.0, 12.3, 42.36, -71.06, "Boston"),
+        (datetime.datetime(2026, 1, 25, 1), 0.0, 82, 0.2, 10.1, 42.36, -71.06, "Boston"),
+        (datetime.datetime(2026, 1, 25, 2), 3.25, 85, 1.4, 8.0, 42.36, -71.06, "Boston"),
+    ]
+    columns = [
+        "time", "temperature_2m", "relative_humidity_2m", "precipitation",
+        "wind_speed_10m", "latitude", "longitude", "location",
+    ]
+    return spark.createDataFrame(rows, columns)
+
+
+def test_transform_renames_and_derives_columns(spark):
+    """Test that the curated frame has analytics names, fahrenheit, freezing flag and run_date."""
+    curated = transform_silver_to_gold(_silver_df(spark), "2026-01-25").orderBy("time").collect()
+
+    assert curated[0]["temp_celsius"] == -1.5
+    assert curated[0]["temp_fahrenheit"] == 29.3
+    assert [r["is_freezing"] for r in curated] == [True, True, False]
+    assert {r["run_date"] for r in curated} == {"2026-01-25"}
+    assert "wind_speed_kmh" in curated[0].asDict()
+
+
+def test_reconcile_row_counts_single_cached_scan(spark):
+    """Test that reconciliation passes on a cached silver frame and returns both counts."""
+    raw_df = _silver_df(spark).cache()
+    curated = transform_silver_to_gold(raw_df, "2026-01-25")
+
+    assert reconcile_row_counts(raw_df, curated) == (3, 3)
+    raw_df.unpersist()
+
+
+def test_reconcile_row_counts_detects_mismatch(spark):
+    """Test that a dropped row fails the reconciliation."""
+    raw_df = _silver_df(spark).cache()
+    curated = transform_silver_to_gold(raw_df, "2026-01-25").limit(2)
+
+    with pytest.raises(ValueError, match="Validation failed"):
+        reconcile_row_counts(raw_df, curated)
+    raw_df.unpersist()
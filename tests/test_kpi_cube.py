@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipeline.warehouse.kpi_cube import KpiCube
+
+FIRST = date(2025, 1, 1)
+
+
+@pytest.fixture
+def mart():
+    """Daily summaries for 3 cities over 200 days, with missing days per city and NULL measures."""
+    rng = np.random.default_rng(7)
+    rows = []
+    for location in ["Boston", "Denver", "Miami"]:
+        for day in range(200):
+            if rng.random() < 0.15:
+                continue
+            rows.append({
+                "summary_date": FIRST + timedelta(days=day),
+                "location_name": location,
+                "avg_temp_c": rng.normal(10, 8),
+                "min_temp_c": rng.normal(2, 8),
+                "max_temp_c": rng.normal(18, 8),
+                "avg_humidity": rng.uniform(30, 90) if rng.random() > 0.1 else None,
+                "total_precipitation_mm": rng.gamma(1, 2),
+                "max_wind_speed_kmh": rng.gamma(2, 10) if rng.random() > 0.1 else None,
+            })
+    return pd.DataFrame(rows).sample(frac=1, random_state=0)
+
+
+def test_cube_matches_dataframe_filters(mart):
+    """Test that KPIs, chart series and rows equal the pandas filter-and-aggregate results for random selections."""
+    cube = KpiCube(mart)
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        location = [None, "Boston", "Denver", "Miami"][rng.integers(4)]
+        start = FIRST + timedelta(days=int(rng.integers(-5, 200)))
+        end = start + timedelta(days=int(rng.integers(0, 120)))
+        selected = mart[(mart["summary_date"] >= start) & (mart["summary_date"] <= end)]
+        if location is not None:
+            selected = selected[selected["location_name"] == location]
+
+        kpis = cube.kpis(location, start, end)
+        assert (kpis is None) == selected.empty
+        if kpis is not None:
+            for column in ["avg_temp_c", "avg_humidity"]:
+                assert kpis[column] == pytest.approx(selected[column].mean(), nan_ok=True)
+            assert kpis["total_precipitation_mm"] == pytest.approx(selected["total_precipitation_mm"].sum())
+            assert kpis["max_wind_speed_kmh"] == pytest.approx(selected["max_wind_speed_kmh"].max(), nan_ok=True)
+
+        expected_temps = selected.groupby("summary_date")[["min_temp_c", "avg_temp_c", "max_temp_c"]].mean()
+        pd.testing.assert_frame_equal(cube.temperature_series(location, start, end), expected_temps, check_index_type=False)
+        expected_precip = selected.groupby("summary_date")["total_precipitation_mm"].sum()
+        pd.testing.assert_series_equal(cube.precipitation_series(location, start, end), expected_precip, check_index_type=False)
+        assert sorted(map(tuple, cube.rows(location, start, end)[["location_name", "summary_date"]].values)) == sorted(
+            map(tuple, selected[["location_name", "summary_date"]].values)
+        )
+
+
+def test_cube_edges(mart):
+    """Test empty ranges, single days, unknown locations and per-build ids."""
+    cube = KpiCube(mart)
+    assert cube.build_id != KpiCube(mart).build_id
+    assert cube.kpis(None, date(2024, 1, 1), date(2024, 12, 31)) is None
+    assert cube.kpis("Boston", date(2025, 3, 1), date(2025, 2, 1)) is None
+    assert cube.temperature_series(None, date(2030, 1, 1), date(2030, 1, 2)).empty
+    assert cube.rows("Miami", date(2030, 1, 1), date(2030, 1, 2)).empty
+
+    day = mart["summary_date"].iloc[0]
+    one_day = mart[mart["summary_date"] == day]
+    assert cube.kpis(None, day, day)["max_temp_c"] == pytest.approx(one_day["max_temp_c"].mean())
+    assert len(cube.rows(None, day, day)) == len(one_day)
+    with pytest.raises(KeyError):
+        cube.kpis("Atlantis", day, day)
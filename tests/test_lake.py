@@ -0,0 +1,142 @@
+import math
+import numbers
+import os
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from src.pipeline.config import Project_Config
+from src.pipeline.transform.features import FEATURE_COLUMNS, add_hourly_features
+from src.pipeline.warehouse import lake, queries
+
+duckdb = pytest.importorskip("duckdb")
+
+RUN_DATES = ["2026-01-24", "2026-01-25", "2026-01-26"]
+LOCATIONS = {"Boston": (42.36, -71.06, -5.0), "Miami": (25.76, -80.19, 20.0)}
+
+
+@pytest.fixture
+def silver_frames(tmp_path, monkeypatch):
+    """Seed silver with the 24 hours of its own day per run_date and location, as the fetch writes them."""
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_SILVER", str(tmp_path / "silver"))
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", None)
+    frames = []
+    for run_index, run_date in enumerate(RUN_DATES):
+        for location, (latitude, longitude, base) in LOCATIONS.items():
+            hours = pd.Series(range(24))
+            df = pd.DataFrame({
+                "time": pd.date_range(f"{run_date}T00:00", periods=24, freq="h"),
+                "temperature_2m": base + (hours % 24) * 0.6 + run_index * 0.1,
+                "relative_humidity_2m": 60 + hours % 7,
+                "precipitation": (hours % 5 == 0) * (0.4 + run_index),
+                "wind_speed_10m": (hours * 7 % 31).astype(float),
+                "latitude": latitude,
+                "longitude": longitude,
+            })
+            silver_dir = Project_Config.Paths.silver_path("openmeteo", run_date, location)
+            os.makedirs(silver_dir)
+            df.to_parquet(f"{silver_dir}/weather_data.parquet", index=False)
+            frames.append(df.assign(location=location, run_date=run_date))
+    yield pd.concat(frames, ignore_index=True)
+    queries.set_engine(None)
+
+
+def _warehouse(raw: pd.DataFrame, path: str):
+    """Reference star schema in SQLite, populated like 02_populate_tables.sql from the latest run per hour."""
+    raw = raw.sort_values("run_date").drop_duplicates(["location", "time"], keep="last")
+    raw = add_hourly_features(raw, "temperature_2m", "precipitation")
+    dates = sorted(raw["time"].dt.date.unique())
+    dim_date = pd.DataFrame({
+        "date_id": range(1, len(dates) + 1),
+        "date_value": [d.isoformat() for d in dates],
+        "day_of_week": [(d.weekday() + 1) % 7 for d in dates],
+        "is_weekend": [d.weekday() >= 5 for d in dates],
+    })
+    names = sorted(LOCATIONS)
+    dim_location = pd.DataFrame({"location_id": range(1, len(names) + 1), "location_name": names})
+    fact = pd.DataFrame({
+        "date_id": raw["time"].dt.date.map(dict(zip(dates, dim_date["date_id"]))),
+        "location_id": raw["location"].map(dict(zip(names, dim_location["location_id"]))),
+        "hour": raw["time"].dt.hour,
+        "temperature_2m": raw["temperature_2m"],
+        "relative_humidity_2m": raw["relative_humidity_2m"],
+        "precipitation": raw["precipitation"],
+        "wind_speed_10m": raw["wind_speed_10m"],
+        **{column: raw[column] for column in FEATURE_COLUMNS},
+    })
+    engine = create_engine(f"sqlite:///{path}")
+    versions = pd.DataFrame({"location_name": pd.Series(dtype=str), "date_value": pd.Series(dtype=str), "version": pd.Series(dtype=int)})
+    for name, df in [("dim_date", dim_date), ("dim_location", dim_location), ("fact_weather_hourly", fact), ("fact_load_versions", versions)]:
+        df.to_sql(name, engine, index=False)
+    return engine
+
+
+def _records(df: pd.DataFrame) -> list[dict]:
+    """Engine-neutral rows: ISO dates, rounded floats, NULL for NaN, in a canonical order."""
+    rows = []
+    for row in df.to_dict("records"):
+        for key, value in row.items():
+            if key == "date_value":
+                row[key] = str(value)[:10]
+            elif isinstance(value, numbers.Number) and not isinstance(value, bool):
+                row[key] = None if math.isnan(float(value)) else round(float(value), 6)
+        rows.append(row)
+    return sorted(rows, key=repr)
+
+
+@pytest.mark.parametrize("layer", ["silver", "gold"])
+def test_lake_matches_warehouse_for_every_query(silver_frames, tmp_path, monkeypatch, layer):
+    """Test that every analytics query returns the same rows from the lake as from the loaded star schema."""
+    if layer == "gold":
+        from src.pipeline.transform.pandas_transform import run_transform
+
+        monkeypatch.setattr(Project_Config.Paths, "LOCAL_GOLD", str(tmp_path / "gold"))
+        for run_date in RUN_DATES:
+            run_transform(run_date, engine="pandas")
+
+    filters = [{}, {"locations": ["Boston"], "start_date": "2026-01-25", "end_date": "2026-01-26"}]
+    expected = {}
+    queries.set_engine(_warehouse(silver_frames, str(tmp_path / "warehouse.db")))
+    for name, query in queries.QUERIES.items():
+        for i, kwargs in enumerate(filters):
+            expected[name, i] = _records(query(**kwargs))
+
+    for lookback_days in (0, 1):
+        queries.set_engine(lake.LakeEngine(layer, threads=2, lookback_days=lookback_days))
+        for name, query in queries.QUERIES.items():
+            for i, kwargs in enumerate(filters):
+                assert _records(query(**kwargs)) == expected[name, i], f"{name} {kwargs} lookback={lookback_days}"
+    assert len(expected["extreme_weather", 0]) == 6
+    if layer == "gold":
+        # gold stores the features, so a one-day query scans only that run_date
+        one_day = lake.LakeEngine("gold").files(start_date="2026-01-25", end_date="2026-01-25")
+        assert {f.split(os.sep)[-3] for f in one_day} == {"run_date=2026-01-25"}
+
+
+def test_lake_prunes_partitions(silver_frames, monkeypatch):
+    """Test that only partitions able to hold the requested locations and dates are scanned."""
+    engine = lake.LakeEngine("silver")
+    assert len(engine.files()) == 6
+
+    pruned = engine.files(locations=("Miami",), start_date="2026-01-20", end_date="2026-01-25")
+    assert [f.split(os.sep)[-3:-1] for f in pruned] == [
+        ["run_date=2026-01-24", "location=Miami"], ["run_date=2026-01-25", "location=Miami"],
+    ]
+    # one day per run_date: a one-day query scans that day, plus the day before as silver feature context
+    assert {f.split(os.sep)[-3] for f in engine.files(start_date="2026-01-26", end_date="2026-01-26")} == {
+        "run_date=2026-01-25", "run_date=2026-01-26",
+    }
+    assert engine.files(start_date="2027-01-01") == []
+    # partitions reaching further keep that many earlier run_dates
+    monkeypatch.setattr(Project_Config.Database, "LAKE_RUN_DATE_LOOKBACK_DAYS", 1)
+    assert len(lake.LakeEngine("silver").files(start_date="2026-01-26")) == 6
+
+    queries.set_engine(engine)
+    assert queries.high_winds(locations=["Nowhere"]).empty
+
+    # the cache version only moves when a scanned file changes
+    version = engine.version(("Miami",), "2026-01-20", "2026-01-25")
+    assert engine.version(("Miami",), "2026-01-20", "2026-01-25") == version
+    os.utime(pruned[0], ns=(0, 0))
+    assert engine.version(("Miami",), "2026-01-20", "2026-01-25") != version
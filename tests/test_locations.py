@@ -0,0 +1,82 @@
+import math
+import random
+
+import pytest
+
+from src.pipeline.locations import EARTH_RADIUS_KM, LocationCatalog
+
+
+def _haversine_km(lat1, lon1, latitude, longitude):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, latitude, longitude))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+@pytest.fixture
+def random_catalog():
+    rng = random.Random(42)
+    return LocationCatalog({
+        f"loc_{i}": {"latitude": rng.uniform(-89, 89), "longitude": rng.uniform(-180, 180)}
+        for i in range(2000)
+    })
+
+
+def test_from_file_loads_csv(tmp_path):
+    """Test that a CSV catalog is loaded and built-in overrides win over file rows."""
+    catalog_file = tmp_path / "locations.csv"
+    catalog_file.write_text("name,latitude,longitude\nBoston,0,0\nMiami,25.7617,-80.1918\n")
+
+    catalog = LocationCatalog.from_file(str(catalog_file), overrides={"Boston": {"latitude": 42.3601, "longitude": -71.0589}})
+
+    assert len(catalog) == 2
+    assert catalog.get("Miami") == {"latitude": 25.7617, "longitude": -80.1918}
+    assert catalog.get("Boston")["latitude"] == 42.3601
+
+
+def test_from_file_rejects_missing_columns(tmp_path):
+    """Test that a catalog without coordinate columns is rejected."""
+    catalog_file = tmp_path / "locations.csv"
+    catalog_file.write_text("name,lat\nBoston,42.36\n")
+
+    with pytest.raises(ValueError, match="missing required columns"):
+        LocationCatalog.from_file(str(catalog_file))
+
+
+def test_nearest_matches_brute_force(random_catalog):
+    """Test that the KD-tree returns the same nearest location as a full great-circle scan."""
+    rng = random.Random(7)
+    for _ in range(200):
+        lat, lon = rng.uniform(-90, 90), rng.uniform(-180, 180)
+        expected = min(
+            random_catalog.names,
+            key=lambda name: _haversine_km(lat, lon, **random_catalog.get(name)),
+        )
+        name, distance = random_catalog.nearest(lat, lon)
+
+        assert name == expected
+        assert distance == pytest.approx(_haversine_km(lat, lon, **random_catalog.get(name)), abs=1e-6)
+
+
+def test_within_bbox_matches_filter(random_catalog):
+    """Test bounding-box queries, including one that crosses the antimeridian."""
+    def inside(coords, min_lat, min_lon, max_lat, max_lon):
+        if not min_lat <= coords["latitude"] <= max_lat:
+            return False
+        lon = coords["longitude"]
+        return min_lon <= lon <= max_lon if min_lon <= max_lon else (lon >= min_lon or lon <= max_lon)
+
+    for box in [(10, -30, 40, 20), (-20, 170, 20, -170)]:
+        expected = {name for name in random_catalog.names if inside(random_catalog.get(name), *box)}
+        assert set(random_catalog.within_bbox(*box)) == expected
+
+
+def test_resolve_coordinates_to_partition_name():
+    """Test that coordinate-only input resolves to the canonical name, and far-away input is rejected."""
+    catalog = LocationCatalog({
+        "Boston": {"latitude": 42.3601, "longitude": -71.0589},
+        "Miami": {"latitude": 25.7617, "longitude": -80.1918},
+    })
+
+    assert catalog.resolve(42.36, -71.06) == "Boston"
+    with pytest.raises(ValueError, match="No catalog location within"):
+        catalog.resolve(0.0, 0.0)
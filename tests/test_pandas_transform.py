@@ -0,0 +1,107 @@
+import os
+
+import pandas as pd
+import pytest
+
+from src.pipeline.config import Project_Config
+from src.pipeline.transform.pandas_transform import (
+    _round_half_up,
+    choose_engine,
+    run_transform,
+    transform_silver_to_gold,
+)
+
+RUN_DATE = "2026-01-25"
+PREVIOUS_RUN_DATE = "2026-01-24"
+
+
+@pytest.fixture
+def lake(tmp_path, monkeypatch):
+    """Point the silver/gold layers at a temp dir and seed two silver locations for RUN_DATE and the day before."""
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_SILVER", str(tmp_path / "silver"))
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_GOLD", str(tmp_path / "gold"))
+
+    for run_date, offset in [(PREVIOUS_RUN_DATE, 1.0), (RUN_DATE, 0.0)]:
+        for location, base in [("Boston", -2.0), ("Miami", 24.0)]:
+            df = pd.DataFrame({
+                "time": pd.date_range(f"{run_date}T00:00", periods=24, freq="h"),
+                "temperature_2m": [base + offset + i * 0.15 for i in range(24)],
+                "relative_humidity_2m": list(range(60, 84)),
+                "precipitation": [0.1] * 24,
+                "wind_speed_10m": [12.5] * 24,
+                "latitude": 42.36,
+                "longitude": -71.06,
+            })
+            path = Project_Config.Paths.silver_path("openmeteo", run_date, location)
+            os.makedirs(path)
+            df.to_parquet(f"{path}/weather_data.parquet", index=False)
+    return tmp_path
+
+
+def test_round_half_up_matches_spark_not_bankers():
+    """Test that .5 cases round away from zero like Spark, not to even like numpy."""
+    values = pd.Series([32.445, 0.125, -0.125, None])
+    result = _round_half_up(values, 2)
+
+    assert result.iloc[:3].tolist() == [32.45, 0.13, -0.13]
+    assert pd.isna(result.iloc[3])
+
+
+def test_transform_derives_columns_and_null_is_not_freezing():
+    """Test renames, fahrenheit, freezing flag and run_date on a small frame."""
+    silver = pd.DataFrame({
+        "time": ["2026-01-25T00:00", "2026-01-25T01:00", "2026-01-25T02:00"],
+        "temperature_2m": [-1.5, 0.0, None],
+        "relative_humidity_2m": [80, 82, 85],
+        "precipitation": [0.0, 0.2, 1.4],
+        "wind_speed_10m": [12.3, 10.1, 8.0],
+        "location": "Boston",
+    })
+    gold = transform_silver_to_gold(silver, RUN_DATE)
+
+    assert "temp_celsius" in gold.columns and "temperature_2m" not in gold.columns
+    assert pd.api.types.is_datetime64_any_dtype(gold["time"])
+    assert gold["temp_fahrenheit"].iloc[0] == 29.3
+    assert gold["is_freezing"].tolist() == [True, True, False]
+    assert (gold["run_date"] == RUN_DATE).all()
+
+
+def test_choose_engine_by_partition_size():
+    """Test that small partitions use pandas and large ones fall back to Spark."""
+    assert choose_engine(500, max_pandas_rows=1000) == "pandas"
+    assert choose_engine(5000, max_pandas_rows=1000) == "spark"
+
+
+def test_run_transform_writes_hive_partitions_idempotently(lake):
+    """Test that the pandas engine writes one file per location and reruns overwrite it."""
+    assert run_transform(RUN_DATE, engine="auto") == 48
+    assert run_transform(RUN_DATE, engine="pandas") == 48
+
+    gold_dir = Project_Config.Paths.gold_path("openmeteo", RUN_DATE, "Boston")
+    assert os.listdir(gold_dir) == ["weather_data.parquet"]
+
+    gold = pd.read_parquet(f"{gold_dir}/weather_data.parquet")
+    assert len(gold) == 24
+    assert "location" not in gold.columns and "run_date" not in gold.columns
+
+
+def test_pandas_engine_matches_spark(lake, spark):
+    """Test parity between the pandas engine and the Glue job transform on the same silver data."""
+    from spark.glue_job import transform_silver_to_gold as spark_transform
+
+    from src.pipeline.transform.features import previous_partition
+    from src.pipeline.transform.pandas_transform import read_silver_partition
+
+    silver_dir = Project_Config.Paths.silver_path("openmeteo", RUN_DATE)
+    context_dir = Project_Config.Paths.silver_path("openmeteo", PREVIOUS_RUN_DATE)
+    spark_df = spark_transform(spark.read.parquet(silver_dir), RUN_DATE, spark.read.parquet(context_dir)).toPandas()
+    pandas_df = transform_silver_to_gold(read_silver_partition(RUN_DATE), RUN_DATE, previous_partition(RUN_DATE))
+
+    key = ["location", "time"]
+    spark_df = spark_df.sort_values(key).reset_index(drop=True)
+    pandas_df = pandas_df.sort_values(key).reset_index(drop=True)[spark_df.columns]
+    spark_df["time"] = pd.to_datetime(spark_df["time"]).astype(pandas_df["time"].dtype)
+
+    pd.testing.assert_frame_equal(pandas_df, spark_df, check_dtype=False)
+    # the first hours carry on from the previous run_date
+    assert pandas_df["temp_change_1h"].iloc[0] == pytest.approx(-2.0 - (-1.0 + 23 * 0.15))
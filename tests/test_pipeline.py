@@ -84,4 +84,122 @@ def test_normalize_data_formatting():
     
     assert pd.api.types.is_datetime64_any_dtype(df["time"])
     
-    assert len(df) == 2
\ No newline at end of file
+    assert len(df) == 2
+
+def test_streaming_normalize_writes_chunked_row_groups(tmp_path, monkeypatch):
+    """Test that chunked normalization writes one row group per chunk with the same data as one shot."""
+    import pyarrow.parquet as pq
+    from src.pipeline.config import Project_Config
+    from src.pipeline.ingest.normalize import _iter_normalized_chunks, _save_to_silver
+
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_SILVER", str(tmp_path / "silver"))
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", None)
+    times = pd.date_range("2026-01-25T00:00", periods=10, freq="h").strftime("%Y-%m-%dT%H:%M").tolist()
+    bronze_data = {
+        "latitude": 42.36,
+        "longitude": -71.06,
+        "hourly": {"time": times, "temperature_2m": [None] * 4 + [1.5] * 6}
+    }
+
+    file_path = _save_to_silver(_iter_normalized_chunks(bronze_data, chunk_rows=4), "2026-01-25", "Boston", "openmeteo")
+
+    parquet_file = pq.ParquetFile(file_path)
+    assert parquet_file.metadata.num_row_groups == 3
+    pd.testing.assert_frame_equal(parquet_file.read().to_pandas(), _normalize_data(bronze_data))
+
+def test_streaming_normalize_types_do_not_depend_on_chunk_boundaries(tmp_path, monkeypatch):
+    """Test that an integer column gaining a null in a later chunk is float64, as when normalized whole."""
+    import pyarrow.parquet as pq
+    from src.pipeline.config import Project_Config
+    from src.pipeline.ingest.normalize import _iter_normalized_chunks, _json_silver_schema, _save_to_silver
+
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_SILVER", str(tmp_path / "silver"))
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", None)
+    times = pd.date_range("2026-01-25T00:00", periods=6, freq="h").strftime("%Y-%m-%dT%H:%M").tolist()
+    bronze_data = {
+        "latitude": 42.36,
+        "longitude": -71.06,
+        "hourly": {"time": times, "relative_humidity_2m": [65, 70, 71, 90, None, 88], "weather_code": [3] * 6}
+    }
+
+    file_path = _save_to_silver(
+        _iter_normalized_chunks(bronze_data, chunk_rows=3), "2026-01-25", "Boston", "openmeteo",
+        schema=_json_silver_schema(bronze_data),
+    )
+
+    # without the pinned schema the first chunk would make the file's column int64
+    schema = pq.read_schema(file_path)
+    assert (str(schema.field("relative_humidity_2m").type), str(schema.field("weather_code").type)) == ("double", "int64")
+    pd.testing.assert_frame_equal(pq.read_table(file_path).to_pandas(), _normalize_data(bronze_data))
+
+def test_streaming_normalize_rejects_empty_payload(tmp_path, monkeypatch):
+    """Test that an empty payload raises and leaves no silver file behind."""
+    from src.pipeline.config import Project_Config
+    from src.pipeline.ingest.normalize import _iter_normalized_chunks, _save_to_silver
+
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_SILVER", str(tmp_path / "silver"))
+    empty_data = {"latitude": 42.36, "longitude": -71.06, "hourly": {"time": [], "temperature_2m": []}}
+
+    with pytest.raises(ValueError, match="empty"):
+        _save_to_silver(_iter_normalized_chunks(empty_data), "2026-01-25", "Boston", "openmeteo")
+    assert not list(tmp_path.rglob("*.parquet*"))
+
+
+# --- FETCH TESTS ---
+
+def test_split_batch_response_maps_results_to_locations():
+    """Test that a multi-coordinate response is split back into one payload per location."""
+    from src.pipeline.ingest.fetch import _split_batch_response
+
+    data = [
+        {"location_id": 1, "latitude": 25.76},
+        {"location_id": 0, "latitude": 42.36},
+    ]
+    split = _split_batch_response(data, ["Boston", "Miami"])
+
+    assert split["Boston"]["latitude"] == 42.36
+    assert split["Miami"]["latitude"] == 25.76
+
+def test_split_batch_response_rejects_length_mismatch():
+    """Test that a response with the wrong number of results is not silently misassigned."""
+    from src.pipeline.ingest.fetch import _split_batch_response
+
+    with pytest.raises(ValueError, match="1 results for 2 locations"):
+        _split_batch_response({"latitude": 42.36}, ["Boston", "Miami"])
+
+# --- CLI TESTS ---
+
+def test_parse_locations_splits_chunks():
+    """Test that a comma-separated location chunk from the DAG fan-out is split and trimmed."""
+    from src.pipeline.run import _parse_locations
+
+    assert _parse_locations("Boston") == ["Boston"]
+    assert _parse_locations("Boston, Miami,,Denver ") == ["Boston", "Miami", "Denver"]
+
+
+def test_multi_location_run_continues_past_a_failed_location(monkeypatch):
+    """Test that one failed location does not stop the others, and the run still exits non-zero."""
+    from src.pipeline import run
+
+    attempted = []
+    def fake_execute(run_date, location, source, write_to_s3=False):
+        attempted.append(location)
+        if location == "Miami":
+            raise RuntimeError("API timeout")
+    monkeypatch.setattr(run, "execute_pipeline", fake_execute)
+
+    with pytest.raises(SystemExit) as excinfo:
+        run.run_locations_pipeline("2026-01-25", ["Boston", "Miami", "Denver"])
+    assert excinfo.value.code == 1
+    assert attempted == ["Boston", "Miami", "Denver"]
+
+
+def test_cli_import_does_not_load_heavy_dependencies():
+    """Test that importing the ingest CLI defers pandas/pyarrow/boto3 until a stage needs them."""
+    import subprocess
+    import sys
+
+    code = "import sys, src.pipeline.run; print(sorted(m for m in ('pandas', 'pyarrow', 'boto3') if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert out.strip() == "[]"
@@ -0,0 +1,46 @@
+import os
+import pstats
+
+from src.pipeline import profiling
+
+
+def test_stage_is_shared_noop_when_disabled():
+    """Test that profiling off costs one shared no-op context, with no profiler state."""
+    assert profiling._profiler is None
+    assert profiling.stage("fetch") is profiling.stage("normalize")
+    with profiling.stage("fetch"):
+        pass
+    assert profiling.disable() is None
+
+
+def test_pipeline_stages_write_profiles(tmp_path, monkeypatch):
+    """Test that a profiled run writes a .prof per stage and a summary with nested stages and allocations."""
+    from benchmarks.fake_openmeteo import FakeOpenMeteo
+    from src.pipeline.config import Project_Config
+    from src.pipeline.ingest import normalize  # noqa: F401  (keep pandas import time out of the profile)
+    from src.pipeline.run import execute_pipeline
+
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_BRONZE", str(tmp_path / "bronze"))
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_SILVER", str(tmp_path / "silver"))
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", None)
+    output_dir = str(tmp_path / "profile")
+
+    profiling.enable(output_dir)
+    try:
+        with FakeOpenMeteo() as api:
+            monkeypatch.setattr(Project_Config.API, "OPEN_METEO_URL_TEMPLATE", api.url_template)
+            execute_pipeline("2026-01-25", "Boston")
+            with profiling.stage("fetch"):
+                with profiling.stage("upload"):
+                    blob = [bytearray(1024) for _ in range(512)]
+    finally:
+        summary_path = profiling.disable()
+
+    assert summary_path == os.path.join(output_dir, "profile_summary.txt")
+    for stage in ("fetch", "validate", "normalize", "upload"):
+        assert pstats.Stats(os.path.join(output_dir, f"{stage}.prof")).total_calls > 0
+    with open(summary_path) as f:
+        summary = f.read()
+    assert "== fetch: 2 call(s)" in summary and "== upload: 1 call(s)" in summary
+    assert "test_profiling.py" in summary.split("== upload")[1]
+    assert profiling._profiler is None and len(blob) == 512
@@ -0,0 +1,231 @@
+import os
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.pipeline.transform.features import add_hourly_features
+from src.pipeline.warehouse import queries
+
+# SQLite stand-in for sql/postgres/01_create_tables.sql (star schema only)
+SCHEMA_SQL = [
+    """CREATE TABLE dim_date (
+        date_id INTEGER PRIMARY KEY, date_value TEXT UNIQUE NOT NULL,
+        year INT, month INT, day INT, day_of_week INT, is_weekend BOOLEAN
+    )""",
+    """CREATE TABLE dim_location (
+        location_id INTEGER PRIMARY KEY, location_name TEXT UNIQUE NOT NULL, latitude FLOAT, longitude FLOAT
+    )""",
+    """CREATE TABLE fact_weather_hourly (
+        fact_id INTEGER PRIMARY KEY, date_id INT NOT NULL, location_id INT NOT NULL, hour INT NOT NULL,
+        temperature_2m FLOAT, relative_humidity_2m INT, precipitation FLOAT, wind_speed_10m FLOAT,
+        temp_change_1h FLOAT, temp_rolling_3h FLOAT, temp_rank_daily INT, precip_cumulative_daily FLOAT
+    )""",
+    """CREATE TABLE fact_load_versions (
+        location_name TEXT NOT NULL, date_value TEXT NOT NULL, version INT NOT NULL, PRIMARY KEY (location_name, date_value)
+    )""",
+]
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    """Point the query layer at a SQLite star schema: Boston and Miami, 2026-01-24 (Sat) and 2026-01-26 (Mon), 4 hours each."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'warehouse.db'}")
+    with engine.begin() as conn:
+        for statement in SCHEMA_SQL:
+            conn.execute(text(statement))
+        conn.execute(text("INSERT INTO dim_date VALUES (1, '2026-01-24', 2026, 1, 24, 6, 1), (2, '2026-01-26', 2026, 1, 26, 1, 0)"))
+        conn.execute(text("INSERT INTO dim_location VALUES (1, 'Boston', 42.36, -71.06), (2, 'Miami', 25.76, -80.19)"))
+    rows = pd.DataFrame([
+        {"date_id": date_id, "location_id": location_id, "hour": hour, "temperature_2m": base + 3 * hour,
+         "precipitation": 0.5 * location_id, "wind_speed_10m": 10.0 * hour,
+         "location": location_id, "time": pd.Timestamp(day) + pd.Timedelta(hours=hour)}
+        for location_id, base in [(1, -4.0), (2, 22.0)]
+        for date_id, day in [(1, "2026-01-24"), (2, "2026-01-26")]
+        for hour in range(4)
+    ])
+    fact = add_hourly_features(rows, "temperature_2m", "precipitation").drop(columns=["location", "time"])
+    fact.to_sql("fact_weather_hourly", engine, if_exists="append", index=False)
+    queries.set_engine(engine)
+    yield engine
+    queries.set_engine(None)
+
+
+def test_queries_apply_filters_and_thresholds(warehouse):
+    """Test that locations, date range and thresholds are bound as parameters."""
+    freezing = queries.freezing_hours(locations=["Boston"], start_date="2026-01-24", end_date="2026-01-24")
+    assert freezing["temperature_2m"].tolist() == [-4.0, -1.0]
+
+    assert len(queries.high_winds(min_wind_speed=15)) == 8
+    assert len(queries.high_winds(min_wind_speed=25)) == 4
+    assert queries.rainy_cities(min_precipitation=5.0)["location_name"].tolist() == ["Miami"]
+    assert set(queries.weekend_weather()["date_value"]) == {"2026-01-24"}
+
+    buckets = queries.temp_buckets(locations=["Miami"], start_date="2026-01-26", cold_below=25, hot_above=30)
+    assert dict(zip(buckets["temp_category"], buckets["hours_count"])) == {"Cold": 1, "Mild": 2, "Hot": 1}
+    assert queries.extreme_weather(min_variance=8.5)["temp_variance"].tolist() == [9.0] * 4
+    assert queries.hottest_hour_rank(locations=["Boston"], top=1)["hour"].tolist() == [3, 3]
+    # precomputed features: the day gap breaks the hour-over-hour change, cumulative rain restarts daily
+    change = queries.hourly_temp_change(locations=["Miami"], start_date="2026-01-26")
+    assert pd.isna(change["temp_change"].iloc[0]) and change["temp_change"].tolist()[1:] == [3.0, 3.0, 3.0]
+    assert queries.cumulative_rainfall(locations=["Miami"])["cumulative_precip"].tolist() == [1.0, 2.0, 3.0, 4.0] * 2
+    assert queries.rolling_avg_temp(locations=["Boston"], start_date="2026-01-26")["moving_avg"].tolist() == [
+        -4.0, -2.5, -1.0, 2.0,
+    ]
+    assert queries.rolling_avg_temp(locations=["Boston"], end_date="2026-01-24", window_hours=2)["moving_avg"].tolist() == [
+        -4.0, -2.5, 0.5, 3.5,
+    ]
+    with pytest.raises(ValueError):
+        queries.sample_data(start_date="01/24/2026")
+
+
+def test_cache_hits_and_load_version_invalidation(warehouse):
+    """Test that repeated queries are served from the cache and a populate in any process only evicts overlapping results."""
+    cache = queries.RESULT_CACHE
+    boston = queries.avg_temp_by_city(locations=["Boston"])
+    boston_saturday = queries.avg_temp_by_city(locations=["Boston"], end_date="2026-01-24")
+    miami = queries.avg_temp_by_city(locations=["Miami"])
+    boston.loc[0, "avg_temp"] = 99.0  # callers get copies
+    hits = cache.hits
+    assert queries.avg_temp_by_city(locations=["Boston"])["avg_temp"].tolist() == [0.5, 0.5]
+    assert cache.hits == hits + 1 and len(cache) == 3
+
+    # another process populates Boston 2026-01-26: new facts, then the version stamp (02_populate_tables.sql)
+    other_process = create_engine(str(warehouse.url))
+    with other_process.begin() as conn:
+        conn.execute(text("UPDATE fact_weather_hourly SET temperature_2m = 50 WHERE location_id = 1 AND date_id = 2"))
+        conn.execute(text("INSERT INTO fact_load_versions VALUES ('Boston', '2026-01-26', 1)"))
+
+    misses = cache.misses
+    assert queries.avg_temp_by_city(locations=["Boston"], end_date="2026-01-24").equals(boston_saturday)
+    assert queries.avg_temp_by_city(locations=["Miami"]).equals(miami)
+    assert cache.misses == misses
+    assert sorted(queries.avg_temp_by_city(locations=["Boston"])["avg_temp"]) == [0.5, 50.0]
+    assert cache.misses == misses + 1
+
+
+def test_compact_fact_layout_round_trips_and_is_queried(warehouse, monkeypatch):
+    """Test that 03_compact_facts.sql keeps every hour, including all-NULL ones, and FACT_LAYOUT selects its view."""
+    duckdb = pytest.importorskip("duckdb")
+    from src.pipeline.config import Project_Config
+
+    facts = pd.read_sql("SELECT * FROM fact_weather_hourly", warehouse)
+    facts = pd.concat([facts, pd.DataFrame({"fact_id": [99], "date_id": [1], "location_id": [1], "hour": [10]})])
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE dim_date (date_id INT PRIMARY KEY); INSERT INTO dim_date VALUES (1), (2)")
+    conn.execute("CREATE TABLE dim_location (location_id INT PRIMARY KEY); INSERT INTO dim_location VALUES (1), (2)")
+    conn.execute("CREATE TABLE fact_weather_hourly AS SELECT *, TIMESTAMP '2026-01-27 06:00' AS extraction_time FROM facts")
+    with open(os.path.join(os.path.dirname(__file__), "..", "sql", "postgres", "03_compact_facts.sql")) as f:
+        conn.execute(f.read())
+
+    assert conn.execute("SELECT COUNT(*) FROM fact_weather_daily").fetchone()[0] == 4
+    assert conn.execute("SELECT COUNT(*) FROM fact_weather_hourly").fetchone()[0] == 0
+    unnested = conn.execute("SELECT * FROM fact_weather_hourly_compact").df()
+    key = ["location_id", "date_id", "hour"]
+    columns = facts.columns.drop("fact_id")
+    pd.testing.assert_frame_equal(
+        unnested.sort_values(key, ignore_index=True)[columns],
+        facts.sort_values(key, ignore_index=True)[columns],
+        check_dtype=False,
+    )
+    assert (unnested["extraction_time"] == pd.Timestamp("2026-01-27 06:00")).all()
+
+    with warehouse.begin() as sqlite_conn:
+        sqlite_conn.execute(text("CREATE VIEW fact_weather_hourly_compact AS SELECT * FROM fact_weather_hourly WHERE location_id = 2"))
+    monkeypatch.setattr(Project_Config.Database, "FACT_LAYOUT", "compact")
+    assert queries.avg_temp_by_city()["location_name"].tolist() == ["Miami", "Miami"]
+    monkeypatch.setattr(Project_Config.Database, "FACT_LAYOUT", "columnar")
+    with pytest.raises(ValueError):
+        queries.avg_temp_by_city()
+
+
+def test_compact_fact_layout_merges_each_populate(warehouse):
+    """Test that rerunning 03_compact_facts.sql after a later populate keeps earlier days and merges reloaded hours."""
+    duckdb = pytest.importorskip("duckdb")
+
+    facts = pd.read_sql("SELECT * FROM fact_weather_hourly", warehouse).drop(columns="fact_id")
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE dim_date (date_id INT PRIMARY KEY); INSERT INTO dim_date VALUES (1), (2)")
+    conn.execute("CREATE TABLE dim_location (location_id INT PRIMARY KEY); INSERT INTO dim_location VALUES (1), (2)")
+    conn.execute("CREATE TABLE fact_weather_hourly AS SELECT *, TIMESTAMP '2026-01-27 06:00' AS extraction_time FROM facts LIMIT 0")
+    with open(os.path.join(os.path.dirname(__file__), "..", "sql", "postgres", "03_compact_facts.sql")) as f:
+        script = f.read()
+
+    day_1 = facts[facts["date_id"] == 1]
+    conn.register("day_1", day_1)
+    conn.register("day_2", facts[facts["date_id"] == 2])
+    conn.execute("INSERT INTO fact_weather_hourly SELECT *, TIMESTAMP '2026-01-25 06:00' FROM day_1")
+    conn.execute(script)
+    # the next populate loads day 2 and reloads hour 0 of Boston's day 1
+    conn.register("reloaded", day_1[(day_1["location_id"] == 1) & (day_1["hour"] == 0)].assign(temperature_2m=50.0))
+    conn.execute("INSERT INTO fact_weather_hourly SELECT *, TIMESTAMP '2026-01-27 06:00' FROM day_2")
+    conn.execute("INSERT INTO fact_weather_hourly SELECT *, TIMESTAMP '2026-01-27 06:00' FROM reloaded")
+    conn.execute(script)
+
+    assert conn.execute("SELECT date_id, COUNT(*) FROM fact_weather_daily GROUP BY 1 ORDER BY 1").fetchall() == [(1, 2), (2, 2)]
+    unnested = conn.execute("SELECT * FROM fact_weather_hourly_compact").df()
+    key = ["location_id", "date_id", "hour"]
+    expected = facts.copy()
+    expected.loc[(expected["location_id"] == 1) & (expected["date_id"] == 1) & (expected["hour"] == 0), "temperature_2m"] = 50.0
+    pd.testing.assert_frame_equal(
+        unnested.sort_values(key, ignore_index=True)[expected.columns],
+        expected.sort_values(key, ignore_index=True),
+        check_dtype=False,
+    )
+
+
+def test_populate_keeps_earlier_loads_and_replaces_reloaded_partitions():
+    """Test that 01/02 upgrade a warehouse created by the original schema in place, replacing only the staged partitions."""
+    duckdb = pytest.importorskip("duckdb")
+    sql_dir = os.path.join(os.path.dirname(__file__), "..", "sql", "postgres")
+
+    # the star schema as the original 01_create_tables.sql created it (no hourly features), with one earlier load
+    conn = duckdb.connect()
+    conn.execute("""
+        CREATE SEQUENCE ids;
+        CREATE TABLE dim_date (date_id INT PRIMARY KEY DEFAULT nextval('ids'), date_value DATE UNIQUE NOT NULL,
+            year INT, month INT, day INT, day_of_week INT, is_weekend BOOLEAN);
+        CREATE TABLE dim_location (location_id INT PRIMARY KEY DEFAULT nextval('ids'), location_name VARCHAR UNIQUE NOT NULL,
+            latitude FLOAT NOT NULL, longitude FLOAT NOT NULL);
+        CREATE TABLE fact_weather_hourly (fact_id INT PRIMARY KEY DEFAULT nextval('ids'),
+            date_id INT NOT NULL REFERENCES dim_date(date_id), location_id INT NOT NULL REFERENCES dim_location(location_id),
+            hour INT NOT NULL, temperature_2m FLOAT, relative_humidity_2m INT, precipitation FLOAT, wind_speed_10m FLOAT,
+            extraction_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+        INSERT INTO dim_date (date_value) VALUES ('2026-01-20');
+        INSERT INTO dim_location (location_name, latitude, longitude) VALUES ('Boston', 42.36, -71.06);
+        INSERT INTO fact_weather_hourly (date_id, location_id, hour, temperature_2m) VALUES (1, 2, 0, 0.5);
+    """)
+    # DuckDB has no SERIAL; a sequence default stands in for it
+    with open(os.path.join(sql_dir, "01_create_tables.sql")) as f:
+        conn.execute(f.read().replace("SERIAL", "INT DEFAULT nextval('ids')"))
+    with open(os.path.join(sql_dir, "02_populate_tables.sql")) as f:
+        script = f.read()
+
+    def populate(location, day, temperature):
+        raw = pd.DataFrame({
+            "time": pd.date_range(day, periods=3, freq="h"), "temperature_2m": temperature,
+            "relative_humidity_2m": 50, "precipitation": 0.0, "wind_speed_10m": 5.0,
+            "latitude": 42.36, "longitude": -71.06, "location": location,
+        })
+        conn.register("raw", add_hourly_features(raw, "temperature_2m", "precipitation"))
+        conn.execute("CREATE OR REPLACE TABLE raw_weather AS SELECT * FROM raw")
+        conn.execute(script)
+
+    populate("Boston", "2026-01-24", 1.0)
+    boston_id = conn.execute("SELECT location_id FROM dim_location").fetchone()[0]
+    populate("Miami", "2026-01-24", 20.0)
+    populate("Boston", "2026-01-26", 2.0)
+    populate("Boston", "2026-01-24", 5.0)
+
+    rows = conn.execute("""
+        SELECT l.location_name, CAST(d.date_value AS VARCHAR), COUNT(*), MAX(f.temperature_2m)
+        FROM fact_weather_hourly f JOIN dim_location l USING (location_id) JOIN dim_date d USING (date_id)
+        GROUP BY 1, 2 ORDER BY 1, 2
+    """).fetchall()
+    assert rows == [
+        ("Boston", "2026-01-20", 1, 0.5), ("Boston", "2026-01-24", 3, 5.0),
+        ("Boston", "2026-01-26", 3, 2.0), ("Miami", "2026-01-24", 3, 20.0),
+    ]
+    assert conn.execute("SELECT location_id FROM dim_location WHERE location_name = 'Boston'").fetchone()[0] == boston_id
+    versions = conn.execute("SELECT location_name, CAST(date_value AS VARCHAR), version FROM fact_load_versions ORDER BY 3").fetchall()
+    assert versions == [("Miami", "2026-01-24", 2), ("Boston", "2026-01-26", 3), ("Boston", "2026-01-24", 4)]
@@ -0,0 +1,73 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from src.pipeline.config import Project_Config
+from src.pipeline.io.archive import run_archive
+from src.pipeline.io.local import save_json_local
+from src.pipeline.reprocess import chunk_jobs, discover_partitions, run_reprocess
+
+
+@pytest.fixture
+def lake(tmp_path, monkeypatch):
+    """Point bronze/silver at a temporary directory with no partition catalog."""
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_BRONZE", str(tmp_path / "bronze"))
+    monkeypatch.setattr(Project_Config.Paths, "LOCAL_SILVER", str(tmp_path / "silver"))
+    monkeypatch.setattr(Project_Config.Paths, "PARTITION_CATALOG", None)
+    return tmp_path
+
+
+def _write_bronze(run_date, location, hours=24):
+    payload = {
+        "latitude": 42.36, "longitude": -71.06,
+        "generationtime_ms": 0.5, "utc_offset_seconds": 0,
+        "timezone": "GMT", "timezone_abbreviation": "GMT",
+        "elevation": 10.0, "hourly_units": {},
+        "hourly": {
+            "time": [f"{run_date}T{hour:02d}:00" for hour in range(hours)],
+            "temperature_2m": [1.5] * hours,
+        },
+    }
+    save_json_local(payload, f"{Project_Config.Paths.bronze_path('openmeteo', run_date, location)}/raw.json")
+
+
+def test_discover_partitions_finds_loose_and_archived(lake):
+    """Test that discovery covers loose and archived bronze in the range, optionally filtered by location."""
+    for run_date in ["2026-01-30", "2026-01-31", "2026-02-01", "2026-02-02"]:
+        _write_bronze(run_date, "Boston")
+    _write_bronze("2026-01-31", "Miami")
+    run_archive(months=["2026-01"])
+    os.makedirs(Project_Config.Paths.bronze_path("openmeteo", "2026-02-01", "Denver"))
+
+    jobs = discover_partitions("2026-01-31", "2026-02-01")
+    assert [(job["run_date"], job["location"]) for job in jobs] == [
+        ("2026-01-31", "Boston"), ("2026-01-31", "Miami"), ("2026-02-01", "Boston"),
+    ]
+    assert [job["run_date"] for job in discover_partitions("2026-01-01", "2026-03-31", ["Boston"])] == [
+        "2026-01-30", "2026-01-31", "2026-02-01", "2026-02-02",
+    ]
+
+    chunks = chunk_jobs(list(range(100)), workers=3)
+    assert len(chunks[0]) == 9 and sum(chunks, []) == list(range(100))
+    assert chunk_jobs(list(range(5)), workers=3, chunk_size=2) == [[0, 1], [2, 3], [4]]
+
+
+def test_run_reprocess_rebuilds_silver_on_process_pool(lake):
+    """Test that every partition is rebuilt across worker processes, failures are isolated and results keep job order."""
+    for run_date in ["2026-01-24", "2026-01-25", "2026-01-26"]:
+        for location in ["Boston", "Miami"]:
+            _write_bronze(run_date, location)
+    _write_bronze("2026-01-25", "Denver", hours=0)
+    jobs = discover_partitions("2026-01-24", "2026-01-26")
+
+    summary = run_reprocess(jobs, workers=2, chunk_size=2, report_path=str(lake / "report.json"))
+
+    assert (summary["total"], summary["succeeded"], summary["failed"]) == (7, 6, 1)
+    assert [(r["run_date"], r["location"]) for r in summary["jobs"]] == [(j["run_date"], j["location"]) for j in jobs]
+    assert [r["location"] for r in summary["jobs"] if r["status"] == "failed"] == ["Denver"]
+    silver = pd.read_parquet(f"{Project_Config.Paths.silver_path('openmeteo', '2026-01-26', 'Miami')}/weather_data.parquet")
+    assert len(silver) == 24
+    with open(lake / "report.json") as f:
+        assert json.load(f)["chunk_size"] == 2
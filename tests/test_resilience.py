@@ -0,0 +1,122 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.pipeline.ingest.resilience import CircuitBreaker, CircuitOpenError, TokenBucket, get_with_retry
+
+
+class _ScriptedHandler(BaseHTTPRequestHandler):
+    """Answers each request with the next status from the server's script (200 once exhausted)."""
+
+    def do_GET(self):
+        self.server.hits += 1
+        status = self.server.script.pop(0) if self.server.script else 200
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(b'{"ok": true}')
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fake_api():
+    """Local stand-in for the weather API with a scriptable sequence of statuses."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ScriptedHandler)
+    server.script, server.hits = [], 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}/v1/forecast"
+    server.shutdown()
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_transient_errors_are_retried_in_process(fake_api):
+    """Test that a 503/429 blip is absorbed by backoff instead of failing the fetch."""
+    server, url = fake_api
+    server.script = [503, 429, 502]
+    delays = []
+
+    response = get_with_retry(requests, url, max_retries=4, backoff_base=0.01, limiter=None, breaker=None, sleep=delays.append)
+
+    assert response.json() == {"ok": True}
+    assert server.hits == 4
+    assert len(delays) == 3 and all(0 <= d <= 0.04 for d in delays)
+
+
+def test_non_retryable_status_fails_immediately(fake_api):
+    """Test that a 4xx other than 429 is raised without retries."""
+    server, url = fake_api
+    server.script = [404]
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        get_with_retry(requests, url, max_retries=4, limiter=None, breaker=None, sleep=lambda s: None)
+    assert server.hits == 1
+
+
+def test_circuit_breaker_fails_fast_then_recovers(fake_api):
+    """Test that the breaker stops hitting a down API and lets one trial through after the cool-down."""
+    server, url = fake_api
+    server.script = [500] * 3
+    clock = _FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+
+    with pytest.raises(CircuitOpenError):
+        get_with_retry(requests, url, max_retries=5, limiter=None, breaker=breaker, sleep=lambda s: None)
+    assert server.hits == 3 and breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        get_with_retry(requests, url, limiter=None, breaker=breaker)
+    assert server.hits == 3
+
+    clock.now += 30
+    assert breaker.state == "half-open"
+    assert get_with_retry(requests, url, limiter=None, breaker=breaker).status_code == 200
+    assert breaker.state == "closed"
+
+
+def test_half_open_trial_without_verdict_frees_the_slot(fake_api):
+    """Test that a trial answered with 429, or failing unexpectedly, does not leave the breaker stuck open."""
+    server, url = fake_api
+    clock = _FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+    clock.now += 30
+
+    server.script = [429]
+    with pytest.raises(requests.exceptions.HTTPError):
+        get_with_retry(requests, url, max_retries=0, limiter=None, breaker=breaker)
+    assert breaker.state == "half-open"
+
+    class _Broken:
+        def get(self, url, timeout):
+            raise ValueError("bad response")
+
+    with pytest.raises(ValueError):
+        get_with_retry(_Broken(), url, limiter=None, breaker=breaker)
+    assert get_with_retry(requests, url, limiter=None, breaker=breaker).status_code == 200
+    assert breaker.state == "closed"
+
+
+def test_token_bucket_limits_sustained_rate():
+    """Test that bursts are capped and further calls wait for refill at the configured rate."""
+    clock = _FakeClock()
+    bucket = TokenBucket(rate=10, capacity=5, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(25)]
+
+    assert waits[:5] == [0.0] * 5
+    assert clock.now == pytest.approx(2.0)
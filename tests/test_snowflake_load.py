@@ -0,0 +1,81 @@
+import pytest
+
+from src.pipeline.dates import date_range
+from src.pipeline.warehouse.snowflake_load import build_load_sql, build_merge_statements
+
+duckdb = pytest.importorskip("duckdb")
+
+# DuckDB stand-in for warehouse/snowflake/00_setup.sql
+SCHEMA_SQL = """
+CREATE SEQUENCE date_seq;
+CREATE SEQUENCE location_seq;
+CREATE SEQUENCE fact_seq;
+CREATE TABLE raw_weather_staging (
+    time TIMESTAMP, temp_celsius FLOAT, humidity_percent INT, wind_speed_kmh FLOAT,
+    precipitation_mm FLOAT, temp_fahrenheit FLOAT, is_freezing BOOLEAN,
+    latitude FLOAT, longitude FLOAT, location VARCHAR, run_date DATE
+);
+CREATE TABLE dim_date (
+    date_id INT DEFAULT nextval('date_seq') PRIMARY KEY, date_value DATE UNIQUE NOT NULL,
+    year INT, month INT, day INT, day_of_week INT, is_weekend BOOLEAN
+);
+CREATE TABLE dim_location (
+    location_id INT DEFAULT nextval('location_seq') PRIMARY KEY, location_name VARCHAR UNIQUE NOT NULL,
+    latitude FLOAT NOT NULL, longitude FLOAT NOT NULL
+);
+CREATE TABLE fact_weather_hourly (
+    fact_id INT DEFAULT nextval('fact_seq') PRIMARY KEY, date_id INT NOT NULL, location_id INT NOT NULL,
+    hour INT NOT NULL, temp_celsius FLOAT, humidity_percent INT, precipitation_mm FLOAT,
+    wind_speed_kmh FLOAT, extraction_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+
+def _stage(conn, run_dates, temp):
+    """Replace staging with 3 hours x 2 locations for each run date."""
+    conn.execute("DELETE FROM raw_weather_staging")
+    for run_date in run_dates:
+        for location in ["Boston", "Miami"]:
+            for hour in range(3):
+                conn.execute(
+                    "INSERT INTO raw_weather_staging VALUES (?, ?, 80, 10.0, 0.1, 0, FALSE, 42.36, -71.06, ?, ?)",
+                    [f"{run_date} {hour:02d}:00:00", temp, location, run_date],
+                )
+
+
+def _merge(conn):
+    for statement in build_merge_statements("duckdb"):
+        conn.execute(statement)
+
+
+def test_load_sql_copies_each_prefix_and_bounds_fact_merge():
+    """Test that each run_date gets one COPY scoped to its stage prefix and the fact MERGE is date-bounded."""
+    sql = build_load_sql(date_range("2026-01-01", "2026-01-03") + ["2026-01-02"])
+
+    assert sql.count("COPY INTO") == 3
+    for run_date in ["2026-01-01", "2026-01-02", "2026-01-03"]:
+        assert f"FROM @my_s3_gold_stage/run_date={run_date}/\n)\nPATTERN = '.*[.]parquet';" in sql
+    assert "run_date=(" not in sql
+    assert "target.date_id BETWEEN $min_date_id AND $max_date_id" in sql
+    assert "@my_s3_gold_stage/run_date={{ ds }}/" in build_load_sql(["{{ ds }}"])
+
+
+def test_merges_are_idempotent_and_update_in_place():
+    """Test the generated MERGEs on DuckDB: multi-day insert, rerun update, no duplicates."""
+    conn = duckdb.connect()
+    conn.execute(SCHEMA_SQL)
+
+    _stage(conn, ["2026-01-24", "2026-01-25"], temp=1.0)
+    _merge(conn)
+    assert conn.execute("SELECT COUNT(*) FROM fact_weather_hourly").fetchone()[0] == 12
+
+    _stage(conn, ["2026-01-25"], temp=5.0)
+    _merge(conn)
+    counts = conn.execute(
+        "SELECT d.date_value::VARCHAR, COUNT(*), MAX(f.temp_celsius) FROM fact_weather_hourly f "
+        "JOIN dim_date d USING (date_id) GROUP BY 1 ORDER BY 1"
+    ).fetchall()
+    assert counts == [("2026-01-24", 6, 1.0), ("2026-01-25", 6, 5.0)]
+
+    weekend = conn.execute("SELECT is_weekend FROM dim_date WHERE date_value = '2026-01-25'").fetchone()[0]
+    assert weekend is True